@@ -5,10 +5,11 @@ This module provides intelligent caching for log queries with
 dynamic TTL calculation and cache invalidation strategies.
 """
 
+import asyncio
 import json
 import logging
 import hashlib
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Awaitable
 from datetime import datetime, timedelta
 import redis.asyncio as redis
 from redis.exceptions import RedisError
@@ -314,28 +315,49 @@ class CacheManager:
             logger.error(f"Failed to clear cache: {e}")
             return False
             
-    async def warm_cache(self, common_queries: List[Dict[str, Any]]) -> int:
+    async def warm_cache(self,
+                         common_queries: List[Dict[str, Any]],
+                         loader: Optional[Callable[[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]] = None,
+                         max_concurrency: int = 4) -> int:
         """
         Pre-warm cache with common queries.
         
         Args:
             common_queries: List of common query parameters
+            loader: Coroutine function executing a query and returning the result to cache
+            max_concurrency: Maximum concurrent loader calls
             
         Returns:
             Number of entries warmed
         """
+        if not self._is_connected():
+            return 0
+        if loader is None:
+            logger.warning("Cache warming skipped: no loader provided")
+            return 0
+            
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
         warmed = 0
         
-        for query_params in common_queries:
+        async def warm_one(query_params: Dict[str, Any]) -> None:
+            nonlocal warmed
             cache_key = self.generate_cache_key(query_params)
-            
-            # Check if already cached
-            if await self.get(cache_key):
-                continue
+            try:
+                # Check if already cached (without counting a hit or miss)
+                if await self._redis_client.exists(cache_key):
+                    return
+                    
+                async with semaphore:
+                    data = await loader(query_params)
+                if data is not None and await self.set(
+                    cache_key, data, self.calculate_ttl(query_params)
+                ):
+                    warmed += 1
+            except Exception as e:
+                logger.warning(f"Failed to warm cache entry {cache_key}: {e}")
+                self._stats["errors"] += 1
                 
-            # This would normally execute the query and cache result
-            # For now, just count
-            warmed += 1
+        await asyncio.gather(*[warm_one(query_params) for query_params in common_queries])
             
         logger.info(f"Warmed cache with {warmed} entries")
-        return warmed
\ No newline at end of file
+        return warmed
@@ -147,7 +147,7 @@ async def get_recent_activity(
                 # For other types, return empty list for now
                 return []
             
-            results = await db_manager.fetch_all(query, (limit,))
+            results = await db_manager.fetch_all(query, (limit,), pool="analytics")
         else:
             # Get mixed recent activities from all sources
             query = """
@@ -182,7 +182,7 @@ async def get_recent_activity(
             LIMIT 20
             """
         
-            results = await db_manager.fetch_all(query)
+            results = await db_manager.fetch_all(query, pool="analytics")
         
         # Convert to ActivityItem objects
         activities = []
@@ -269,7 +269,7 @@ async def get_recent_searches(
         LIMIT 20
         """
         
-        results = await db_manager.fetch_all(query)
+        results = await db_manager.fetch_all(query, pool="analytics")
         
         # Convert to ActivityItem objects
         search_activities = []
@@ -331,7 +331,7 @@ async def get_dashboard_data(
             COUNT(CASE WHEN created_at >= datetime('now', '-24 hours') THEN 1 END) as searches_24h
         FROM search_cache
         """
-        search_result = await db_manager.fetch_one(search_stats_query)
+        search_result = await db_manager.fetch_one(search_stats_query, pool="analytics")
         
         # Get content statistics
         content_stats_query = """
@@ -341,7 +341,7 @@ async def get_dashboard_data(
             MAX(updated_at) as last_update
         FROM content_metadata
         """
-        content_result = await db_manager.fetch_one(content_stats_query)
+        content_result = await db_manager.fetch_one(content_stats_query, pool="analytics")
         
         # Get system uptime (simplified)
         import time
@@ -361,7 +361,7 @@ async def get_dashboard_data(
         )
         SELECT * FROM recent_activity
         """
-        activity_results = await db_manager.fetch_all(activity_query)
+        activity_results = await db_manager.fetch_all(activity_query, pool="analytics")
         
         # Get provider status from config
         provider_query = """
@@ -369,7 +369,7 @@ async def get_dashboard_data(
         FROM system_config
         WHERE key LIKE 'ai.%' AND value != '{}'
         """
-        provider_result = await db_manager.fetch_one(provider_query)
+        provider_result = await db_manager.fetch_one(provider_query, pool="analytics")
         
         # Aggregate all dashboard data
         dashboard_data = {
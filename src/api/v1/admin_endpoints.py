@@ -132,7 +132,7 @@ async def admin_search_content(
         
         # Get total count
         count_query = f"SELECT COUNT(*) as total FROM content_metadata {where_clause}"
-        count_result = await db_manager.fetch_one(count_query, params)
+        count_result = await db_manager.fetch_one(count_query, params, pool="analytics")
         total_count = count_result.get("total", 0) if count_result else 0
         
         # Get paginated results using actual schema columns
@@ -162,7 +162,7 @@ async def admin_search_content(
         params["limit"] = limit
         params["offset"] = offset
         
-        results = await db_manager.fetch_all(query, params)
+        results = await db_manager.fetch_all(query, params, pool="analytics")
         
         # Convert to AdminContentItem objects
         items = []
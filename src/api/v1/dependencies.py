@@ -14,7 +14,10 @@ from src.database.connection import (
     create_database_manager,
     create_cache_manager,
 )
-from src.clients.weaviate_client import WeaviateVectorClient
+from src.clients.weaviate_client import WeaviateVectorClient, close_weaviate_connections
+from src.llm.models import EmbeddingRequest
+from src.llm.ollama_provider import OllamaProvider
+from src.database.write_buffer import close_write_buffers
 from src.search.orchestrator import SearchOrchestrator
 from src.core.config.manager import ConfigurationManager
 
@@ -24,6 +27,7 @@ logger = logging.getLogger(__name__)
 _db_manager: Optional[DatabaseManager] = None
 _cache_manager: Optional[CacheManager] = None
 _weaviate_client: Optional[WeaviateVectorClient] = None
+_embedding_provider: Optional[OllamaProvider] = None
 _search_orchestrator: Optional[SearchOrchestrator] = None
 _configuration_manager: Optional[ConfigurationManager] = None
 _knowledge_enricher = None  # Type: Optional[KnowledgeEnricher]
@@ -39,7 +43,7 @@ def _reset_dependent_instances():
 
 async def reset_service_instances():
     """Reset all service instances when configuration changes"""
-    global _weaviate_client, _search_orchestrator, _knowledge_enricher, _configuration_manager
+    global _weaviate_client, _embedding_provider, _search_orchestrator, _knowledge_enricher, _configuration_manager
     
     # Disconnect existing clients gracefully
     if _weaviate_client is not None:
@@ -47,9 +51,15 @@ async def reset_service_instances():
             await _weaviate_client.disconnect()
         except Exception as e:
             logger.warning(f"Error disconnecting Weaviate client: {e}")
+    if _embedding_provider is not None:
+        try:
+            await _embedding_provider.close()
+        except Exception as e:
+            logger.warning(f"Error closing embedding provider: {e}")
     
     # Reset all service instances
     _weaviate_client = None
+    _embedding_provider = None
     _search_orchestrator = None
     _knowledge_enricher = None
     _configuration_manager = None
@@ -121,6 +131,31 @@ class StubWeaviateClient:
     async def search_workspace(self, workspace_slug: str, query: str, limit: int = 20):
         return []
 
+    async def search_workspaces(self, workspace_slugs, query: str, limit: int = 20):
+        return {slug: [] for slug in workspace_slugs}
+
+
+class StubCachePipeline:
+    """Stub cache pipeline that discards queued commands"""
+
+    def set(self, key: str, value, ttl: int) -> "StubCachePipeline":
+        return self
+
+    def set_bytes(self, key: str, value: bytes, ttl: int) -> "StubCachePipeline":
+        return self
+
+    def increment(self, key: str) -> "StubCachePipeline":
+        return self
+
+    def expire(self, key: str, seconds: int) -> "StubCachePipeline":
+        return self
+
+    def delete(self, key: str) -> "StubCachePipeline":
+        return self
+
+    async def execute(self) -> list:
+        return []
+
 
 class StubCacheManager:
     """Stub cache manager for degraded operation when Redis is unavailable"""
@@ -140,15 +175,42 @@ class StubCacheManager:
     async def set(self, key: str, value, ttl: int) -> None:
         pass
 
+    async def get_bytes(self, key: str):
+        return None
+
+    async def set_bytes(self, key: str, value: bytes, ttl: int) -> None:
+        pass
+
     async def delete(self, key: str) -> None:
         pass
 
-    async def increment(self, key: str) -> int:
+    async def increment(self, key: str, amount: int = 1) -> int:
         return 1
 
     async def expire(self, key: str, seconds: int) -> None:
         pass
 
+    async def acquire_lock(self, key: str, ttl_seconds: int):
+        return "local"
+
+    async def release_lock(self, key: str, token: str) -> bool:
+        return False
+
+    async def publish(self, channel: str, message: str) -> int:
+        return 0
+
+    async def subscribe(self, *channels: str):
+        return None
+
+    async def mget(self, keys) -> dict:
+        return {}
+
+    async def mset_with_ttl(self, items: dict, ttl: int) -> None:
+        pass
+
+    def pipeline(self) -> "StubCachePipeline":
+        return StubCachePipeline()
+
     async def health_check(self) -> dict:
         return {
             "status": "unavailable",
@@ -219,6 +281,35 @@ async def get_cache_manager() -> CacheManager:
     return _cache_manager
 
 
+def _configure_embeddings(client: WeaviateVectorClient, config) -> None:
+    """
+    Embed search queries and uploaded chunks with the configured Ollama
+    embedding model, so stored vectors and query vectors share one model
+    """
+    global _embedding_provider
+
+    model = config.ai.ollama.embedding_model
+    if not model:
+        logger.info("No embedding model configured; vector search falls back to near_text")
+        return
+
+    provider = OllamaProvider(config.ai.ollama.model_dump())
+    _embedding_provider = provider
+
+    async def embed_texts(texts):
+        response = await provider.generate_embeddings(
+            EmbeddingRequest(texts=texts, model_id=model)
+        )
+        return response.embeddings
+
+    async def embed_query(query):
+        return (await embed_texts([query]))[0]
+
+    client.set_query_embedder(embed_query, namespace=f"ollama/{model}")
+    client.document_embedder = embed_texts
+    logger.info(f"Weaviate client embedding with ollama/{model}")
+
+
 async def get_weaviate_client() -> WeaviateVectorClient:
     """
     Dependency to get Weaviate client instance with graceful degradation
@@ -228,7 +319,11 @@ async def get_weaviate_client() -> WeaviateVectorClient:
     if _weaviate_client is None:
         try:
             config = get_system_configuration()
-            _weaviate_client = WeaviateVectorClient(config.weaviate)
+            cache_manager = await get_cache_manager()
+            _weaviate_client = WeaviateVectorClient(
+                config.weaviate, cache_manager=cache_manager
+            )
+            _configure_embeddings(_weaviate_client, config)
             await _weaviate_client.connect()
             # Test connection but don't fail hard
             await _weaviate_client.health_check()
@@ -389,9 +484,24 @@ async def cleanup_dependencies():
     """
     Cleanup all dependency instances on application shutdown
     """
-    global _db_manager, _cache_manager, _anythingllm_client, _search_orchestrator, _configuration_manager, _knowledge_enricher
+    global _db_manager, _cache_manager, _weaviate_client, _embedding_provider, _anythingllm_client, _search_orchestrator, _configuration_manager, _knowledge_enricher
 
     try:
+        # Flush buffered usage signal / feedback writes while the database is up
+        await close_write_buffers()
+
+        # Stop the search cache and workspace catalog listeners, pending refreshes
+        # and re-warming while Redis and the database are still connected
+        if _search_orchestrator and hasattr(_search_orchestrator, "search_cache"):
+            await _search_orchestrator.search_cache.close()
+        if _search_orchestrator and hasattr(_search_orchestrator, "workspace_catalog"):
+            await _search_orchestrator.workspace_catalog.close()
+
+        # Cleanup knowledge enricher
+        if _knowledge_enricher and hasattr(_knowledge_enricher, "shutdown"):
+            await _knowledge_enricher.shutdown()
+            logger.info("Knowledge enricher shut down")
+
         if _db_manager and hasattr(_db_manager, "disconnect"):
             await _db_manager.disconnect()
             logger.info("Database manager disconnected")
@@ -404,15 +514,17 @@ async def cleanup_dependencies():
             await _weaviate_client.disconnect()
             logger.info("Weaviate client disconnected")
 
-        # Cleanup knowledge enricher
-        if _knowledge_enricher and hasattr(_knowledge_enricher, "shutdown"):
-            await _knowledge_enricher.shutdown()
-            logger.info("Knowledge enricher shut down")
+        # Close pooled Weaviate connections shared by per-request clients
+        await close_weaviate_connections()
+
+        if _embedding_provider is not None:
+            await _embedding_provider.close()
 
         # Reset global instances
         _db_manager = None
         _cache_manager = None
         _weaviate_client = None
+        _embedding_provider = None
         _search_orchestrator = None
         _configuration_manager = None
         _knowledge_enricher = None
@@ -19,6 +19,7 @@ from .dependencies import (
     get_search_orchestrator,
 )
 from src.database.connection import DatabaseManager, CacheManager
+from src.database.write_buffer import get_write_buffer_stats
 from src.clients.weaviate_client import WeaviateVectorClient
 from src.search.orchestrator import SearchOrchestrator
 from src.core.config import get_system_configuration
@@ -234,24 +235,27 @@ async def get_stats(
     """
 
     try:
-        # Get real search statistics from database
-        # Using search_cache table which is what we have in our schema
+        # Get search statistics from the hourly rollup maintained by
+        # triggers on search_cache (one row per hour, not per search)
         search_stats_query = """
         SELECT 
-            COUNT(*) as total_searches
-        FROM search_cache
+            COALESCE(SUM(search_count), 0) as total_searches,
+            COALESCE(SUM(total_execution_time_ms), 0) as total_execution_time_ms
+        FROM search_stats_hourly
         """
         try:
-            search_result = await db_manager.fetch_one(search_stats_query)
+            search_result = await db_manager.fetch_one(search_stats_query, pool="analytics")
         except Exception as e:
-            logger.warning(f"Failed to query search_cache table: {e}")
+            logger.warning(f"Failed to query search_stats_hourly table: {e}")
             search_result = None
         
+        total_searches = int(search_result.get("total_searches") or 0) if search_result else 0
+        total_execution_ms = int(search_result.get("total_execution_time_ms") or 0) if search_result else 0
         search_stats = {
-            "total_searches": search_result.get("total_searches", 0) if search_result else 0,
-            "avg_response_time_ms": 0,  # Not available in current schema
+            "total_searches": total_searches,
+            "avg_response_time_ms": total_execution_ms / total_searches if total_searches else 0,
             "cache_hit_rate": 0,  # Would need to be calculated from cache_entries
-            "successful_searches": search_result.get("total_searches", 0) if search_result else 0,  # Assume all are successful
+            "successful_searches": total_searches,  # Assume all are successful
             "failed_searches": 0,  # Not tracked in current schema
         }
         
@@ -276,28 +280,36 @@ async def get_stats(
                     "evictions": 0,
                 }
         
-        # Get real content statistics using correct field names from our schema
+        # Get content statistics from the per technology/workspace rollup
+        # maintained by triggers on content_metadata
         content_stats_query = """
         SELECT 
-            COUNT(DISTINCT content_id) as total_documents,
-            SUM(chunk_count) as total_chunks,
-            AVG(quality_score) as avg_quality_score,
-            COUNT(DISTINCT weaviate_workspace) as workspaces,
-            MAX(updated_at) as last_enrichment
+            COALESCE(SUM(document_count), 0) as total_documents,
+            COALESCE(SUM(chunk_count), 0) as total_chunks,
+            COALESCE(SUM(quality_score_total), 0) as quality_score_total,
+            COUNT(DISTINCT workspace) FILTER (WHERE document_count > 0) as workspaces
+        FROM content_counts
+        """
+        # Served by the updated_at index rather than a scan
+        last_enrichment_query = """
+        SELECT MAX(updated_at) as last_enrichment
         FROM content_metadata
         """
         try:
-            content_result = await db_manager.fetch_one(content_stats_query)
+            content_result = await db_manager.fetch_one(content_stats_query, pool="analytics")
+            enrichment_result = await db_manager.fetch_one(last_enrichment_query, pool="analytics")
         except Exception as e:
-            logger.warning(f"Failed to query content_metadata table: {e}")
-            content_result = None
+            logger.warning(f"Failed to query content statistics: {e}")
+            content_result = enrichment_result = None
         
+        total_documents = int(content_result.get("total_documents") or 0) if content_result else 0
+        quality_score_total = float(content_result.get("quality_score_total") or 0) if content_result else 0
         content_stats = {
-            "total_documents": content_result.get("total_documents", 0) if content_result else 0,
-            "total_chunks": content_result.get("total_chunks", 0) if content_result else 0,
-            "avg_quality_score": float(content_result.get("avg_quality_score", 0)) if content_result and content_result.get("avg_quality_score") is not None else 0,
+            "total_documents": total_documents,
+            "total_chunks": int(content_result.get("total_chunks") or 0) if content_result else 0,
+            "avg_quality_score": quality_score_total / total_documents if total_documents else 0,
             "workspaces": content_result.get("workspaces", 0) if content_result else 0,
-            "last_enrichment": content_result.get("last_enrichment") or datetime.utcnow() if content_result else datetime.utcnow(),
+            "last_enrichment": (enrichment_result.get("last_enrichment") if enrichment_result else None) or datetime.utcnow(),
         }
         
         # Get real system statistics
@@ -318,6 +330,9 @@ async def get_stats(
                 "memory_usage_mb": 0,
                 "disk_usage_mb": 0,
             }
+        system_stats["write_buffers"] = get_write_buffer_stats()
+        if hasattr(db_manager, "get_pool_stats"):
+            system_stats["database_pools"] = db_manager.get_pool_stats()
         
         return StatsResponse(
             search_stats=search_stats,
@@ -376,7 +391,7 @@ async def get_analytics(
         WHERE created_at >= :start_date AND created_at <= :end_date
         """
         search_result = await db_manager.fetch_one(
-            search_query, {"start_date": start_date, "end_date": end_date}
+            search_query, {"start_date": start_date, "end_date": end_date}, pool="analytics"
         )
         
         # Get top queries from search_cache
@@ -389,7 +404,7 @@ async def get_analytics(
         LIMIT 5
         """
         top_queries = await db_manager.fetch_all(
-            top_queries_query, {"start_date": start_date, "end_date": end_date}
+            top_queries_query, {"start_date": start_date, "end_date": end_date}, pool="analytics"
         )
         
         # Get content metrics
@@ -402,7 +417,7 @@ async def get_analytics(
         WHERE created_at >= :start_date AND created_at <= :end_date
         """
         content_result = await db_manager.fetch_one(
-            content_query, {"start_date": start_date, "end_date": end_date}
+            content_query, {"start_date": start_date, "end_date": end_date}, pool="analytics"
         )
         
         # Get documents by technology
@@ -415,7 +430,7 @@ async def get_analytics(
         LIMIT 5
         """
         tech_docs = await db_manager.fetch_all(
-            tech_query, {"start_date": start_date, "end_date": end_date}
+            tech_query, {"start_date": start_date, "end_date": end_date}, pool="analytics"
         )
         
         # Get user metrics from usage_signals table
@@ -428,7 +443,7 @@ async def get_analytics(
         WHERE created_at >= :start_date AND created_at <= :end_date
         """
         user_result = await db_manager.fetch_one(
-            user_query, {"start_date": start_date, "end_date": end_date}
+            user_query, {"start_date": start_date, "end_date": end_date}, pool="analytics"
         )
         
         return {
@@ -51,6 +51,15 @@ class SearchRequest(BaseModel):
     use_external_search: Optional[bool] = Field(
         None, description="Force external search usage (None = auto-decide based on results)"
     )
+    latency_budget_ms: Optional[int] = Field(
+        None,
+        ge=10,
+        le=30000,
+        description="Return once this many ms have passed and enough results are ranked",
+    )
+    stream: bool = Field(
+        False, description="Stream progressive results as server-sent events"
+    )
 
 
 class SearchResult(BaseModel):
@@ -92,6 +101,9 @@ class SearchResponse(BaseModel):
     ingestion_status: Optional[Dict[str, Any]] = Field(
         None, description="Status of synchronous knowledge ingestion if performed"
     )
+    partial_results: bool = Field(
+        False, description="Whether slower workspaces were skipped to meet the latency budget"
+    )
 
 
 # Feedback Models
@@ -3,11 +3,16 @@ Search API Endpoints - PRD-001: HTTP API Foundation
 Search, feedback, and signals endpoints
 """
 
+import json
 import logging
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query, Request
+from fastapi import (
+    APIRouter, Depends, HTTPException, BackgroundTasks, Query, Request, WebSocket, WebSocketDisconnect
+)
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 
 from .schemas import (
     SearchRequest,
@@ -103,6 +108,14 @@ async def search_documents_post(
     start_time = time.time()
     client_ip = request.client.host if request.client else "unknown"
     trace_id = get_trace_id(request)
+
+    if search_request.stream or "text/event-stream" in request.headers.get("accept", ""):
+        logger.info(f"[{trace_id}] Streaming search started")
+        return StreamingResponse(
+            _search_event_stream(search_orchestrator, search_request, background_tasks, trace_id),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
     
     try:
         logger.info(f"[{trace_id}] Search endpoint started")
@@ -118,7 +131,8 @@ async def search_documents_post(
             offset=0,  # Default offset as it's not in SearchRequest
             session_id=search_request.session_id,
             external_providers=search_request.external_providers,
-            use_external_search=search_request.use_external_search
+            use_external_search=search_request.use_external_search,
+            latency_budget_ms=search_request.latency_budget_ms,
         )
         
         # Log search metrics
@@ -152,6 +166,10 @@ async def search_documents_get(
     technology_hint: Optional[str] = Query(None, description="Technology filter"),
     limit: int = Query(20, ge=1, le=100, description="Maximum results"),
     session_id: Optional[str] = Query(None, description="Session identifier"),
+    latency_budget_ms: Optional[int] = Query(
+        None, ge=10, le=30000, description="Return early after this many ms"
+    ),
+    stream: bool = Query(False, description="Stream progressive results as server-sent events"),
     search_orchestrator: SearchOrchestrator = Depends(get_search_orchestrator),
     config_manager: ConfigurationManager = Depends(get_configuration_manager),
 ) -> SearchResponse:
@@ -164,6 +182,8 @@ async def search_documents_get(
         technology_hint: Optional technology filter
         limit: Maximum number of results
         session_id: Optional session identifier
+        latency_budget_ms: Optional latency budget for early return
+        stream: Stream progressive results (EventSource-friendly)
         search_orchestrator: Search orchestrator dependency
 
     Returns:
@@ -171,7 +191,8 @@ async def search_documents_get(
     """
     # Convert GET parameters to SearchRequest
     search_request = SearchRequest(
-        query=q, technology_hint=technology_hint, limit=limit, session_id=session_id
+        query=q, technology_hint=technology_hint, limit=limit, session_id=session_id,
+        latency_budget_ms=latency_budget_ms, stream=stream,
     )
 
     # Use the same logic as POST endpoint
@@ -180,6 +201,77 @@ async def search_documents_get(
     )
 
 
+@router.websocket("/search")
+async def search_documents_websocket(
+    websocket: WebSocket,
+    search_orchestrator: SearchOrchestrator = Depends(get_search_orchestrator),
+):
+    """
+    WebSocket /api/v1/search - Progressive search results
+
+    Each message from the client is a SearchRequest JSON object. The server
+    answers with "progress" frames as workspaces complete and a final
+    "result" frame carrying the SearchResponse (or an "error" frame).
+    """
+    await websocket.accept()
+    try:
+        while True:
+            message = await websocket.receive_json()
+            try:
+                search_request = SearchRequest(**message)
+            except (ValidationError, TypeError) as e:
+                await websocket.send_json({"type": "error", "data": {"detail": str(e)}})
+                continue
+
+            try:
+                async for frame in _stream_search_frames(search_orchestrator, search_request, None):
+                    await websocket.send_json(frame)
+            except WebSocketDisconnect:
+                raise
+            except Exception as e:
+                logger.error(f"WebSocket search failed: {e}", exc_info=True)
+                await websocket.send_json(
+                    {"type": "error", "data": {"detail": f"Search execution failed: {str(e)}"}}
+                )
+    except WebSocketDisconnect:
+        logger.debug("Search WebSocket disconnected")
+
+
+def _stream_search_frames(
+    search_orchestrator: SearchOrchestrator,
+    search_request: SearchRequest,
+    background_tasks: Optional[BackgroundTasks],
+) -> AsyncIterator[Dict[str, Any]]:
+    """Progressive search frames for a request"""
+    return search_orchestrator.stream_search(
+        query=search_request.query,
+        technology_hint=search_request.technology_hint,
+        limit=search_request.limit,
+        offset=0,
+        session_id=search_request.session_id,
+        background_tasks=background_tasks,
+        external_providers=search_request.external_providers,
+        use_external_search=search_request.use_external_search,
+        latency_budget_ms=search_request.latency_budget_ms,
+    )
+
+
+async def _search_event_stream(
+    search_orchestrator: SearchOrchestrator,
+    search_request: SearchRequest,
+    background_tasks: Optional[BackgroundTasks],
+    trace_id: str,
+) -> AsyncIterator[str]:
+    """Format progressive search frames as server-sent events"""
+    try:
+        async for frame in _stream_search_frames(search_orchestrator, search_request, background_tasks):
+            yield f"event: {frame['type']}\ndata: {json.dumps(frame['data'], default=str)}\n\n"
+    except Exception as e:
+        logger.error(f"[{trace_id}] Streaming search failed: {e}", exc_info=True)
+        detail = json.dumps({"detail": f"Search execution failed: {str(e)}"})
+        yield f"event: error\ndata: {detail}\n\n"
+
+
 @router.post("/feedback", status_code=202, tags=["feedback"])
 async def submit_feedback(
     request: Request,
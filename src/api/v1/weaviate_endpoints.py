@@ -201,26 +201,25 @@ async def get_expired_documents(
 @router.delete("/workspaces/{workspace_slug}/expired")
 async def cleanup_expired_documents(
     workspace_slug: str,
-    batch_size: int = 50,
     config_manager: ConfigurationManager = Depends(get_configuration_manager)
 ):
     """
     Clean up expired documents in a workspace.
     
+    Expired chunks are removed by one server-side filtered delete.
+    
     Args:
         workspace_slug: The workspace to clean up
-        batch_size: Number of documents to process in each batch (default: 50)
     """
     try:
         config = config_manager.get_configuration()
         
         async with WeaviateVectorClient(config.weaviate) as client:
-            result = await client.cleanup_expired_documents(workspace_slug, batch_size=batch_size)
+            result = await client.cleanup_expired_documents(workspace_slug)
             
             return {
                 "workspace": workspace_slug,
-                "cleanup_result": result,
-                "batch_size": batch_size
+                "cleanup_result": result
             }
     except Exception as e:
         logger.error(f"Failed to cleanup expired documents: {e}")
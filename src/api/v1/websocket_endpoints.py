@@ -14,13 +14,15 @@ from datetime import datetime, timedelta
 from typing import Dict, Set, Optional
 import psutil
 import docker
-from sqlalchemy import select, func, and_, desc
+from sqlalchemy import select, func, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
 from fastapi.responses import HTMLResponse
 
-from ...database.models import SearchCache, ContentMetadata, FeedbackEvents, UsageSignals
+from ...database.models import (
+    SearchCache, FeedbackEvents, UsageSignals, SearchStatsHourly, ContentCounts
+)
 from .dependencies import get_database_manager, get_cache_manager, get_weaviate_client, get_search_orchestrator
 
 
@@ -165,15 +167,20 @@ async def get_basic_analytics_stats():
     async with db_manager.session_factory() as session:
         # Get basic counts in parallel
         results = await asyncio.gather(
-            session.scalar(select(func.count()).select_from(SearchCache)),
-            session.scalar(select(func.avg(SearchCache.execution_time_ms)).select_from(SearchCache)),
-            session.scalar(select(func.count()).select_from(ContentMetadata)),
+            session.execute(select(
+                func.sum(SearchStatsHourly.search_count),
+                func.sum(SearchStatsHourly.total_execution_time_ms),
+            )),
+            session.scalar(select(func.sum(ContentCounts.document_count))),
             return_exceptions=True
         )
         
-        total_searches = results[0] if not isinstance(results[0], Exception) else 0
-        avg_response_time = results[1] if not isinstance(results[1], Exception) else 0
-        total_documents = results[2] if not isinstance(results[2], Exception) else 0
+        search_totals = results[0].first() if not isinstance(results[0], Exception) else None
+        total_searches = search_totals[0] if search_totals else 0
+        avg_response_time = (
+            search_totals[1] / search_totals[0] if search_totals and search_totals[0] else 0
+        )
+        total_documents = results[1] if not isinstance(results[1], Exception) else 0
         
         return {
             "search_stats": {
@@ -199,11 +206,15 @@ async def get_detailed_analytics_data(time_range: str = "24h"):
     
     db_manager = await get_database_manager()
     async with db_manager.session_factory() as session:
-        # Get search metrics
-        search_count = await session.scalar(
-            select(func.count()).select_from(SearchCache)
-            .where(SearchCache.created_at >= start_time)
-        ) or 0
+        # Hourly search rollup for the whole range (one row per active hour)
+        current_hour = now.replace(minute=0, second=0, microsecond=0)
+        hourly_result = await session.execute(
+            select(SearchStatsHourly)
+            .where(SearchStatsHourly.bucket >= start_time.replace(minute=0, second=0, microsecond=0))
+        )
+        buckets = {row.bucket: row for row in hourly_result.scalars()}
+        search_count = sum(row.search_count for row in buckets.values())
+        searches_with_results = sum(row.searches_with_results for row in buckets.values())
         
         # Get top queries
         top_queries_result = await session.execute(
@@ -221,36 +232,26 @@ async def get_detailed_analytics_data(time_range: str = "24h"):
             for row in top_queries_result
         ]
         
-        # Get queries by hour (last 24 hours) - this is expensive
+        # Queries by hour for the last 24 hours, oldest first
         hourly_stats = []
-        for i in range(24):
-            hour_start = now - timedelta(hours=i+1)
-            hour_end = now - timedelta(hours=i)
-            
-            hour_data = await session.execute(
-                select(
-                    func.count().label('count'),
-                    func.avg(SearchCache.execution_time_ms).label('avg_time')
-                )
-                .select_from(SearchCache)
-                .where(and_(
-                    SearchCache.created_at >= hour_start,
-                    SearchCache.created_at < hour_end
-                ))
-            )
-            row = hour_data.first()
+        for i in range(23, -1, -1):
+            row = buckets.get(current_hour - timedelta(hours=i))
             hourly_stats.append({
-                "count": row.count if row else 0,
-                "responseTime": float(row.avg_time) if row and row.avg_time else 0
+                "count": row.search_count if row else 0,
+                "responseTime": (
+                    row.total_execution_time_ms / row.search_count
+                    if row and row.search_count else 0
+                )
             })
         
         # Get document distribution by technology
         tech_distribution = await session.execute(
             select(
-                ContentMetadata.technology,
-                func.count().label('count')
+                ContentCounts.technology,
+                func.sum(ContentCounts.document_count).label('count')
             )
-            .group_by(ContentMetadata.technology)
+            .group_by(ContentCounts.technology)
+            .having(func.sum(ContentCounts.document_count) > 0)
             .order_by(desc('count'))
             .limit(10)
         )
@@ -260,14 +261,6 @@ async def get_detailed_analytics_data(time_range: str = "24h"):
         ]
         
         # Calculate success rate
-        searches_with_results = await session.scalar(
-            select(func.count()).select_from(SearchCache)
-            .where(and_(
-                SearchCache.created_at >= start_time,
-                SearchCache.result_count > 0
-            ))
-        ) or 0
-        
         success_rate = (searches_with_results / search_count) if search_count > 0 else 0
         
         return {
@@ -276,7 +269,7 @@ async def get_detailed_analytics_data(time_range: str = "24h"):
                 "totalSearches": search_count,
                 "successRate": success_rate,
                 "topQueries": top_queries,
-                "queriesByHour": list(reversed(hourly_stats)),
+                "queriesByHour": hourly_stats,
             },
             "contentMetrics": {
                 "documentsByTechnology": docs_by_tech,
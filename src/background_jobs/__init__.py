@@ -66,7 +66,7 @@ from .manager import Context7BackgroundJobManager
 from .scheduler import JobScheduler, CronParser
 from .storage import JobStorage
 from .monitoring import JobMonitor
-from .jobs import TTLCleanupJob, DocumentRefreshJob, HealthCheckJob
+from .jobs import TTLCleanupJob, DocumentRefreshJob, HealthCheckJob, CacheWarmingJob
 
 __version__ = "1.0.0"
 
@@ -99,7 +99,8 @@ __all__ = [
     # Job implementations
     "TTLCleanupJob",
     "DocumentRefreshJob", 
-    "HealthCheckJob"
+    "HealthCheckJob",
+    "CacheWarmingJob"
 ]
 
 
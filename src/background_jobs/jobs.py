@@ -116,6 +116,8 @@ class TTLCleanupJob(BaseJob):
                                f"correlation_id={correlation_id} workspace={workspace}")
                     
                     # Cleanup expired documents in this workspace
+                    # Expired chunks are removed by one server-side filtered
+                    # delete_many per workspace
                     cleanup_result = await self.context7_service.cleanup_expired_documents(
                         workspace_slug=workspace,
                         correlation_id=correlation_id
@@ -479,17 +481,17 @@ class DocumentRefreshJob(BaseJob):
             
             recent_threshold = now - timedelta(hours=1) if self.config.skip_recent_updates else now
             
-            results = await self.db_manager.fetch_all(query, {
+            # Streamed so only candidates passing the quality filter are held
+            candidates = []
+            total_queried = 0
+            async for row in self.db_manager.fetch_stream(query, {
                 "workspace": workspace,
                 "near_expiry_threshold": near_expiry_threshold,
                 "max_age_threshold": max_age_threshold,
                 "skip_recent": self.config.skip_recent_updates,
                 "recent_threshold": recent_threshold
-            })
-            
-            # Filter by quality score
-            candidates = []
-            for row in results:
+            }, pool="jobs"):
+                total_queried += 1
                 enrichment_metadata = row["enrichment_metadata"] or {}
                 quality_score = enrichment_metadata.get("quality_score", 0.0)
                 
@@ -505,7 +507,7 @@ class DocumentRefreshJob(BaseJob):
             logger.info(f"Found {len(candidates)} refresh candidates in workspace {workspace}")
             logger.info(f"PIPELINE_METRICS: step=document_refresh_candidates_found "
                        f"correlation_id={correlation_id} workspace={workspace} "
-                       f"candidates_count={len(candidates)} total_queried={len(results)}")
+                       f"candidates_count={len(candidates)} total_queried={total_queried}")
             
             return candidates
             
@@ -859,4 +861,74 @@ class HealthCheckJob(BaseJob):
                 "status": "error",
                 "error": str(e),
                 "timestamp": datetime.utcnow().isoformat()
-            }
\ No newline at end of file
+            }
+
+
+class CacheWarmingJob(BaseJob):
+    """
+    Search Cache Warming Job
+    
+    Replays the most popular queries from search history through the search
+    orchestrator so that hot queries are served from cache after deploys,
+    flushes and TTL expiry.
+    """
+    
+    def __init__(
+        self,
+        context7_service: Context7IngestionService,
+        weaviate_client: WeaviateVectorClient,
+        db_manager: DatabaseManager,
+        config: Context7JobConfig,
+        search_orchestrator: Any
+    ):
+        super().__init__(context7_service, weaviate_client, db_manager, config)
+        self.search_orchestrator = search_orchestrator
+    
+    async def execute(self, job_config: JobConfig, execution: JobExecution) -> Dict[str, Any]:
+        """Execute cache warming job"""
+        start_time = time.time()
+        correlation_id = execution.correlation_id or f"cache_warming_{uuid.uuid4().hex[:8]}"
+        params = job_config.parameters
+        
+        try:
+            logger.info(f"PIPELINE_METRICS: step=cache_warming_job_start "
+                       f"correlation_id={correlation_id} job_id={job_config.job_id}")
+            
+            result = await self.search_orchestrator.cache_warmer.warm(
+                limit=params.get("limit"),
+                min_access_count=params.get("min_access_count"),
+                lookback_days=params.get("lookback_days"),
+                max_concurrency=params.get("max_concurrency"),
+                force=not params.get("respect_off_peak", True),
+                reason="scheduled"
+            )
+            if result.get("status") == "failed":
+                raise RuntimeError(result.get("error", "cache warming failed"))
+            
+            total_time = int((time.time() - start_time) * 1000)
+            logger.info(f"PIPELINE_METRICS: step=cache_warming_job_complete "
+                       f"correlation_id={correlation_id} duration_ms={total_time} "
+                       f"warming_status={result.get('status')} warmed={result.get('warmed', 0)}")
+            
+            return {
+                **result,
+                "status": "completed",
+                "warming_status": result.get("status"),
+                "correlation_id": correlation_id,
+                "completed_at": datetime.utcnow().isoformat()
+            }
+            
+        except Exception as e:
+            total_time = int((time.time() - start_time) * 1000)
+            logger.error(f"Cache warming job failed: {e}")
+            logger.info(f"PIPELINE_METRICS: step=cache_warming_job_error "
+                       f"correlation_id={correlation_id} duration_ms={total_time} "
+                       f"error=\"{str(e)}\"")
+            
+            return {
+                "status": "failed",
+                "error": str(e),
+                "duration_ms": total_time,
+                "correlation_id": correlation_id,
+                "failed_at": datetime.utcnow().isoformat()
+            }
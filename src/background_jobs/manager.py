@@ -66,13 +66,15 @@ class Context7BackgroundJobManager:
         context7_service: Context7IngestionService,
         weaviate_client: WeaviateVectorClient,
         db_manager: DatabaseManager,
-        llm_client: LLMProviderClient
+        llm_client: LLMProviderClient,
+        search_orchestrator: Optional[Any] = None
     ):
         self.config = config
         self.context7_service = context7_service
         self.weaviate_client = weaviate_client
         self.db_manager = db_manager
         self.llm_client = llm_client
+        self.search_orchestrator = search_orchestrator
         
         # Core components will be initialized later to avoid circular imports
         self.scheduler = None
@@ -108,7 +110,8 @@ class Context7BackgroundJobManager:
             JobType.TTL_CLEANUP: self._handle_ttl_cleanup,
             JobType.DOCUMENT_REFRESH: self._handle_document_refresh,
             JobType.HEALTH_CHECK: self._handle_health_check,
-            JobType.MAINTENANCE: self._handle_maintenance
+            JobType.MAINTENANCE: self._handle_maintenance,
+            JobType.CACHE_WARMING: self._handle_cache_warming
         }
     
     async def start(self) -> None:
@@ -284,6 +287,25 @@ class Context7BackgroundJobManager:
             await self.register_job(refresh_job)
             await self.register_job(health_check_job)
             
+            # Search cache warming job (skips runs outside the off-peak window)
+            if self.search_orchestrator is not None:
+                cache_warming_job = JobConfig(
+                    job_id="search-cache-warming",
+                    job_type=JobType.CACHE_WARMING,
+                    job_name="Search Cache Warming",
+                    description="Replay popular queries from search history into the search cache",
+                    enabled=True,
+                    priority=JobPriority.LOW,
+                    schedule=JobSchedule(
+                        schedule_type="interval",
+                        interval_hours=1
+                    ),
+                    parameters={
+                        "respect_off_peak": True
+                    }
+                )
+                await self.register_job(cache_warming_job)
+            
             logger.info("Created default Context7 jobs")
             
         except Exception as e:
@@ -786,6 +808,27 @@ class Context7BackgroundJobManager:
         
         return await health_job.execute(job_config, execution)
     
+    async def _handle_cache_warming(self, job_config: JobConfig, execution: JobExecution) -> Dict[str, Any]:
+        """Handle search cache warming job"""
+        from .jobs import CacheWarmingJob
+        
+        if self.search_orchestrator is None:
+            return {
+                "status": "failed",
+                "error": "Search orchestrator not available for cache warming",
+                "failed_at": datetime.utcnow().isoformat()
+            }
+        
+        warming_job = CacheWarmingJob(
+            context7_service=self.context7_service,
+            weaviate_client=self.weaviate_client,
+            db_manager=self.db_manager,
+            config=self.config.context7_config,
+            search_orchestrator=self.search_orchestrator
+        )
+        
+        return await warming_job.execute(job_config, execution)
+    
     async def _handle_maintenance(self, job_config: JobConfig, execution: JobExecution) -> Dict[str, Any]:
         """Handle maintenance job"""
         # Basic maintenance operations
@@ -32,6 +32,7 @@ class JobType(str, Enum):
     DOCUMENT_REFRESH = "document_refresh"
     HEALTH_CHECK = "health_check"
     MAINTENANCE = "maintenance"
+    CACHE_WARMING = "cache_warming"
 
 
 class JobPriority(str, Enum):
@@ -44,12 +44,14 @@ class BackgroundJobService:
         weaviate_client: WeaviateVectorClient,
         db_manager: DatabaseManager,
         llm_client: LLMProviderClient,
-        config: Optional[BackgroundJobManagerConfig] = None
+        config: Optional[BackgroundJobManagerConfig] = None,
+        search_orchestrator: Optional[Any] = None
     ):
         self.context7_service = context7_service
         self.weaviate_client = weaviate_client
         self.db_manager = db_manager
         self.llm_client = llm_client
+        self.search_orchestrator = search_orchestrator
         
         # Use provided config or create default
         self.config = config or create_default_config()
@@ -83,7 +85,8 @@ class BackgroundJobService:
                 context7_service=self.context7_service,
                 weaviate_client=self.weaviate_client,
                 db_manager=self.db_manager,
-                llm_client=self.llm_client
+                llm_client=self.llm_client,
+                search_orchestrator=self.search_orchestrator
             )
             
             # Start job manager
@@ -301,7 +304,8 @@ def create_background_job_service(
     weaviate_client: WeaviateVectorClient,
     db_manager: DatabaseManager,
     llm_client: LLMProviderClient,
-    config: Optional[BackgroundJobManagerConfig] = None
+    config: Optional[BackgroundJobManagerConfig] = None,
+    search_orchestrator: Optional[Any] = None
 ) -> BackgroundJobService:
     """
     Factory function to create a BackgroundJobService instance
@@ -312,6 +316,7 @@ def create_background_job_service(
         db_manager: Database manager
         llm_client: LLM client
         config: Optional configuration (uses default if not provided)
+        search_orchestrator: Optional search orchestrator enabling cache warming jobs
     
     Returns:
         Configured BackgroundJobService instance
@@ -321,7 +326,8 @@ def create_background_job_service(
         weaviate_client=weaviate_client,
         db_manager=db_manager,
         llm_client=llm_client,
-        config=config
+        config=config,
+        search_orchestrator=search_orchestrator
     )
 
 
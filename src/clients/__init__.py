@@ -6,7 +6,13 @@ This package contains all client implementations for external services
 following async patterns with proper error handling and circuit breakers.
 """
 
-from .weaviate_client import WeaviateVectorClient
+from .weaviate_client import (
+    WeaviateVectorClient,
+    WeaviateConnectionPool,
+    get_weaviate_connection_pool,
+    close_weaviate_connections,
+)
+from .embedding_cache import QueryEmbeddingCache
 from .github import GitHubClient
 from .exceptions import (
     WeaviateError,
@@ -20,6 +26,10 @@ from .exceptions import (
 
 __all__ = [
     "WeaviateVectorClient",
+    "WeaviateConnectionPool",
+    "get_weaviate_connection_pool",
+    "close_weaviate_connections",
+    "QueryEmbeddingCache",
     "GitHubClient",
     "WeaviateError",
     "WeaviateConnectionError",
@@ -0,0 +1,192 @@
+"""
+Query Embedding Cache
+Two-tier cache mapping normalized query text to its embedding vector
+
+L1 is an in-process LRU; L2 is Redis via CacheManager with vectors stored as
+packed float32 bytes (4 bytes per dimension) instead of JSON. Used by
+WeaviateVectorClient so repeated queries skip the vectorizer entirely.
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+import sys
+import time
+from array import array
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_EDGE_PUNCTUATION_RE = re.compile(r"^[^\w]+|[^\w]+$")
+
+
+def normalize_query_text(query: str) -> str:
+    """
+    Normalize query text for embedding cache lookups.
+
+    Case, surrounding punctuation and whitespace differences do not change
+    the meaning of a search query, so near-repeated queries share an entry.
+    """
+    text = _WHITESPACE_RE.sub(" ", query.lower()).strip()
+    return _EDGE_PUNCTUATION_RE.sub("", text)
+
+
+def pack_vector(vector: List[float]) -> bytes:
+    """Pack a vector as little-endian float32 bytes"""
+    packed = array("f", vector)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_vector(data: bytes) -> List[float]:
+    """Unpack little-endian float32 bytes into a vector"""
+    unpacked = array("f")
+    unpacked.frombytes(data)
+    if sys.byteorder != "little":
+        unpacked.byteswap()
+    return unpacked.tolist()
+
+
+class QueryEmbeddingCache:
+    """
+    Caching wrapper around a query embedding function.
+
+    Instances are awaitable callables with the same signature as the wrapped
+    embedder, so they can be passed anywhere a query_embedder is expected.
+    """
+
+    KEY_PREFIX = "search:embedding:"
+
+    def __init__(
+        self,
+        embed_func: Callable[[str], Awaitable[List[float]]],
+        cache_manager: Optional[Any] = None,
+        maxsize: int = 2048,
+        ttl_seconds: int = 86400,
+        namespace: str = "default",
+    ):
+        """
+        Initialize query embedding cache.
+
+        Args:
+            embed_func: Coroutine function returning the embedding for a query
+            cache_manager: Optional CacheManager for the shared Redis tier
+            maxsize: Maximum entries in the in-process LRU
+            ttl_seconds: Redis TTL for cached vectors
+            namespace: Embedding model identifier (vectors from different
+                models must never be mixed)
+        """
+        self.embed_func = embed_func
+        self.cache_manager = cache_manager
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.namespace = namespace
+
+        self._l1: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._stats = {
+            "l1_hits": 0,
+            "l2_hits": 0,
+            "misses": 0,
+            "embed_errors": 0,
+            "embed_time_ms": 0.0,
+        }
+
+    async def __call__(self, query: str) -> List[float]:
+        return await self.get_embedding(query)
+
+    async def get_embedding(self, query: str) -> List[float]:
+        """
+        Get the embedding for query, computing it only on a full cache miss.
+
+        Args:
+            query: Query text (normalized again for the cache key)
+
+        Returns:
+            Embedding vector
+        """
+        normalized = normalize_query_text(query)
+
+        # L1: in-process LRU
+        vector = self._l1.get(normalized)
+        if vector is not None:
+            self._l1.move_to_end(normalized)
+            self._stats["l1_hits"] += 1
+            return vector
+
+        # Concurrent misses for the same query share one computation
+        inflight = self._inflight.get(normalized)
+        if inflight is not None:
+            self._stats["l1_hits"] += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[normalized] = future
+        try:
+            vector = await self._load_or_embed(normalized)
+            future.set_result(vector)
+            return vector
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so waiter-less failures are not reported as unhandled
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(normalized, None)
+
+    async def _load_or_embed(self, normalized: str) -> List[float]:
+        """Load vector from Redis or compute it, populating both tiers"""
+        cache_key = self._cache_key(normalized)
+
+        # L2: Redis (packed float32)
+        if self.cache_manager is not None:
+            data = await self.cache_manager.get_bytes(cache_key)
+            if data:
+                vector = unpack_vector(data)
+                self._stats["l2_hits"] += 1
+                self._store_l1(normalized, vector)
+                return vector
+
+        self._stats["misses"] += 1
+        start_time = time.time()
+        try:
+            vector = list(await self.embed_func(normalized))
+        except Exception:
+            self._stats["embed_errors"] += 1
+            raise
+        self._stats["embed_time_ms"] += (time.time() - start_time) * 1000
+
+        self._store_l1(normalized, vector)
+        if self.cache_manager is not None:
+            await self.cache_manager.set_bytes(cache_key, pack_vector(vector), self.ttl_seconds)
+        return vector
+
+    def _store_l1(self, normalized: str, vector: List[float]) -> None:
+        self._l1[normalized] = vector
+        self._l1.move_to_end(normalized)
+        while len(self._l1) > self.maxsize:
+            self._l1.popitem(last=False)
+
+    def _cache_key(self, normalized: str) -> str:
+        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:32]
+        return f"{self.KEY_PREFIX}{self.namespace}:{digest}"
+
+    def clear(self) -> None:
+        """Clear the in-process tier (Redis entries expire by TTL)"""
+        self._l1.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit-rate metrics"""
+        hits = self._stats["l1_hits"] + self._stats["l2_hits"]
+        total = hits + self._stats["misses"]
+        return {
+            **self._stats,
+            "requests": total,
+            "hit_rate": hits / total if total > 0 else 0.0,
+            "l1_size": len(self._l1),
+            "l1_maxsize": self.maxsize,
+        }
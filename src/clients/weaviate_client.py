@@ -9,19 +9,25 @@ with circuit breaker pattern, async operations, and comprehensive error handling
 import weaviate
 from weaviate.classes.init import Auth
 from weaviate.classes.config import Configure
+from weaviate.classes.data import DataObject
 from weaviate.classes.tenants import Tenant, TenantActivityStatus
-from weaviate.classes.query import MetadataQuery
+from weaviate.classes.query import MetadataQuery, Filter, HybridFusion
+from weaviate.classes.aggregate import GroupByAggregate
 import asyncio
+import functools
+import inspect
 import logging
 import time
 import uuid
-from typing import List, Optional, Dict, Any, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Union, Tuple, Callable, Awaitable, AsyncIterator
 from contextlib import asynccontextmanager
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import httpx
 
 from src.core.config.models import WeaviateConfig
 from src.database.connection import ProcessedDocument, DocumentChunk, UploadResult
+from .embedding_cache import QueryEmbeddingCache
 from .exceptions import (
     WeaviateError,
     WeaviateConnectionError,
@@ -43,6 +49,152 @@ except ImportError:
     logger.warning("Enhanced service logging not available")
 
 
+class WeaviateConnectionPool:
+    """
+    Per-process pool of connected Weaviate clients.
+    
+    API endpoints create short-lived WeaviateVectorClient instances per request;
+    the pool lets them share one HTTP/gRPC connection per endpoint, credentials
+    and client mode instead of reconnecting (and re-checking the schema) on
+    every call. Async clients are bound to the event loop that connected them,
+    so an entry created on a different or closed loop is replaced; the
+    replaced client is closed once no client on its loop still references it.
+    """
+    
+    def __init__(self):
+        self._entries: Dict[Tuple, Dict[str, Any]] = {}
+        self._retired: List[Dict[str, Any]] = []
+        self._locks: Dict[int, asyncio.Lock] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    def _get_lock(self, loop: asyncio.AbstractEventLoop) -> asyncio.Lock:
+        """Get the pool lock for the running event loop"""
+        lock = self._locks.get(id(loop))
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[id(loop)] = lock
+        return lock
+    
+    def get_executor(self, max_workers: int) -> ThreadPoolExecutor:
+        """Get the bounded executor used to offload sync client calls"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="weaviate"
+            )
+        return self._executor
+    
+    async def acquire(
+        self, key: Tuple, factory: Callable[[], Awaitable[Any]], loop_bound: bool
+    ) -> Any:
+        """
+        Get a pooled client for key, creating it with factory if needed.
+        
+        Args:
+            key: Pool key (endpoint, credentials, mode)
+            factory: Coroutine function returning a connected client
+            loop_bound: Whether the client is tied to the current event loop
+            
+        Returns:
+            Connected Weaviate client
+        """
+        loop = asyncio.get_running_loop()
+        async with self._get_lock(loop):
+            entry = self._entries.get(key)
+            if entry and loop_bound and (entry["loop"] is not loop or entry["loop"].is_closed()):
+                logger.info("Discarding pooled Weaviate connection bound to another event loop")
+                self._entries.pop(key, None)
+                await self._retire(entry)
+                entry = None
+            
+            if entry is None:
+                client = await factory()
+                entry = {
+                    "client": client,
+                    "loop": loop if loop_bound else None,
+                    "refs": 0,
+                    "created_at": time.time(),
+                }
+                self._entries[key] = entry
+                logger.info(f"Opened pooled Weaviate connection ({len(self._entries)} in pool)")
+            
+            entry["refs"] += 1
+            return entry["client"]
+    
+    async def release(self, key: Tuple, client: Any) -> None:
+        """Release a reference to a pooled client (connection stays open unless replaced)"""
+        entry = self._entries.get(key)
+        if entry is not None and entry["client"] is client:
+            if entry["refs"] > 0:
+                entry["refs"] -= 1
+            return
+        
+        for retired in self._retired:
+            if retired["client"] is client:
+                retired["refs"] -= 1
+                if retired["refs"] <= 0:
+                    self._retired.remove(retired)
+                    await self._close_client(retired["client"])
+                return
+    
+    async def _retire(self, entry: Dict[str, Any]) -> None:
+        """Close a replaced entry now, or when its last reference is released"""
+        old_loop = entry["loop"]
+        if old_loop is None or old_loop.is_closed():
+            # Nothing can release references held on a closed loop
+            await self._close_client(entry["client"])
+        elif entry["refs"] > 0:
+            self._retired.append(entry)
+        elif old_loop.is_running():
+            # Async clients must be closed on the loop that connected them
+            asyncio.run_coroutine_threadsafe(self._close_client(entry["client"]), old_loop)
+        else:
+            await self._close_client(entry["client"])
+    
+    @staticmethod
+    async def _close_client(client: Any) -> None:
+        """Close a Weaviate client, logging instead of raising on failure"""
+        try:
+            result = client.close()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.warning(f"Error closing pooled Weaviate connection: {e}")
+    
+    async def close_all(self) -> None:
+        """Close every pooled connection and the sync executor"""
+        entries = list(self._entries.values()) + self._retired
+        self._entries.clear()
+        self._retired = []
+        for entry in entries:
+            await self._close_client(entry["client"])
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        logger.info(f"Closed {len(entries)} pooled Weaviate connections")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics"""
+        return {
+            "connections": len(self._entries),
+            "active_references": sum(e["refs"] for e in self._entries.values()),
+            "retired_connections": len(self._retired),
+            "executor_active": self._executor is not None,
+        }
+
+
+_connection_pool = WeaviateConnectionPool()
+
+
+def get_weaviate_connection_pool() -> WeaviateConnectionPool:
+    """Get the process-wide Weaviate connection pool"""
+    return _connection_pool
+
+
+async def close_weaviate_connections() -> None:
+    """Close all pooled Weaviate connections (application shutdown)"""
+    await _connection_pool.close_all()
+
+
 class WeaviateVectorClient:
     """
     Weaviate client with multi-tenancy support for DocAIche.
@@ -50,27 +202,53 @@ class WeaviateVectorClient:
     Provides complete integration with Weaviate for tenant (workspace) management,
     document upload, vector search, and health monitoring operations.
     
-    Uses the official Weaviate Python client v4 with async support.
+    Uses the official Weaviate Python client v4. By default the native
+    WeaviateAsyncClient is used so searches never block the event loop; with
+    use_async_client disabled, sync client calls are offloaded to a bounded
+    executor. Connections are shared per process via WeaviateConnectionPool.
     """
     
     COLLECTION_NAME = "DocumentContent"
     
-    def __init__(self, config: WeaviateConfig):
+    def __init__(
+        self,
+        config: WeaviateConfig,
+        query_embedder: Optional[Callable[[str], Awaitable[List[float]]]] = None,
+        cache_manager: Optional[Any] = None,
+        document_embedder: Optional[Callable[[List[str]], Awaitable[List[List[float]]]]] = None,
+    ):
         """
         Initialize Weaviate client with configuration.
         
         Args:
             config: Weaviate configuration
+            query_embedder: Optional coroutine function embedding query text;
+                when set, multi-workspace search vectorizes the query once
+            cache_manager: Optional CacheManager backing the query embedding cache
+            document_embedder: Optional coroutine function embedding a batch of
+                chunk texts; when set, uploads store a vector with every chunk
         """
         self.config = config
         self.base_url = config.endpoint.rstrip("/")
         self.api_key = config.api_key
-        self.client: Optional[weaviate.WeaviateClient] = None
+        self.client: Optional[Union[weaviate.WeaviateClient, weaviate.WeaviateAsyncClient]] = None
+        self.use_async = getattr(config, "use_async_client", True)
+        self._executor_max_workers = getattr(config, "executor_max_workers", 8)
+        self._pool_key: Optional[Tuple] = None
+        self.cache_manager = cache_manager
+        self.query_embedder: Optional[Callable[[str], Awaitable[List[float]]]] = None
+        self.embedding_cache: Optional[QueryEmbeddingCache] = None
+        self.set_query_embedder(query_embedder)
+        self.document_embedder = document_embedder
         self._request_count = 0
         self._rate_limit_remaining = None
         self._rate_limit_reset = None
+        self._tenant_listeners: List[Callable[[str, str], Awaitable[Any]]] = []
         
-        logger.info(f"Weaviate client initialized for endpoint: {self.base_url}")
+        logger.info(
+            f"Weaviate client initialized for endpoint: {self.base_url} "
+            f"(mode: {'async' if self.use_async else 'sync+executor'})"
+        )
     
     async def __aenter__(self):
         """Async context manager entry"""
@@ -82,33 +260,19 @@ class WeaviateVectorClient:
         await self.disconnect()
     
     async def connect(self) -> None:
-        """Initialize Weaviate client connection"""
+        """Initialize Weaviate client connection (shared via the process pool)"""
         start_time = time.time()
         
         try:
-            # Parse the endpoint to get host and port
-            import urllib.parse
-            parsed = urllib.parse.urlparse(self.base_url)
-            host = parsed.hostname or "localhost"
-            port = parsed.port or 8080
-            
-            # Connect to Weaviate
-            connect_params = {
-                "http_host": host,
-                "http_port": port,
-                "http_secure": False,  # Not using HTTPS internally
-                "grpc_host": host,
-                "grpc_port": 50051,  # Default gRPC port
-                "grpc_secure": False,  # Not using secure gRPC internally
-            }
-            
-            if self.api_key:
-                connect_params["auth_credentials"] = Auth.api_key(self.api_key)
-            
-            self.client = weaviate.connect_to_custom(**connect_params)
-            
-            # Ensure the main collection exists
-            await self._ensure_collection_exists()
+            self._pool_key = (
+                self.base_url,
+                self.api_key,
+                getattr(self.config, "grpc_port", 50051),
+                self.use_async,
+            )
+            self.client = await _connection_pool.acquire(
+                self._pool_key, self._open_connection, loop_bound=self.use_async
+            )
             
             connection_duration = (time.time() - start_time) * 1000
             logger.info("Weaviate client session initialized")
@@ -123,25 +287,94 @@ class WeaviateVectorClient:
                 )
                 
         except Exception as e:
+            self._pool_key = None
             logger.error(f"Failed to connect to Weaviate: {e}")
             raise WeaviateConnectionError(
                 f"Failed to connect to Weaviate: {str(e)}",
                 error_context={"endpoint": self.base_url}
             )
     
+    async def _open_connection(self) -> Union[weaviate.WeaviateClient, weaviate.WeaviateAsyncClient]:
+        """Open a new Weaviate connection for the pool and ensure the schema"""
+        # Parse the endpoint to get host and port
+        import urllib.parse
+        parsed = urllib.parse.urlparse(self.base_url)
+        host = parsed.hostname or "localhost"
+        port = parsed.port or 8080
+        
+        # Connect to Weaviate
+        connect_params = {
+            "http_host": host,
+            "http_port": port,
+            "http_secure": False,  # Not using HTTPS internally
+            "grpc_host": host,
+            "grpc_port": getattr(self.config, "grpc_port", 50051),
+            "grpc_secure": False,  # Not using secure gRPC internally
+        }
+        
+        if self.api_key:
+            connect_params["auth_credentials"] = Auth.api_key(self.api_key)
+        
+        if self.use_async:
+            client = weaviate.use_async_with_custom(**connect_params)
+            await client.connect()
+        else:
+            loop = asyncio.get_running_loop()
+            client = await loop.run_in_executor(
+                self._get_executor(),
+                functools.partial(weaviate.connect_to_custom, **connect_params),
+            )
+        
+        self.client = client
+        
+        # Ensure the main collection exists
+        await self._ensure_collection_exists()
+        return client
+    
     async def disconnect(self) -> None:
-        """Clean up Weaviate client connection"""
+        """Release the pooled Weaviate connection"""
         if self.client:
-            self.client.close()
+            if self._pool_key is not None:
+                # Pooled connections stay open; close_weaviate_connections() closes them
+                await _connection_pool.release(self._pool_key, self.client)
+                self._pool_key = None
+            else:
+                result = self.client.close()
+                if inspect.isawaitable(result):
+                    await result
+            self.client = None
             logger.info("Weaviate client session closed")
     
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the bounded executor for sync client calls"""
+        return _connection_pool.get_executor(self._executor_max_workers)
+    
+    async def _call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Invoke a Weaviate client method without blocking the event loop.
+        
+        Async client methods return awaitables and are awaited directly; sync
+        client methods are run in the bounded executor.
+        """
+        if self.use_async:
+            result = func(*args, **kwargs)
+            if inspect.isawaitable(result):
+                return await result
+            return result
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), functools.partial(func, *args, **kwargs)
+        )
+    
     async def _ensure_collection_exists(self) -> None:
         """Ensure the main collection exists with multi-tenancy enabled and TTL support"""
         try:
             # Check if collection exists
-            if not self.client.collections.exists(self.COLLECTION_NAME):
+            if not await self._call(self.client.collections.exists, self.COLLECTION_NAME):
                 # Create collection with multi-tenancy enabled and TTL properties
-                self.client.collections.create(
+                await self._call(
+                    self.client.collections.create,
                     name=self.COLLECTION_NAME,
                     multi_tenancy_config=Configure.multi_tenancy(
                         enabled=True,
@@ -213,7 +446,7 @@ class WeaviateVectorClient:
         """Migrate existing collection to add TTL properties if they don't exist"""
         try:
             collection = self.client.collections.get(self.COLLECTION_NAME)
-            collection_config = collection.config.get()
+            collection_config = await self._call(collection.config.get)
             
             # Check which TTL properties are missing
             existing_props = {prop.name for prop in collection_config.properties}
@@ -239,7 +472,7 @@ class WeaviateVectorClient:
                 
                 # Add missing properties to the collection
                 for prop in missing_props:
-                    collection.config.add_property(prop)
+                    await self._call(collection.config.add_property, prop)
                     logger.info(f"Added TTL property: {prop.name}")
                 
                 logger.info("Collection schema migration completed successfully")
@@ -266,13 +499,14 @@ class WeaviateVectorClient:
         start_time = time.time()
         try:
             # Use the client's readiness check
-            is_ready = self.client.is_ready()
+            is_ready = await self._call(self.client.is_ready)
             duration_ms = (time.time() - start_time) * 1000
             
             health_data = {
                 "status": "healthy" if is_ready else "unhealthy",
                 "ready": is_ready,
-                "endpoint": self.base_url
+                "endpoint": self.base_url,
+                "query_embedding_cache": self.get_embedding_cache_stats(),
             }
             
             if _service_logger:
@@ -311,7 +545,7 @@ class WeaviateVectorClient:
         start_time = time.time()
         try:
             collection = self.client.collections.get(self.COLLECTION_NAME)
-            tenants = collection.tenants.get()
+            tenants = await self._call(collection.tenants.get)
             
             duration_ms = (time.time() - start_time) * 1000
             
@@ -347,7 +581,7 @@ class WeaviateVectorClient:
             collection = self.client.collections.get(self.COLLECTION_NAME)
             
             # Check if tenant exists
-            tenants = collection.tenants.get()
+            tenants = await self._call(collection.tenants.get)
             if workspace_slug in tenants:
                 return {
                     "slug": workspace_slug,
@@ -357,7 +591,7 @@ class WeaviateVectorClient:
                 }
             
             # Create new tenant
-            collection.tenants.create([
+            await self._call(collection.tenants.create, [
                 Tenant(
                     name=workspace_slug,
                     activity_status=TenantActivityStatus.ACTIVE
@@ -365,6 +599,7 @@ class WeaviateVectorClient:
             ])
             
             logger.info(f"Created new workspace/tenant: {workspace_slug}")
+            await self._notify_tenant_listeners("created", workspace_slug)
             
             return {
                 "slug": workspace_slug,
@@ -380,6 +615,37 @@ class WeaviateVectorClient:
                 workspace_slug=workspace_slug
             )
     
+    async def delete_workspace(self, workspace_slug: str) -> bool:
+        """Delete a workspace (tenant) and all of its objects"""
+        try:
+            collection = self.client.collections.get(self.COLLECTION_NAME)
+            await self._call(collection.tenants.remove, [workspace_slug])
+            logger.info(f"Deleted workspace/tenant: {workspace_slug}")
+            await self._notify_tenant_listeners("deleted", workspace_slug)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to delete workspace: {e}")
+            raise WeaviateWorkspaceError(
+                f"Failed to delete workspace: {str(e)}",
+                workspace_slug=workspace_slug
+            )
+
+    def add_tenant_listener(self, listener: Callable[[str, str], Awaitable[Any]]) -> None:
+        """
+        Register a coroutine called as listener(event, workspace_slug) after a
+        tenant is created or deleted through this client.
+        """
+        if listener not in self._tenant_listeners:
+            self._tenant_listeners.append(listener)
+
+    async def _notify_tenant_listeners(self, event: str, workspace_slug: str) -> None:
+        """Run tenant listeners; listener failures never fail the operation"""
+        for listener in self._tenant_listeners:
+            try:
+                await listener(event, workspace_slug)
+            except Exception as e:
+                logger.warning(f"Tenant {event} listener failed for {workspace_slug}: {e}")
+
     async def upload_document(
         self, workspace_slug: str, document: ProcessedDocument, ttl_days: int = 30, source_provider: str = "default"
     ) -> UploadResult:
@@ -419,35 +685,59 @@ class WeaviateVectorClient:
             collection = self.client.collections.get(self.COLLECTION_NAME)
             tenant_collection = collection.with_tenant(workspace_slug)
             
-            # Use Weaviate's batch import
-            with tenant_collection.batch.fixed_size(batch_size=100) as batch:
-                for chunk in document.chunks:
-                    try:
-                        chunk_data = {
-                            "content": chunk.content,
-                            "chunk_id": chunk.id,
-                            "chunk_index": chunk.chunk_index,
-                            "total_chunks": chunk.total_chunks,
-                            "document_title": document.title,
-                            "document_id": document.id,
-                            "technology": document.technology,
-                            "source_url": document.source_url,
-                            # TTL metadata
-                            "expires_at": ttl_timestamps["expires_at"],
-                            "created_at": ttl_timestamps["created_at"],
-                            "updated_at": ttl_timestamps["updated_at"],
-                            "source_provider": source_provider,
-                        }
-                        
-                        batch.add_object(properties=chunk_data)
-                        upload_results["successful_uploads"] += 1
-                        upload_results["uploaded_chunk_ids"].append(chunk.id)
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to upload chunk {chunk.id}: {e}")
+            objects = []
+            for chunk in document.chunks:
+                objects.append({
+                    "content": chunk.content,
+                    "chunk_id": chunk.id,
+                    "chunk_index": chunk.chunk_index,
+                    "total_chunks": chunk.total_chunks,
+                    "document_title": document.title,
+                    "document_id": document.id,
+                    "technology": document.technology,
+                    "source_url": document.source_url,
+                    # TTL metadata
+                    "expires_at": ttl_timestamps["expires_at"],
+                    "created_at": ttl_timestamps["created_at"],
+                    "updated_at": ttl_timestamps["updated_at"],
+                    "source_provider": source_provider,
+                })
+            
+            # insert_many issues one gRPC batch request per slice and works with
+            # both the async client and the executor-offloaded sync client
+            batch_size = 100
+            for start in range(0, len(objects), batch_size):
+                batch_objects = objects[start:start + batch_size]
+                batch_chunks = document.chunks[start:start + batch_size]
+                # The collection has no server-side vectorizer, so chunk vectors
+                # come from the same model that embeds search queries
+                vectors = await self._embed_documents([chunk.content for chunk in batch_chunks])
+                if vectors is not None:
+                    batch_objects = [
+                        DataObject(properties=properties, vector=vector)
+                        for properties, vector in zip(batch_objects, vectors)
+                    ]
+                try:
+                    batch_result = await self._call(
+                        tenant_collection.data.insert_many, batch_objects
+                    )
+                    batch_errors = getattr(batch_result, "errors", None)
+                    if not isinstance(batch_errors, dict):
+                        batch_errors = {}
+                except Exception as e:
+                    batch_errors = {i: e for i in range(len(batch_objects))}
+                
+                for i, chunk in enumerate(batch_chunks):
+                    if i in batch_errors:
+                        error = batch_errors[i]
+                        message = getattr(error, "message", str(error))
+                        logger.error(f"Failed to upload chunk {chunk.id}: {message}")
                         upload_results["failed_uploads"] += 1
                         upload_results["failed_chunk_ids"].append(chunk.id)
-                        upload_results["errors"].append(f"Chunk {chunk.id}: {str(e)}")
+                        upload_results["errors"].append(f"Chunk {chunk.id}: {message}")
+                    else:
+                        upload_results["successful_uploads"] += 1
+                        upload_results["uploaded_chunk_ids"].append(chunk.id)
             
             # Log results
             success_rate = (
@@ -466,44 +756,28 @@ class WeaviateVectorClient:
         return UploadResult(**upload_results)
     
     async def search_workspace(
-        self, workspace_slug: str, query: str, limit: int = 20
+        self, workspace_slug: str, query: str, limit: int = 20, alpha: Optional[float] = None
     ) -> List[Dict[str, Any]]:
-        """Execute vector search against workspace (tenant)"""
+        """
+        Execute search against workspace (tenant).
+        
+        Args:
+            workspace_slug: Workspace (tenant) to search
+            query: Search query text
+            limit: Maximum results
+            alpha: Vector weight for hybrid search (None = pure vector search)
+        """
         start_time = time.time()
         try:
             collection = self.client.collections.get(self.COLLECTION_NAME)
             tenant_collection = collection.with_tenant(workspace_slug)
             
-            # Perform near text search
-            response = tenant_collection.query.near_text(
-                query=query,
-                limit=limit,
-                return_metadata=MetadataQuery(distance=True, certainty=True)
-            )
+            response = await self._query_tenant(tenant_collection, query, None, limit, alpha)
             
             duration_ms = (time.time() - start_time) * 1000
             
             # Format results to match expected structure
-            results = []
-            for obj in response.objects:
-                result = {
-                    "content": obj.properties.get("content", ""),
-                    "metadata": {
-                        "source": obj.properties.get("source_url", ""),
-                        "document_id": obj.properties.get("document_id", ""),
-                        "chunk_id": obj.properties.get("chunk_id", ""),
-                        "technology": obj.properties.get("technology", ""),
-                        "distance": obj.metadata.distance if obj.metadata else None,
-                        "certainty": obj.metadata.certainty if obj.metadata else None,
-                        # TTL metadata
-                        "expires_at": obj.properties.get("expires_at"),
-                        "created_at": obj.properties.get("created_at"),
-                        "updated_at": obj.properties.get("updated_at"),
-                        "source_provider": obj.properties.get("source_provider", ""),
-                    },
-                    "id": str(obj.uuid) if obj.uuid else obj.properties.get("chunk_id", ""),
-                }
-                results.append(result)
+            results = self._format_search_results(response)
             
             if _service_logger:
                 _service_logger.log_service_call(
@@ -520,133 +794,496 @@ class WeaviateVectorClient:
             return results
             
         except Exception as e:
-            error_str = str(e).lower()
-            error_type = type(e).__name__
-            logger.info(f"Weaviate search exception for workspace '{workspace_slug}': {e} (type: {error_type})")
-            
-            # Handle data-related scenarios as empty results (not system errors)
-            data_related_errors = [
-                "tenant", "not found", "does not exist", "no such tenant", 
-                "no objects found", "empty", "no results", "no schema",
-                "collection", "class", "not exist"
-            ]
-            
-            if any(phrase in error_str for phrase in data_related_errors):
-                logger.info(f"Workspace '{workspace_slug}' has no data or doesn't exist - returning empty results")
-                return []
-            
-            # Log full exception details for system errors
-            logger.error(f"System error in workspace search '{workspace_slug}': {e}", exc_info=True)
-            raise WeaviateError(f"Search failed for workspace {workspace_slug}: {str(e)}")
+            return self._handle_search_error(workspace_slug, e)
     
-    async def list_workspace_documents(
-        self, workspace_slug: str
-    ) -> List[Dict[str, Any]]:
-        """List all documents in workspace (tenant)"""
-        try:
-            collection = self.client.collections.get(self.COLLECTION_NAME)
-            tenant_collection = collection.with_tenant(workspace_slug)
-            
-            # Query all objects and group by document_id
-            response = tenant_collection.query.fetch_objects(limit=10000)
+    async def search_workspaces(
+        self,
+        workspace_slugs: List[str],
+        query: str,
+        limit: int = 20,
+        alpha: Optional[float] = None,
+        timeout: Optional[float] = None,
+        return_exceptions: bool = False,
+    ) -> Dict[str, Union[List[Dict[str, Any]], Exception]]:
+        """
+        Execute one search across several workspaces (tenants).
+        
+        The query is embedded once via query_embedder and the same vector is sent
+        to every tenant (near_vector, or as the vector half of a hybrid query);
+        the tenant requests are multiplexed over the shared gRPC channel instead
+        of re-vectorizing the query text per workspace. Without an embedder each
+        tenant falls back to server-side vectorization.
+        
+        Args:
+            workspace_slugs: Workspaces (tenants) to search
+            query: Search query text
+            limit: Maximum results per workspace
+            alpha: Vector weight for hybrid search (None = pure vector search)
+            timeout: Seconds each tenant query may take; a slow tenant fails
+                with asyncio.TimeoutError without affecting the others
+            return_exceptions: Map failed workspaces to their exception
+                instead of omitting them
             
-            # Group by document
-            documents_map = {}
-            for obj in response.objects:
-                doc_id = obj.properties.get("document_id", "unknown")
-                if doc_id not in documents_map:
-                    documents_map[doc_id] = {
-                        "id": doc_id,
-                        "title": obj.properties.get("document_title", "Untitled"),
-                        "chunks": 0,
-                        "technology": obj.properties.get("technology", ""),
-                        "source_url": obj.properties.get("source_url", ""),
-                        # TTL metadata
-                        "expires_at": obj.properties.get("expires_at"),
-                        "created_at": obj.properties.get("created_at"),
-                        "updated_at": obj.properties.get("updated_at"),
-                        "source_provider": obj.properties.get("source_provider", ""),
-                    }
-                documents_map[doc_id]["chunks"] += 1
+        Returns:
+            Dict mapping workspace slug to formatted results. Workspaces whose
+            search failed with a system error or timed out are omitted, or
+            mapped to the exception with return_exceptions.
             
-            return list(documents_map.values())
+        Raises:
+            WeaviateError: If every workspace search failed (unless
+                return_exceptions is set)
+        """
+        if not workspace_slugs:
+            return {}
+        
+        start_time = time.time()
+        query_vector = None if alpha is not None and alpha <= 0.0 else await self.embed_query(query)
+        embed_ms = (time.time() - start_time) * 1000
+        
+        collection = self.client.collections.get(self.COLLECTION_NAME)
+        
+        async def _search_tenant(workspace_slug: str) -> List[Dict[str, Any]]:
+            tenant_collection = collection.with_tenant(workspace_slug)
+            try:
+                response = await asyncio.wait_for(
+                    self._query_tenant(tenant_collection, query, query_vector, limit, alpha),
+                    timeout=timeout,
+                )
+                return self._format_search_results(response)
+            except asyncio.TimeoutError:
+                raise
+            except Exception as e:
+                return self._handle_search_error(workspace_slug, e)
+        
+        outcomes = await asyncio.gather(
+            *[_search_tenant(slug) for slug in workspace_slugs], return_exceptions=True
+        )
+        
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        errors = []
+        for workspace_slug, outcome in zip(workspace_slugs, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(
+                    f"Batched search failed for workspace '{workspace_slug}': "
+                    f"{outcome or type(outcome).__name__}"
+                )
+                errors.append(outcome)
+                if return_exceptions:
+                    results[workspace_slug] = outcome
+            else:
+                results[workspace_slug] = outcome
+        
+        duration_ms = (time.time() - start_time) * 1000
+        logger.info(
+            f"Batched search across {len(workspace_slugs)} workspaces completed in "
+            f"{duration_ms:.1f}ms (embedding: {embed_ms:.1f}ms, "
+            f"mode: {self._search_mode(query_vector, alpha)}, "
+            f"failed: {len(errors)})"
+        )
+        
+        if _service_logger:
+            _service_logger.log_service_call(
+                service="weaviate",
+                endpoint="/v1/graphql",
+                method="POST",
+                duration_ms=duration_ms,
+                status_code=200 if results else 500,
+                workspace_count=len(workspace_slugs),
+                query_length=len(query),
+                result_count=sum(len(r) for r in results.values() if not isinstance(r, Exception))
+            )
+        
+        if not return_exceptions and not results and errors:
+            raise WeaviateError(
+                f"Search failed for all {len(workspace_slugs)} workspaces: {errors[0]}"
+            )
+        
+        return results
+    
+    async def iter_search_workspaces(
+        self,
+        workspace_slugs: List[str],
+        query: str,
+        limit: int = 20,
+        alpha: Optional[float] = None,
+    ) -> AsyncIterator[Tuple[str, Union[List[Dict[str, Any]], Exception]]]:
+        """
+        Search several workspaces, yielding each tenant's results as it completes.
+        
+        Same query embedding and tenant queries as search_workspaces, but the
+        caller can rank and return before the slowest tenant answers. Closing
+        the iterator cancels the tenant queries still running.
+        
+        Args:
+            workspace_slugs: Workspaces (tenants) to search
+            query: Search query text
+            limit: Maximum results per workspace
+            alpha: Vector weight for hybrid search (None = pure vector search)
             
+        Yields:
+            (workspace_slug, formatted results or the exception raised)
+        """
+        if not workspace_slugs:
+            return
+        
+        query_vector = None if alpha is not None and alpha <= 0.0 else await self.embed_query(query)
+        collection = self.client.collections.get(self.COLLECTION_NAME)
+        
+        async def _search_tenant(workspace_slug: str):
+            tenant_collection = collection.with_tenant(workspace_slug)
+            try:
+                response = await self._query_tenant(
+                    tenant_collection, query, query_vector, limit, alpha
+                )
+                return workspace_slug, self._format_search_results(response)
+            except Exception as e:
+                try:
+                    return workspace_slug, self._handle_search_error(workspace_slug, e)
+                except Exception as error:
+                    return workspace_slug, error
+        
+        tasks = [asyncio.create_task(_search_tenant(slug)) for slug in workspace_slugs]
+        try:
+            for next_completed in asyncio.as_completed(tasks):
+                yield await next_completed
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    @staticmethod
+    def _search_mode(query_vector: Optional[List[float]], alpha: Optional[float]) -> str:
+        """Name the query type used for a tenant search"""
+        if alpha is not None and alpha <= 0.0:
+            return "bm25"
+        if alpha is not None and alpha < 1.0:
+            return "hybrid"
+        return "near_vector" if query_vector is not None else "near_text"
+    
+    async def _query_tenant(
+        self,
+        tenant_collection: Any,
+        query: str,
+        query_vector: Optional[List[float]],
+        limit: int,
+        alpha: Optional[float],
+    ) -> Any:
+        """
+        Run the tenant query selected by alpha.
+        
+        alpha <= 0 issues a BM25 query, 0 < alpha < 1 a hybrid query fusing
+        BM25 and vector rankings inside Weaviate, and None or 1 a pure vector
+        query (near_vector with a precomputed vector, otherwise near_text).
+        """
+        mode = self._search_mode(query_vector, alpha)
+        if mode == "bm25":
+            return await self._call(
+                tenant_collection.query.bm25,
+                query=query,
+                limit=limit,
+                return_metadata=MetadataQuery(score=True)
+            )
+        if mode == "hybrid":
+            hybrid_config = getattr(self.config, "hybrid_search", None)
+            fusion_type = (
+                HybridFusion.RELATIVE_SCORE
+                if getattr(hybrid_config, "fusion_type", "ranked") == "relative_score"
+                else HybridFusion.RANKED
+            )
+            return await self._call(
+                tenant_collection.query.hybrid,
+                query=query,
+                vector=query_vector,
+                alpha=alpha,
+                fusion_type=fusion_type,
+                limit=limit,
+                return_metadata=MetadataQuery(score=True, distance=True)
+            )
+        if mode == "near_vector":
+            return await self._call(
+                tenant_collection.query.near_vector,
+                near_vector=query_vector,
+                limit=limit,
+                return_metadata=MetadataQuery(distance=True, certainty=True)
+            )
+        return await self._call(
+            tenant_collection.query.near_text,
+            query=query,
+            limit=limit,
+            return_metadata=MetadataQuery(distance=True, certainty=True)
+        )
+    
+    def set_query_embedder(
+        self,
+        query_embedder: Optional[Callable[[str], Awaitable[List[float]]]],
+        namespace: str = "default",
+    ) -> None:
+        """
+        Set the coroutine function used to embed search queries.
+        
+        The embedder is wrapped in a QueryEmbeddingCache (in-process LRU plus
+        Redis when a cache manager is available) unless caching is disabled.
+        
+        Args:
+            query_embedder: Coroutine function returning a query vector, or None
+            namespace: Embedding model identifier used to partition cache keys
+        """
+        cache_size = getattr(self.config, "query_embedding_cache_size", 2048)
+        if query_embedder is None or cache_size <= 0:
+            self.embedding_cache = None
+            self.query_embedder = query_embedder
+            return
+        
+        self.embedding_cache = QueryEmbeddingCache(
+            query_embedder,
+            cache_manager=self.cache_manager,
+            maxsize=cache_size,
+            ttl_seconds=getattr(self.config, "query_embedding_cache_ttl", 86400),
+            namespace=namespace,
+        )
+        self.query_embedder = self.embedding_cache
+    
+    async def _embed_documents(self, texts: List[str]) -> Optional[List[List[float]]]:
+        """
+        Embed chunk texts with the configured document_embedder.
+        
+        Returns:
+            One vector per text, or None when no embedder is configured or
+            embedding failed (chunks are then stored without vectors)
+        """
+        if self.document_embedder is None or not texts:
+            return None
+        try:
+            vectors = await self.document_embedder(texts)
         except Exception as e:
-            logger.error(f"Failed to list documents: {e}")
-            raise WeaviateError(f"Failed to list documents: {str(e)}")
+            logger.warning(f"Document embedding failed, storing chunks without vectors: {e}")
+            return None
+        if vectors is None or len(vectors) != len(texts):
+            logger.warning("Document embedder returned a mismatched batch, storing chunks without vectors")
+            return None
+        return [list(vector) for vector in vectors]
+    
+    def get_embedding_cache_stats(self) -> Dict[str, Any]:
+        """Get query embedding cache hit-rate metrics"""
+        if self.embedding_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.embedding_cache.get_stats()}
     
-    async def delete_document(self, workspace_slug: str, document_id: str) -> bool:
-        """Delete document from workspace (tenant)"""
+    async def embed_query(self, query: str) -> Optional[List[float]]:
+        """
+        Embed query text with the configured query_embedder.
+        
+        Returns:
+            Query vector, or None when no embedder is configured or embedding
+            failed (callers fall back to server-side near_text)
+        """
+        if self.query_embedder is None:
+            return None
         try:
-            collection = self.client.collections.get(self.COLLECTION_NAME)
-            tenant_collection = collection.with_tenant(workspace_slug)
-            
-            # Delete all chunks belonging to this document
-            # For now, iterate through objects and delete individually
-            response = tenant_collection.query.fetch_objects(limit=10000)
-            deleted_count = 0
-            for obj in response.objects:
-                if obj.properties.get("document_id") == document_id:
-                    tenant_collection.data.delete_by_id(obj.uuid)
-                    deleted_count += 1
+            vector = await self.query_embedder(query)
+            return list(vector) if vector is not None else None
+        except Exception as e:
+            logger.warning(f"Query embedding failed, falling back to near_text: {e}")
+            return None
+    
+    def _format_search_results(self, response: Any) -> List[Dict[str, Any]]:
+        """Format Weaviate query response objects to the search result structure"""
+        results = []
+        for obj in response.objects:
+            result = {
+                "content": obj.properties.get("content", ""),
+                "metadata": {
+                    "source": obj.properties.get("source_url", ""),
+                    "document_id": obj.properties.get("document_id", ""),
+                    "chunk_id": obj.properties.get("chunk_id", ""),
+                    "technology": obj.properties.get("technology", ""),
+                    "distance": obj.metadata.distance if obj.metadata else None,
+                    "certainty": obj.metadata.certainty if obj.metadata else None,
+                    "score": getattr(obj.metadata, "score", None) if obj.metadata else None,
+                    # TTL metadata
+                    "expires_at": obj.properties.get("expires_at"),
+                    "created_at": obj.properties.get("created_at"),
+                    "updated_at": obj.properties.get("updated_at"),
+                    "source_provider": obj.properties.get("source_provider", ""),
+                },
+                "id": str(obj.uuid) if obj.uuid else obj.properties.get("chunk_id", ""),
+            }
+            results.append(result)
+        return results
+    
+    def _handle_search_error(self, workspace_slug: str, e: Exception) -> List[Dict[str, Any]]:
+        """Map data-related search errors to empty results, raise on system errors"""
+        error_str = str(e).lower()
+        error_type = type(e).__name__
+        logger.info(f"Weaviate search exception for workspace '{workspace_slug}': {e} (type: {error_type})")
+        
+        # Handle data-related scenarios as empty results (not system errors)
+        data_related_errors = [
+            "tenant", "not found", "does not exist", "no such tenant", 
+            "no objects found", "empty", "no results", "no schema",
+            "collection", "class", "not exist"
+        ]
+        
+        if any(phrase in error_str for phrase in data_related_errors):
+            logger.info(f"Workspace '{workspace_slug}' has no data or doesn't exist - returning empty results")
+            return []
+        
+        # Log full exception details for system errors
+        logger.error(f"System error in workspace search '{workspace_slug}': {e}", exc_info=True)
+        raise WeaviateError(f"Search failed for workspace {workspace_slug}: {str(e)}")
+    
+    # Properties needed to summarize documents from their chunks
+    DOCUMENT_SUMMARY_PROPERTIES = [
+        "document_id", "document_title", "technology", "source_url",
+        "expires_at", "created_at", "updated_at", "source_provider",
+    ]
+    
+    async def iter_workspace_objects(
+        self,
+        workspace_slug: str,
+        properties: Optional[List[str]] = None,
+        page_size: int = 500,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        max_objects: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Stream objects from a workspace (tenant) using Weaviate's cursor API.
+        
+        Pages are fetched with fetch_objects(after=<last uuid>) so memory stays
+        bounded by page_size regardless of tenant size, and only the requested
+        properties are returned (no vectors). Weaviate's cursor cannot be
+        combined with where-filters, so filtering is done with predicate on
+        each page as it streams.
+        
+        Args:
+            workspace_slug: The workspace to iterate
+            properties: Properties to return (None returns all)
+            page_size: Objects fetched per request
+            predicate: Optional filter applied to each object's properties
+            max_objects: Stop after scanning this many objects
+            
+        Yields:
+            Weaviate objects (uuid, properties)
+        """
+        collection = self.client.collections.get(self.COLLECTION_NAME)
+        tenant_collection = collection.with_tenant(workspace_slug)
+        
+        after = None
+        scanned = 0
+        while True:
+            fetch_kwargs = {"limit": page_size}
+            if after is not None:
+                fetch_kwargs["after"] = after
+            if properties is not None:
+                fetch_kwargs["return_properties"] = properties
+            
+            response = await self._call(tenant_collection.query.fetch_objects, **fetch_kwargs)
+            objects = response.objects
+            
+            for obj in objects:
+                scanned += 1
+                if predicate is None or predicate(obj.properties):
+                    yield obj
+                if max_objects is not None and scanned >= max_objects:
+                    return
+            
+            if len(objects) < page_size or objects[-1].uuid == after:
+                return
+            after = objects[-1].uuid
+    
+    async def aggregate_documents(
+        self,
+        workspace_slug: str,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        max_objects: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Group a workspace's chunks into document summaries while streaming.
+        
+        Only one page of chunks is held in memory; the result holds one entry
+        per document.
+        
+        Args:
+            workspace_slug: The workspace to scan
+            predicate: Optional filter on chunk properties
+            max_objects: Stop after scanning this many chunks
             
-            logger.info(f"Deleted document {document_id} from workspace {workspace_slug}")
-            return True
+        Returns:
+            List of document summaries with chunk counts
+        """
+        documents_map: Dict[str, Dict[str, Any]] = {}
+        async for obj in self.iter_workspace_objects(
+            workspace_slug,
+            properties=self.DOCUMENT_SUMMARY_PROPERTIES,
+            predicate=predicate,
+            max_objects=max_objects,
+        ):
+            self._add_chunk_to_documents(documents_map, obj.properties)
+        return list(documents_map.values())
+    
+    @staticmethod
+    def _add_chunk_to_documents(documents_map: Dict[str, Dict[str, Any]], properties: Dict[str, Any]) -> None:
+        """Count a chunk towards its document summary"""
+        doc_id = properties.get("document_id", "unknown")
+        if doc_id not in documents_map:
+            documents_map[doc_id] = {
+                "id": doc_id,
+                "title": properties.get("document_title", "Untitled"),
+                "chunks": 0,
+                "technology": properties.get("technology", ""),
+                "source_url": properties.get("source_url", ""),
+                # TTL metadata
+                "expires_at": properties.get("expires_at"),
+                "created_at": properties.get("created_at"),
+                "updated_at": properties.get("updated_at"),
+                "source_provider": properties.get("source_provider", ""),
+            }
+        documents_map[doc_id]["chunks"] += 1
+    
+    @staticmethod
+    def _as_naive_utc(value: Any) -> Any:
+        """Convert timezone-aware datetimes returned by Weaviate to naive UTC"""
+        if isinstance(value, datetime) and value.tzinfo is not None:
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+    
+    @classmethod
+    def _expired_predicate(cls, current_time: datetime) -> Callable[[Dict[str, Any]], bool]:
+        """Build a predicate matching chunks that expired before current_time (naive UTC)"""
+        def is_expired(properties: Dict[str, Any]) -> bool:
+            expires_at = cls._as_naive_utc(properties.get("expires_at"))
+            return isinstance(expires_at, datetime) and expires_at < current_time
+        return is_expired
+    
+    async def list_workspace_documents(
+        self, workspace_slug: str
+    ) -> List[Dict[str, Any]]:
+        """List all documents in workspace (tenant)"""
+        try:
+            return await self.aggregate_documents(workspace_slug)
             
         except Exception as e:
-            logger.error(f"Failed to delete document: {e}")
-            if "not found" in str(e).lower():
-                return True  # Already deleted
-            raise WeaviateError(f"Failed to delete document: {str(e)}")
+            logger.error(f"Failed to list documents: {e}")
+            raise WeaviateError(f"Failed to list documents: {str(e)}")
     
-    async def get_expired_documents(self, workspace_slug: str, limit: int = 10000) -> List[Dict[str, Any]]:
+    async def get_expired_documents(self, workspace_slug: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get documents that have expired based on TTL.
         
         Args:
             workspace_slug: The workspace to search in
-            limit: Maximum number of objects to fetch (default: 10000)
+            limit: Maximum number of chunks to scan (default: whole tenant)
             
         Returns:
             List of expired documents with metadata
         """
         try:
-            collection = self.client.collections.get(self.COLLECTION_NAME)
-            tenant_collection = collection.with_tenant(workspace_slug)
-            
-            # Query objects with larger limit to handle big datasets
-            response = tenant_collection.query.fetch_objects(limit=limit)
-            
-            # Group by document and filter expired ones
-            documents_map = {}
-            current_time = datetime.utcnow()
-            processed_chunks = 0
-            
-            logger.info(f"Scanning {len(response.objects)} chunks for expired documents in workspace '{workspace_slug}'")
-            
-            for obj in response.objects:
-                processed_chunks += 1
-                
-                # Check if document is expired
-                expires_at = obj.properties.get("expires_at")
-                if expires_at and isinstance(expires_at, datetime) and expires_at < current_time:
-                    doc_id = obj.properties.get("document_id", "unknown")
-                    if doc_id not in documents_map:
-                        documents_map[doc_id] = {
-                            "id": doc_id,
-                            "title": obj.properties.get("document_title", "Untitled"),
-                            "chunks": 0,
-                            "technology": obj.properties.get("technology", ""),
-                            "source_url": obj.properties.get("source_url", ""),
-                            "expires_at": obj.properties.get("expires_at"),
-                            "created_at": obj.properties.get("created_at"),
-                            "updated_at": obj.properties.get("updated_at"),
-                            "source_provider": obj.properties.get("source_provider", ""),
-                        }
-                    documents_map[doc_id]["chunks"] += 1
-            
-            expired_docs = list(documents_map.values())
-            logger.info(f"Found {len(expired_docs)} expired documents out of {processed_chunks} total chunks")
+            logger.info(f"Scanning chunks for expired documents in workspace '{workspace_slug}'")
+            expired_docs = await self.aggregate_documents(
+                workspace_slug,
+                predicate=self._expired_predicate(datetime.utcnow()),
+                max_objects=limit,
+            )
+            logger.info(f"Found {len(expired_docs)} expired documents in workspace '{workspace_slug}'")
             
             return expired_docs
             
@@ -654,79 +1291,55 @@ class WeaviateVectorClient:
             logger.error(f"Failed to get expired documents in workspace '{workspace_slug}': {e}")
             raise WeaviateError(f"Failed to get expired documents: {str(e)}")
     
-    async def cleanup_expired_documents(self, workspace_slug: str, batch_size: int = 50, correlation_id: str = None) -> Dict[str, Any]:
+    async def cleanup_expired_documents(self, workspace_slug: str, correlation_id: str = None) -> Dict[str, Any]:
         """
         Clean up expired documents from workspace.
         
+        Expired chunks (expires_at < now) are removed by a single server-side
+        filtered delete_many; no objects are fetched. Chunk counts are the
+        exact numbers reported by Weaviate, and the number of affected
+        documents comes from one grouped aggregate over the same filter.
+        
         Args:
             workspace_slug: The workspace to clean up
-            batch_size: Number of documents to process in each batch (default: 50)
             correlation_id: Optional correlation ID for tracking
             
         Returns:
             Dictionary with cleanup statistics
         """
         start_time = datetime.utcnow()
-        perf_start = time.time()
         if correlation_id is None:
             correlation_id = f"wv_cleanup_{uuid.uuid4().hex[:8]}"
         
         try:
-            collection = self.client.collections.get(self.COLLECTION_NAME)
-            tenant_collection = collection.with_tenant(workspace_slug)
-            
-            # Query for expired documents
             logger.info(f"Starting cleanup of expired documents in workspace '{workspace_slug}'")
-            expired_docs = await self.get_expired_documents(workspace_slug)
+            cutoff = datetime.now(timezone.utc)
+            expired_documents = await self._count_expired_documents(workspace_slug, cutoff)
+            counts = await self.delete_many(workspace_slug, expired_before=cutoff)
+            cleanup_duration = (datetime.utcnow() - start_time).total_seconds()
             
-            if not expired_docs:
+            if counts["matched"] == 0:
                 return {
                     "deleted_documents": 0,
                     "deleted_chunks": 0,
                     "message": "No expired documents found",
-                    "duration_seconds": (datetime.utcnow() - start_time).total_seconds()
+                    "duration_seconds": cleanup_duration
                 }
             
-            logger.info(f"Found {len(expired_docs)} expired documents to clean up")
-            
-            # Delete expired documents in batches
-            deleted_chunks = 0
-            failed_deletions = []
-            successful_deletions = []
-            
-            for i in range(0, len(expired_docs), batch_size):
-                batch = expired_docs[i:i + batch_size]
-                logger.info(f"Processing batch {i//batch_size + 1}/{(len(expired_docs) + batch_size - 1)//batch_size}")
-                
-                for doc in batch:
-                    try:
-                        # Delete document using the existing delete method
-                        success = await self.delete_document(workspace_slug, doc["id"])
-                        if success:
-                            deleted_chunks += doc["chunks"]
-                            successful_deletions.append(doc["id"])
-                            logger.info(f"Deleted expired document {doc['id']} with {doc['chunks']} chunks")
-                        else:
-                            failed_deletions.append(doc["id"])
-                            logger.warning(f"Failed to delete document {doc['id']}")
-                    except Exception as e:
-                        failed_deletions.append(doc["id"])
-                        logger.error(f"Error deleting document {doc['id']}: {e}")
-                        continue
-            
-            cleanup_duration = (datetime.utcnow() - start_time).total_seconds()
-            
             result = {
-                "deleted_documents": len(successful_deletions),
-                "deleted_chunks": deleted_chunks,
-                "failed_deletions": len(failed_deletions),
-                "message": f"Successfully cleaned up {len(successful_deletions)} expired documents",
+                "deleted_documents": expired_documents,
+                "deleted_chunks": counts["deleted"],
+                "failed_deletions": counts["failed"],
+                "message": f"Successfully cleaned up {expired_documents} expired documents",
                 "duration_seconds": cleanup_duration
             }
             
-            if failed_deletions:
-                result["failed_document_ids"] = failed_deletions
-                result["message"] += f" ({len(failed_deletions)} failed)"
+            if counts["failed"]:
+                result["message"] += f" ({counts['failed']} chunks failed)"
+                logger.warning(
+                    f"{counts['failed']} expired chunks failed to delete in workspace "
+                    f"'{workspace_slug}' (correlation_id={correlation_id})"
+                )
             
             logger.info(f"Cleanup completed in {cleanup_duration:.2f}s: {result['message']}")
             
@@ -736,53 +1349,109 @@ class WeaviateVectorClient:
             logger.error(f"Failed to cleanup expired documents in workspace '{workspace_slug}': {e}")
             raise WeaviateError(f"Failed to cleanup expired documents: {str(e)}")
     
-    async def get_documents_by_provider(self, workspace_slug: str, source_provider: str, limit: int = 10000) -> List[Dict[str, Any]]:
+    async def _count_expired_documents(self, workspace_slug: str, expired_before: datetime) -> int:
+        """Count documents with chunks expiring before a time (server-side aggregate)"""
+        collection = self.client.collections.get(self.COLLECTION_NAME)
+        tenant_collection = collection.with_tenant(workspace_slug)
+        try:
+            response = await self._call(
+                tenant_collection.aggregate.over_all,
+                filters=Filter.by_property("expires_at").less_than(expired_before),
+                group_by=GroupByAggregate(prop="document_id"),
+                total_count=True,
+            )
+            return len(response.groups)
+        except Exception as e:
+            logger.warning(f"Could not count expired documents in workspace '{workspace_slug}': {e}")
+            return 0
+    
+    async def delete_many(
+        self,
+        workspace_slug: str,
+        document_ids: Optional[List[str]] = None,
+        expired_before: Optional[datetime] = None,
+        dry_run: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Delete chunks matching a server-side filter from workspace (tenant).
+        
+        Filters are combined with AND: document_id in document_ids and/or
+        expires_at < expired_before. Weaviate caps the objects removed per
+        request (QUERY_MAXIMUM_RESULTS), so the request is repeated until no
+        more objects match.
+        
+        Args:
+            workspace_slug: The workspace to delete from
+            document_ids: Only delete chunks of these documents
+            expired_before: Only delete chunks expiring before this time
+            dry_run: Count matching chunks without deleting them
+            
+        Returns:
+            Dict with exact "matched", "deleted" and "failed" chunk counts and
+            the number of "requests" issued
+            
+        Raises:
+            ValueError: If no filter is given (refuses to delete a whole tenant)
+        """
+        filters = []
+        if document_ids is not None:
+            if not document_ids:
+                return {"matched": 0, "deleted": 0, "failed": 0, "requests": 0}
+            filters.append(Filter.by_property("document_id").contains_any(list(document_ids)))
+        if expired_before is not None:
+            if expired_before.tzinfo is None:
+                expired_before = expired_before.replace(tzinfo=timezone.utc)
+            filters.append(Filter.by_property("expires_at").less_than(expired_before))
+        if not filters:
+            raise ValueError("delete_many requires document_ids and/or expired_before")
+        
+        where = filters[0] if len(filters) == 1 else Filter.all_of(filters)
+        
+        collection = self.client.collections.get(self.COLLECTION_NAME)
+        tenant_collection = collection.with_tenant(workspace_slug)
+        
+        totals = {"matched": 0, "deleted": 0, "failed": 0, "requests": 0}
+        start_time = time.time()
+        while True:
+            result = await self._call(
+                tenant_collection.data.delete_many, where=where, dry_run=dry_run
+            )
+            totals["requests"] += 1
+            totals["matched"] += result.matches
+            totals["deleted"] += result.successful
+            totals["failed"] += result.failed
+            
+            # Stop when the filter is exhausted or a request had failures
+            # (failed objects would match again and be double counted)
+            if dry_run or result.matches == 0 or result.failed or result.successful == 0:
+                break
+        
+        duration_ms = (time.time() - start_time) * 1000
+        logger.info(
+            f"delete_many in workspace '{workspace_slug}': {totals['deleted']} deleted, "
+            f"{totals['failed']} failed in {totals['requests']} requests ({duration_ms:.1f}ms)"
+        )
+        return totals
+    
+    async def get_documents_by_provider(self, workspace_slug: str, source_provider: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get documents by source provider.
         
         Args:
             workspace_slug: The workspace to search in
             source_provider: The source provider to filter by
-            limit: Maximum number of objects to fetch (default: 10000)
+            limit: Maximum number of chunks to scan (default: whole tenant)
             
         Returns:
             List of documents from the specified provider
         """
         try:
-            collection = self.client.collections.get(self.COLLECTION_NAME)
-            tenant_collection = collection.with_tenant(workspace_slug)
-            
-            # Query all documents and filter by provider in Python
-            response = tenant_collection.query.fetch_objects(limit=limit)
-            
-            # Group by document and filter by provider
-            documents_map = {}
-            processed_chunks = 0
-            
-            logger.info(f"Scanning {len(response.objects)} chunks for provider '{source_provider}' in workspace '{workspace_slug}'")
-            
-            for obj in response.objects:
-                processed_chunks += 1
-                obj_provider = obj.properties.get("source_provider", "")
-                
-                if obj_provider == source_provider:
-                    doc_id = obj.properties.get("document_id", "unknown")
-                    if doc_id not in documents_map:
-                        documents_map[doc_id] = {
-                            "id": doc_id,
-                            "title": obj.properties.get("document_title", "Untitled"),
-                            "chunks": 0,
-                            "technology": obj.properties.get("technology", ""),
-                            "source_url": obj.properties.get("source_url", ""),
-                            "expires_at": obj.properties.get("expires_at"),
-                            "created_at": obj.properties.get("created_at"),
-                            "updated_at": obj.properties.get("updated_at"),
-                            "source_provider": obj.properties.get("source_provider", ""),
-                        }
-                    documents_map[doc_id]["chunks"] += 1
-            
-            filtered_docs = list(documents_map.values())
-            logger.info(f"Found {len(filtered_docs)} documents from provider '{source_provider}' out of {processed_chunks} total chunks")
+            filtered_docs = await self.aggregate_documents(
+                workspace_slug,
+                predicate=lambda properties: properties.get("source_provider", "") == source_provider,
+                max_objects=limit,
+            )
+            logger.info(f"Found {len(filtered_docs)} documents from provider '{source_provider}' in workspace '{workspace_slug}'")
             
             return filtered_docs
             
@@ -790,81 +1459,22 @@ class WeaviateVectorClient:
             logger.error(f"Failed to get documents by provider '{source_provider}' in workspace '{workspace_slug}': {e}")
             raise WeaviateError(f"Failed to get documents by provider: {str(e)}")
     
-    async def get_expired_documents_optimized(self, workspace_slug: str, limit: int = 10000) -> List[Dict[str, Any]]:
+    async def get_expired_documents_optimized(self, workspace_slug: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Get expired documents using Weaviate's native filtering (when available).
+        Get expired documents (kept for API compatibility).
         
-        This method attempts to use Weaviate's where filtering to improve performance
-        for large datasets. Falls back to Python filtering if native filtering fails.
+        get_expired_documents now streams the tenant with the cursor API and
+        only fetches the properties needed for document summaries, so this is
+        an alias.
         
         Args:
             workspace_slug: The workspace to search in
-            limit: Maximum number of objects to fetch (default: 10000)
+            limit: Maximum number of chunks to scan (default: whole tenant)
             
         Returns:
             List of expired documents with metadata
         """
-        try:
-            collection = self.client.collections.get(self.COLLECTION_NAME)
-            tenant_collection = collection.with_tenant(workspace_slug)
-            
-            current_time = datetime.utcnow()
-            
-            # Try to use Weaviate's native filtering for better performance
-            try:
-                # Note: Weaviate v4 client doesn't support 'where' in fetch_objects
-                # This is a placeholder for when Weaviate supports native date filtering
-                logger.info("Native filtering not available in current Weaviate version")
-                raise NotImplementedError("Native filtering not supported")
-                
-            except Exception as filter_error:
-                logger.warning(f"Native filtering failed, falling back to Python filtering: {filter_error}")
-                # Fall back to regular fetch and Python filtering
-                response = tenant_collection.query.fetch_objects(limit=limit)
-                
-                # Filter in Python
-                filtered_objects = []
-                for obj in response.objects:
-                    expires_at = obj.properties.get("expires_at")
-                    if expires_at and isinstance(expires_at, datetime) and expires_at < current_time:
-                        filtered_objects.append(obj)
-                
-                # Create a mock response object for consistency
-                class MockResponse:
-                    def __init__(self, objects):
-                        self.objects = objects
-                
-                response = MockResponse(filtered_objects)
-                logger.info(f"Using Python filtering: found {len(response.objects)} expired chunks")
-            
-            # Group by document
-            documents_map = {}
-            for obj in response.objects:
-                doc_id = obj.properties.get("document_id", "unknown")
-                if doc_id not in documents_map:
-                    documents_map[doc_id] = {
-                        "id": doc_id,
-                        "title": obj.properties.get("document_title", "Untitled"),
-                        "chunks": 0,
-                        "technology": obj.properties.get("technology", ""),
-                        "source_url": obj.properties.get("source_url", ""),
-                        "expires_at": obj.properties.get("expires_at"),
-                        "created_at": obj.properties.get("created_at"),
-                        "updated_at": obj.properties.get("updated_at"),
-                        "source_provider": obj.properties.get("source_provider", ""),
-                    }
-                documents_map[doc_id]["chunks"] += 1
-            
-            expired_docs = list(documents_map.values())
-            logger.info(f"Optimized query found {len(expired_docs)} expired documents")
-            
-            return expired_docs
-            
-        except Exception as e:
-            logger.error(f"Failed to get expired documents (optimized) in workspace '{workspace_slug}': {e}")
-            # Fall back to the regular method
-            logger.info("Falling back to regular get_expired_documents method")
-            return await self.get_expired_documents(workspace_slug, limit)
+        return await self.get_expired_documents(workspace_slug, limit)
     
     async def get_expiration_statistics(self, workspace_slug: str) -> Dict[str, Any]:
         """
@@ -877,17 +1487,11 @@ class WeaviateVectorClient:
             Dictionary with expiration statistics
         """
         try:
-            collection = self.client.collections.get(self.COLLECTION_NAME)
-            tenant_collection = collection.with_tenant(workspace_slug)
-            
-            # Get all documents with a very safe limit
-            response = tenant_collection.query.fetch_objects(limit=100)
-            
             current_time = datetime.utcnow()
             
             # Statistics tracking
             stats = {
-                "total_chunks": len(response.objects),
+                "total_chunks": 0,
                 "total_documents": 0,
                 "expired_documents": 0,
                 "expired_chunks": 0,
@@ -905,10 +1509,13 @@ class WeaviateVectorClient:
             
             documents_map = {}
             
-            # Process all chunks
-            for obj in response.objects:
+            # Process all chunks, streaming the tenant page by page
+            async for obj in self.iter_workspace_objects(
+                workspace_slug, properties=self.DOCUMENT_SUMMARY_PROPERTIES
+            ):
+                stats["total_chunks"] += 1
                 doc_id = obj.properties.get("document_id", "unknown")
-                expires_at = obj.properties.get("expires_at")
+                expires_at = self._as_naive_utc(obj.properties.get("expires_at"))
                 provider = obj.properties.get("source_provider", "unknown")
                 
                 # Track document
@@ -999,38 +1606,18 @@ class WeaviateVectorClient:
             Dict with deletion results
         """
         try:
-            collection = self.client.collections.get(self.COLLECTION_NAME)
-            tenant_collection = collection.with_tenant(workspace_slug)
-            
-            # First, find all chunks for this document
-            response = tenant_collection.query.fetch_objects(
-                where=weaviate.classes.query.Filter.by_property("document_id").equal(document_id),
-                limit=10000
-            )
-            
-            chunk_ids = []
-            for obj in response.objects:
-                chunk_ids.append(obj.uuid)
-            
-            # Delete all chunks
-            deleted_count = 0
-            for chunk_id in chunk_ids:
-                try:
-                    tenant_collection.data.delete_by_id(chunk_id)
-                    deleted_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to delete chunk {chunk_id}: {e}")
+            counts = await self.delete_many(workspace_slug, document_ids=[document_id])
             
             result = {
                 "document_id": document_id,
                 "workspace_slug": workspace_slug,
-                "total_chunks": len(chunk_ids),
-                "deleted_chunks": deleted_count,
-                "success": deleted_count > 0,
+                "total_chunks": counts["matched"],
+                "deleted_chunks": counts["deleted"],
+                "success": counts["deleted"] > 0 and counts["failed"] == 0,
                 "deleted_at": datetime.utcnow().isoformat()
             }
             
-            logger.info(f"Deleted document {document_id}: {deleted_count}/{len(chunk_ids)} chunks")
+            logger.info(f"Deleted document {document_id}: {counts['deleted']}/{counts['matched']} chunks")
             return result
             
         except Exception as e:
@@ -1070,8 +1657,9 @@ class WeaviateVectorClient:
             ttl_timestamps = self._calculate_ttl_timestamps(new_ttl_days)
             
             # Find all chunks for this document
-            response = tenant_collection.query.fetch_objects(
-                where=weaviate.classes.query.Filter.by_property("document_id").equal(document_id),
+            response = await self._call(
+                tenant_collection.query.fetch_objects,
+                filters=Filter.by_property("document_id").equal(document_id),
                 limit=10000
             )
             
@@ -1079,7 +1667,8 @@ class WeaviateVectorClient:
             for obj in response.objects:
                 try:
                     # Update TTL properties
-                    tenant_collection.data.update(
+                    await self._call(
+                        tenant_collection.data.update,
                         uuid=obj.uuid,
                         properties={
                             "expires_at": ttl_timestamps["expires_at"],
@@ -1137,8 +1726,9 @@ class WeaviateVectorClient:
             tenant_collection = collection.with_tenant(workspace_slug)
             
             # Find first chunk for this document to get TTL info
-            response = tenant_collection.query.fetch_objects(
-                where=weaviate.classes.query.Filter.by_property("document_id").equal(document_id),
+            response = await self._call(
+                tenant_collection.query.fetch_objects,
+                filters=Filter.by_property("document_id").equal(document_id),
                 limit=1
             )
             
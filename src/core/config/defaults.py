@@ -50,6 +50,63 @@ def get_environment_overrides() -> Dict[str, Any]:
         # Weaviate configuration
         "WEAVIATE_ENDPOINT": "weaviate.endpoint",
         "WEAVIATE_API_KEY": "weaviate.api_key",
+        "WEAVIATE_USE_ASYNC_CLIENT": ("weaviate.use_async_client", lambda x: x.lower() == "true"),
+        "WEAVIATE_EXECUTOR_MAX_WORKERS": ("weaviate.executor_max_workers", int),
+        "WEAVIATE_QUERY_EMBEDDING_CACHE_SIZE": ("weaviate.query_embedding_cache_size", int),
+        "WEAVIATE_QUERY_EMBEDDING_CACHE_TTL": ("weaviate.query_embedding_cache_ttl", int),
+        "WEAVIATE_HYBRID_SEARCH_ENABLED": (
+            "weaviate.hybrid_search.enabled", lambda x: x.lower() == "true"
+        ),
+        "WEAVIATE_HYBRID_RRF_K": ("weaviate.hybrid_search.rrf_k", int),
+        "WEAVIATE_WORKSPACE_CATALOG_ENABLED": (
+            "weaviate.workspace_catalog.enabled", lambda x: x.lower() == "true"
+        ),
+        "WEAVIATE_WORKSPACE_CATALOG_TTL": ("weaviate.workspace_catalog.refresh_ttl_seconds", int),
+        # Search cache configuration
+        "SEARCH_CACHE_LOCAL_ENABLED": (
+            "search_cache.local_cache_enabled", lambda x: x.lower() == "true"
+        ),
+        "SEARCH_CACHE_LOCAL_MAX_BYTES": ("search_cache.local_cache_max_bytes", int),
+        "SEARCH_CACHE_LOCAL_MAX_ENTRIES": ("search_cache.local_cache_max_entries", int),
+        "SEARCH_CACHE_LOCAL_TTL_SECONDS": ("search_cache.local_cache_ttl_seconds", int),
+        "SEARCH_CACHE_STATS_SAMPLE_RATE": ("search_cache.stats_sample_rate", float),
+        "SEARCH_CACHE_SINGLE_FLIGHT_ENABLED": (
+            "search_cache.single_flight_enabled", lambda x: x.lower() == "true"
+        ),
+        "SEARCH_CACHE_DISTRIBUTED_LOCK_ENABLED": (
+            "search_cache.distributed_lock_enabled", lambda x: x.lower() == "true"
+        ),
+        "SEARCH_CACHE_LOCK_TTL_SECONDS": ("search_cache.lock_ttl_seconds", int),
+        "SEARCH_CACHE_LOCK_WAIT_TIMEOUT_SECONDS": ("search_cache.lock_wait_timeout_seconds", float),
+        "SEARCH_CACHE_SWR_ENABLED": (
+            "search_cache.stale_while_revalidate_enabled", lambda x: x.lower() == "true"
+        ),
+        "SEARCH_CACHE_SOFT_TTL_SECONDS": ("search_cache.stale_window.soft_ttl_seconds", int),
+        "SEARCH_CACHE_STALE_WINDOW_SECONDS": ("search_cache.stale_window.stale_window_seconds", int),
+        "SEARCH_CACHE_WARMING_ENABLED": (
+            "search_cache.warming_enabled", lambda x: x.lower() == "true"
+        ),
+        "SEARCH_CACHE_WARM_ON_STARTUP": (
+            "search_cache.warm_on_startup", lambda x: x.lower() == "true"
+        ),
+        "SEARCH_CACHE_WARMING_QUERY_LIMIT": ("search_cache.warming_query_limit", int),
+        "SEARCH_CACHE_WARMING_MAX_CONCURRENCY": ("search_cache.warming_max_concurrency", int),
+        "SEARCH_CACHE_SEMANTIC_ENABLED": (
+            "search_cache.semantic_cache_enabled", lambda x: x.lower() == "true"
+        ),
+        "SEARCH_CACHE_SEMANTIC_THRESHOLD": ("search_cache.semantic_similarity_threshold", float),
+        "SEARCH_PIPELINE_MERGED_EVALUATION": (
+            "search_pipeline.merged_evaluation_enabled", lambda x: x.lower() == "true"
+        ),
+        "SEARCH_PIPELINE_SPECULATIVE_EXTERNAL": (
+            "search_pipeline.speculative_external_search_enabled", lambda x: x.lower() == "true"
+        ),
+        "SEARCH_PIPELINE_LOCAL_EVALUATION": (
+            "search_pipeline.local_evaluation_enabled", lambda x: x.lower() == "true"
+        ),
+        "SEARCH_PIPELINE_LOCAL_MIN_CONFIDENCE": (
+            "search_pipeline.local_evaluation_min_confidence", float
+        ),
         # GitHub configuration
         "GITHUB_API_TOKEN": "github.api_token",
         # AI configuration
@@ -57,12 +114,16 @@ def get_environment_overrides() -> Dict[str, Any]:
         "AI_FALLBACK_PROVIDER": "ai.fallback_provider",
         "AI_ENABLE_FAILOVER": ("ai.enable_failover", lambda x: x.lower() == "true"),
         "AI_CACHE_TTL_SECONDS": ("ai.cache_ttl_seconds", int),
+        "AI_BATCHING_ENABLED": ("ai.batching.enabled", lambda x: x.lower() == "true"),
+        "AI_BATCHING_WINDOW_MS": ("ai.batching.window_ms", int),
+        "AI_BATCHING_MAX_TOKENS": ("ai.batching.max_batch_tokens", int),
         # Ollama configuration
         "AI_OLLAMA_ENDPOINT": "ai.ollama.endpoint",
         "AI_OLLAMA_MODEL": "ai.ollama.model",
         "AI_OLLAMA_TEMPERATURE": ("ai.ollama.temperature", float),
         "AI_OLLAMA_MAX_TOKENS": ("ai.ollama.max_tokens", int),
         "AI_OLLAMA_TIMEOUT": ("ai.ollama.timeout_seconds", int),
+        "AI_OLLAMA_EMBEDDING_MODEL": "ai.ollama.embedding_model",
         # OpenAI configuration
         "AI_OPENAI_API_KEY": "ai.openai.api_key",
         "AI_OPENAI_MODEL": "ai.openai.model",
@@ -235,6 +235,8 @@ class ConfigurationLoader:
                 OllamaConfig,
                 OpenAIConfig,
                 MCPConfig,
+                SearchCacheConfig,
+                SearchPipelineConfig,
             )
 
             # Build individual configuration sections with fallback defaults
@@ -244,6 +246,8 @@ class ConfigurationLoader:
             github_config = GitHubConfig(**config_dict.get("github", {}))
             scraping_config = ScrapingConfig(**config_dict.get("scraping", {}))
             redis_config = RedisConfig(**config_dict.get("redis", {}))
+            search_cache_config = SearchCacheConfig(**config_dict.get("search_cache", {}))
+            search_pipeline_config = SearchPipelineConfig(**config_dict.get("search_pipeline", {}))
 
             # Build AI configuration with nested providers
             ai_dict = config_dict.get("ai", {})
@@ -265,6 +269,7 @@ class ConfigurationLoader:
                 fallback_provider=ai_dict.get("fallback_provider", "openai"),
                 enable_failover=ai_dict.get("enable_failover", True),
                 cache_ttl_seconds=ai_dict.get("cache_ttl_seconds", 3600),
+                batching=ai_dict.get("batching", {}),
                 ollama=ollama_config,
                 openai=openai_config,
             )
@@ -286,6 +291,8 @@ class ConfigurationLoader:
                 scraping=scraping_config,
                 redis=redis_config,
                 ai=ai_config,
+                search_cache=search_cache_config,
+                search_pipeline=search_pipeline_config,
                 mcp=mcp_config if mcp_config else MCPConfig(),
             )
 
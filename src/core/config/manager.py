@@ -317,6 +317,8 @@ class ConfigurationManager:
                 MCPConfig,
                 EnrichmentConfig,
                 Context7Config,
+                SearchCacheConfig,
+                SearchPipelineConfig,
             )
 
             # Build configuration sections with defaults
@@ -349,6 +351,7 @@ class ConfigurationManager:
                 fallback_provider=ai_dict.get("fallback_provider", "openai"),
                 enable_failover=ai_dict.get("enable_failover", True),
                 cache_ttl_seconds=ai_dict.get("cache_ttl_seconds", 3600),
+                batching=ai_dict.get("batching", {}),
                 ollama=ollama_config,
                 openai=openai_config,
             )
@@ -359,6 +362,10 @@ class ConfigurationManager:
             # Build Context7 configuration
             context7_config = Context7Config(**config_dict.get("context7", {}))
 
+            # Build search cache configuration
+            search_cache_config = SearchCacheConfig(**config_dict.get("search_cache", {}))
+            search_pipeline_config = SearchPipelineConfig(**config_dict.get("search_pipeline", {}))
+
             # Build MCP configuration
             mcp_config = None
             if "mcp" in config_dict:
@@ -374,6 +381,8 @@ class ConfigurationManager:
                 scraping=scraping_config,
                 redis=redis_config,
                 ai=ai_config,
+                search_cache=search_cache_config,
+                search_pipeline=search_pipeline_config,
                 enrichment=enrichment_config,
                 context7=context7_config,
                 mcp=mcp_config,
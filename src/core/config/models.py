@@ -53,6 +53,53 @@ class ContentConfig(BaseModel):
     )
 
 
+class HybridSearchConfig(BaseModel):
+    """Hybrid BM25 + vector retrieval settings"""
+
+    enabled: bool = Field(
+        True, description="Use Weaviate hybrid/BM25 queries with reciprocal-rank fusion"
+    )
+    strategy_alpha: Dict[str, float] = Field(
+        default_factory=lambda: {
+            "vector": 1.0,
+            "hybrid": 0.5,
+            "metadata": 0.0,
+            "faceted": 0.3,
+        },
+        description="Vector weight per search strategy (0 = pure BM25, 1 = pure vector)",
+    )
+    fusion_type: Literal["ranked", "relative_score"] = Field(
+        "ranked", description="Weaviate fusion of BM25 and vector scores within a workspace"
+    )
+    rrf_k: int = Field(
+        60, ge=1, description="Reciprocal-rank fusion constant for merging workspace result lists"
+    )
+
+    @field_validator("strategy_alpha")
+    @classmethod
+    def validate_alpha(cls, v: Dict[str, float]) -> Dict[str, float]:
+        """Validate alpha values are within [0, 1]"""
+        for strategy, alpha in v.items():
+            if not 0.0 <= alpha <= 1.0:
+                raise ValueError(f"Alpha for strategy '{strategy}' must be between 0 and 1")
+        return {strategy.lower(): alpha for strategy, alpha in v.items()}
+
+
+class WorkspaceCatalogConfig(BaseModel):
+    """Cached workspace (tenant) catalog used for workspace selection"""
+
+    enabled: bool = Field(
+        True, description="Serve workspace selection from the in-process catalog"
+    )
+    refresh_ttl_seconds: int = Field(
+        300, ge=5, description="Refresh the catalog in the background after this many seconds"
+    )
+    invalidation_channel: str = Field(
+        "weaviate:workspaces:changed",
+        description="Redis pub/sub channel announcing tenant create/delete to all workers",
+    )
+
+
 class WeaviateConfig(BaseModel):
     """Weaviate vector database configuration"""
 
@@ -61,6 +108,20 @@ class WeaviateConfig(BaseModel):
     )
     api_key: str = Field("development-key", description="API key for authentication")
     grpc_port: int = Field(50051, description="gRPC port for Weaviate")
+    use_async_client: bool = Field(
+        True, description="Use the native async Weaviate client instead of the sync client"
+    )
+    executor_max_workers: int = Field(
+        8, ge=1, le=64, description="Worker threads for sync client calls when async is disabled"
+    )
+    query_embedding_cache_size: int = Field(
+        2048, ge=0, description="In-process query embedding cache entries (0 disables caching)"
+    )
+    query_embedding_cache_ttl: int = Field(
+        86400, ge=60, description="Redis TTL for cached query embeddings in seconds"
+    )
+    hybrid_search: HybridSearchConfig = Field(default_factory=HybridSearchConfig)
+    workspace_catalog: WorkspaceCatalogConfig = Field(default_factory=WorkspaceCatalogConfig)
     circuit_breaker: CircuitBreakerConfig = Field(
         default_factory=lambda: CircuitBreakerConfig(
             failure_threshold=3, recovery_timeout=60, timeout_seconds=30
@@ -160,6 +221,130 @@ class RedisConfig(BaseModel):
         return v.lower()
 
 
+class StaleWindowConfig(BaseModel):
+    """Soft TTL and stale-serving window for cached search results"""
+
+    soft_ttl_seconds: int = Field(
+        3600, ge=1, description="Seconds a cached result is served as fresh"
+    )
+    stale_window_seconds: int = Field(
+        900, ge=0, description="Seconds after the soft TTL a result may be served while refreshing"
+    )
+
+
+class SearchCacheConfig(BaseModel):
+    """Search result cache configuration (process-local L1 in front of Redis)"""
+
+    local_cache_enabled: bool = Field(
+        True, description="Enable the in-process L1 search result cache"
+    )
+    local_cache_max_bytes: int = Field(
+        32 * 1024 * 1024, ge=0, description="Maximum serialized bytes held in the L1 cache"
+    )
+    local_cache_max_entries: int = Field(
+        1024, ge=1, description="Maximum entries held in the L1 cache"
+    )
+    local_cache_ttl_seconds: int = Field(
+        60, ge=1, description="Upper bound on L1 entry lifetime (bounds cross-worker staleness)"
+    )
+    invalidation_channel: str = Field(
+        "search:cache:invalidate", description="Redis pub/sub channel for L1 invalidation"
+    )
+    stats_sample_rate: float = Field(
+        0.1, ge=0.0, le=1.0, description="Fraction of cache hits recorded in Redis counters"
+    )
+    single_flight_enabled: bool = Field(
+        True, description="Coalesce identical concurrent cache misses into one pipeline run"
+    )
+    distributed_lock_enabled: bool = Field(
+        False, description="Also coalesce across workers using a Redis lock per cache key"
+    )
+    lock_ttl_seconds: int = Field(
+        35, ge=1, description="Redis single-flight lock TTL (should exceed the search timeout)"
+    )
+    lock_wait_timeout_seconds: float = Field(
+        30.0, ge=0.0, description="Maximum wait for another worker's result before executing locally"
+    )
+    lock_poll_interval_ms: int = Field(
+        100, ge=10, description="Result cache poll interval while another worker holds the lock"
+    )
+    stale_while_revalidate_enabled: bool = Field(
+        True, description="Serve soft-expired results immediately and refresh in the background"
+    )
+    stale_window: StaleWindowConfig = Field(
+        default_factory=StaleWindowConfig, description="Default soft TTL and stale window"
+    )
+    technology_stale_windows: Dict[str, StaleWindowConfig] = Field(
+        default_factory=dict, description="Per-technology soft TTL and stale window overrides"
+    )
+    refresh_lock_ttl_seconds: int = Field(
+        60, ge=1, description="Cross-worker lock TTL deduplicating background refreshes"
+    )
+    warming_enabled: bool = Field(
+        True, description="Replay popular queries from search history to pre-populate the cache"
+    )
+    warm_on_startup: bool = Field(
+        True, description="Warm the cache after startup (deploys); full flushes always re-warm"
+    )
+    warming_query_limit: int = Field(
+        200, ge=1, description="Maximum popular queries replayed per warming run"
+    )
+    warming_min_access_count: int = Field(
+        2, ge=1, description="Minimum search_cache access_count for a query to be warmed"
+    )
+    warming_lookback_days: int = Field(
+        7, ge=1, description="Only warm queries accessed within this many days"
+    )
+    warming_max_concurrency: int = Field(
+        4, ge=1, le=32, description="Maximum concurrent query replays while warming"
+    )
+    warming_off_peak_start_hour: int = Field(
+        2, ge=0, le=23, description="Start of the off-peak warming window (UTC hour)"
+    )
+    warming_off_peak_end_hour: int = Field(
+        6, ge=0, le=23, description="End of the off-peak warming window (UTC hour, exclusive)"
+    )
+    semantic_cache_enabled: bool = Field(
+        True, description="Serve cached results for near-duplicate queries by embedding similarity"
+    )
+    semantic_similarity_threshold: float = Field(
+        0.92, ge=0.0, le=1.0, description="Minimum query embedding cosine similarity for a semantic hit"
+    )
+    semantic_cache_max_entries: int = Field(
+        2048, ge=1, description="Maximum query embeddings held in the in-process semantic index"
+    )
+
+
+class SearchPipelineConfig(BaseModel):
+    """Search pipeline LLM stage planning"""
+
+    merged_evaluation_enabled: bool = Field(
+        True, description="Evaluate results and decide on external search in one LLM call"
+    )
+    speculative_external_search_enabled: bool = Field(
+        True, description="Start external search alongside evaluation when internal results are sparse"
+    )
+    speculative_external_result_threshold: int = Field(
+        3, ge=0, description="Speculate when the workspace search returns fewer results than this"
+    )
+    local_evaluation_enabled: bool = Field(
+        True, description="Evaluate results locally and only call the LLM when uncertain"
+    )
+    local_evaluation_min_confidence: float = Field(
+        0.8, ge=0.5, le=1.0, description="Local evaluation confidence below which the LLM evaluates"
+    )
+    local_evaluation_boundary: float = Field(
+        0.6, ge=0.0, le=1.0, description="Local relevance below which external search is needed"
+    )
+    local_evaluation_slope: float = Field(
+        12.0, gt=0.0, description="Logistic slope of the local confidence calibration"
+    )
+    local_evaluation_sample_rate: float = Field(
+        0.0, ge=0.0, le=1.0,
+        description="Fraction of confident local evaluations also sent to the LLM and logged for replay",
+    )
+
+
 class OllamaConfig(BaseModel):
     """Ollama LLM provider configuration"""
 
@@ -168,6 +353,10 @@ class OllamaConfig(BaseModel):
     temperature: float = Field(0.7, ge=0.0, le=2.0, description="Model temperature")
     max_tokens: int = Field(4096, ge=1, description="Maximum tokens in response")
     timeout_seconds: int = Field(60, ge=1, description="Request timeout")
+    embedding_model: str = Field(
+        "nomic-embed-text",
+        description="Model embedding search queries and document chunks (empty disables)",
+    )
     circuit_breaker: CircuitBreakerConfig = Field(
         default_factory=lambda: CircuitBreakerConfig(
             failure_threshold=3, recovery_timeout=60, timeout_seconds=30
@@ -224,6 +413,22 @@ class ProviderConfig(BaseModel):
     embedding_config: Optional[Dict[str, Any]] = Field(None, description="Embedding configuration")
 
 
+class LLMBatchingConfig(BaseModel):
+    """Micro-batching of small concurrent LLM prompts"""
+
+    enabled: bool = Field(True, description="Coalesce concurrent prompts into multi-item LLM calls")
+    window_ms: int = Field(
+        15, ge=0, le=1000, description="How long a batch collects prompts before it is sent"
+    )
+    max_batch_items: int = Field(16, ge=1, le=128, description="Maximum prompts packed into one call")
+    max_batch_tokens: int = Field(
+        3000, ge=256, description="Estimated prompt token budget of one batched call"
+    )
+    max_concurrency: int = Field(
+        2, ge=1, description="Concurrent batched calls per provider without a provider limit"
+    )
+
+
 class AIConfig(BaseModel):
     """Enhanced AI provider configuration with multi-provider support"""
 
@@ -246,6 +451,7 @@ class AIConfig(BaseModel):
     cache_ttl_seconds: int = Field(3600, ge=0, description="Cache TTL for LLM responses")
     load_balancing_enabled: bool = Field(False, description="Enable load balancing")
     health_check_interval: int = Field(300, ge=30, description="Health check interval in seconds")
+    batching: LLMBatchingConfig = Field(default_factory=LLMBatchingConfig)
     
     @model_validator(mode='after')
     def ensure_legacy_providers_in_providers(self):
@@ -708,6 +914,12 @@ class SystemConfiguration(BaseModel):
     scraping: ScrapingConfig
     redis: RedisConfig
     ai: AIConfig
+    search_cache: SearchCacheConfig = Field(
+        default_factory=SearchCacheConfig, description="Search result cache configuration"
+    )
+    search_pipeline: SearchPipelineConfig = Field(
+        default_factory=SearchPipelineConfig, description="Search pipeline LLM stage planning"
+    )
     enrichment: EnrichmentConfig = Field(default_factory=EnrichmentConfig)
     context7: Context7Config = Field(default_factory=Context7Config, description="Context7 ingestion configuration")
     mcp: MCPConfig = Field(default_factory=MCPConfig, description="MCP configuration")
@@ -11,8 +11,9 @@ import gzip
 import json
 import os
 import time
+import uuid
 from contextlib import asynccontextmanager
-from typing import Optional, Dict, Any, List, Tuple, AsyncContextManager
+from typing import Optional, Dict, Any, List, Sequence, Tuple, AsyncContextManager, AsyncIterator, Union
 from datetime import datetime
 
 import redis.asyncio as redis
@@ -22,10 +23,13 @@ from sqlalchemy.ext.asyncio import (
     AsyncSession,
     AsyncEngine,
 )
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy import text, Row
 from pydantic import BaseModel
 
+from .query_registry import CompiledQuery, QueryRegistry, extract_table_name
+
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +49,32 @@ except ImportError:
     logger.warning("DatabaseLogger not available - using basic logging")
 
 
+# Named connection pools. "default" serves writes and unhinted queries; the
+# others isolate hot search lookups, admin analytics and background jobs so a
+# long scan in one class cannot exhaust the connections of another. Each value
+# can be overridden with DATABASE_POOL_<NAME>_SIZE, _MAX_OVERFLOW, _TIMEOUT
+# (seconds to wait for a connection) and _COMMAND_TIMEOUT (seconds per query).
+POOL_DEFAULTS: Dict[str, Dict[str, int]] = {
+    "default": {"size": 10, "max_overflow": 20, "timeout": 30, "command_timeout": 60},
+    "search": {"size": 10, "max_overflow": 10, "timeout": 5, "command_timeout": 15},
+    "analytics": {"size": 3, "max_overflow": 2, "timeout": 30, "command_timeout": 120},
+    "jobs": {"size": 2, "max_overflow": 3, "timeout": 60, "command_timeout": 600},
+}
+
+# Statements that may run on a read replica when a pool hint is given
+READ_ONLY_OPERATIONS = ("SELECT", "WITH")
+
+
+def pool_settings(name: str) -> Dict[str, int]:
+    """Pool size and timeouts for a named pool, with environment overrides"""
+    settings = dict(POOL_DEFAULTS[name])
+    for key in settings:
+        value = os.environ.get(f"DATABASE_POOL_{name.upper()}_{key.upper()}")
+        if value:
+            settings[key] = int(value)
+    return settings
+
+
 # Canonical data models from PRD-002
 class DocumentMetadata(BaseModel):
     """Document metadata model for compatibility"""
@@ -131,6 +161,16 @@ class DatabaseManager:
         self.session_factory: Optional[async_sessionmaker] = None
         self._connected = False
         self._connection_pool_stats = {"active": 0, "idle": 0, "size": 1}
+        self.query_registry = QueryRegistry()
+        # Optional read replica for hinted read-only queries
+        self.replica_url = os.environ.get("DATABASE_READ_REPLICA_URL") or None
+        # (pool name, replica) -> engine/session factory for non-default pools
+        self._engines: Dict[Tuple[str, bool], AsyncEngine] = {}
+        self._session_factories: Dict[Tuple[str, bool], async_sessionmaker] = {}
+        self._pool_wait_stats: Dict[str, Dict[str, float]] = {
+            name: {"checkouts": 0, "wait_ms_total": 0.0, "wait_ms_max": 0.0, "timeouts": 0}
+            for name in POOL_DEFAULTS
+        }
 
     async def connect(self) -> None:
         """Establish async database connection with proper connection pooling"""
@@ -138,32 +178,24 @@ class DatabaseManager:
         try:
             if _db_logger:
                 _db_logger.log_connection_event("connection_attempt", client_ip="localhost")
-            # Create async engine with PostgreSQL-specific configuration
-            connect_args = {
-                "server_settings": {
-                    "application_name": "docaiche",
-                    "jit": "off"  # Disable JIT for more predictable performance
-                },
-                "command_timeout": 60,
-                "prepared_statement_cache_size": 0,  # Disable to prevent cache bloat
-            }
-            pool_size = 10
-            max_overflow = 20
-            
-            self.engine = create_async_engine(
-                self.database_url,
-                echo=False,  # Set to True for SQL logging in debug mode
-                pool_pre_ping=True,
-                pool_recycle=3600,
-                pool_size=pool_size,
-                max_overflow=max_overflow,
-                connect_args=connect_args,
-            )
-
-            # Create session factory
+            # Create one engine per named pool; non-default pools also get a
+            # replica engine when a read replica is configured
+            self.engine = self._create_engine(self.database_url, "default")
             self.session_factory = async_sessionmaker(
                 self.engine, class_=AsyncSession, expire_on_commit=False
             )
+            for name in POOL_DEFAULTS:
+                if name == "default":
+                    continue
+                targets = [(False, self.database_url)]
+                if self.replica_url:
+                    targets.append((True, self.replica_url))
+                for replica, url in targets:
+                    engine = self._create_engine(url, name)
+                    self._engines[(name, replica)] = engine
+                    self._session_factories[(name, replica)] = async_sessionmaker(
+                        engine, class_=AsyncSession, expire_on_commit=False
+                    )
 
             # Test connection and configure PostgreSQL-specific settings
             async with self.engine.begin() as conn:
@@ -179,7 +211,8 @@ class DatabaseManager:
             self._connected = True
             connection_duration = (time.time() - start_time) * 1000
             logger.info(
-                "Database connection established successfully (PostgreSQL)"
+                "Database connection established successfully (PostgreSQL, "
+                f"pools: {', '.join(POOL_DEFAULTS)}, read replica: {'yes' if self.replica_url else 'no'})"
             )
             if _db_logger:
                 _db_logger.log_connection_event(
@@ -206,19 +239,23 @@ class DatabaseManager:
         if self.engine:
             if _db_logger:
                 _db_logger.log_connection_event("disconnection_initiated", client_ip="localhost")
+            for engine in self._engines.values():
+                await engine.dispose()
+            self._engines.clear()
+            self._session_factories.clear()
             await self.engine.dispose()
             self._connected = False
             logger.info("Database connection closed")
             if _db_logger:
                 _db_logger.log_connection_event("disconnection_completed", client_ip="localhost")
 
-    async def execute(self, query: str, params: Tuple = ()) -> None:
+    async def execute(self, query: str, params = ()) -> None:
         """
         Execute a SQL query with parameters.
 
         Args:
-            query: SQL query string with ? placeholders for positional parameters
-            params: Query parameters as tuple
+            query: SQL query string with :named or ? placeholders
+            params: Query parameters as tuple (for ? placeholders) or dict (for :named placeholders)
 
         Raises:
             SQLAlchemyError: If query execution fails
@@ -227,22 +264,13 @@ class DatabaseManager:
             await self.connect()
 
         start_time = time.time()
-        operation_type = query.strip().split()[0].upper()
-        table_name = self._extract_table_name(query)
+        compiled, bind_params = self.query_registry.prepare(query, params)
+        operation_type = compiled.operation
+        table_name = compiled.table
         
         try:
             async with self.session_factory() as session:
-                # Convert positional parameters to dictionary for SQLAlchemy text()
-                if params:
-                    # For ? placeholders, convert to numbered parameters
-                    param_dict = {f"param_{i}": param for i, param in enumerate(params)}
-                    # Replace ? with :param_0, :param_1, etc.
-                    query_modified = query
-                    for i in range(len(params)):
-                        query_modified = query_modified.replace("?", f":param_{i}", 1)
-                    await session.execute(text(query_modified), param_dict)
-                else:
-                    await session.execute(text(query))
+                await self._execute_compiled(session, compiled, bind_params)
                 await session.commit()
                 
                 # Log successful execution
@@ -253,7 +281,7 @@ class DatabaseManager:
                         table=table_name,
                         duration_ms=duration_ms,
                         rows_affected=1,  # Estimate for execute operations
-                        query_hash=hash(query) % 10000,
+                        query_hash=compiled.query_hash,
                         client_ip="localhost"
                     )
                     
@@ -267,18 +295,74 @@ class DatabaseManager:
                     duration_ms=duration_ms,
                     rows_affected=0,
                     error_message=str(e),
-                    query_hash=hash(query) % 10000,
+                    query_hash=compiled.query_hash,
+                    client_ip="localhost"
+                )
+            raise
+
+    async def execute_many(self, query: str, params_list: Sequence[Any]) -> None:
+        """
+        Execute one statement for each parameter set in a single round trip.
+
+        The statement is compiled once and run as an executemany, so batches
+        of any size share one registry entry and prepared statement.
+
+        Args:
+            query: SQL query string with :named or ? placeholders
+            params_list: One tuple or dict of parameters per execution
+
+        Raises:
+            SQLAlchemyError: If query execution fails
+        """
+        if not params_list:
+            return
+        if not self._connected:
+            await self.connect()
+
+        start_time = time.time()
+        compiled, _ = self.query_registry.prepare(query, params_list[0])
+        bind_params = [compiled.bind(params) for params in params_list]
+
+        try:
+            async with self.session_factory() as session:
+                await self._execute_compiled(session, compiled, bind_params)
+                await session.commit()
+
+                duration_ms = (time.time() - start_time) * 1000
+                if _db_logger:
+                    _db_logger.log_query_performance(
+                        operation=compiled.operation,
+                        table=compiled.table,
+                        duration_ms=duration_ms,
+                        rows_affected=len(bind_params),
+                        query_hash=compiled.query_hash,
+                        client_ip="localhost"
+                    )
+
+        except SQLAlchemyError as e:
+            duration_ms = (time.time() - start_time) * 1000
+            logger.error(f"Batch execution failed: {query[:100]}... Error: {e}")
+            if _db_logger:
+                _db_logger.log_query_performance(
+                    operation=f"{compiled.operation}_ERROR",
+                    table=compiled.table,
+                    duration_ms=duration_ms,
+                    rows_affected=0,
+                    error_message=str(e),
+                    query_hash=compiled.query_hash,
                     client_ip="localhost"
                 )
             raise
 
-    async def fetch_one(self, query: str, params = None) -> Optional[Row]:
+    async def fetch_one(self, query: str, params = None, pool: Optional[str] = None) -> Optional[Row]:
         """
         Fetch single row from query result.
 
         Args:
             query: SQL query string with :named or ? placeholders
             params: Query parameters as tuple (for ? placeholders) or dict (for :named placeholders)
+            pool: Connection pool hint ("search", "analytics", "jobs"); read-only
+                queries on a hinted pool use the read replica if configured
 
         Returns:
             Single row or None if no results
@@ -291,31 +375,12 @@ class DatabaseManager:
 
         start_time = time.time()
         operation_type = "SELECT_ONE"
-        table_name = self._extract_table_name(query)
+        compiled, bind_params = self.query_registry.prepare(query, params)
+        table_name = compiled.table
         
         try:
-            async with self.session_factory() as session:
-                if params is not None:
-                    if isinstance(params, dict):
-                        # Named parameters - use as-is
-                        result = await session.execute(text(query), params)
-                    elif isinstance(params, (tuple, list)):
-                        # Positional parameters - convert to named parameters
-                        param_dict = {}
-                        query_modified = query
-                        for i, value in enumerate(params):
-                            param_name = f"param_{i}"
-                            param_dict[param_name] = value
-                            # Replace ? with :param_0, :param_1, etc.
-                            query_modified = query_modified.replace("?", f":{param_name}", 1)
-                        result = await session.execute(text(query_modified), param_dict)
-                    else:
-                        # Single parameter value
-                        param_dict = {"param_0": params}
-                        query_modified = query.replace("?", ":param_0", 1)
-                        result = await session.execute(text(query_modified), param_dict)
-                else:
-                    result = await session.execute(text(query))
+            async with self._session(pool, compiled) as session:
+                result = await self._execute_compiled(session, compiled, bind_params)
                 row = result.fetchone()
                 
                 # Log successful fetch
@@ -327,7 +392,7 @@ class DatabaseManager:
                         table=table_name,
                         duration_ms=duration_ms,
                         rows_affected=rows_returned,
-                        query_hash=hash(query) % 10000,
+                        query_hash=compiled.query_hash,
                         client_ip="localhost"
                     )
                 
@@ -344,18 +409,20 @@ class DatabaseManager:
                     duration_ms=duration_ms,
                     rows_affected=0,
                     error_message=str(e),
-                    query_hash=hash(query) % 10000,
+                    query_hash=compiled.query_hash,
                     client_ip="localhost"
                 )
             raise
 
-    async def fetch_all(self, query: str, params = None) -> List[Row]:
+    async def fetch_all(self, query: str, params = None, pool: Optional[str] = None) -> List[Row]:
         """
         Fetch all rows from query result.
 
         Args:
             query: SQL query string with :named or ? placeholders
             params: Query parameters as tuple (for ? placeholders) or dict (for :named placeholders)
+            pool: Connection pool hint ("search", "analytics", "jobs"); read-only
+                queries on a hinted pool use the read replica if configured
 
         Returns:
             List of rows
@@ -368,31 +435,12 @@ class DatabaseManager:
 
         start_time = time.time()
         operation_type = "SELECT_ALL"
-        table_name = self._extract_table_name(query)
+        compiled, bind_params = self.query_registry.prepare(query, params)
+        table_name = compiled.table
         
         try:
-            async with self.session_factory() as session:
-                if params is not None:
-                    if isinstance(params, dict):
-                        # Named parameters - use as-is
-                        result = await session.execute(text(query), params)
-                    elif isinstance(params, (tuple, list)):
-                        # Positional parameters - convert to named parameters
-                        param_dict = {}
-                        query_modified = query
-                        for i, value in enumerate(params):
-                            param_name = f"param_{i}"
-                            param_dict[param_name] = value
-                            # Replace ? with :param_0, :param_1, etc.
-                            query_modified = query_modified.replace("?", f":{param_name}", 1)
-                        result = await session.execute(text(query_modified), param_dict)
-                    else:
-                        # Single parameter value
-                        param_dict = {"param_0": params}
-                        query_modified = query.replace("?", ":param_0", 1)
-                        result = await session.execute(text(query_modified), param_dict)
-                else:
-                    result = await session.execute(text(query))
+            async with self._session(pool, compiled) as session:
+                result = await self._execute_compiled(session, compiled, bind_params)
                 rows = result.fetchall()
                 
                 # Log successful fetch
@@ -404,7 +452,7 @@ class DatabaseManager:
                         table=table_name,
                         duration_ms=duration_ms,
                         rows_affected=rows_returned,
-                        query_hash=hash(query) % 10000,
+                        query_hash=compiled.query_hash,
                         client_ip="localhost"
                     )
                 
@@ -421,7 +469,143 @@ class DatabaseManager:
                     duration_ms=duration_ms,
                     rows_affected=0,
                     error_message=str(e),
-                    query_hash=hash(query) % 10000,
+                    query_hash=compiled.query_hash,
+                    client_ip="localhost"
+                )
+            raise
+
+    async def fetch_stream(
+        self, query: str, params = None, chunk_size: int = 1000, pool: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream rows from a query through a server-side cursor.
+
+        Rows are fetched chunk_size at a time, so large scans run in
+        constant memory and the first rows are available before the query
+        has been read to the end. The connection is held until the
+        generator is exhausted or closed.
+
+        Args:
+            query: SQL query string with :named or ? placeholders
+            params: Query parameters as tuple (for ? placeholders) or dict (for :named placeholders)
+            chunk_size: Rows fetched from the cursor per round trip
+            pool: Connection pool hint ("search", "analytics", "jobs"); read-only
+                queries on a hinted pool use the read replica if configured
+
+        Yields:
+            Rows as dicts
+
+        Raises:
+            SQLAlchemyError: If query execution fails
+        """
+        if not self._connected:
+            await self.connect()
+
+        start_time = time.time()
+        operation_type = "SELECT_STREAM"
+        compiled, bind_params = self.query_registry.prepare(query, params)
+        rows_returned = 0
+
+        try:
+            async with self._session(pool, compiled) as session:
+                result = await self._execute_compiled(
+                    session, compiled, bind_params, stream_chunk_size=chunk_size
+                )
+                async for partition in result.mappings().partitions(chunk_size):
+                    for row in partition:
+                        rows_returned += 1
+                        yield dict(row)
+
+            duration_ms = (time.time() - start_time) * 1000
+            if _db_logger:
+                _db_logger.log_query_performance(
+                    operation=operation_type,
+                    table=compiled.table,
+                    duration_ms=duration_ms,
+                    rows_affected=rows_returned,
+                    query_hash=compiled.query_hash,
+                    client_ip="localhost"
+                )
+
+        except SQLAlchemyError as e:
+            duration_ms = (time.time() - start_time) * 1000
+            logger.error(f"Query fetch_stream failed: {query[:100]}... Error: {e}")
+            if _db_logger:
+                _db_logger.log_query_performance(
+                    operation=f"{operation_type}_ERROR",
+                    table=compiled.table,
+                    duration_ms=duration_ms,
+                    rows_affected=rows_returned,
+                    error_message=str(e),
+                    query_hash=compiled.query_hash,
+                    client_ip="localhost"
+                )
+            raise
+
+    async def fetch_columns(
+        self, query: str, params = None, chunk_size: int = 1000, pool: Optional[str] = None
+    ) -> Dict[str, List[Any]]:
+        """
+        Fetch a query result as column arrays.
+
+        Rows are read through a server-side cursor and appended column by
+        column, without building a dict per row; suited to analytics that
+        aggregate or zip whole columns.
+
+        Args:
+            query: SQL query string with :named or ? placeholders
+            params: Query parameters as tuple (for ? placeholders) or dict (for :named placeholders)
+            chunk_size: Rows fetched from the cursor per round trip
+            pool: Connection pool hint ("search", "analytics", "jobs"); read-only
+                queries on a hinted pool use the read replica if configured
+
+        Returns:
+            Dict mapping each result column name to its list of values
+
+        Raises:
+            SQLAlchemyError: If query execution fails
+        """
+        if not self._connected:
+            await self.connect()
+
+        start_time = time.time()
+        operation_type = "SELECT_COLUMNS"
+        compiled, bind_params = self.query_registry.prepare(query, params)
+
+        try:
+            async with self._session(pool, compiled) as session:
+                result = await self._execute_compiled(
+                    session, compiled, bind_params, stream_chunk_size=chunk_size
+                )
+                names = list(result.keys())
+                columns: List[List[Any]] = [[] for _ in names]
+                async for partition in result.partitions(chunk_size):
+                    for column, values in zip(columns, zip(*partition)):
+                        column.extend(values)
+
+            duration_ms = (time.time() - start_time) * 1000
+            if _db_logger:
+                _db_logger.log_query_performance(
+                    operation=operation_type,
+                    table=compiled.table,
+                    duration_ms=duration_ms,
+                    rows_affected=len(columns[0]) if columns else 0,
+                    query_hash=compiled.query_hash,
+                    client_ip="localhost"
+                )
+            return dict(zip(names, columns))
+
+        except SQLAlchemyError as e:
+            duration_ms = (time.time() - start_time) * 1000
+            logger.error(f"Query fetch_columns failed: {query[:100]}... Error: {e}")
+            if _db_logger:
+                _db_logger.log_query_performance(
+                    operation=f"{operation_type}_ERROR",
+                    table=compiled.table,
+                    duration_ms=duration_ms,
+                    rows_affected=0,
+                    error_message=str(e),
+                    query_hash=compiled.query_hash,
                     client_ip="localhost"
                 )
             raise
@@ -449,21 +633,8 @@ class DatabaseManager:
             async with self.session_factory() as session:
                 async with session.begin():
                     for query, params in queries:
-                        # Convert positional parameters to dictionary for SQLAlchemy text()
-                        if params:
-                            # For ? placeholders, convert to numbered parameters
-                            param_dict = {
-                                f"param_{i}": param for i, param in enumerate(params)
-                            }
-                            # Replace ? with :param_0, :param_1, etc.
-                            query_modified = query
-                            for i in range(len(params)):
-                                query_modified = query_modified.replace(
-                                    "?", f":param_{i}", 1
-                                )
-                            await session.execute(text(query_modified), param_dict)
-                        else:
-                            await session.execute(text(query))
+                        compiled, bind_params = self.query_registry.prepare(query, params)
+                        await session.execute(compiled.statement, bind_params)
                     # Commit is automatic with async context manager
                 
                 # Log successful transaction
@@ -631,6 +802,7 @@ class DatabaseManager:
                 "database_url": self.database_url.split("://")[0] + "://[REDACTED]",
                 "test_query": test_result.test if test_result else None,
                 "health_check_duration_ms": duration_ms,
+                "pools": self.get_pool_stats(),
             }
             
             if _db_logger:
@@ -655,6 +827,101 @@ class DatabaseManager:
                 )
             return {"status": "unhealthy", "connected": False, "error": str(e)}
     
+    def get_pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-pool connection wait metrics and current pool occupancy.
+
+        Wait time is measured from opening a session to holding a
+        connection, so it covers queueing for a free connection as well as
+        establishing a new one.
+
+        Returns:
+            Dict of pool name -> checkouts, average/max wait, timeouts and
+            size/checked-out/overflow for the primary (and replica) engine
+        """
+        stats = {}
+        for name, wait in self._pool_wait_stats.items():
+            settings = pool_settings(name)
+            entry = {
+                "checkouts": wait["checkouts"],
+                "wait_ms_avg": wait["wait_ms_total"] / wait["checkouts"] if wait["checkouts"] else 0.0,
+                "wait_ms_max": wait["wait_ms_max"],
+                "timeouts": wait["timeouts"],
+                "pool_size": settings["size"],
+                "max_overflow": settings["max_overflow"],
+            }
+            engines = {"primary": self.engine} if name == "default" else {
+                "replica" if replica else "primary": engine
+                for (pool, replica), engine in self._engines.items() if pool == name
+            }
+            for role, engine in engines.items():
+                pool_impl = getattr(engine, "pool", None)
+                if pool_impl is not None and hasattr(pool_impl, "checkedout"):
+                    entry[role] = {
+                        "checked_out": pool_impl.checkedout(),
+                        "idle": pool_impl.checkedin(),
+                        "overflow": pool_impl.overflow(),
+                    }
+            stats[name] = entry
+        return stats
+
+    @asynccontextmanager
+    async def _session(self, pool: Optional[str], compiled: CompiledQuery) -> AsyncIterator[AsyncSession]:
+        """
+        Open a session on the pool named by a fetch hint.
+
+        Unhinted queries use the default pool. Read-only queries on a hinted
+        pool go to its replica engine when a read replica is configured. The
+        connection is acquired before yielding so the wait for it is
+        recorded against the pool.
+        """
+        name = pool or "default"
+        if name not in POOL_DEFAULTS:
+            raise ValueError(f"Unknown database pool '{pool}', expected one of {list(POOL_DEFAULTS)}")
+
+        factory = None
+        if name != "default":
+            replica = bool(self.replica_url) and compiled.operation in READ_ONLY_OPERATIONS
+            factory = self._session_factories.get((name, replica)) or self._session_factories.get((name, False))
+        factory = factory or self.session_factory
+
+        wait = self._pool_wait_stats[name]
+        start_time = time.perf_counter()
+        async with factory() as session:
+            try:
+                await session.connection()
+            except PoolTimeoutError:
+                wait["timeouts"] += 1
+                logger.warning(f"Timed out waiting for a '{name}' pool connection")
+                raise
+            wait_ms = (time.perf_counter() - start_time) * 1000
+            wait["checkouts"] += 1
+            wait["wait_ms_total"] += wait_ms
+            wait["wait_ms_max"] = max(wait["wait_ms_max"], wait_ms)
+            yield session
+
+    def _create_engine(self, url: str, pool: str) -> AsyncEngine:
+        """Create an async engine sized and timed out for a named pool"""
+        settings = pool_settings(pool)
+        connect_args = {
+            "server_settings": {
+                "application_name": f"docaiche-{pool}" if pool != "default" else "docaiche",
+                "jit": "off"  # Disable JIT for more predictable performance
+            },
+            "command_timeout": settings["command_timeout"],
+        }
+        connect_args.update(self._statement_cache_args())
+        return create_async_engine(
+            url,
+            echo=False,  # Set to True for SQL logging in debug mode
+            pool_pre_ping=True,
+            pool_recycle=3600,
+            pool_size=settings["size"],
+            max_overflow=settings["max_overflow"],
+            pool_timeout=settings["timeout"],
+            connect_args=connect_args,
+        )
+
     def _extract_table_name(self, query: str) -> str:
         """
         Extract table name from SQL query for logging purposes.
@@ -665,40 +932,70 @@ class DatabaseManager:
         Returns:
             Table name or 'unknown' if not found
         """
+        return extract_table_name(query)
+
+    async def _execute_compiled(
+        self,
+        session: AsyncSession,
+        compiled: CompiledQuery,
+        params: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]],
+        stream_chunk_size: Optional[int] = None,
+    ):
+        """
+        Execute a compiled query in a session.
+
+        A statement prepared before a schema change fails once with an
+        invalidated cached statement; SQLAlchemy then drops its prepared
+        statement cache, so the query is retried once. With
+        stream_chunk_size the query runs on a server-side cursor and an
+        AsyncResult is returned; a list of parameter dicts runs as an
+        executemany.
+        """
+        if stream_chunk_size:
+            run = lambda: session.stream(
+                compiled.statement, params, execution_options={"yield_per": stream_chunk_size}
+            )
+        else:
+            run = lambda: session.execute(compiled.statement, params)
         try:
-            # Simple regex-free table extraction for common SQL patterns
-            query_upper = query.upper().strip()
-            
-            # Handle SELECT queries
-            if query_upper.startswith('SELECT'):
-                if ' FROM ' in query_upper:
-                    from_part = query_upper.split(' FROM ')[1]
-                    table = from_part.split()[0].strip()
-                    return table.replace('`', '').replace('"', '').replace("'", '')
-            
-            # Handle INSERT queries
-            elif query_upper.startswith('INSERT'):
-                if ' INTO ' in query_upper:
-                    into_part = query_upper.split(' INTO ')[1]
-                    table = into_part.split()[0].strip()
-                    return table.replace('`', '').replace('"', '').replace("'", '')
-                    
-            # Handle UPDATE queries
-            elif query_upper.startswith('UPDATE'):
-                update_part = query_upper.split('UPDATE')[1].strip()
-                table = update_part.split()[0].strip()
-                return table.replace('`', '').replace('"', '').replace("'", '')
-                
-            # Handle DELETE queries
-            elif query_upper.startswith('DELETE'):
-                if ' FROM ' in query_upper:
-                    from_part = query_upper.split(' FROM ')[1]
-                    table = from_part.split()[0].strip()
-                    return table.replace('`', '').replace('"', '').replace("'", '')
-                    
-            return 'unknown'
-        except Exception:
-            return 'unknown'
+            return await run()
+        except DBAPIError as e:
+            if not _is_stale_statement_error(e):
+                raise
+            logger.info(f"Re-preparing invalidated statement for {compiled.table}")
+            await session.rollback()
+            return await run()
+
+    @staticmethod
+    def _statement_cache_args() -> Dict[str, Any]:
+        """
+        asyncpg prepared statement cache arguments.
+
+        Statements are cached per connection (DATABASE_STATEMENT_CACHE_SIZE,
+        LRU). Behind PgBouncer in transaction pooling mode
+        (DATABASE_PGBOUNCER=true) named statements cannot outlive a
+        transaction, so caching is disabled and statement names are unique.
+        """
+        if os.environ.get("DATABASE_PGBOUNCER", "false").lower() == "true":
+            return {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+            }
+        return {
+            "prepared_statement_cache_size": int(
+                os.environ.get("DATABASE_STATEMENT_CACHE_SIZE", "256")
+            ),
+        }
+
+
+def _is_stale_statement_error(error: DBAPIError) -> bool:
+    """Whether a DBAPI error is a prepared statement invalidated by DDL"""
+    orig = getattr(error, "orig", None)
+    return (
+        type(orig).__name__ == "InvalidCachedStatementError"
+        or "cache lookup failed" in str(orig or error)
+    )
 
 
 class CacheManager:
@@ -709,6 +1006,17 @@ class CacheManager:
     TTL management, and proper error handling.
     """
 
+    # Values under these key prefixes are gzip-compressed JSON
+    COMPRESSED_KEY_PREFIXES = (
+        "search:results:", "content:processed:", "github:repo:", "mcp:search:results:"
+    )
+
+    # Compare-and-delete so a lock is only released by its owner
+    _RELEASE_LOCK_SCRIPT = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('del', KEYS[1]) else return 0 end"
+    )
+
     def __init__(self, redis_config: Dict[str, Any]):
         """
         Initialize CacheManager with Redis configuration.
@@ -821,14 +1129,8 @@ class CacheManager:
                     )
                 return None
 
-            # Decompress if data is compressed
-            if key.startswith(
-                ("search:results:", "content:processed:", "github:repo:", "mcp:search:results:")
-            ):
-                data = gzip.decompress(data)
-
-            # Parse JSON
-            result = json.loads(data.decode("utf-8"))
+            # Decompress and parse JSON
+            result = self._decode_value(key, data)
             duration_ms = (time.time() - start_time) * 1000
             
             if self._cache_logger:
@@ -891,14 +1193,8 @@ class CacheManager:
             if not self._connected:
                 await self.connect()
 
-            # Serialize to JSON
-            data = json.dumps(value, default=str).encode("utf-8")
-
-            # Compress data for specific key patterns
-            if key.startswith(
-                ("search:results:", "content:processed:", "github:repo:", "mcp:search:results:")
-            ):
-                data = gzip.compress(data)
+            # Serialize to JSON, compressing specific key patterns
+            data = self._encode_value(key, value)
 
             # Set with TTL
             await self.redis_client.setex(key, ttl, data)
@@ -948,6 +1244,143 @@ class CacheManager:
                 )
             # Don't raise - allow application to continue without cache
 
+    def _encode_value(self, key: str, value: Any) -> bytes:
+        """Serialize value to JSON bytes, gzip-compressing by key prefix"""
+        data = json.dumps(value, default=str).encode("utf-8")
+        if key.startswith(self.COMPRESSED_KEY_PREFIXES):
+            data = gzip.compress(data)
+        return data
+
+    def _decode_value(self, key: str, data: bytes) -> Any:
+        """Decode JSON bytes stored by _encode_value"""
+        if key.startswith(self.COMPRESSED_KEY_PREFIXES):
+            data = gzip.decompress(data)
+        return json.loads(data.decode("utf-8"))
+
+    async def mget(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get multiple values in one round trip (Redis MGET).
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dict of key -> value for keys found; empty if Redis unavailable
+        """
+        if not keys:
+            return {}
+
+        start_time = time.time()
+        try:
+            if not self._connected:
+                await self.connect()
+
+            values = await self.redis_client.mget(keys)
+            results = {}
+            for key, data in zip(keys, values):
+                if data is None:
+                    continue
+                try:
+                    results[key] = self._decode_value(key, data)
+                except Exception as e:
+                    logger.warning(f"Failed to decode cached value for key {key}: {e}")
+
+            if self._cache_logger:
+                self._cache_logger.log_service_call(
+                    service="redis",
+                    endpoint="MGET",
+                    method="MGET",
+                    duration_ms=(time.time() - start_time) * 1000,
+                    status_code=200,
+                    key_count=len(keys),
+                    hit_count=len(results)
+                )
+            return results
+
+        except (ConnectionError, TimeoutError, OSError) as e:
+            logger.warning(
+                f"Redis connection failed for mget({len(keys)} keys): {e}. Gracefully degrading without cache."
+            )
+            self._connected = False
+            return {}
+        except Exception as e:
+            logger.error(f"Cache mget failed for {len(keys)} keys: {e}")
+            return {}
+
+    async def mset_with_ttl(self, items: Dict[str, Any], ttl: int) -> None:
+        """
+        Set multiple values with the same TTL in one pipelined round trip.
+
+        Args:
+            items: Dict of key -> value
+            ttl: Time to live in seconds
+        """
+        if not items:
+            return
+
+        pipe = self.pipeline()
+        for key, value in items.items():
+            pipe.set(key, value, ttl)
+        await pipe.execute()
+
+    def pipeline(self) -> "CachePipeline":
+        """
+        Create a pipeline that sends queued commands in one round trip.
+
+        Returns:
+            CachePipeline; call execute() to send the queued commands
+        """
+        return CachePipeline(self)
+
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        """
+        Get raw bytes from cache without JSON decoding or decompression.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached bytes or None if not found or Redis unavailable
+        """
+        try:
+            if not self._connected:
+                await self.connect()
+
+            return await self.redis_client.get(key)
+        except (ConnectionError, TimeoutError, OSError) as e:
+            logger.warning(
+                f"Redis connection failed for get_bytes({key}): {e}. Gracefully degrading without cache."
+            )
+            self._connected = False
+            return None
+        except Exception as e:
+            logger.error(f"Cache get_bytes failed for key {key}: {e}")
+            return None
+
+    async def set_bytes(self, key: str, value: bytes, ttl: int) -> None:
+        """
+        Set raw bytes in cache with TTL (no JSON encoding or compression).
+
+        Args:
+            key: Cache key
+            value: Bytes to cache
+            ttl: Time to live in seconds
+        """
+        try:
+            if not self._connected:
+                await self.connect()
+
+            await self.redis_client.setex(key, ttl, value)
+        except (ConnectionError, TimeoutError, OSError) as e:
+            logger.warning(
+                f"Redis connection failed for set_bytes({key}): {e}. Gracefully degrading without cache."
+            )
+            self._connected = False
+            # Don't raise - allow application to continue without cache
+        except Exception as e:
+            logger.error(f"Cache set_bytes failed for key {key}: {e}")
+            # Don't raise - allow application to continue without cache
+
     async def delete(self, key: str) -> None:
         """
         Delete key from cache.
@@ -970,12 +1403,13 @@ class CacheManager:
             logger.error(f"Cache delete failed for key {key}: {e}")
             # Don't raise - allow application to continue without cache
 
-    async def increment(self, key: str) -> int:
+    async def increment(self, key: str, amount: int = 1) -> int:
         """
         Increment counter value and return new value.
 
         Args:
             key: Cache key for counter
+            amount: Amount to add
 
         Returns:
             New counter value, or 1 if Redis unavailable
@@ -984,7 +1418,9 @@ class CacheManager:
             if not self._connected:
                 await self.connect()
 
-            return await self.redis_client.incr(key)
+            if amount == 1:
+                return await self.redis_client.incr(key)
+            return await self.redis_client.incrby(key, amount)
         except (ConnectionError, TimeoutError, OSError) as e:
             logger.warning(
                 f"Redis connection failed for increment({key}): {e}. Gracefully degrading without cache."
@@ -1018,6 +1454,116 @@ class CacheManager:
             logger.error(f"Cache expire failed for key {key}: {e}")
             # Don't raise - allow application to continue without cache
 
+    async def acquire_lock(self, key: str, ttl_seconds: int) -> Optional[str]:
+        """
+        Try to acquire a short-lived lock (SET NX with expiry).
+
+        Args:
+            key: Lock key
+            ttl_seconds: Lock expiry in seconds
+
+        Returns:
+            Lock token if acquired, None if held by another owner. If Redis is
+            unavailable a local token is returned so callers proceed without
+            cross-process exclusion.
+        """
+        token = uuid.uuid4().hex
+        try:
+            if not self._connected:
+                await self.connect()
+
+            acquired = await self.redis_client.set(key, token, nx=True, ex=ttl_seconds)
+            return token if acquired else None
+        except (ConnectionError, TimeoutError, OSError) as e:
+            logger.warning(
+                f"Redis connection failed for acquire_lock({key}): {e}. Gracefully degrading without cache."
+            )
+            self._connected = False
+            return token
+        except Exception as e:
+            logger.error(f"Cache acquire_lock failed for key {key}: {e}")
+            return token
+
+    async def release_lock(self, key: str, token: str) -> bool:
+        """
+        Release a lock only if it is still owned by token.
+
+        Args:
+            key: Lock key
+            token: Token returned by acquire_lock
+
+        Returns:
+            True if the lock was released
+        """
+        try:
+            if not self._connected:
+                await self.connect()
+
+            return bool(await self.redis_client.eval(self._RELEASE_LOCK_SCRIPT, 1, key, token))
+        except (ConnectionError, TimeoutError, OSError) as e:
+            logger.warning(
+                f"Redis connection failed for release_lock({key}): {e}. Gracefully degrading without cache."
+            )
+            self._connected = False
+            return False
+        except Exception as e:
+            logger.error(f"Cache release_lock failed for key {key}: {e}")
+            return False
+
+    async def publish(self, channel: str, message: str) -> int:
+        """
+        Publish a message on a pub/sub channel.
+
+        Args:
+            channel: Channel name
+            message: Message payload
+
+        Returns:
+            Number of subscribers that received the message, or 0 if Redis unavailable
+        """
+        try:
+            if not self._connected:
+                await self.connect()
+
+            return await self.redis_client.publish(channel, message)
+        except (ConnectionError, TimeoutError, OSError) as e:
+            logger.warning(
+                f"Redis connection failed for publish({channel}): {e}. Gracefully degrading without cache."
+            )
+            self._connected = False
+            return 0
+        except Exception as e:
+            logger.error(f"Cache publish failed for channel {channel}: {e}")
+            return 0
+
+    async def subscribe(self, *channels: str) -> Optional[Any]:
+        """
+        Subscribe to pub/sub channels on a dedicated connection.
+
+        Args:
+            *channels: Channel names
+
+        Returns:
+            Subscribed redis PubSub object (caller must close it), or None if
+            Redis unavailable
+        """
+        try:
+            if not self._connected:
+                await self.connect()
+
+            pubsub = self.redis_client.pubsub()
+            await pubsub.subscribe(*channels)
+            return pubsub
+        except (ConnectionError, TimeoutError, OSError) as e:
+            logger.warning(
+                f"Redis connection failed for subscribe({channels}): {e}. Gracefully degrading without cache."
+            )
+            self._connected = False
+            return None
+        except Exception as e:
+            logger.error(f"Cache subscribe failed for channels {channels}: {e}")
+            return None
+
     async def health_check(self) -> Dict[str, Any]:
         """
         Check Redis health and return status information.
@@ -1072,6 +1618,93 @@ class CacheManager:
             return {"status": "unhealthy", "connected": False, "error": str(e)}
 
 
+class CachePipeline:
+    """
+    Non-transactional Redis pipeline with CacheManager value encoding.
+
+    Commands are queued locally and sent in a single round trip by execute().
+    Values are JSON-encoded and gzip-compressed by key prefix exactly as
+    CacheManager.set does. Failures degrade gracefully like CacheManager.
+    """
+
+    def __init__(self, cache_manager: CacheManager):
+        self._cache_manager = cache_manager
+        self._commands: List[Tuple[str, tuple]] = []
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def set(self, key: str, value: Any, ttl: int) -> "CachePipeline":
+        """Queue SETEX with encoded value"""
+        self._commands.append(("setex", (key, ttl, self._cache_manager._encode_value(key, value))))
+        return self
+
+    def set_bytes(self, key: str, value: bytes, ttl: int) -> "CachePipeline":
+        """Queue SETEX with raw bytes"""
+        self._commands.append(("setex", (key, ttl, value)))
+        return self
+
+    def increment(self, key: str) -> "CachePipeline":
+        """Queue INCR"""
+        self._commands.append(("incr", (key,)))
+        return self
+
+    def expire(self, key: str, seconds: int) -> "CachePipeline":
+        """Queue EXPIRE"""
+        self._commands.append(("expire", (key, seconds)))
+        return self
+
+    def delete(self, key: str) -> "CachePipeline":
+        """Queue DEL"""
+        self._commands.append(("delete", (key,)))
+        return self
+
+    async def execute(self) -> List[Any]:
+        """
+        Send all queued commands in one round trip.
+
+        Returns:
+            Raw Redis replies in queue order, or an empty list if Redis is
+            unavailable
+        """
+        if not self._commands:
+            return []
+
+        commands, self._commands = self._commands, []
+        cache_manager = self._cache_manager
+        start_time = time.time()
+        try:
+            if not cache_manager._connected:
+                await cache_manager.connect()
+
+            pipe = cache_manager.redis_client.pipeline(transaction=False)
+            for command, args in commands:
+                getattr(pipe, command)(*args)
+            results = await pipe.execute()
+
+            if cache_manager._cache_logger:
+                cache_manager._cache_logger.log_service_call(
+                    service="redis",
+                    endpoint="PIPELINE",
+                    method="PIPELINE",
+                    duration_ms=(time.time() - start_time) * 1000,
+                    status_code=200,
+                    command_count=len(commands)
+                )
+            return results
+
+        except (ConnectionError, TimeoutError, OSError) as e:
+            logger.warning(
+                f"Redis connection failed for pipeline({len(commands)} commands): {e}. "
+                "Gracefully degrading without cache."
+            )
+            cache_manager._connected = False
+            return []
+        except Exception as e:
+            logger.error(f"Cache pipeline failed ({len(commands)} commands): {e}")
+            return []
+
+
 async def create_database_manager(
     config: Optional[Dict[str, Any]] = None,
 ) -> DatabaseManager:
@@ -46,6 +46,10 @@ class PostgreSQLInitializer:
                 # Create indexes
                 self._create_indexes(conn)
                 
+                # Create analytics rollups and rebuild them from the base tables
+                self._create_rollups(conn)
+                self._rebuild_rollups(conn)
+                
                 # Insert initial data
                 self._insert_schema_version(conn)
                 self._insert_default_mappings(conn)
@@ -359,6 +363,7 @@ class PostgreSQLInitializer:
             "CREATE INDEX IF NOT EXISTS idx_content_metadata_quality_score ON content_metadata(quality_score)",
             "CREATE INDEX IF NOT EXISTS idx_content_metadata_processing_status ON content_metadata(processing_status)",
             "CREATE INDEX IF NOT EXISTS idx_content_metadata_created_at ON content_metadata(created_at)",
+            "CREATE INDEX IF NOT EXISTS idx_content_metadata_updated_at ON content_metadata(updated_at)",
             "CREATE INDEX IF NOT EXISTS idx_content_metadata_last_accessed_at ON content_metadata(last_accessed_at)",
             "CREATE INDEX IF NOT EXISTS idx_content_metadata_expires_at ON content_metadata(expires_at)",
             "CREATE INDEX IF NOT EXISTS idx_content_metadata_source_provider ON content_metadata(source_provider)",
@@ -413,6 +418,215 @@ class PostgreSQLInitializer:
         
         logger.info("All indexes created successfully")
     
+    def _create_rollups(self, conn):
+        """
+        Create rollup tables for analytics and stats endpoints.
+
+        Statement-level AFTER triggers with transition tables keep them in
+        step with their base tables, so a multi-row write costs one rollup
+        upsert per group rather than one per row.
+        """
+        # Hourly search counts and latency (search_cache)
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS search_stats_hourly (
+                bucket TIMESTAMP PRIMARY KEY NOT NULL,
+                search_count BIGINT NOT NULL DEFAULT 0,
+                searches_with_results BIGINT NOT NULL DEFAULT 0,
+                total_execution_time_ms BIGINT NOT NULL DEFAULT 0
+            )
+        """))
+        
+        # Document, chunk and quality totals per technology and workspace (content_metadata)
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS content_counts (
+                technology TEXT NOT NULL,
+                workspace TEXT NOT NULL,
+                document_count BIGINT NOT NULL DEFAULT 0,
+                chunk_count BIGINT NOT NULL DEFAULT 0,
+                quality_score_total DOUBLE PRECISION NOT NULL DEFAULT 0,
+                PRIMARY KEY (technology, workspace)
+            )
+        """))
+        # Tables created before the chunk and quality totals; the rebuild fills them
+        conn.execute(text("""
+            ALTER TABLE content_counts
+                ADD COLUMN IF NOT EXISTS chunk_count BIGINT NOT NULL DEFAULT 0,
+                ADD COLUMN IF NOT EXISTS quality_score_total DOUBLE PRECISION NOT NULL DEFAULT 0
+        """))
+        
+        # Daily feedback counts by type and rating, 0 for unrated (feedback_events)
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS feedback_stats_daily (
+                bucket DATE NOT NULL,
+                feedback_type TEXT NOT NULL,
+                rating INTEGER NOT NULL,
+                event_count BIGINT NOT NULL DEFAULT 0,
+                PRIMARY KEY (bucket, feedback_type, rating)
+            )
+        """))
+        
+        conn.execute(text("""
+            CREATE OR REPLACE FUNCTION rollup_search_stats() RETURNS trigger AS $$
+            BEGIN
+                IF TG_OP = 'INSERT' THEN
+                    INSERT INTO search_stats_hourly AS s
+                        (bucket, search_count, searches_with_results, total_execution_time_ms)
+                    SELECT date_trunc('hour', created_at), COUNT(*),
+                           COUNT(*) FILTER (WHERE result_count > 0), SUM(execution_time_ms)
+                    FROM new_rows GROUP BY 1
+                    ON CONFLICT (bucket) DO UPDATE SET
+                        search_count = s.search_count + EXCLUDED.search_count,
+                        searches_with_results = s.searches_with_results + EXCLUDED.searches_with_results,
+                        total_execution_time_ms = s.total_execution_time_ms + EXCLUDED.total_execution_time_ms;
+                ELSE
+                    UPDATE search_stats_hourly AS s SET
+                        search_count = s.search_count - d.search_count,
+                        searches_with_results = s.searches_with_results - d.searches_with_results,
+                        total_execution_time_ms = s.total_execution_time_ms - d.total_execution_time_ms
+                    FROM (
+                        SELECT date_trunc('hour', created_at) AS bucket, COUNT(*) AS search_count,
+                               COUNT(*) FILTER (WHERE result_count > 0) AS searches_with_results,
+                               SUM(execution_time_ms) AS total_execution_time_ms
+                        FROM old_rows GROUP BY 1
+                    ) d
+                    WHERE s.bucket = d.bucket;
+                END IF;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+        """))
+        
+        conn.execute(text("""
+            CREATE OR REPLACE FUNCTION rollup_content_counts() RETURNS trigger AS $$
+            BEGIN
+                IF TG_OP = 'INSERT' THEN
+                    INSERT INTO content_counts AS c
+                        (technology, workspace, document_count, chunk_count, quality_score_total)
+                    SELECT technology, COALESCE(weaviate_workspace, 'default'), COUNT(*),
+                           SUM(chunk_count), SUM(quality_score)
+                    FROM new_rows GROUP BY 1, 2
+                    ON CONFLICT (technology, workspace) DO UPDATE SET
+                        document_count = c.document_count + EXCLUDED.document_count,
+                        chunk_count = c.chunk_count + EXCLUDED.chunk_count,
+                        quality_score_total = c.quality_score_total + EXCLUDED.quality_score_total;
+                ELSE
+                    UPDATE content_counts AS c SET
+                        document_count = c.document_count - d.document_count,
+                        chunk_count = c.chunk_count - d.chunk_count,
+                        quality_score_total = c.quality_score_total - d.quality_score_total
+                    FROM (
+                        SELECT technology, COALESCE(weaviate_workspace, 'default') AS workspace,
+                               COUNT(*) AS document_count, SUM(chunk_count) AS chunk_count,
+                               SUM(quality_score) AS quality_score_total
+                        FROM old_rows GROUP BY 1, 2
+                    ) d
+                    WHERE c.technology = d.technology AND c.workspace = d.workspace;
+                END IF;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+        """))
+        
+        # Updates only move totals when technology, workspace, chunk count or
+        # quality score changed
+        conn.execute(text("""
+            CREATE OR REPLACE FUNCTION rollup_content_counts_update() RETURNS trigger AS $$
+            BEGIN
+                INSERT INTO content_counts AS c
+                    (technology, workspace, document_count, chunk_count, quality_score_total)
+                SELECT technology, workspace, SUM(documents), SUM(chunks), SUM(quality) FROM (
+                    SELECT o.technology, COALESCE(o.weaviate_workspace, 'default') AS workspace,
+                           -1 AS documents, -o.chunk_count AS chunks, -o.quality_score AS quality
+                    FROM old_rows o JOIN new_rows n USING (content_id)
+                    WHERE (o.technology, o.weaviate_workspace, o.chunk_count, o.quality_score)
+                          IS DISTINCT FROM (n.technology, n.weaviate_workspace, n.chunk_count, n.quality_score)
+                    UNION ALL
+                    SELECT n.technology, COALESCE(n.weaviate_workspace, 'default'),
+                           1, n.chunk_count, n.quality_score
+                    FROM old_rows o JOIN new_rows n USING (content_id)
+                    WHERE (o.technology, o.weaviate_workspace, o.chunk_count, o.quality_score)
+                          IS DISTINCT FROM (n.technology, n.weaviate_workspace, n.chunk_count, n.quality_score)
+                ) changes
+                GROUP BY technology, workspace
+                ON CONFLICT (technology, workspace) DO UPDATE SET
+                    document_count = c.document_count + EXCLUDED.document_count,
+                    chunk_count = c.chunk_count + EXCLUDED.chunk_count,
+                    quality_score_total = c.quality_score_total + EXCLUDED.quality_score_total;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+        """))
+        
+        conn.execute(text("""
+            CREATE OR REPLACE FUNCTION rollup_feedback_stats() RETURNS trigger AS $$
+            BEGIN
+                IF TG_OP = 'INSERT' THEN
+                    INSERT INTO feedback_stats_daily AS f (bucket, feedback_type, rating, event_count)
+                    SELECT created_at::date, feedback_type::text, COALESCE(rating, 0), COUNT(*)
+                    FROM new_rows GROUP BY 1, 2, 3
+                    ON CONFLICT (bucket, feedback_type, rating) DO UPDATE SET
+                        event_count = f.event_count + EXCLUDED.event_count;
+                ELSE
+                    UPDATE feedback_stats_daily AS f SET event_count = f.event_count - d.event_count
+                    FROM (
+                        SELECT created_at::date AS bucket, feedback_type::text AS feedback_type,
+                               COALESCE(rating, 0) AS rating, COUNT(*) AS event_count
+                        FROM old_rows GROUP BY 1, 2, 3
+                    ) d
+                    WHERE f.bucket = d.bucket AND f.feedback_type = d.feedback_type AND f.rating = d.rating;
+                END IF;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+        """))
+        
+        # Transition tables allow a single event per trigger
+        triggers = [
+            ("trg_search_stats_insert", "INSERT", "search_cache", "NEW TABLE AS new_rows", "rollup_search_stats"),
+            ("trg_search_stats_delete", "DELETE", "search_cache", "OLD TABLE AS old_rows", "rollup_search_stats"),
+            ("trg_content_counts_insert", "INSERT", "content_metadata", "NEW TABLE AS new_rows", "rollup_content_counts"),
+            ("trg_content_counts_delete", "DELETE", "content_metadata", "OLD TABLE AS old_rows", "rollup_content_counts"),
+            ("trg_content_counts_update", "UPDATE", "content_metadata",
+             "OLD TABLE AS old_rows NEW TABLE AS new_rows", "rollup_content_counts_update"),
+            ("trg_feedback_stats_insert", "INSERT", "feedback_events", "NEW TABLE AS new_rows", "rollup_feedback_stats"),
+            ("trg_feedback_stats_delete", "DELETE", "feedback_events", "OLD TABLE AS old_rows", "rollup_feedback_stats"),
+        ]
+        
+        for name, event, table, transition, function in triggers:
+            conn.execute(text(f"""
+                CREATE OR REPLACE TRIGGER {name}
+                AFTER {event} ON {table}
+                REFERENCING {transition}
+                FOR EACH STATEMENT EXECUTE FUNCTION {function}()
+            """))
+        
+        logger.info("Analytics rollups created successfully")
+    
+    def _rebuild_rollups(self, conn):
+        """Recompute all rollups from their base tables."""
+        conn.execute(text("TRUNCATE search_stats_hourly, content_counts, feedback_stats_daily"))
+        
+        conn.execute(text("""
+            INSERT INTO search_stats_hourly
+                (bucket, search_count, searches_with_results, total_execution_time_ms)
+            SELECT date_trunc('hour', created_at), COUNT(*),
+                   COUNT(*) FILTER (WHERE result_count > 0), SUM(execution_time_ms)
+            FROM search_cache GROUP BY 1
+        """))
+        
+        conn.execute(text("""
+            INSERT INTO content_counts (technology, workspace, document_count, chunk_count, quality_score_total)
+            SELECT technology, COALESCE(weaviate_workspace, 'default'), COUNT(*),
+                   SUM(chunk_count), SUM(quality_score)
+            FROM content_metadata GROUP BY 1, 2
+        """))
+        
+        conn.execute(text("""
+            INSERT INTO feedback_stats_daily (bucket, feedback_type, rating, event_count)
+            SELECT created_at::date, feedback_type::text, COALESCE(rating, 0), COUNT(*)
+            FROM feedback_events GROUP BY 1, 2, 3
+        """))
+    
     def _insert_schema_version(self, conn):
         """Insert initial schema version."""
         conn.execute(text("""
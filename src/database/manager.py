@@ -10,7 +10,7 @@ connection pooling, transaction support, and document reconstruction.
 import logging
 import os
 from contextlib import asynccontextmanager
-from typing import Optional, Dict, Any, List, Tuple, AsyncContextManager
+from typing import Optional, Dict, Any, List, Tuple, AsyncContextManager, AsyncIterator
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import (
@@ -124,13 +124,15 @@ class DatabaseManager:
             logger.error(f"Query execution failed. Error type: {error_type}")
             raise
 
-    async def fetch_one(self, query: str, params: Tuple = ()) -> Optional[Row]:
+    async def fetch_one(self, query: str, params: Tuple = (), pool: Optional[str] = None) -> Optional[Row]:
         """
         Fetch single row from query result using proper parameterized queries.
 
         Args:
             query: SQL query string with :param_N placeholders for named parameters
             params: Query parameters as tuple
+            pool: Connection pool hint, accepted for compatibility with the API
+                DatabaseManager; this manager has a single pool
 
         Returns:
             Single row or None if no results
@@ -156,13 +158,15 @@ class DatabaseManager:
             logger.error(f"Query fetch_one failed. Error type: {error_type}")
             raise
 
-    async def fetch_all(self, query: str, params: Tuple = ()) -> List[Row]:
+    async def fetch_all(self, query: str, params: Tuple = (), pool: Optional[str] = None) -> List[Row]:
         """
         Fetch all rows from query result using proper parameterized queries.
 
         Args:
             query: SQL query string with :param_N placeholders for named parameters
             params: Query parameters as tuple
+            pool: Connection pool hint, accepted for compatibility with the API
+                DatabaseManager; this manager has a single pool
 
         Returns:
             List of rows
@@ -188,6 +192,48 @@ class DatabaseManager:
             logger.error(f"Query fetch_all failed. Error type: {error_type}")
             raise
 
+    async def fetch_stream(
+        self, query: str, params: Tuple = (), chunk_size: int = 1000, pool: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream rows from a query through a server-side cursor.
+
+        Args:
+            query: SQL query string with :param_N placeholders (or :named
+                placeholders when params is a dict)
+            params: Query parameters as tuple, or dict of named parameters
+            chunk_size: Rows fetched from the cursor per round trip
+            pool: Connection pool hint, accepted for compatibility with the API
+                DatabaseManager; this manager has a single pool
+
+        Yields:
+            Rows as dicts, chunk_size rows in memory at a time
+
+        Raises:
+            SQLAlchemyError: If query execution fails
+        """
+        if not self._connected:
+            await self.connect()
+
+        if isinstance(params, dict):
+            param_dict = params or None
+        else:
+            param_dict = {f"param_{i}": param for i, param in enumerate(params)} or None
+
+        try:
+            async with self.session_factory() as session:
+                result = await session.stream(
+                    text(query), param_dict, execution_options={"yield_per": chunk_size}
+                )
+                async for partition in result.mappings().partitions(chunk_size):
+                    for row in partition:
+                        yield dict(row)
+        except SQLAlchemyError as e:
+            # Strip SQLAlchemy error details that may contain sensitive SQL
+            error_type = type(e).__name__
+            logger.error(f"Query fetch_stream failed. Error type: {error_type}")
+            raise
+
     async def execute_transaction(self, queries: List[Tuple[str, Tuple]]) -> bool:
         """
         Execute multiple queries in a single transaction using proper parameterized queries.
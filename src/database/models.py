@@ -16,6 +16,8 @@ from sqlalchemy import (
     Float,
     Boolean,
     DateTime,
+    Date,
+    BigInteger,
     Text,
     JSON,
     CheckConstraint,
@@ -180,6 +182,7 @@ class ContentMetadata(Base):
         Index("idx_content_metadata_quality_score", "quality_score"),
         Index("idx_content_metadata_processing_status", "processing_status"),
         Index("idx_content_metadata_created_at", "created_at"),
+        Index("idx_content_metadata_updated_at", "updated_at"),
         Index("idx_content_metadata_last_accessed_at", "last_accessed_at"),
     )
 
@@ -261,6 +264,40 @@ class UsageSignals(Base):
     )
 
 
+class SearchStatsHourly(Base):
+    """Hourly search_cache rollup, maintained by triggers on search_cache"""
+
+    __tablename__ = "search_stats_hourly"
+
+    bucket: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    search_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    searches_with_results: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    total_execution_time_ms: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
+class ContentCounts(Base):
+    """Document, chunk and quality totals per technology and workspace, maintained by triggers on content_metadata"""
+
+    __tablename__ = "content_counts"
+
+    technology: Mapped[str] = mapped_column(String, primary_key=True)
+    workspace: Mapped[str] = mapped_column(String, primary_key=True)
+    document_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    chunk_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    quality_score_total: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+
+class FeedbackStatsDaily(Base):
+    """Daily feedback counts by type and rating (0 = unrated), maintained by triggers on feedback_events"""
+
+    __tablename__ = "feedback_stats_daily"
+
+    bucket: Mapped[datetime] = mapped_column(Date, primary_key=True)
+    feedback_type: Mapped[str] = mapped_column(String, primary_key=True)
+    rating: Mapped[int] = mapped_column(Integer, primary_key=True)
+    event_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
 class SourceMetadata(Base):
     """Source metadata table - PRD-002 lines 113-130"""
 
@@ -0,0 +1,210 @@
+"""
+Compiled Query Registry
+Per-SQL-string compilation cache for DatabaseManager
+
+Each distinct query string is prepared once: "?" placeholders are rewritten
+to :param_N binds, the SQLAlchemy text() clause is constructed, and the
+operation and table used for query logging are classified. Hot queries then
+cost a dictionary lookup instead of repeated string rewriting and parsing on
+every call, and the reused text() clause keeps SQLAlchemy's compiled cache
+and asyncpg's prepared statement cache keyed on identical SQL.
+"""
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CompiledQuery:
+    """A query string prepared for execution and logging"""
+
+    sql: str
+    statement: TextClause
+    param_names: Tuple[str, ...]
+    operation: str
+    table: str
+    query_hash: int
+
+    def bind(self, params: Any) -> Optional[Dict[str, Any]]:
+        """
+        Build the bind parameters for a call.
+
+        Args:
+            params: Tuple/list for ? placeholders, dict for :named
+                placeholders, a single value, or None
+
+        Returns:
+            Bind parameter dict, or None when the query takes none
+        """
+        if params is None or isinstance(params, dict):
+            return params
+        if not isinstance(params, (tuple, list)):
+            params = (params,)
+        if len(params) == len(self.param_names):
+            return dict(zip(self.param_names, params))
+        return {f"param_{i}": value for i, value in enumerate(params)}
+
+
+def rewrite_placeholders(query: str, count: int) -> str:
+    """
+    Rewrite the first count ? placeholders to :param_0, :param_1, ...
+
+    Question marks inside quoted literals and identifiers are left as is.
+    """
+    parts = []
+    quote = None
+    index = 0
+    for char in query:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in ("'", '"'):
+            quote = char
+        elif char == "?" and index < count:
+            parts.append(f":param_{index}")
+            index += 1
+            continue
+        parts.append(char)
+    return "".join(parts)
+
+
+def extract_table_name(query: str) -> str:
+    """
+    Extract table name from SQL query for logging purposes.
+
+    Args:
+        query: SQL query string
+
+    Returns:
+        Table name or 'unknown' if not found
+    """
+    try:
+        # Simple regex-free table extraction for common SQL patterns
+        query_upper = query.upper().strip()
+
+        # Handle SELECT queries
+        if query_upper.startswith('SELECT'):
+            if ' FROM ' in query_upper:
+                from_part = query_upper.split(' FROM ')[1]
+                table = from_part.split()[0].strip()
+                return table.replace('`', '').replace('"', '').replace("'", '')
+
+        # Handle INSERT queries
+        elif query_upper.startswith('INSERT'):
+            if ' INTO ' in query_upper:
+                into_part = query_upper.split(' INTO ')[1]
+                table = into_part.split()[0].strip()
+                return table.replace('`', '').replace('"', '').replace("'", '')
+
+        # Handle UPDATE queries
+        elif query_upper.startswith('UPDATE'):
+            update_part = query_upper.split('UPDATE')[1].strip()
+            table = update_part.split()[0].strip()
+            return table.replace('`', '').replace('"', '').replace("'", '')
+
+        # Handle DELETE queries
+        elif query_upper.startswith('DELETE'):
+            if ' FROM ' in query_upper:
+                from_part = query_upper.split(' FROM ')[1]
+                table = from_part.split()[0].strip()
+                return table.replace('`', '').replace('"', '').replace("'", '')
+
+        return 'unknown'
+    except Exception:
+        return 'unknown'
+
+
+class QueryRegistry:
+    """
+    Bounded LRU of compiled queries keyed by query string.
+
+    Positional queries are keyed together with their parameter count, since
+    that decides how many ? placeholders are rewritten.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        Initialize the registry.
+
+        Args:
+            max_size: Maximum distinct compiled queries retained
+        """
+        self.max_size = max_size
+        self._queries: "OrderedDict[Tuple[str, Optional[int]], CompiledQuery]" = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def prepare(self, query: str, params: Any = None) -> Tuple[CompiledQuery, Optional[Dict[str, Any]]]:
+        """
+        Compile (or look up) a query and bind its parameters.
+
+        Args:
+            query: SQL query string with :named or ? placeholders
+            params: Query parameters as accepted by DatabaseManager
+
+        Returns:
+            Tuple of (compiled query, bind parameters or None)
+        """
+        if params is None or isinstance(params, dict):
+            count = None
+        elif isinstance(params, (tuple, list)):
+            count = len(params) or None
+            if count is None:
+                params = None
+        else:
+            count = 1
+
+        compiled = self.compile(query, count)
+        return compiled, compiled.bind(params)
+
+    def compile(self, query: str, positional_count: Optional[int] = None) -> CompiledQuery:
+        """
+        Compile a query string.
+
+        Args:
+            query: SQL query string
+            positional_count: Number of ? placeholders to rewrite, or None
+                for queries with named or no parameters
+
+        Returns:
+            CompiledQuery
+        """
+        key = (query, positional_count)
+        compiled = self._queries.get(key)
+        if compiled is not None:
+            self._stats["hits"] += 1
+            self._queries.move_to_end(key)
+            return compiled
+
+        self._stats["misses"] += 1
+        sql = rewrite_placeholders(query, positional_count) if positional_count else query
+        stripped = query.strip()
+        compiled = CompiledQuery(
+            sql=sql,
+            statement=text(sql),
+            param_names=tuple(f"param_{i}" for i in range(positional_count or 0)),
+            operation=stripped.split()[0].upper() if stripped else "UNKNOWN",
+            table=extract_table_name(query),
+            query_hash=hash(query) % 10000,
+        )
+
+        self._queries[key] = compiled
+        if len(self._queries) > self.max_size:
+            self._queries.popitem(last=False)
+            self._stats["evictions"] += 1
+        return compiled
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Registry hit/miss statistics"""
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "size": len(self._queries),
+            "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,289 @@
+"""
+Write-Behind Buffer
+Batched background inserts for high-rate, append-only event tables
+
+Rows are accepted into a bounded in-memory queue on the request path and
+written by a background flusher whenever flush_rows rows are waiting or
+every flush_interval_ms. A batch is one executemany of the table's single-row
+INSERT, so every flush reuses the same compiled and prepared statement
+whatever the batch size. When the queue is
+full, writers wait up to backpressure_ms for a flush to make room before the
+row is dropped and counted. Buffers are shared per table and flushed on
+application shutdown by close_write_buffers().
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.exc import DataError, IntegrityError, ProgrammingError
+
+logger = logging.getLogger(__name__)
+
+def build_insert(table: str, columns: Sequence[str]) -> str:
+    """
+    Build the single-row INSERT for a table with :param_N placeholders.
+
+    Args:
+        table: Table name
+        columns: Column names, in placeholder order
+
+    Returns:
+        INSERT statement taking the parameters of row_params()
+    """
+    placeholders = ", ".join(f":param_{i}" for i in range(len(columns)))
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+
+def row_params(columns: Sequence[str], row: Dict[str, Any]) -> Tuple:
+    """
+    Positional INSERT parameters of a row.
+
+    Args:
+        columns: Column names, in placeholder order
+        row: Row keyed by column name; missing columns insert NULL
+
+    Returns:
+        Parameter tuple for build_insert()
+    """
+    return tuple(row.get(column) for column in columns)
+
+
+class WriteBehindBuffer:
+    """
+    Bounded queue of rows for one table with a background flusher.
+
+    A batch rejected for its data (constraint or type errors) is retried row
+    by row so only the offending rows are dropped; a batch failing for any
+    other reason (e.g. the database is unavailable) is put back and retried
+    on the next flush.
+    """
+
+    def __init__(
+        self,
+        db_manager: Any,
+        table: str,
+        columns: Sequence[str],
+        max_rows: int = 10000,
+        flush_rows: int = 500,
+        flush_interval_ms: int = 250,
+        backpressure_ms: int = 50,
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            db_manager: DatabaseManager used for the INSERTs
+            table: Target table
+            columns: Columns written for each row
+            max_rows: Maximum rows held in memory
+            flush_rows: Rows that trigger an immediate flush (and batch size)
+            flush_interval_ms: Maximum time a row waits before a flush
+            backpressure_ms: How long a writer waits for room when full
+        """
+        self.db_manager = db_manager
+        self.table = table
+        self.columns = tuple(columns)
+        self.max_rows = max_rows
+        self.flush_rows = max(1, flush_rows)
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.backpressure = backpressure_ms / 1000.0
+        self.insert_query = build_insert(table, self.columns)
+
+        self._rows: Deque[Dict[str, Any]] = deque()
+        self._flush_requested = asyncio.Event()
+        self._space_available = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task] = None
+        self._closed = False
+        self._stats = {
+            "accepted": 0,
+            "flushed_rows": 0,
+            "flushes": 0,
+            "failed_flushes": 0,
+            "dropped_full": 0,
+            "dropped_invalid": 0,
+            "last_flush_ms": 0.0,
+            "max_flush_ms": 0.0,
+            "total_flush_ms": 0.0,
+        }
+
+    async def add(self, row: Dict[str, Any]) -> bool:
+        """
+        Queue a row for writing.
+
+        Args:
+            row: Row keyed by column name
+
+        Returns:
+            True if the row was queued, False if it was dropped because the
+            buffer stayed full (or is closed)
+        """
+        if self._closed:
+            self._stats["dropped_full"] += 1
+            return False
+        self._ensure_flusher()
+
+        if len(self._rows) >= self.max_rows:
+            self._flush_requested.set()
+            self._space_available.clear()
+            try:
+                await asyncio.wait_for(self._space_available.wait(), timeout=self.backpressure)
+            except asyncio.TimeoutError:
+                pass
+            if len(self._rows) >= self.max_rows:
+                self._stats["dropped_full"] += 1
+                logger.warning(f"Write buffer for {self.table} full; dropping row")
+                return False
+
+        self._rows.append(row)
+        self._stats["accepted"] += 1
+        if len(self._rows) >= self.flush_rows:
+            self._flush_requested.set()
+        return True
+
+    async def flush(self) -> int:
+        """
+        Write all queued rows now.
+
+        Returns:
+            Number of rows written
+        """
+        written = 0
+        async with self._flush_lock:
+            while self._rows:
+                batch = [self._rows.popleft() for _ in range(min(self.flush_rows, len(self._rows)))]
+                self._space_available.set()
+                flushed = await self._write_batch(batch)
+                if flushed is None:
+                    break
+                written += flushed
+        return written
+
+    async def close(self) -> None:
+        """Stop the flusher and write the remaining rows"""
+        self._closed = True
+        if self._flusher and not self._flusher.done():
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+        await self.flush()
+        if self._rows:
+            self._stats["dropped_full"] += len(self._rows)
+            logger.error(f"Write buffer for {self.table} closed with {len(self._rows)} unwritten rows")
+            self._rows.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Buffer counters and flush latency"""
+        stats = {key: value for key, value in self._stats.items() if key != "total_flush_ms"}
+        stats["buffered"] = len(self._rows)
+        stats["avg_flush_ms"] = (
+            self._stats["total_flush_ms"] / self._stats["flushes"] if self._stats["flushes"] else 0.0
+        )
+        return stats
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            if self._rows:
+                try:
+                    # Shielded so close() cancelling the loop never loses an in-flight batch
+                    await asyncio.shield(self.flush())
+                except Exception as e:
+                    logger.error(f"Write buffer flush for {self.table} failed: {e}")
+
+    async def _write_batch(self, batch: List[Dict[str, Any]]) -> Optional[int]:
+        """Write a batch; None when it was re-queued after a failure"""
+        start_time = time.time()
+        try:
+            await self.db_manager.execute_many(
+                self.insert_query, [row_params(self.columns, row) for row in batch]
+            )
+            written = len(batch)
+        except (IntegrityError, DataError, ProgrammingError) as e:
+            logger.warning(f"Batch insert into {self.table} rejected, retrying rows individually: {e}")
+            written = await self._write_rows_individually(batch)
+        except Exception as e:
+            self._stats["failed_flushes"] += 1
+            self._requeue(batch)
+            logger.error(f"Batch insert into {self.table} failed; {len(batch)} rows re-queued: {e}")
+            return None
+
+        duration_ms = (time.time() - start_time) * 1000
+        self._stats["flushes"] += 1
+        self._stats["flushed_rows"] += written
+        self._stats["last_flush_ms"] = duration_ms
+        self._stats["max_flush_ms"] = max(self._stats["max_flush_ms"], duration_ms)
+        self._stats["total_flush_ms"] += duration_ms
+        logger.info(f"PIPELINE_METRICS: step=write_behind_flush duration_ms={int(duration_ms)} "
+                   f"table={self.table} rows={written} buffered={len(self._rows)}")
+        return written
+
+    async def _write_rows_individually(self, batch: List[Dict[str, Any]]) -> int:
+        written = 0
+        for row in batch:
+            try:
+                await self.db_manager.execute(self.insert_query, row_params(self.columns, row))
+                written += 1
+            except Exception as e:
+                self._stats["dropped_invalid"] += 1
+                logger.warning(f"Dropping invalid {self.table} row: {e}")
+        return written
+
+    def _requeue(self, batch: List[Dict[str, Any]]) -> None:
+        room = self.max_rows - len(self._rows)
+        if room < len(batch):
+            self._stats["dropped_full"] += len(batch) - max(room, 0)
+            batch = batch[:max(room, 0)]
+        self._rows.extendleft(reversed(batch))
+
+
+_buffers: Dict[Tuple[int, str], WriteBehindBuffer] = {}
+
+
+def get_write_buffer(db_manager: Any, table: str, columns: Sequence[str]) -> WriteBehindBuffer:
+    """
+    Get the shared write buffer for a table.
+
+    Sizing comes from WRITE_BUFFER_MAX_ROWS, WRITE_BUFFER_FLUSH_ROWS and
+    WRITE_BUFFER_FLUSH_INTERVAL_MS.
+    """
+    key = (id(db_manager), table)
+    buffer = _buffers.get(key)
+    if buffer is None or buffer._closed:
+        buffer = WriteBehindBuffer(
+            db_manager,
+            table,
+            columns,
+            max_rows=int(os.environ.get("WRITE_BUFFER_MAX_ROWS", "10000")),
+            flush_rows=int(os.environ.get("WRITE_BUFFER_FLUSH_ROWS", "500")),
+            flush_interval_ms=int(os.environ.get("WRITE_BUFFER_FLUSH_INTERVAL_MS", "250")),
+        )
+        _buffers[key] = buffer
+    return buffer
+
+
+def get_write_buffer_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats of all shared write buffers, keyed by table"""
+    return {buffer.table: buffer.get_stats() for buffer in _buffers.values()}
+
+
+async def close_write_buffers() -> None:
+    """Flush and close all shared write buffers (application shutdown)"""
+    buffers = list(_buffers.values())
+    _buffers.clear()
+    for buffer in buffers:
+        try:
+            await buffer.close()
+        except Exception as e:
+            logger.error(f"Failed to close write buffer for {buffer.table}: {e}")
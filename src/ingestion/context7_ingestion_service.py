@@ -851,7 +851,7 @@ class Context7IngestionService(SmartIngestionPipeline):
             return content
     
     async def cleanup_expired_documents(self, workspace_slug: str, correlation_id: str = None) -> Dict[str, Any]:
-        """Clean up expired documents from Weaviate and database"""
+        """Clean up expired documents from Weaviate (one filtered delete_many) and database"""
         start_time = time.time()
         if correlation_id is None:
             correlation_id = f"ctx7_cleanup_{uuid.uuid4().hex[:8]}"
@@ -863,7 +863,9 @@ class Context7IngestionService(SmartIngestionPipeline):
             
             # Use Weaviate client's cleanup method directly
             weaviate_start = time.time()
-            weaviate_result = await self.weaviate.cleanup_expired_documents(workspace_slug)
+            weaviate_result = await self.weaviate.cleanup_expired_documents(
+                workspace_slug, correlation_id=correlation_id
+            )
             weaviate_time = int((time.time() - weaviate_start) * 1000)
             logger.info(f"PIPELINE_METRICS: step=context7_weaviate_cleanup duration_ms={weaviate_time} "
                        f"correlation_id={correlation_id} deleted_documents={weaviate_result.get('deleted_documents', 0)} "
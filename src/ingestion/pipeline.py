@@ -261,7 +261,7 @@ class IngestionPipeline:
         try:
             # Query database for metrics
             total_docs_query = "SELECT COUNT(*) FROM content_metadata WHERE processing_status = 'completed'"
-            total_docs = await self.db_manager.fetch_one(total_docs_query)
+            total_docs = await self.db_manager.fetch_one(total_docs_query, pool="analytics")
             total_count = total_docs[0] if total_docs else 0
 
             # Get format distribution (approximated from filenames in source_url)
@@ -280,10 +280,8 @@ class IngestionPipeline:
                 WHERE processing_status = 'completed'
                 GROUP BY format
             """
-            format_results = await self.db_manager.fetch_all(format_query)
-            format_distribution = (
-                {row[0]: row[1] for row in format_results} if format_results else {}
-            )
+            format_columns = await self.db_manager.fetch_columns(format_query, pool="analytics")
+            format_distribution = dict(zip(format_columns["format"], format_columns["count"]))
 
             # Get technology distribution
             tech_query = """
@@ -294,14 +292,12 @@ class IngestionPipeline:
                 ORDER BY count DESC
                 LIMIT 10
             """
-            tech_results = await self.db_manager.fetch_all(tech_query)
-            tech_distribution = (
-                {row[0]: row[1] for row in tech_results} if tech_results else {}
-            )
+            tech_columns = await self.db_manager.fetch_columns(tech_query, pool="analytics")
+            tech_distribution = dict(zip(tech_columns["technology"], tech_columns["count"]))
 
             # Calculate success rate
             failed_query = "SELECT COUNT(*) FROM content_metadata WHERE processing_status = 'failed'"
-            failed_docs = await self.db_manager.fetch_one(failed_query)
+            failed_docs = await self.db_manager.fetch_one(failed_query, pool="analytics")
             failed_count = failed_docs[0] if failed_docs else 0
 
             success_rate = (
@@ -323,9 +319,9 @@ class IngestionPipeline:
                 WHERE processing_status = 'completed' AND quality_score IS NOT NULL
                 GROUP BY quality_range
             """
-            quality_results = await self.db_manager.fetch_all(quality_query)
-            quality_distribution = (
-                {row[0]: row[1] for row in quality_results} if quality_results else {}
+            quality_columns = await self.db_manager.fetch_columns(quality_query, pool="analytics")
+            quality_distribution = dict(
+                zip(quality_columns["quality_range"], quality_columns["count"])
             )
 
             return ProcessingMetrics(
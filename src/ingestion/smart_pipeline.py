@@ -3,12 +3,14 @@ Smart Ingestion Pipeline with LLM-powered processing
 Intelligently processes and stores documentation in Weaviate
 """
 
+import asyncio
 import json
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 
+from src.llm.batching import MicroBatchDispatcher
 from src.llm.client import LLMProviderClient
 from src.clients.weaviate_client import WeaviateVectorClient
 from src.database.manager import DatabaseManager
@@ -18,6 +20,23 @@ from src.document_processing.models import DocumentContent
 logger = logging.getLogger(__name__)
 
 
+CHUNK_METADATA_TASK = """
+Extract key metadata from documentation chunks.
+
+Extract:
+1. Main topic or concept covered
+2. Any code language used
+3. Difficulty level (beginner/intermediate/advanced)
+
+The result for a chunk is a JSON object:
+{
+    "main_topic": "...",
+    "code_language": "...",
+    "difficulty": "..."
+}
+"""
+
+
 class Chunk(BaseModel):
     """Represents a document chunk"""
     text: str
@@ -45,6 +64,12 @@ class SmartIngestionPipeline:
         self.llm = llm_client
         self.weaviate = weaviate_client
         self.db = db_manager
+
+        # Share the client's dispatcher so concurrent documents batch together
+        batcher = getattr(llm_client, "batch_dispatcher", None)
+        if not isinstance(batcher, MicroBatchDispatcher):
+            batcher = MicroBatchDispatcher.from_client(llm_client)
+        self.batcher = batcher
     
     async def process_documentation(
         self,
@@ -218,19 +243,23 @@ class SmartIngestionPipeline:
             # Split by chunk marker
             chunk_texts = response.split("---CHUNK---")
             
+            # Keep chunks above the minimum size with their original positions
+            kept = [
+                (i, chunk_text.strip()) for i, chunk_text in enumerate(chunk_texts)
+                if len(chunk_text.strip()) > 50
+            ]
+            
+            # Extract metadata for all chunks concurrently; the requests are
+            # micro-batched into a few LLM calls
+            metadata = await asyncio.gather(
+                *(self._extract_chunk_metadata(chunk_text, intent) for _, chunk_text in kept)
+            )
+            
             # Create chunk objects
-            chunks = []
-            for i, chunk_text in enumerate(chunk_texts):
-                chunk_text = chunk_text.strip()
-                if chunk_text and len(chunk_text) > 50:  # Minimum chunk size
-                    # Extract any headers or key topics from chunk
-                    chunk_metadata = await self._extract_chunk_metadata(chunk_text, intent)
-                    
-                    chunks.append(Chunk(
-                        text=chunk_text,
-                        index=i,
-                        metadata=chunk_metadata
-                    ))
+            chunks = [
+                Chunk(text=chunk_text, index=i, metadata=chunk_metadata)
+                for (i, chunk_text), chunk_metadata in zip(kept, metadata)
+            ]
             
             # If no chunks were created or too few, fall back to simple chunking
             if len(chunks) < 2:
@@ -310,44 +339,13 @@ class SmartIngestionPipeline:
             # For performance, only extract metadata for first 500 chars
             preview = chunk_text[:500]
             
-            prompt = f"""
-            Extract key metadata from this documentation chunk.
-            
-            Technology: {intent.technology}
-            Chunk preview: {preview}
-            
-            Extract:
-            1. Main topic or concept covered
-            2. Any code language used
-            3. Difficulty level (beginner/intermediate/advanced)
-            
-            Return as JSON:
-            {{
-                "main_topic": "...",
-                "code_language": "...",
-                "difficulty": "..."
-            }}
-            
-            Return ONLY the JSON.
-            """
-            
-            response = await self.llm.generate(prompt)
-            
-            # Parse response
-            try:
-                cleaned_response = response.strip()
-                if cleaned_response.startswith("```json"):
-                    cleaned_response = cleaned_response[7:]
-                if cleaned_response.startswith("```"):
-                    cleaned_response = cleaned_response[3:]
-                if cleaned_response.endswith("```"):
-                    cleaned_response = cleaned_response[:-3]
-                
-                metadata = json.loads(cleaned_response.strip())
-                return metadata
-                
-            except json.JSONDecodeError:
+            metadata = await self.batcher.submit(
+                CHUNK_METADATA_TASK,
+                f"Technology: {intent.technology}\nChunk preview: {preview}"
+            )
+            if not isinstance(metadata, dict):
                 return {"extraction_failed": True}
+            return metadata
                 
         except Exception as e:
             logger.error(f"Metadata extraction failed: {e}")
@@ -3,14 +3,16 @@ Base LLM Provider Abstract Class - PRD-005 LLM-001
 Abstract base class defining common interface for all LLM providers
 
 Implements circuit breaker integration, error handling patterns, and the
-async generate_structured method interface as specified in PRD-005.
+async generate_structured method interface as specified in PRD-005, plus the
+generate_stream token streaming interface.
 """
 
 import logging
 import asyncio
 import hashlib
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Type, TypeVar, List
+from typing import Any, AsyncIterator, Dict, Optional, Tuple, Type, TypeVar, List
 
 from .models import (
     ProviderCapabilities, ProviderCategory, ModelInfo, ModelDiscoveryResult,
@@ -46,6 +48,38 @@ class LLMProviderUnavailableError(LLMProviderError):
     pass
 
 
+async def iter_sse_events(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[Optional[str], str]]:
+    """
+    Parse a server-sent events stream.
+
+    Args:
+        lines: Response body lines
+
+    Yields:
+        (event name or None, data) for each dispatched event
+    """
+    event: Optional[str] = None
+    data: List[str] = []
+    async for line in lines:
+        line = line.rstrip("\r\n")
+        if not line:
+            if data:
+                yield event, "\n".join(data)
+            event, data = None, []
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "event":
+            event = value
+        elif field == "data":
+            data.append(value)
+    if data:
+        yield event, "\n".join(data)
+
+
 class BaseLLMProvider(ABC):
     """
     Enhanced abstract base class for LLM providers implementing PRD-005 requirements
@@ -124,6 +158,81 @@ class BaseLLMProvider(ABC):
         """
         pass
     
+    async def _stream_request(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Stream the response from the LLM provider.
+
+        Providers with a streaming API override this; the default yields
+        the complete _make_request response as a single chunk.
+
+        Args:
+            prompt: Formatted prompt text
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            Response text chunks
+
+        Raises:
+            LLMProviderError: When request fails
+        """
+        yield await self._make_request(prompt, **kwargs)
+
+    async def generate_stream(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Generate text, yielding tokens as the provider produces them.
+
+        Args:
+            prompt: Formatted prompt text
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            Response text chunks (non-empty)
+
+        Raises:
+            LLMProviderError: When the request fails before or during streaming
+        """
+        prompt_hash = hashlib.md5(prompt.encode()).hexdigest()[:8]
+        logger.info(
+            "LLM stream request",
+            extra={"provider": self.provider_name, "prompt_hash": prompt_hash},
+        )
+
+        start_time = time.time()
+        first_token_ms = None
+        chunks = 0
+        try:
+            async for chunk in self._stream_request(prompt, **kwargs):
+                if not chunk:
+                    continue
+                if first_token_ms is None:
+                    first_token_ms = int((time.time() - start_time) * 1000)
+                chunks += 1
+                yield chunk
+        except LLMProviderError:
+            raise
+        except Exception as e:
+            logger.error(
+                "LLM stream failed",
+                extra={
+                    "provider": self.provider_name,
+                    "prompt_hash": prompt_hash,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                },
+            )
+            raise LLMProviderError(f"{self.provider_name} stream failed: {str(e)}")
+
+        logger.info(
+            "LLM stream completed",
+            extra={
+                "provider": self.provider_name,
+                "prompt_hash": prompt_hash,
+                "first_token_ms": first_token_ms,
+                "duration_ms": int((time.time() - start_time) * 1000),
+                "chunks": chunks,
+            },
+        )
+
     @abstractmethod
     async def generate_text(self, request: TextGenerationRequest) -> TextGenerationResponse:
         """
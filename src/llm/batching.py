@@ -0,0 +1,246 @@
+"""
+LLM Micro-Batching
+Coalesces concurrent small prompts into multi-item structured LLM calls
+
+Callers submit (task, content) pairs; prompts sharing the same task
+instructions are collected for a short window and packed into one prompt
+that asks for a JSON result per item id. Each caller awaits only its own
+result. Batches are capped by item count and an estimated token budget, and
+batched calls are limited per provider (ai.providers.<id>.max_concurrent_requests,
+else ai.batching.max_concurrency).
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+
+class BatchItemResult(BaseModel):
+    """Result for one item of a batched prompt"""
+
+    id: str = Field(..., description="Item id from the prompt")
+    result: Any = Field(None, description="Result for the item")
+
+
+class BatchResponse(BaseModel):
+    """Structured response of a batched prompt"""
+
+    results: List[BatchItemResult] = Field(default_factory=list)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough prompt token estimate (about four characters per token)"""
+    return max(1, len(text) // 4)
+
+
+@dataclass
+class _PendingItem:
+    item_id: str
+    content: str
+    future: asyncio.Future
+
+
+@dataclass
+class _Batch:
+    task: str
+    tokens: int
+    items: List[_PendingItem] = field(default_factory=list)
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class MicroBatchDispatcher:
+    """
+    Collects concurrent prompts and dispatches them as batched LLM calls.
+
+    Items missing from a batched response are retried once on their own;
+    an item still without a result resolves to None. A failed call raises
+    its error in every caller of the batch.
+    """
+
+    def __init__(
+        self,
+        llm_client: Any,
+        enabled: bool = True,
+        window_ms: int = 15,
+        max_batch_items: int = 16,
+        max_batch_tokens: int = 3000,
+        max_concurrency: int = 2,
+        provider_concurrency: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            llm_client: LLMProviderClient used for generate_structured
+            enabled: When False every prompt is sent on its own
+            window_ms: How long a batch collects prompts
+            max_batch_items: Maximum items per batched call
+            max_batch_tokens: Estimated token budget per batched call
+            max_concurrency: Concurrent batched calls for providers without a limit
+            provider_concurrency: Concurrent batched calls per provider id
+        """
+        self.llm = llm_client
+        self.enabled = enabled
+        self.window = window_ms / 1000.0
+        self.max_batch_items = max_batch_items
+        self.max_batch_tokens = max_batch_tokens
+        self.max_concurrency = max_concurrency
+        self.provider_concurrency = provider_concurrency or {}
+
+        self._pending: Dict[str, _Batch] = {}
+        self._inflight: Set[asyncio.Task] = set()
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._next_id = 0
+        self._stats = {
+            "items": 0,
+            "batches": 0,
+            "retried_items": 0,
+            "failed_batches": 0,
+            "max_batch_size": 0,
+        }
+
+    @classmethod
+    def from_client(cls, llm_client: Any) -> "MicroBatchDispatcher":
+        """Create a dispatcher from the client's ai configuration"""
+        config = getattr(llm_client, "config", None)
+        config = config if isinstance(config, dict) else {}
+        batching = config.get("batching") or {}
+        provider_concurrency = {
+            provider_id: provider["max_concurrent_requests"]
+            for provider_id, provider in (config.get("providers") or {}).items()
+            if isinstance(provider, dict) and provider.get("max_concurrent_requests")
+        }
+        return cls(llm_client, provider_concurrency=provider_concurrency, **batching)
+
+    async def submit(self, task: str, content: str) -> Any:
+        """
+        Submit one item and wait for its result.
+
+        Args:
+            task: Instructions applied to the item; items with identical
+                instructions are batched together
+            content: Item content
+
+        Returns:
+            The JSON result for the item, or None if the model returned none
+        """
+        loop = asyncio.get_running_loop()
+        item = _PendingItem(str(self._next_id), content, loop.create_future())
+        self._next_id += 1
+        self._stats["items"] += 1
+
+        if not self.enabled:
+            await self._dispatch(task, [item])
+            return await item.future
+
+        tokens = estimate_tokens(content) + 16
+        batch = self._pending.get(task)
+        if batch and batch.items and batch.tokens + tokens > self.max_batch_tokens:
+            self._flush(task)
+            batch = None
+        if batch is None:
+            batch = _Batch(task=task, tokens=estimate_tokens(task) + 64)
+            batch.timer = loop.call_later(self.window, self._flush, task)
+            self._pending[task] = batch
+
+        batch.items.append(item)
+        batch.tokens += tokens
+        if len(batch.items) >= self.max_batch_items:
+            self._flush(task)
+
+        return await item.future
+
+    async def flush(self) -> None:
+        """Send all collected batches now and wait for in-flight calls"""
+        for task in list(self._pending):
+            self._flush(task)
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Batching statistics"""
+        stats = dict(self._stats)
+        stats["llm_calls_saved"] = max(stats["items"] - stats["batches"], 0)
+        stats["pending_items"] = sum(len(batch.items) for batch in self._pending.values())
+        return stats
+
+    def _flush(self, task: str) -> None:
+        batch = self._pending.pop(task, None)
+        if batch is None:
+            return
+        if batch.timer:
+            batch.timer.cancel()
+        dispatch = asyncio.create_task(self._dispatch(task, batch.items))
+        self._inflight.add(dispatch)
+        dispatch.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, task: str, items: List[_PendingItem], retry: bool = True) -> None:
+        items = [item for item in items if not item.future.done()]
+        if not items:
+            return
+
+        provider = getattr(self.llm, "primary_provider_name", None) or "default"
+        start_time = time.time()
+        async with self._semaphore(provider):
+            self._stats["batches"] += 1
+            self._stats["max_batch_size"] = max(self._stats["max_batch_size"], len(items))
+            try:
+                response = await self.llm.generate_structured(
+                    self._build_prompt(task, items), BatchResponse
+                )
+            except Exception as e:
+                self._stats["failed_batches"] += 1
+                logger.warning(f"Batched LLM call for {len(items)} items failed: {e}")
+                for item in items:
+                    if not item.future.done():
+                        item.future.set_exception(e)
+                return
+
+        results = {result.id: result.result for result in response.results}
+        missing = []
+        for item in items:
+            if item.item_id not in results:
+                missing.append(item)
+            elif not item.future.done():
+                item.future.set_result(results[item.item_id])
+
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.info(f"PIPELINE_METRICS: step=llm_micro_batch duration_ms={duration_ms} "
+                   f"provider={provider} items={len(items)} missing={len(missing)}")
+
+        if missing and retry and len(items) > 1:
+            self._stats["retried_items"] += len(missing)
+            await asyncio.gather(*(self._dispatch(task, [item], retry=False) for item in missing))
+        else:
+            for item in missing:
+                if not item.future.done():
+                    item.future.set_result(None)
+
+    def _semaphore(self, provider: str) -> asyncio.Semaphore:
+        if provider not in self._semaphores:
+            limit = self.provider_concurrency.get(provider, self.max_concurrency)
+            self._semaphores[provider] = asyncio.Semaphore(limit)
+        return self._semaphores[provider]
+
+    @staticmethod
+    def _build_prompt(task: str, items: List[_PendingItem]) -> str:
+        sections = "\n\n".join(f"### ITEM {item.item_id}\n{item.content}" for item in items)
+        return f"""{task.strip()}
+
+Apply the instructions above to each of the {len(items)} items below independently.
+Each item starts with a line "### ITEM <id>".
+
+{sections}
+
+Return ONLY JSON in this format, with one entry per item id:
+{{
+    "results": [
+        {{"id": "<item id>", "result": <JSON result for that item>}}
+    ]
+}}"""
@@ -8,10 +8,12 @@ selection and health monitoring as specified in PRD-005.
 
 import logging
 import time
-from typing import Any, Dict, Optional, Type, TypeVar, List
+from typing import Any, AsyncIterator, Dict, Optional, Type, TypeVar, List
 from enum import Enum
 
 from .base_provider import BaseLLMProvider, LLMProviderError
+from .batching import MicroBatchDispatcher
+from .json_parser import stream_json_field
 from .ollama_provider import OllamaProvider
 from .openai_provider import OpenAIProvider
 from .models import (
@@ -99,6 +101,9 @@ class LLMProviderClient:
         
         # Rate limiting tracking
         self._rate_limits = {}
+
+        # Shared micro-batching dispatcher, created on first use
+        self._batch_dispatcher: Optional[MicroBatchDispatcher] = None
         
         if _service_logger:
             _service_logger.log_service_call(
@@ -429,6 +434,89 @@ Return your response as JSON in this format:
             
             raise LLMProviderError("Failed to generate response with any provider")
     
+    async def generate_stream(
+        self, prompt: str, json_field: Optional[str] = "text", **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream text generation, yielding tokens as they are produced.
+
+        By default the prompt requests the same JSON envelope as generate()
+        and the envelope field is unwrapped incrementally, so callers receive
+        plain text from the first token. Failover to the next provider only
+        happens before the first token has been yielded.
+
+        Args:
+            prompt: Text prompt
+            json_field: Envelope field to stream, or None for the raw completion
+            **kwargs: Additional provider parameters
+
+        Yields:
+            Generated text chunks
+
+        Raises:
+            LLMProviderError: When all providers fail or a stream breaks mid-way
+            LLMProviderUnavailableError: When no providers are available
+        """
+        await self._maybe_check_health()
+
+        providers_to_try = self._get_provider_order()
+        if not providers_to_try:
+            raise LLMProviderUnavailableError(
+                "No LLM providers are configured or available"
+            )
+
+        if json_field:
+            prompt = f"""{prompt}
+
+Return your response as JSON in this format:
+{{
+    "{json_field}": "Your response here"
+}}"""
+
+        last_error = None
+        for provider_name in providers_to_try:
+            provider = self.providers.get(provider_name)
+            if not provider:
+                continue
+
+            start_time = time.time()
+            self._request_metrics["total_requests"] += 1
+            started = False
+            try:
+                logger.info(f"Attempting LLM streaming generation with {provider_name}")
+                chunks = provider.generate_stream(prompt, **kwargs)
+                if json_field:
+                    chunks = stream_json_field(chunks, json_field)
+                async for chunk in chunks:
+                    if not started:
+                        started = True
+                        logger.info(
+                            f"LLM stream first token from {provider_name} in "
+                            f"{int((time.time() - start_time) * 1000)}ms"
+                        )
+                    yield chunk
+
+                self._request_metrics["successful_requests"] += 1
+                self.provider_status[provider_name] = ProviderStatus.HEALTHY
+                return
+
+            except LLMProviderError as e:
+                self._request_metrics["failed_requests"] += 1
+                self.provider_status[provider_name] = (
+                    ProviderStatus.RATE_LIMITED if "rate limit" in str(e).lower()
+                    else ProviderStatus.UNHEALTHY
+                )
+                logger.warning(f"Provider {provider_name} stream failed: {e}")
+                if started or not self.enable_failover:
+                    raise
+                last_error = e
+
+        if last_error:
+            raise last_error
+        raise LLMProviderUnavailableError(
+            "All LLM providers failed or are unavailable"
+        )
+
     async def _maybe_check_health(self):
         """Perform periodic health checks on providers."""
         import time
@@ -725,6 +813,13 @@ Return your response as JSON in this format:
             logger.error(f"LLM response parsing error: {e}")
             return None
 
+    @property
+    def batch_dispatcher(self) -> MicroBatchDispatcher:
+        """Micro-batching dispatcher shared by all users of this client"""
+        if self._batch_dispatcher is None:
+            self._batch_dispatcher = MicroBatchDispatcher.from_client(self)
+        return self._batch_dispatcher
+
     def _sanitize_input(self, value: str) -> str:
         """
         Sanitize input to prevent prompt injection and unsafe content.
@@ -744,6 +839,9 @@ Return your response as JSON in this format:
 
     async def close(self):
         """Close all provider sessions and cleanup resources."""
+        if self._batch_dispatcher is not None:
+            await self._batch_dispatcher.flush()
+
         for provider_name, provider in self.providers.items():
             try:
                 await provider.close()
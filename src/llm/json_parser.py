@@ -3,13 +3,15 @@ JSON Parsing Utility for LLM Responses - PRD-005 LLM-006
 Robust JSON extraction and validation from LLM responses
 
 Handles partial JSON, markdown code blocks, malformed responses, and validates
-against expected Pydantic model schemas as specified in PRD-005.
+against expected Pydantic model schemas as specified in PRD-005. Streamed
+responses are parsed incrementally so fields can be used before the
+completion finishes.
 """
 
 import logging
 import json
 import re
-from typing import Optional, Type, TypeVar
+from typing import Any, AsyncIterator, List, Optional, Tuple, Type, TypeVar
 from pydantic import BaseModel, ValidationError
 
 logger = logging.getLogger(__name__)
@@ -272,3 +274,277 @@ def parse_llm_response(response_text: str, model_class: Type[T]) -> Optional[T]:
         return JSONParser.extract_and_parse(response_text, model_class)
     except Exception:
         return None
+
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+class IncrementalJSONParser:
+    """
+    Incremental parser for a JSON object streamed in chunks.
+
+    Each character is scanned once to track string, escape and nesting
+    state, and the last position where the prefix is a complete value once
+    its open containers are closed. partial() closes the prefix and parses
+    it only when such a safe point has advanced since the last parse; a
+    string value still being generated is extended between safe points by
+    decoding just its new characters, so fields are available while the
+    response streams. Text before the first brace, such as a markdown code
+    fence, is skipped.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self._start: Optional[int] = None
+        self._scanned = 0
+        self._stack: List[str] = []
+        self._expect_key: List[bool] = []
+        self._keys: List[Optional[Tuple[int, int]]] = []
+        self._in_string = False
+        self._string_is_key = False
+        self._string_start = 0
+        self._escape = False
+        self._unicode_left = 0
+        self._pending_high_surrogate = False
+        self._clean = 0
+        self._safe: Tuple[int, Tuple[str, ...]] = (0, ())
+        self._end: Optional[int] = None
+        self._partial: Any = None
+        self._partial_at = -1
+        self._parsed_safe: Optional[int] = None
+        self._string_base_at: Optional[int] = None
+        self._string_holder: Any = None
+        self._string_key: Any = None
+        self._string_text = ""
+        self._decoded_to = 0
+
+    @property
+    def started(self) -> bool:
+        """Whether the opening brace of the object has been seen"""
+        return self._start is not None
+
+    @property
+    def complete(self) -> bool:
+        """Whether the top-level object has been closed"""
+        return self._end is not None
+
+    def feed(self, chunk: str) -> None:
+        """
+        Append a streamed chunk.
+
+        Args:
+            chunk: Next piece of response text
+        """
+        if self.complete:
+            return
+        self.buffer += chunk
+        self._scan()
+
+    def partial(self) -> Any:
+        """
+        Parse the longest complete prefix of the object.
+
+        The object returned while a string value is being generated is
+        updated in place by later calls until that string closes.
+
+        Returns:
+            The object parsed so far (a dict), or None before the opening brace
+        """
+        if not self.started:
+            return None
+        if self._partial_at == len(self.buffer):
+            return self._partial
+        self._partial_at = len(self.buffer)
+
+        if self.complete:
+            parsed = self._parse(self.buffer[self._start : self._end + 1])
+            if parsed is not None:
+                self._partial = parsed
+        elif self._in_string and not self._string_is_key:
+            self._extend_string()
+        else:
+            position, stack = self._safe
+            if position != self._parsed_safe:
+                parsed = self._parse(self.buffer[self._start : position] + self._closers(stack))
+                if parsed is not None:
+                    self._partial = parsed
+                self._parsed_safe = position
+        return self._partial
+
+    def result(self, model_class: Type[T]) -> Optional[T]:
+        """Validate the complete response against a model"""
+        return JSONParser.extract_and_parse(self.buffer, model_class)
+
+    def _extend_string(self) -> None:
+        """Update the string value being generated with its newly decoded characters"""
+        if self._string_base_at != self._string_start:
+            # Parse the structure once, with the new string still empty
+            self._string_base_at = self._string_start
+            self._string_holder = None
+            base = self._parse(
+                self.buffer[self._start : self._string_start + 1] + '"' + self._closers(self._stack)
+            )
+            if base is None:
+                return
+            self._locate_string(base)
+            self._string_text = ""
+            self._decoded_to = self._string_start + 1
+            self._partial = base
+            self._parsed_safe = None
+
+        if self._string_holder is None or self._clean <= self._decoded_to:
+            return
+        piece = self._parse('"' + self.buffer[self._decoded_to : self._clean] + '"')
+        if piece is None:
+            return
+        self._string_text += piece
+        self._decoded_to = self._clean
+        self._string_holder[self._string_key] = self._string_text
+
+    def _locate_string(self, base: Any) -> None:
+        """Find the container and key of the open string value in a parsed prefix"""
+        node = base
+        for depth in range(len(self._stack) - 1):
+            node = node[self._key_at(depth)] if self._stack[depth] == "{" else node[-1]
+        self._string_holder = node
+        self._string_key = self._key_at(len(self._stack) - 1) if self._stack[-1] == "{" else len(node) - 1
+
+    def _key_at(self, depth: int) -> str:
+        """Decoded key of the member currently open at a nesting depth"""
+        key_start, key_end = self._keys[depth]
+        return json.loads(self.buffer[key_start:key_end])
+
+    @staticmethod
+    def _closers(stack: Tuple[str, ...]) -> str:
+        return "".join(_CLOSERS[c] for c in reversed(stack))
+
+    @staticmethod
+    def _parse(candidate: str) -> Any:
+        try:
+            return json.loads(candidate)
+        except json.JSONDecodeError:
+            logger.debug("Partial JSON not parseable yet, keeping previous value")
+            return None
+
+    def _scan(self) -> None:
+        """Advance the scanner over newly buffered characters"""
+        buffer = self.buffer
+        for position in range(self._scanned, len(buffer)):
+            char = buffer[position]
+            if self._start is None:
+                if char == "{":
+                    self._start = position
+                    self._open(char, position)
+                continue
+
+            if self._in_string:
+                self._scan_string_char(char, position)
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_is_key = bool(self._expect_key) and self._expect_key[-1]
+                self._string_start = position
+                self._clean = position + 1
+            elif char in "{[":
+                self._open(char, position)
+            elif char in "}]":
+                if self._stack:
+                    self._stack.pop()
+                    self._expect_key.pop()
+                    self._keys.pop()
+                if not self._stack:
+                    self._end = position
+                    self._scanned = position + 1
+                    return
+                self._safe = (position + 1, tuple(self._stack))
+            elif char == ",":
+                self._safe = (position, tuple(self._stack))
+                if self._stack[-1] == "{":
+                    self._expect_key[-1] = True
+            elif char == ":":
+                self._expect_key[-1] = False
+        self._scanned = len(buffer)
+
+    def _scan_string_char(self, char: str, position: int) -> None:
+        """
+        Track escapes inside a string; _clean is the end of its decodable part.
+
+        Incomplete escapes, and a \\u high surrogate until its pair follows,
+        stay beyond _clean.
+        """
+        if self._unicode_left:
+            self._unicode_left -= 1
+            if self._unicode_left:
+                return
+            try:
+                code = int(self.buffer[position - 3 : position + 1], 16)
+            except ValueError:
+                code = 0
+            if 0xD800 <= code < 0xDC00 and not self._pending_high_surrogate:
+                self._pending_high_surrogate = True
+                return
+        elif self._escape:
+            self._escape = False
+            if char == "u":
+                self._unicode_left = 4
+                return
+        elif char == "\\":
+            self._escape = True
+            return
+        elif char == '"':
+            self._in_string = False
+            if self._string_is_key:
+                self._keys[-1] = (self._string_start, position + 1)
+            else:
+                self._safe = (position + 1, tuple(self._stack))
+            return
+        self._pending_high_surrogate = False
+        self._clean = position + 1
+
+    def _open(self, char: str, position: int) -> None:
+        self._stack.append(char)
+        self._expect_key.append(char == "{")
+        self._keys.append(None)
+        self._safe = (position + 1, tuple(self._stack))
+
+
+async def stream_json_field(chunks: AsyncIterator[str], field: str) -> AsyncIterator[str]:
+    """
+    Yield a top-level string field of a streamed JSON object as it grows.
+
+    Used to unwrap JSON-enveloped completions (e.g. {"text": "..."}) token by
+    token. If the response does not start with a JSON object or code fence,
+    the text is passed through unchanged.
+
+    Args:
+        chunks: Streamed response text
+        field: Name of the string field to emit
+
+    Yields:
+        Newly generated characters of the field
+    """
+    parser = IncrementalJSONParser()
+    raw = False
+    emitted = 0
+    async for chunk in chunks:
+        if raw:
+            yield chunk
+            continue
+
+        parser.feed(chunk)
+        if not parser.started:
+            leading = parser.buffer.lstrip()
+            if leading and leading[0] not in "{`":
+                raw = True
+                yield parser.buffer
+            continue
+
+        value = (parser.partial() or {}).get(field)
+        if isinstance(value, str) and len(value) > emitted:
+            yield value[emitted:]
+            emitted = len(value)
+
+    if not raw and not parser.started and parser.buffer.strip():
+        # Only a code fence prefix arrived; nothing parseable
+        yield parser.buffer
@@ -1,15 +1,18 @@
 """
 Ollama LLM Provider Implementation - PRD-005 LLM-002
 Ollama-specific provider class with POST requests to /api/generate endpoint
+(text) and /api/embed endpoint (embeddings)
 
 Implements circuit breaker configuration for internal service with lower
-tolerance settings as specified in PRD-005 lines 244-250.
+tolerance settings as specified in PRD-005 lines 244-250. Streaming requests
+read Ollama's newline-delimited JSON chunks.
 """
 
 import logging
 import asyncio
+import json
 import aiohttp
-from typing import Any, Dict, Optional, List
+from typing import Any, AsyncIterator, Dict, Optional, List
 from datetime import datetime
 
 from .base_provider import (
@@ -20,7 +23,8 @@ from .base_provider import (
 )
 from .models import (
     ProviderCapabilities, ProviderCategory, ModelInfo, ModelType,
-    ModelDiscoveryResult, TextGenerationRequest, TextGenerationResponse
+    ModelDiscoveryResult, TextGenerationRequest, TextGenerationResponse,
+    EmbeddingRequest, EmbeddingResponse
 )
 
 logger = logging.getLogger(__name__)
@@ -95,6 +99,7 @@ class OllamaProvider(BaseLLMProvider):
         self.temperature = config.get("temperature", 0.7)
         self.max_tokens = config.get("max_tokens", 4096)
         self.timeout = config.get("timeout_seconds", 60)
+        self.embedding_model = config.get("embedding_model") or "nomic-embed-text"
         self.session: aiohttp.ClientSession = None
         self._circuit_breaker = self._create_circuit_breaker()
 
@@ -103,7 +108,7 @@ class OllamaProvider(BaseLLMProvider):
         """Get static capabilities for Ollama provider."""
         return ProviderCapabilities(
             text_generation=True,
-            embeddings=False,  # Ollama embeddings require separate endpoint
+            embeddings=True,
             streaming=True,
             function_calling=False,
             local=True,
@@ -150,6 +155,11 @@ class OllamaProvider(BaseLLMProvider):
                     "maximum": 300,
                     "default": 60,
                     "description": "Request timeout in seconds"
+                },
+                "embedding_model": {
+                    "type": "string",
+                    "default": "nomic-embed-text",
+                    "description": "Model used for /api/embed requests"
                 }
             },
             "required": ["endpoint"],
@@ -196,19 +206,7 @@ class OllamaProvider(BaseLLMProvider):
         await self._ensure_session()
         if self._circuit_breaker.is_open():
             raise LLMProviderUnavailableError("Circuit breaker is open")
-        payload = {
-            "model": kwargs.get("model", self.model),
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": kwargs.get("temperature", self.temperature),
-                "num_predict": kwargs.get("max_tokens", self.max_tokens),
-            },
-        }
-        if "top_p" in kwargs:
-            payload["options"]["top_p"] = kwargs["top_p"]
-        if "top_k" in kwargs:
-            payload["options"]["top_k"] = kwargs["top_k"]
+        payload = self._build_payload(prompt, stream=False, **kwargs)
 
         url = f"{self.endpoint}/api/generate"
         try:
@@ -260,6 +258,94 @@ class OllamaProvider(BaseLLMProvider):
             logger.error(f"Unexpected Ollama error: {e}")
             raise LLMProviderError(f"Unexpected Ollama error: {str(e)}")
 
+    async def _stream_request(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Stream tokens from Ollama /api/generate (newline-delimited JSON).
+
+        Args:
+            prompt: Formatted prompt text
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+
+        Yields:
+            Response text chunks as generated
+
+        Raises:
+            LLMProviderError: When request fails
+            LLMProviderTimeoutError: When no chunk arrives within the timeout
+        """
+        await self._ensure_session()
+        if self._circuit_breaker.is_open():
+            raise LLMProviderUnavailableError("Circuit breaker is open")
+        payload = self._build_payload(prompt, stream=True, **kwargs)
+
+        url = f"{self.endpoint}/api/generate"
+        # Bound the wait between chunks rather than the whole generation
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=self.timeout)
+        received = False
+        try:
+            logger.debug(f"Making streaming Ollama request to {url}")
+            async with self.session.post(url, json=payload, timeout=timeout) as response:
+                if response.status != 200:
+                    self._circuit_breaker.record_failure()
+                    if response.status == 404:
+                        raise LLMProviderError(
+                            f"Ollama model '{payload['model']}' not found"
+                        )
+                    error_text = await response.text()
+                    raise LLMProviderError(
+                        f"Ollama request failed with status {response.status}: {error_text}"
+                    )
+                async for line in response.content:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    data = json.loads(line)
+                    if "error" in data:
+                        self._circuit_breaker.record_failure()
+                        raise LLMProviderError(f"Ollama error: {data['error']}")
+                    token = data.get("response", "")
+                    if token:
+                        received = True
+                        yield token
+                    if data.get("done"):
+                        break
+            if not received:
+                self._circuit_breaker.record_failure()
+                raise LLMProviderError("Empty response from Ollama")
+            self._circuit_breaker.record_success()
+        except LLMProviderError:
+            raise
+        except asyncio.TimeoutError:
+            self._circuit_breaker.record_failure()
+            logger.error(f"Ollama stream timeout: no data for {self.timeout}s")
+            raise LLMProviderTimeoutError(
+                f"Ollama stream timed out after {self.timeout}s without data"
+            )
+        except json.JSONDecodeError as e:
+            self._circuit_breaker.record_failure()
+            raise LLMProviderError(f"Invalid Ollama stream chunk: {str(e)}")
+        except aiohttp.ClientError as e:
+            self._circuit_breaker.record_failure()
+            logger.error(f"Ollama client error: {e}")
+            raise LLMProviderError(f"Ollama connection error: {str(e)}")
+
+    def _build_payload(self, prompt: str, stream: bool, **kwargs) -> Dict[str, Any]:
+        """Build the /api/generate request body"""
+        payload = {
+            "model": kwargs.get("model", self.model),
+            "prompt": prompt,
+            "stream": stream,
+            "options": {
+                "temperature": kwargs.get("temperature", self.temperature),
+                "num_predict": kwargs.get("max_tokens", self.max_tokens),
+            },
+        }
+        if "top_p" in kwargs:
+            payload["options"]["top_p"] = kwargs["top_p"]
+        if "top_k" in kwargs:
+            payload["options"]["top_k"] = kwargs["top_k"]
+        return payload
+
     async def list_models(self) -> Dict[str, Any]:
         """
         List available models from Ollama.
@@ -401,6 +487,66 @@ class OllamaProvider(BaseLLMProvider):
         except Exception as e:
             raise LLMProviderError(f"Text generation failed: {str(e)}")
     
+    async def generate_embeddings(self, request: EmbeddingRequest) -> EmbeddingResponse:
+        """
+        Generate embeddings with one POST to Ollama's /api/embed endpoint.
+        
+        Args:
+            request: Embedding request; all texts are sent as a single batch
+            
+        Returns:
+            Embedding response with one vector per input text
+            
+        Raises:
+            LLMProviderError: When the request fails or returns malformed vectors
+            LLMProviderTimeoutError: When the request times out
+        """
+        await self._ensure_session()
+        if self._circuit_breaker.is_open():
+            raise LLMProviderUnavailableError("Circuit breaker is open")
+        
+        start_time = datetime.utcnow()
+        model = request.model_id or self.embedding_model
+        url = f"{self.endpoint}/api/embed"
+        try:
+            async with self.session.post(
+                url, json={"model": model, "input": request.texts}
+            ) as response:
+                if response.status != 200:
+                    self._circuit_breaker.record_failure()
+                    error_text = await response.text()
+                    raise LLMProviderError(
+                        f"Ollama embedding request failed with status {response.status}: {error_text}"
+                    )
+                response_data = await response.json()
+        except asyncio.TimeoutError:
+            self._circuit_breaker.record_failure()
+            raise LLMProviderTimeoutError(
+                f"Ollama embedding request timed out after {self.timeout}s"
+            )
+        except aiohttp.ClientError as e:
+            self._circuit_breaker.record_failure()
+            raise LLMProviderError(f"Ollama connection error: {str(e)}")
+        
+        embeddings = response_data.get("embeddings")
+        if not isinstance(embeddings, list) or len(embeddings) != len(request.texts):
+            self._circuit_breaker.record_failure()
+            raise LLMProviderError(
+                "Invalid Ollama embedding response: expected one vector per input"
+            )
+        self._circuit_breaker.record_success()
+        
+        latency_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+        return EmbeddingResponse(
+            embeddings=embeddings,
+            tokens_used=response_data.get("prompt_eval_count", 0),
+            latency_ms=latency_ms,
+            model_id=model,
+            provider_id=self._provider_id,
+            cost_usd=None,
+            metadata=request.metadata
+        )
+    
     async def discover_models(self, config: Dict[str, Any]) -> ModelDiscoveryResult:
         """
         Discover available models from Ollama server.
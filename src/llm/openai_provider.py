@@ -11,7 +11,7 @@ This provider does NOT require or use the real OpenAI cloud API unless configure
 import logging
 import asyncio
 import os
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 from .base_provider import BaseLLMProvider, LLMProviderError, LLMProviderTimeoutError, LLMProviderUnavailableError
 
@@ -198,28 +198,78 @@ class OpenAIProvider(BaseLLMProvider):
             self._circuit_breaker.record_success()
             return response_text.strip()
         except Exception as e:
-            msg = str(e)
-            if "authentication" in msg.lower():
-                self._circuit_breaker.record_failure()
-                logger.error(
-                    "OpenAI-compatible API authentication failed - check API key"
-                )
-                raise LLMProviderError(
-                    "OpenAI-compatible API authentication failed - check API key"
-                )
-            if "rate limit" in msg.lower():
-                self._circuit_breaker.record_failure()
-                logger.warning(f"OpenAI-compatible rate limit exceeded: {e}")
-                raise LLMProviderError(f"OpenAI-compatible rate limit exceeded: {e}")
-            if isinstance(e, asyncio.TimeoutError):
-                self._circuit_breaker.record_failure()
-                logger.error(f"OpenAI-compatible request timeout after {self.timeout}s")
-                raise LLMProviderTimeoutError(
-                    f"OpenAI-compatible request timed out after {self.timeout}s"
-                )
-            logger.error(f"Unexpected OpenAI-compatible error: {e}")
+            raise self._translate_error(e)
+
+    async def _stream_request(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Stream tokens from the Chat Completions API (server-sent events,
+        decoded by the SDK).
+
+        Args:
+            prompt: Formatted prompt text
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+
+        Yields:
+            Response text chunks as generated
+
+        Raises:
+            LLMProviderError: When request fails
+            LLMProviderTimeoutError: When request times out
+        """
+        if self._circuit_breaker.is_open():
+            raise LLMProviderUnavailableError("Circuit breaker is open")
+
+        received = False
+        try:
+            stream = await self._client.chat.completions.create(
+                model=kwargs.get("model", self.model),
+                messages=[{"role": "user", "content": prompt}],
+                temperature=kwargs.get("temperature", self.temperature),
+                max_tokens=kwargs.get("max_tokens", self.max_tokens),
+                top_p=kwargs.get("top_p", 1.0),
+                frequency_penalty=kwargs.get("frequency_penalty", 0.0),
+                presence_penalty=kwargs.get("presence_penalty", 0.0),
+                timeout=self.timeout,
+                stream=True,
+            )
+            async for chunk in stream:
+                if not getattr(chunk, "choices", None):
+                    continue
+                token = getattr(chunk.choices[0].delta, "content", None)
+                if token:
+                    received = True
+                    yield token
+        except LLMProviderError:
+            raise
+        except Exception as e:
+            raise self._translate_error(e)
+
+        if not received:
             self._circuit_breaker.record_failure()
-            raise LLMProviderError(f"Unexpected OpenAI-compatible error: {str(e)}")
+            raise LLMProviderError("Empty response from OpenAI-compatible endpoint")
+        self._circuit_breaker.record_success()
+
+    def _translate_error(self, e: Exception) -> LLMProviderError:
+        """Record a failure and map an SDK/transport error to a provider error"""
+        self._circuit_breaker.record_failure()
+        msg = str(e)
+        if "authentication" in msg.lower():
+            logger.error(
+                "OpenAI-compatible API authentication failed - check API key"
+            )
+            return LLMProviderError(
+                "OpenAI-compatible API authentication failed - check API key"
+            )
+        if "rate limit" in msg.lower():
+            logger.warning(f"OpenAI-compatible rate limit exceeded: {e}")
+            return LLMProviderError(f"OpenAI-compatible rate limit exceeded: {e}")
+        if isinstance(e, asyncio.TimeoutError):
+            logger.error(f"OpenAI-compatible request timeout after {self.timeout}s")
+            return LLMProviderTimeoutError(
+                f"OpenAI-compatible request timed out after {self.timeout}s"
+            )
+        logger.error(f"Unexpected OpenAI-compatible error: {e}")
+        return LLMProviderError(f"Unexpected OpenAI-compatible error: {str(e)}")
 
     async def list_models(self) -> Dict[str, Any]:
         """
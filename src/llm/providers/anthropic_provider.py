@@ -5,11 +5,12 @@ Access to Claude models with advanced reasoning capabilities
 
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional
+import json
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
 
 import httpx
 
-from ..base_provider import BaseLLMProvider, LLMProviderError
+from ..base_provider import BaseLLMProvider, LLMProviderError, iter_sse_events
 from ..models import (
     ProviderCapabilities, ProviderCategory, ModelInfo, ModelDiscoveryResult,
     TextGenerationRequest, TextGenerationResponse,
@@ -107,8 +108,8 @@ class AnthropicProvider(BaseLLMProvider):
         # TODO: Implement circuit breaker logic
         pass
     
-    async def _make_request(self, prompt: str, **kwargs) -> str:
-        """Make request to Anthropic API"""
+    def _build_request(self, prompt: str, **kwargs) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """Build headers and Messages API payload"""
         headers = {
             "x-api-key": self.api_key,
             "content-type": "application/json",
@@ -128,6 +129,11 @@ class AnthropicProvider(BaseLLMProvider):
                 {"role": "user", "content": prompt}
             ]
         }
+        return headers, payload
+    
+    async def _make_request(self, prompt: str, **kwargs) -> str:
+        """Make request to Anthropic API"""
+        headers, payload = self._build_request(prompt, **kwargs)
         
         try:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
@@ -165,6 +171,45 @@ class AnthropicProvider(BaseLLMProvider):
         except Exception as e:
             raise LLMProviderError(f"Anthropic provider error: {str(e)}")
     
+    async def _stream_request(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """Stream text deltas from the Anthropic Messages API event stream"""
+        headers, payload = self._build_request(prompt, **kwargs)
+        payload["stream"] = True
+        
+        try:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                async with client.stream(
+                    "POST",
+                    f"{self.base_url}/v1/messages",
+                    headers=headers,
+                    json=payload
+                ) as response:
+                    if response.status_code != 200:
+                        body = (await response.aread()).decode(errors="replace")
+                        raise LLMProviderError(f"Anthropic API error: {response.status_code} - {body}")
+                    
+                    async for event, data in iter_sse_events(response.aiter_lines()):
+                        message = json.loads(data)
+                        event_type = message.get("type", event)
+                        if event_type == "content_block_delta":
+                            delta = message.get("delta", {})
+                            if delta.get("type") == "text_delta" and delta.get("text"):
+                                yield delta["text"]
+                        elif event_type == "error":
+                            error_message = message.get("error", {}).get("message", "Unknown error")
+                            raise LLMProviderError(f"Anthropic stream error: {error_message}")
+                        elif event_type == "message_stop":
+                            break
+                        
+        except LLMProviderError:
+            raise
+        except httpx.TimeoutException:
+            raise LLMProviderError(f"Anthropic request timed out after {self.timeout}s")
+        except httpx.RequestError as e:
+            raise LLMProviderError(f"Anthropic request failed: {str(e)}")
+        except Exception as e:
+            raise LLMProviderError(f"Anthropic provider error: {str(e)}")
+    
     async def generate_text(self, request: TextGenerationRequest) -> TextGenerationResponse:
         """Generate text using Anthropic Claude"""
         try:
@@ -5,6 +5,7 @@ A clean, maintainable FastAPI application that consolidates all functionality
 into a single service with essential middleware and clear error handling.
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from datetime import datetime
@@ -26,6 +27,25 @@ metrics = MetricsLogger(logger)
 
 
 
+async def _warm_search_cache_on_startup():
+    """Replay popular queries into the search cache in the background."""
+    try:
+        from src.api.v1.dependencies import get_search_orchestrator
+
+        orchestrator = await get_search_orchestrator()
+        cache_warmer = getattr(orchestrator, "cache_warmer", None)
+        if cache_warmer is None or not cache_warmer.config.warm_on_startup:
+            return
+
+        result = await cache_warmer.warm(force=True, reason="startup")
+        if result.get("status") == "completed":
+            print(f"✅ Search cache warmed with {result['warmed']} queries")
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        print(f"⚠️ Search cache warming failed: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
@@ -56,7 +76,6 @@ async def lifespan(app: FastAPI):
         # This is independent of provider initialization
         try:
             from src.database.init_workspace import init_workspace
-            import asyncio
             
             # Run the sync function in a thread
             workspace_success = await asyncio.to_thread(init_workspace)
@@ -72,11 +91,18 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"⚠️ Configuration manager initialization failed: {e}")
 
+    # Warm the search cache from search history after a deploy/restart
+    cache_warming_task = asyncio.create_task(_warm_search_cache_on_startup())
+
     yield
 
     # Shutdown
     print(f"🛑 Docaiche API shutting down at {datetime.utcnow()}")
 
+    if not cache_warming_task.done():
+        cache_warming_task.cancel()
+        await asyncio.gather(cache_warming_task, return_exceptions=True)
+
     # Cleanup dependencies
     try:
         from src.api.v1.dependencies import cleanup_dependencies
@@ -8,13 +8,13 @@ LLM infrastructure, avoiding duplication while adding new capabilities.
 
 import logging
 import time
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, AsyncIterator, List, Optional
 import json
 
 from .service import TextAIService
 from .models import (
     QueryAnalysis, RelevanceEvaluation, ExternalSearchDecision, 
-    ExternalSearchQuery, FormattedResponse
+    ExternalSearchQuery, FormattedResponse, ResultEvaluationDecision
 )
 from .prompts import PromptType, PromptTemplate, DEFAULT_TEMPLATES
 from ..core.models import NormalizedQuery, VectorSearchResults, EvaluationResult
@@ -24,7 +24,10 @@ from src.llm.models import (
     EnrichmentStrategy,
     QualityAssessment
 )
-from src.search.llm_query_analyzer import LLMQueryAnalyzer
+
+if TYPE_CHECKING:
+    # src.search imports this module through its MCP integration
+    from src.search.llm_query_analyzer import LLMQueryAnalyzer
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +43,7 @@ class TextAILLMAdapter(TextAIService):
     def __init__(
         self,
         llm_client: LLMProviderClient,
-        query_analyzer: Optional[LLMQueryAnalyzer] = None,
+        query_analyzer: Optional["LLMQueryAnalyzer"] = None,
         model_config: Optional[Dict[str, Any]] = None
     ):
         """
@@ -257,7 +260,7 @@ class TextAILLMAdapter(TextAIService):
         except Exception as e:
             logger.error(f"Result evaluation failed: {e}")
             # Fallback evaluation
-            return self._simple_evaluation(results)
+            return self._simple_evaluation(results, query.original_query)
     
     async def refine_query(
         self,
@@ -517,26 +520,7 @@ class TextAILLMAdapter(TextAIService):
         Generate answer using LLM with RESPONSE_FORMAT prompt.
         """
         try:
-            # Get prompt template
-            template = self.prompt_templates[PromptType.RESPONSE_FORMAT]
-            
-            # Prepare results JSON
-            results_json = json.dumps({
-                'summary': content.get('summary', ''),
-                'code_snippets': content.get('code_snippets', [])[:3],
-                'key_points': content.get('key_points', []),
-                'citations': content.get('citations', [])[:3]
-            }, indent=2)
-            
-            # Prepare variables
-            variables = {
-                'query': query.original_query,
-                'response_type': response_type,
-                'results_json': results_json
-            }
-            
-            # Render prompt
-            prompt = template.format(**variables)
+            prompt = self._build_answer_prompt(query, content, response_type)
             
             # Call LLM directly for markdown response
             start_time = time.time()
@@ -553,28 +537,98 @@ class TextAILLMAdapter(TextAIService):
         except Exception as e:
             logger.error(f"LLM answer generation failed: {e}")
             # Fallback to simple formatting
-            answer_parts = []
-            
-            # Add summary
-            if content.get('summary'):
-                answer_parts.append(content['summary'])
-            
-            # Add code examples if present
-            if content.get('code_snippets'):
-                answer_parts.append("\n**Code Examples:**")
-                for i, snippet in enumerate(content['code_snippets'][:3]):
-                    answer_parts.append(f"\n```\n{snippet}\n```")
-            
-            # Add citations
-            if content.get('citations'):
-                answer_parts.append("\n**Sources:**")
-                for citation in content['citations'][:5]:
-                    answer_parts.append(
-                        f"- [{citation['title']}]({citation['url']}) "
-                        f"(relevance: {citation['relevance']:.2f})"
-                    )
+            return self._format_answer_fallback(content)
+    
+    async def generate_answer_stream(
+        self,
+        query: NormalizedQuery,
+        content: Dict[str, Any],
+        response_type: str = "answer"
+    ) -> AsyncIterator[str]:
+        """
+        Stream answer generation token by token for MCP/WebSocket clients.
+        
+        Falls back to the simple formatted answer if the LLM fails before
+        the first token.
+        """
+        if not callable(getattr(type(self.llm_client), "generate_stream", None)):
+            yield await self.generate_answer(query, content, response_type)
+            return
+        
+        started = False
+        start_time = time.time()
+        try:
+            prompt = self._build_answer_prompt(query, content, response_type)
+            async for chunk in self.llm_client.generate_stream(
+                prompt=prompt,
+                temperature=0.7,
+                max_tokens=1000
+            ):
+                if not started:
+                    started = True
+                    logger.info(f"LLM answer first token in {int((time.time() - start_time) * 1000)}ms")
+                yield chunk
+            
+            logger.info(f"LLM answer streaming completed in {int((time.time() - start_time) * 1000)}ms")
             
-            return '\n'.join(answer_parts)
+        except Exception as e:
+            logger.error(f"LLM answer streaming failed: {e}")
+            if started:
+                raise
+            yield self._format_answer_fallback(content)
+    
+    def _build_answer_prompt(
+        self,
+        query: NormalizedQuery,
+        content: Dict[str, Any],
+        response_type: str
+    ) -> str:
+        """Render the RESPONSE_FORMAT prompt for answer generation."""
+        # Get prompt template
+        template = self.prompt_templates[PromptType.RESPONSE_FORMAT]
+        
+        # Prepare results JSON
+        results_json = json.dumps({
+            'summary': content.get('summary', ''),
+            'code_snippets': content.get('code_snippets', [])[:3],
+            'key_points': content.get('key_points', []),
+            'citations': content.get('citations', [])[:3]
+        }, indent=2)
+        
+        # Prepare variables
+        variables = {
+            'query': query.original_query,
+            'response_type': response_type,
+            'results_json': results_json
+        }
+        
+        # Render prompt
+        return template.format(**variables)
+    
+    def _format_answer_fallback(self, content: Dict[str, Any]) -> str:
+        """Simple formatted answer used when LLM generation fails."""
+        answer_parts = []
+        
+        # Add summary
+        if content.get('summary'):
+            answer_parts.append(content['summary'])
+        
+        # Add code examples if present
+        if content.get('code_snippets'):
+            answer_parts.append("\n**Code Examples:**")
+            for i, snippet in enumerate(content['code_snippets'][:3]):
+                answer_parts.append(f"\n```\n{snippet}\n```")
+        
+        # Add citations
+        if content.get('citations'):
+            answer_parts.append("\n**Sources:**")
+            for citation in content['citations'][:5]:
+                answer_parts.append(
+                    f"- [{citation['title']}]({citation['url']}) "
+                    f"(relevance: {citation['relevance']:.2f})"
+                )
+        
+        return '\n'.join(answer_parts)
     
     async def identify_learning_opportunities(
         self,
@@ -875,31 +929,20 @@ class TextAILLMAdapter(TextAIService):
         
         return list(set(entities))
     
-    def _simple_evaluation(self, results: VectorSearchResults) -> EvaluationResult:
-        """Simple evaluation without LLM."""
-        if not results.results:
-            return EvaluationResult(
-                relevance_score=0.0,
-                completeness_score=0.0,
-                needs_refinement=True,
-                needs_external_search=True,
-                missing_information=["No results found"],
-                confidence=0.9
-            )
-        
-        # Calculate average relevance
-        avg_relevance = sum(r.relevance_score for r in results.results) / len(results.results)
-        
-        # Estimate completeness
-        completeness = min(len(results.results) / 10, 1.0)
+    def _simple_evaluation(self, results: VectorSearchResults, query: str = "") -> EvaluationResult:
+        """Simple evaluation without LLM (local score distribution and term coverage)."""
+        from src.search.local_evaluator import LocalRelevanceEvaluator
         
+        local = LocalRelevanceEvaluator().evaluate(query, results.results)
         return EvaluationResult(
-            relevance_score=avg_relevance,
-            completeness_score=completeness,
-            needs_refinement=avg_relevance < 0.6,
-            needs_external_search=completeness < 0.5,
-            missing_information=[],
-            confidence=0.7
+            overall_quality=local.relevance_score,
+            relevance_assessment=local.relevance_score,
+            completeness_score=local.completeness_score,
+            needs_refinement=local.relevance_score < 0.6,
+            needs_external_search=local.needs_external_search,
+            missing_information=local.missing_information,
+            confidence_level=local.confidence,
+            reasoning="Local evaluation without LLM"
         )
     
     def _extract_code_blocks(self, content: str) -> List[str]:
@@ -1046,6 +1089,60 @@ class TextAILLMAdapter(TextAIService):
                 suggested_providers=['brave_search'] if should_search else []
             )
     
+    async def evaluate_and_decide(
+        self,
+        query: NormalizedQuery,
+        results: List[Dict[str, Any]]
+    ) -> ResultEvaluationDecision:
+        """
+        Evaluate results and decide on external search in one LLM call
+        using the RESULT_EVALUATION_DECISION prompt.
+        
+        Args:
+            query: Normalized query
+            results: Top results as dicts with title, content, url and score
+            
+        Returns:
+            ResultEvaluationDecision (heuristic fallback if the LLM call fails)
+        """
+        trace_id = getattr(query, 'trace_id', 'no-trace')
+        try:
+            template = self.prompt_templates[PromptType.RESULT_EVALUATION_DECISION]
+            prompt = template.format(
+                query=query.original_query,
+                results_json=json.dumps(results[:10], indent=2, default=str)
+            )
+            
+            start_time = time.time()
+            decision = await self.llm_client.generate_structured(
+                prompt=prompt,
+                response_model=ResultEvaluationDecision,
+                temperature=0.3,
+                max_tokens=500
+            )
+            
+            duration_ms = int((time.time() - start_time) * 1000)
+            logger.info(
+                f"[{trace_id}] LLM evaluation and external search decision completed in {duration_ms}ms: "
+                f"relevance={decision.relevance_score:.2f}, external={decision.needs_external_search}"
+            )
+            return decision
+            
+        except Exception as e:
+            logger.error(f"LLM evaluation and external search decision failed: {e}")
+            # Fallback to the local evaluation used by _simple_evaluation
+            from src.search.local_evaluator import LocalRelevanceEvaluator
+            
+            local = LocalRelevanceEvaluator().evaluate(query.original_query, results)
+            return ResultEvaluationDecision(
+                relevance_score=local.relevance_score,
+                completeness_score=local.completeness_score,
+                missing_information=local.missing_information,
+                confidence=local.confidence,
+                needs_external_search=local.needs_external_search,
+                reasoning="Fallback decision based on local evaluation"
+            )
+    
     async def generate_search_query(self, original_query: str, context: Dict[str, Any]) -> ExternalSearchQuery:
         """Generate optimized search query."""
         
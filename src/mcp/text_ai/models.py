@@ -208,6 +208,48 @@ class ExternalSearchDecision(BaseModel):
     )
 
 
+class ResultEvaluationDecision(BaseModel):
+    """
+    Response model for combined Result Relevance Evaluation and External
+    Search Decision (Decisions 2 and 4 in one call).
+    
+    Lets the search pipeline evaluate results and decide on external search
+    with a single LLM round trip.
+    """
+    
+    relevance_score: float = Field(
+        description="Overall relevance score (0.0-1.0)",
+        ge=0.0,
+        le=1.0
+    )
+    
+    completeness_score: float = Field(
+        description="Answer completeness (0.0-1.0)",
+        ge=0.0,
+        le=1.0
+    )
+    
+    missing_information: List[str] = Field(
+        default_factory=list,
+        description="List of missing information elements"
+    )
+    
+    confidence: float = Field(
+        description="Confidence in evaluation (0.0-1.0)",
+        ge=0.0,
+        le=1.0
+    )
+    
+    needs_external_search: bool = Field(
+        description="Whether external search would provide significantly better results"
+    )
+    
+    reasoning: str = Field(
+        default="",
+        description="Reasoning for the external search decision"
+    )
+
+
 class ExternalSearchQuery(BaseModel):
     """
     Response model for External Search Query Generation (Decision 5).
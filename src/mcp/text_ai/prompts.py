@@ -21,6 +21,7 @@ class PromptType(str, Enum):
     RESULT_RELEVANCE = "result_relevance"
     QUERY_REFINEMENT = "query_refinement"
     EXTERNAL_SEARCH_DECISION = "external_search_decision"
+    RESULT_EVALUATION_DECISION = "result_evaluation_decision"
     EXTERNAL_SEARCH_QUERY = "external_search_query"
     CONTENT_EXTRACTION = "content_extraction"
     RESPONSE_FORMAT = "response_format"
@@ -275,6 +276,23 @@ Consider:
 
 Return your decision (true/false) and reasoning in JSON format.''',
 
+    PromptType.RESULT_EVALUATION_DECISION: '''Evaluate these search results for the query and decide if external search is needed:
+
+Query: "{query}"
+
+Search Results:
+{results_json}
+
+Please assess:
+1. Overall relevance score (0-1)
+2. Completeness score (0-1)
+3. Missing information (if any)
+4. Confidence in your evaluation (0-1)
+5. Would external search (documentation sites, public repositories, web search) provide significantly better results? (true/false)
+6. Reasoning for the external search decision
+
+Return your evaluation and decision in JSON format.''',
+
     PromptType.EXTERNAL_SEARCH_QUERY: '''Generate an optimal external search query based on:
 
 Original Query: "{original_query}"
@@ -552,6 +570,7 @@ class PromptTemplateManager(ABC):
                     PromptType.QUERY_UNDERSTANDING,
                     PromptType.RESULT_RELEVANCE,
                     PromptType.EXTERNAL_SEARCH_DECISION,
+                    PromptType.RESULT_EVALUATION_DECISION,
                     PromptType.PROVIDER_SELECTION,
                     PromptType.FAILURE_ANALYSIS
                 ] else 0.7,
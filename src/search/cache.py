@@ -6,14 +6,21 @@ Implements search result caching with TTL management, cache invalidation,
 and performance optimization as specified in PRD-009.
 """
 
+import asyncio
 import hashlib
 import json
 import logging
+import random
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Awaitable, Tuple
 
 from .models import SearchQuery, SearchResults, CachedSearchResult
 from .exceptions import SearchCacheError
+from .optimized_cache import LRUCache
+from .pubsub import listen_channel
+from .query_normalizer import query_fingerprint
+from .semantic_cache import SemanticQueryIndex
+from src.core.config.models import SearchCacheConfig, StaleWindowConfig
 from src.database.connection import CacheManager
 
 logger = logging.getLogger(__name__)
@@ -21,27 +28,91 @@ logger = logging.getLogger(__name__)
 
 class SearchCacheManager:
     """
-    Redis-based search result caching manager.
+    Two-tier search result caching manager.
 
     Implements search result caching with configurable TTL, cache invalidation,
-    and query normalization as specified in PRD-009.
+    and query normalization as specified in PRD-009. A process-local,
+    byte-bounded LRU (L1) sits in front of Redis (L2); L1 entries are evicted
+    across workers via Redis pub/sub when results are invalidated.
+
+    In stale-while-revalidate mode entries carry a soft expiry (stale_at) and
+    a hard expiry (expires_at). Hits between the two are served immediately
+    and a single background refresh is scheduled through the refresh handler.
+
+    With a query embedder registered, exact-key misses fall back to a
+    semantic tier: the embeddings of queries cached by this process are
+    indexed, and a miss whose embedding is similar enough to a cached query
+    with the same scope (including technology_hint) is served that entry.
     """
 
-    def __init__(self, cache_manager: CacheManager):
+    _INVALIDATE_ALL = "*"
+    _REFRESHED_PREFIX = "refreshed:"
+    REFRESH_LOCK_PREFIX = "search:refresh:"
+
+    def __init__(
+        self,
+        cache_manager: CacheManager,
+        config: Optional[SearchCacheConfig] = None,
+    ):
         """
         Initialize search cache manager.
 
         Args:
             cache_manager: Redis cache manager from database layer
+            config: Search cache configuration (defaults if None)
         """
         self.cache_manager = cache_manager
+        self.config = config if isinstance(config, SearchCacheConfig) else SearchCacheConfig()
 
         # Cache configuration
         self.default_ttl = 3600  # 1 hour default TTL
         self.cache_key_prefix = "search:results:"
         self.analytics_key_prefix = "search:analytics:"
 
-        logger.info("SearchCacheManager initialized")
+        # Process-local L1 tier
+        self.local_cache: Optional[LRUCache] = None
+        if self.config.local_cache_enabled and self.config.local_cache_max_bytes > 0:
+            self.local_cache = LRUCache(
+                maxsize=self.config.local_cache_max_entries,
+                max_bytes=self.config.local_cache_max_bytes,
+            )
+        self._listener_task: Optional[asyncio.Task] = None
+
+        # Semantic tier (active once a query embedder is registered)
+        self.semantic_index: Optional[SemanticQueryIndex] = None
+        if self.config.semantic_cache_enabled:
+            self.semantic_index = SemanticQueryIndex(
+                max_entries=self.config.semantic_cache_max_entries,
+                threshold=self.config.semantic_similarity_threshold,
+            )
+        self._query_embedder: Optional[Callable[[str], Awaitable[Optional[List[float]]]]] = None
+
+        # Stale-while-revalidate refreshes
+        self._refresh_handler: Optional[Callable[[SearchQuery], Awaitable[Any]]] = None
+        self._refreshing: Dict[str, asyncio.Task] = {}
+
+        # Re-warming after a full flush
+        self._flush_handler: Optional[Callable[[], Awaitable[Any]]] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+        self._stats = {
+            "l1_hits": 0,
+            "l2_hits": 0,
+            "semantic_hits": 0,
+            "misses": 0,
+            "invalidations_received": 0,
+            "fresh_hits": 0,
+            "stale_served": 0,
+            "refreshes_scheduled": 0,
+            "refreshes_deduplicated": 0,
+            "refreshes_completed": 0,
+            "refresh_failures": 0,
+        }
+
+        logger.info(
+            f"SearchCacheManager initialized (L1 "
+            f"{'enabled' if self.local_cache else 'disabled'})"
+        )
 
     async def get_cached_results(self, query: SearchQuery) -> Optional[SearchResults]:
         """
@@ -62,12 +133,17 @@ class SearchCacheManager:
 
             logger.debug(f"Looking up cached results for key: {cache_key}")
 
-            # Get cached data from Redis
-            cached_data = await self.cache_manager.get(cache_key)
-
+            cached_data, from_l2 = await self._read_entry(cache_key)
+            semantic_hit = False
             if cached_data is None:
-                logger.debug("No cached results found")
-                return None
+                semantic_key, cached_data = await self._semantic_lookup(query, cache_key)
+                if cached_data is None:
+                    self._stats["misses"] += 1
+                    logger.debug("No cached results found")
+                    return None
+                cache_key = semantic_key
+                semantic_hit = True
+                from_l2 = False
 
             # Parse cached search result
             cached_result = CachedSearchResult(**cached_data)
@@ -75,9 +151,25 @@ class SearchCacheManager:
             # Check if cache has expired (additional check beyond Redis TTL)
             if datetime.utcnow() > cached_result.expires_at:
                 logger.debug("Cached results expired, removing from cache")
+                if self.local_cache is not None:
+                    await self.local_cache.delete(cache_key)
                 await self.cache_manager.delete(cache_key)
+                if self.semantic_index is not None:
+                    self.semantic_index.remove(cache_key)
                 return None
 
+            if from_l2:
+                await self._store_local(cache_key, cached_data, cached_result.expires_at)
+
+            # Soft-expired: serve now, refresh in the background (a semantic hit
+            # leaves the refresh to requests for the entry's own query)
+            if cached_result.stale_at is not None and datetime.utcnow() > cached_result.stale_at:
+                self._stats["stale_served"] += 1
+                if not semantic_hit:
+                    self._schedule_refresh(cache_key, query)
+            else:
+                self._stats["fresh_hits"] += 1
+
             # Update access statistics
             await self._update_access_stats(cache_key, cached_result)
 
@@ -85,7 +177,9 @@ class SearchCacheManager:
             search_results = cached_result.results
             search_results.cache_hit = True
 
-            logger.info(f"Cache hit for query: {query.query[:50]}...")
+            logger.info(
+                f"{'Semantic cache' if semantic_hit else 'Cache'} hit for query: {query.query[:50]}..."
+            )
             return search_results
 
         except Exception as e:
@@ -109,7 +203,9 @@ class SearchCacheManager:
         Args:
             query: Search query used
             results: Search results to cache
-            ttl_seconds: Time to live in seconds (uses default if None)
+            ttl_seconds: Time to live in seconds (uses default if None). In
+                stale-while-revalidate mode this is the soft TTL and the
+                technology's stale window is added for the hard expiry.
 
         Raises:
             SearchCacheError: If caching fails
@@ -118,22 +214,35 @@ class SearchCacheManager:
             # Generate cache key
             cache_key = self._generate_cache_key(query)
 
-            # Use default TTL if not specified
-            ttl = ttl_seconds or self.default_ttl
+            now = datetime.utcnow()
+            stale_at = None
+            if self.config.stale_while_revalidate_enabled:
+                window = self._stale_window(query)
+                soft_ttl = ttl_seconds or window.soft_ttl_seconds
+                ttl = soft_ttl + window.stale_window_seconds
+                stale_at = now + timedelta(seconds=soft_ttl)
+            else:
+                # Use default TTL if not specified
+                ttl = ttl_seconds or self.default_ttl
 
             # Create cached result object
             cached_result = CachedSearchResult(
                 query_hash=cache_key,
                 results=results,
-                expires_at=datetime.utcnow() + timedelta(seconds=ttl),
+                expires_at=now + timedelta(seconds=ttl),
+                stale_at=stale_at,
                 access_count=0,
             )
 
-            # Store in Redis
-            await self.cache_manager.set(cache_key, cached_result.model_dump(), ttl)
+            # Store results and analytics in one pipelined round trip
+            cached_data = cached_result.model_dump()
+            pipe = self.cache_manager.pipeline()
+            pipe.set(cache_key, cached_data, ttl)
+            self._queue_analytics(pipe, query, results, cache_key)
+            await pipe.execute()
 
-            # Store analytics data
-            await self._store_analytics(query, results, cache_key)
+            await self._store_local(cache_key, cached_data, cached_result.expires_at)
+            await self._index_query(query, cache_key)
 
             logger.info(
                 f"Cached search results: {len(results.results)} results, TTL: {ttl}s"
@@ -167,14 +276,24 @@ class SearchCacheManager:
                 # so this is a simplified implementation)
                 cache_key = f"{self.cache_key_prefix}{pattern}"
                 await self.cache_manager.delete(cache_key)
+                await self._invalidate_local(cache_key)
+                await self.cache_manager.publish(self.config.invalidation_channel, cache_key)
                 logger.info(f"Invalidated cache for pattern: {pattern}")
                 return 1
             else:
                 # For full invalidation, we'd need to implement a pattern-based deletion
-                # This is a simplified implementation
+                # This is a simplified implementation; L1 tiers are still cleared
+                await self._invalidate_local(self._INVALIDATE_ALL)
+                await self.cache_manager.publish(
+                    self.config.invalidation_channel, self._INVALIDATE_ALL
+                )
                 logger.warning(
                     "Full cache invalidation not implemented - would require Redis SCAN"
                 )
+                if self._flush_handler is not None and (
+                    self._flush_task is None or self._flush_task.done()
+                ):
+                    self._flush_task = asyncio.create_task(self._flush_handler())
                 return 0
 
         except Exception as e:
@@ -203,6 +322,7 @@ class SearchCacheManager:
                 "connected_clients": cache_health.get("connected_clients"),
                 "default_ttl_seconds": self.default_ttl,
                 "cache_key_prefix": self.cache_key_prefix,
+                **self.get_local_stats(),
             }
 
             return stats
@@ -221,26 +341,26 @@ class SearchCacheManager:
         Returns:
             Normalized cache key string
         """
+        # Generate hash for cache key
+        key_string = f"{query_fingerprint(query.query)}|{self._cache_scope(query)}"
+        key_hash = hashlib.sha256(key_string.encode()).hexdigest()[:32]
+
+        return f"{self.cache_key_prefix}{key_hash}"
+
+    @staticmethod
+    def _cache_scope(query: SearchQuery) -> str:
+        """Cache key components other than the query text"""
         # Normalize query components for consistent caching
-        normalized_query = query.query.lower().strip()
         normalized_filters = json.dumps(query.filters or {}, sort_keys=True)
 
-        # Create cache key components
-        key_components = [
-            normalized_query,
+        return "|".join([
             query.strategy.value,
             str(query.limit),
             str(query.offset),
             query.technology_hint or "",
             ",".join(sorted(query.workspace_slugs or [])),
             normalized_filters,
-        ]
-
-        # Generate hash for cache key
-        key_string = "|".join(key_components)
-        key_hash = hashlib.sha256(key_string.encode()).hexdigest()[:32]
-
-        return f"{self.cache_key_prefix}{key_hash}"
+        ])
 
     async def _update_access_stats(
         self, cache_key: str, cached_result: CachedSearchResult
@@ -259,8 +379,13 @@ class SearchCacheManager:
             # Update last accessed time (note: this is in-memory only)
             # For persistent access tracking, we'd need a separate Redis operation
 
-            # Update cache statistics
-            await self.cache_manager.increment(f"stats:cache_hits:{cache_key}")
+            # Update cache statistics for a sample of hits, scaled so the
+            # Redis counter remains an unbiased estimate of total hits
+            sample_rate = self.config.stats_sample_rate
+            if sample_rate > 0 and random.random() < sample_rate:
+                await self.cache_manager.increment(
+                    f"stats:cache_hits:{cache_key}", max(1, round(1 / sample_rate))
+                )
 
         except Exception as e:
             logger.warning(f"Failed to update access stats: {e}")
@@ -277,6 +402,27 @@ class SearchCacheManager:
             results: Search results
             cache_key: Generated cache key
         """
+        try:
+            pipe = self.cache_manager.pipeline()
+            self._queue_analytics(pipe, query, results, cache_key)
+            await pipe.execute()
+
+        except Exception as e:
+            logger.warning(f"Failed to store analytics: {e}")
+            # Don't raise exception for analytics storage failures
+
+    def _queue_analytics(
+        self, pipe, query: SearchQuery, results: SearchResults, cache_key: str
+    ) -> None:
+        """
+        Queue search analytics data on a cache pipeline.
+
+        Args:
+            pipe: CachePipeline to queue the write on
+            query: Original search query
+            results: Search results
+            cache_key: Generated cache key
+        """
         try:
             analytics_data = {
                 "query": query.query,
@@ -291,36 +437,309 @@ class SearchCacheManager:
 
             # Store analytics with longer TTL (24 hours)
             analytics_key = f"{self.analytics_key_prefix}{cache_key}"
-            await self.cache_manager.set(analytics_key, analytics_data, ttl=86400)
+            pipe.set(analytics_key, analytics_data, 86400)
 
         except Exception as e:
             logger.warning(f"Failed to store analytics: {e}")
             # Don't raise exception for analytics storage failures
 
-    async def warm_cache(self, popular_queries: List[SearchQuery]) -> int:
+    def get_local_stats(self) -> Dict[str, Any]:
+        """
+        Get L1/L2/semantic hit statistics for this process.
+
+        Returns:
+            Dictionary with tier hit counts and rates and L1 occupancy
+        """
+        exact_hits = self._stats["l1_hits"] + self._stats["l2_hits"]
+        hits = exact_hits + self._stats["semantic_hits"]
+        lookups = hits + self._stats["misses"]
+        served = self._stats["fresh_hits"] + self._stats["stale_served"]
+        return {
+            **self._stats,
+            "hit_rate": hits / lookups if lookups > 0 else 0.0,
+            "exact_hit_rate": exact_hits / lookups if lookups > 0 else 0.0,
+            "semantic_hit_rate": self._stats["semantic_hits"] / lookups if lookups > 0 else 0.0,
+            "semantic_index_entries": len(self.semantic_index) if self.semantic_index else 0,
+            "stale_served_ratio": self._stats["stale_served"] / served if served > 0 else 0.0,
+            "refreshes_in_progress": len(self._refreshing),
+            "local_cache": self.local_cache.get_stats() if self.local_cache else None,
+        }
+
+    def set_refresh_handler(
+        self, handler: Optional[Callable[[SearchQuery], Awaitable[Any]]]
+    ) -> None:
+        """
+        Register the coroutine that recomputes and re-caches a stale query.
+
+        Args:
+            handler: Coroutine function taking the SearchQuery to refresh; it
+                is expected to store fresh results via cache_results
+        """
+        self._refresh_handler = handler
+
+    def set_query_embedder(
+        self, embedder: Optional[Callable[[str], Awaitable[Optional[List[float]]]]]
+    ) -> None:
+        """
+        Register the coroutine embedding query text for the semantic tier.
+
+        Args:
+            embedder: Coroutine function returning a query vector (or None
+                when embedding is unavailable)
+        """
+        self._query_embedder = embedder
+
+    def set_flush_handler(self, handler: Optional[Callable[[], Awaitable[Any]]]) -> None:
+        """
+        Register the coroutine run in the background after a full invalidation.
+
+        Args:
+            handler: Coroutine function re-warming the cache
+        """
+        self._flush_handler = handler
+
+    async def close(self) -> None:
+        """Stop the invalidation listener, pending refreshes and re-warming"""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        if self._refreshing:
+            await asyncio.gather(*self._refreshing.values(), return_exceptions=True)
+
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+
+    def _stale_window(self, query: SearchQuery) -> StaleWindowConfig:
+        """Get the soft TTL / stale window for the query's technology"""
+        technology = (query.technology_hint or "").lower()
+        return self.config.technology_stale_windows.get(technology, self.config.stale_window)
+
+    def _schedule_refresh(self, cache_key: str, query: SearchQuery) -> None:
+        """Start one background refresh per key"""
+        if self._refresh_handler is None:
+            return
+        if cache_key in self._refreshing:
+            self._stats["refreshes_deduplicated"] += 1
+            return
+
+        task = asyncio.create_task(self._refresh(cache_key, query))
+        self._refreshing[cache_key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(cache_key, None))
+        self._stats["refreshes_scheduled"] += 1
+
+    async def _refresh(self, cache_key: str, query: SearchQuery) -> None:
+        """Recompute a stale entry unless another worker is already doing so"""
+        lock_key = f"{self.REFRESH_LOCK_PREFIX}{cache_key}"
+        token = await self.cache_manager.acquire_lock(
+            lock_key, self.config.refresh_lock_ttl_seconds
+        )
+        if token is None:
+            self._stats["refreshes_deduplicated"] += 1
+            return
+
+        try:
+            await self._refresh_handler(query)
+            self._stats["refreshes_completed"] += 1
+            # Other workers drop their stale L1 copies; semantic rows stay valid
+            await self.cache_manager.publish(
+                self.config.invalidation_channel, f"{self._REFRESHED_PREFIX}{cache_key}"
+            )
+            logger.info(f"Refreshed stale search results for query: {query.query[:50]}...")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._stats["refresh_failures"] += 1
+            logger.warning(f"Background refresh failed for {cache_key}: {e}")
+        finally:
+            await self.cache_manager.release_lock(lock_key, token)
+
+    async def _store_local(
+        self, cache_key: str, cached_data: Dict[str, Any], expires_at: datetime
+    ) -> None:
+        """Store a cached result in L1, never beyond its own expiry"""
+        if self.local_cache is None:
+            return
+        remaining = (expires_at - datetime.utcnow()).total_seconds()
+        ttl = min(remaining, self.config.local_cache_ttl_seconds)
+        if ttl > 0:
+            # Kept encoded like the Redis copy so no reader shares mutable state
+            encoded = json.dumps(cached_data, default=str).encode("utf-8")
+            await self.local_cache.set(cache_key, encoded, ttl, size=len(encoded))
+
+    async def _get_local(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Decode a private copy of an L1 entry (None on a miss)"""
+        encoded = await self.local_cache.get(cache_key)
+        if encoded is None:
+            return None
+        return json.loads(encoded.decode("utf-8"))
+
+    async def _invalidate_local(self, cache_key: str, keep_semantic: bool = False) -> None:
+        """Drop one key (or everything for '*') from L1 and the semantic index"""
+        if self.semantic_index is not None and not keep_semantic:
+            if cache_key == self._INVALIDATE_ALL:
+                self.semantic_index.clear()
+            else:
+                self.semantic_index.remove(cache_key)
+        if self.local_cache is None:
+            return
+        if cache_key == self._INVALIDATE_ALL:
+            await self.local_cache.clear()
+        else:
+            await self.local_cache.delete(cache_key)
+
+    async def _read_entry(self, cache_key: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Read a cache entry from L1, then Redis; returns (data, read from L2)"""
+        # L1: process-local cache (each hit decodes a fresh copy)
+        if self.local_cache is not None:
+            self._ensure_invalidation_listener()
+            cached_data = await self._get_local(cache_key)
+            if cached_data is not None:
+                self._stats["l1_hits"] += 1
+                return cached_data, False
+
+        # L2: Redis
+        cached_data = await self.cache_manager.get(cache_key)
+        if cached_data is None:
+            return None, False
+        self._stats["l2_hits"] += 1
+        return cached_data, True
+
+    async def _embed_query(self, query: SearchQuery) -> Optional[List[float]]:
+        """Embed query text for the semantic tier (None if unavailable)"""
+        if self.semantic_index is None or self._query_embedder is None:
+            return None
+        try:
+            return await self._query_embedder(query.query)
+        except Exception as e:
+            logger.warning(f"Semantic cache query embedding failed: {e}")
+            return None
+
+    async def _semantic_lookup(
+        self, query: SearchQuery, exact_key: str
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Find a cached entry for a similar query with the same scope"""
+        vector = await self._embed_query(query)
+        if vector is None:
+            return None, None
+        match = self.semantic_index.search(vector, self._cache_scope(query))
+        if match is None or match[0] == exact_key:
+            return None, None
+
+        cache_key, similarity = match
+        cached_data = None
+        if self.local_cache is not None:
+            cached_data = await self._get_local(cache_key)
+        if cached_data is None:
+            cached_data = await self.cache_manager.get(cache_key)
+        if cached_data is None:
+            # Evicted or invalidated elsewhere
+            self.semantic_index.remove(cache_key)
+            return None, None
+
+        self._stats["semantic_hits"] += 1
+        logger.debug(f"Semantic cache match {cache_key} (similarity {similarity:.3f})")
+        return cache_key, cached_data
+
+    async def _index_query(self, query: SearchQuery, cache_key: str) -> None:
+        """Add a freshly cached query to the semantic index"""
+        vector = await self._embed_query(query)
+        if vector is not None:
+            self.semantic_index.add(cache_key, vector, self._cache_scope(query))
+
+    def _ensure_invalidation_listener(self) -> None:
+        """Start the pub/sub listener on first use inside a running loop"""
+        if self._listener_task is None or self._listener_task.done():
+            self._listener_task = asyncio.create_task(self._invalidation_loop())
+
+    async def _invalidation_loop(self) -> None:
+        """Evict L1 entries invalidated by any worker"""
+        await listen_channel(
+            self.cache_manager,
+            self.config.invalidation_channel,
+            self._on_invalidation,
+            name="Search cache",
+        )
+
+    async def _on_invalidation(self, cache_key: str) -> None:
+        """Apply an invalidation or refresh broadcast to the local tiers"""
+        self._stats["invalidations_received"] += 1
+        if cache_key.startswith(self._REFRESHED_PREFIX):
+            # Refreshed in place: only the L1 copy is outdated
+            await self._invalidate_local(cache_key[len(self._REFRESHED_PREFIX):], keep_semantic=True)
+        else:
+            await self._invalidate_local(cache_key)
+
+    async def warm_cache(
+        self,
+        popular_queries: List[SearchQuery],
+        search_func: Optional[Callable[[SearchQuery], Awaitable[Any]]] = None,
+        max_concurrency: int = 4,
+        normalize_func: Optional[Callable[[SearchQuery], Awaitable[SearchQuery]]] = None,
+    ) -> int:
         """
         Warm cache with popular queries.
 
+        Queries with a fresh cache entry are skipped; the rest are replayed
+        through search_func (which caches its results) with at most
+        max_concurrency searches in flight.
+
         Args:
             popular_queries: List of popular queries to pre-cache
+            search_func: Coroutine function executing and caching a search
+            max_concurrency: Maximum concurrent replays
+            normalize_func: Maps a raw query to the normalized query search_func
+                caches under, used for the freshness check
 
         Returns:
             Number of queries successfully cached
         """
+        if search_func is None:
+            logger.warning("Cache warming skipped: no search function provided")
+            return 0
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
         warmed_count = 0
 
-        for query in popular_queries:
+        async def warm_one(query: SearchQuery) -> None:
+            nonlocal warmed_count
             try:
-                # Check if already cached
-                cached = await self.get_cached_results(query)
-                if cached is None:
-                    # Would need to execute search and cache results
-                    # This is a placeholder for cache warming logic
-                    logger.info(f"Would warm cache for query: {query.query}")
-                    warmed_count += 1
-
+                cached_query = await normalize_func(query) if normalize_func else query
+                if await self._is_fresh(cached_query):
+                    return
+                async with semaphore:
+                    await search_func(query)
+                warmed_count += 1
             except Exception as e:
                 logger.warning(f"Failed to warm cache for query {query.query}: {e}")
 
-        logger.info(f"Cache warming completed: {warmed_count} queries processed")
+        await asyncio.gather(*[warm_one(query) for query in popular_queries])
+
+        logger.info(
+            f"Cache warming completed: {warmed_count}/{len(popular_queries)} queries warmed"
+        )
         return warmed_count
+
+    async def _is_fresh(self, query: SearchQuery) -> bool:
+        """Check for an unexpired, non-stale entry without touching hit statistics"""
+        cache_key = self._generate_cache_key(query)
+        cached_data = None
+        if self.local_cache is not None:
+            cached_data = await self._get_local(cache_key)
+        if cached_data is None:
+            cached_data = await self.cache_manager.get(cache_key)
+        if cached_data is None:
+            return False
+
+        cached_result = CachedSearchResult(**cached_data)
+        now = datetime.utcnow()
+        if now > cached_result.expires_at:
+            return False
+        return cached_result.stale_at is None or now <= cached_result.stale_at
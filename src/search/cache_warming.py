@@ -0,0 +1,189 @@
+"""
+Search Cache Warming
+Pre-populates the search result cache from search history
+
+Popular queries are read from the search_cache table (ranked by
+access_count) and replayed through SearchOrchestrator.execute_search at
+bounded concurrency. Scheduled runs are restricted to an off-peak window;
+startup (deploy) and post-flush runs are forced.
+"""
+
+import json
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from .models import SearchQuery, SearchStrategy
+from src.core.config.models import SearchCacheConfig
+
+logger = logging.getLogger(__name__)
+
+
+class SearchCacheWarmer:
+    """
+    Replays popular historical queries to keep the search cache warm.
+    """
+
+    HOT_QUERIES_SQL = """
+        SELECT original_query, technology_hint, workspace_slugs, access_count
+        FROM search_cache
+        WHERE access_count >= :min_access_count
+          AND last_accessed_at >= :since
+        ORDER BY access_count DESC, last_accessed_at DESC
+        LIMIT :limit
+    """
+
+    def __init__(
+        self,
+        db_manager: Any,
+        orchestrator: Any,
+        config: Optional[SearchCacheConfig] = None,
+    ):
+        """
+        Initialize cache warmer.
+
+        Args:
+            db_manager: DatabaseManager for reading search history
+            orchestrator: SearchOrchestrator used to replay queries
+            config: Search cache configuration (defaults if None)
+        """
+        self.db_manager = db_manager
+        self.orchestrator = orchestrator
+        self.config = config if isinstance(config, SearchCacheConfig) else SearchCacheConfig()
+        self.last_run: Optional[Dict[str, Any]] = None
+
+    def is_off_peak(self, now: Optional[datetime] = None) -> bool:
+        """
+        Check whether the UTC hour falls in the configured off-peak window.
+
+        Args:
+            now: Time to check (current UTC time if None)
+
+        Returns:
+            True if inside the window (which may wrap past midnight)
+        """
+        hour = (now or datetime.utcnow()).hour
+        start = self.config.warming_off_peak_start_hour
+        end = self.config.warming_off_peak_end_hour
+        if start <= end:
+            return start <= hour < end
+        return hour >= start or hour < end
+
+    async def load_hot_queries(
+        self,
+        limit: Optional[int] = None,
+        min_access_count: Optional[int] = None,
+        lookback_days: Optional[int] = None,
+    ) -> List[SearchQuery]:
+        """
+        Load the most accessed recent queries from search history.
+
+        Args:
+            limit: Maximum number of queries
+            min_access_count: Minimum access_count to include
+            lookback_days: Only include queries accessed within this many days
+
+        Returns:
+            Distinct SearchQuery objects, most popular first
+        """
+        lookback_days = lookback_days or self.config.warming_lookback_days
+        rows = await self.db_manager.fetch_all(
+            self.HOT_QUERIES_SQL,
+            {
+                "min_access_count": min_access_count or self.config.warming_min_access_count,
+                "since": datetime.utcnow() - timedelta(days=lookback_days),
+                "limit": limit or self.config.warming_query_limit,
+            },
+            pool="jobs",
+        )
+
+        queries: List[SearchQuery] = []
+        seen = set()
+        for row in rows or []:
+            text = (row.get("original_query") or "").strip()
+            technology_hint = row.get("technology_hint") or None
+            workspace_slugs = row.get("workspace_slugs") or None
+            if isinstance(workspace_slugs, str):
+                try:
+                    workspace_slugs = json.loads(workspace_slugs) or None
+                except ValueError:
+                    workspace_slugs = None
+
+            identity = (text.lower(), technology_hint, tuple(sorted(workspace_slugs or [])))
+            if not text or identity in seen:
+                continue
+            seen.add(identity)
+
+            try:
+                queries.append(
+                    SearchQuery(
+                        query=text,
+                        strategy=SearchStrategy.HYBRID,
+                        technology_hint=technology_hint,
+                        workspace_slugs=workspace_slugs,
+                    )
+                )
+            except Exception as e:
+                logger.debug(f"Skipping unwarmable query {text[:50]!r}: {e}")
+
+        return queries
+
+    async def warm(
+        self,
+        limit: Optional[int] = None,
+        min_access_count: Optional[int] = None,
+        lookback_days: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        force: bool = False,
+        reason: str = "scheduled",
+    ) -> Dict[str, Any]:
+        """
+        Warm the cache with popular historical queries.
+
+        Args:
+            limit: Maximum number of queries to replay
+            min_access_count: Minimum access_count to include
+            lookback_days: Only include queries accessed within this many days
+            max_concurrency: Maximum concurrent replays
+            force: Run even outside the off-peak window
+            reason: Trigger recorded in logs and stats (scheduled, startup, cache_flush)
+
+        Returns:
+            Run statistics
+        """
+        start_time = time.time()
+
+        if not self.config.warming_enabled:
+            return {"status": "skipped", "reason": reason, "skipped_because": "disabled"}
+        if not force and not self.is_off_peak():
+            logger.debug("Search cache warming skipped outside off-peak window")
+            return {"status": "skipped", "reason": reason, "skipped_because": "peak_hours"}
+
+        try:
+            queries = await self.load_hot_queries(limit, min_access_count, lookback_days)
+            warmed = await self.orchestrator.search_cache.warm_cache(
+                queries,
+                search_func=self.orchestrator.execute_search,
+                max_concurrency=max_concurrency or self.config.warming_max_concurrency,
+                normalize_func=self.orchestrator._normalize_query,
+            )
+        except Exception as e:
+            duration_ms = int((time.time() - start_time) * 1000)
+            logger.error(f"Search cache warming failed: {e}")
+            return {"status": "failed", "reason": reason, "error": str(e), "duration_ms": duration_ms}
+
+        duration_ms = int((time.time() - start_time) * 1000)
+        self.last_run = {
+            "status": "completed",
+            "reason": reason,
+            "candidates": len(queries),
+            "warmed": warmed,
+            "duration_ms": duration_ms,
+            "completed_at": datetime.utcnow().isoformat(),
+        }
+        logger.info(
+            f"PIPELINE_METRICS: step=search_cache_warming reason={reason} "
+            f"candidates={len(queries)} warmed={warmed} duration_ms={duration_ms}"
+        )
+        return self.last_run
@@ -0,0 +1,188 @@
+"""
+Evaluation Replay Harness
+Offline replay of logged evaluation samples through the local evaluator
+
+The orchestrator logs an EVALUATION_SAMPLE line (query, top results and the
+LLM verdict) whenever the LLM evaluates results, for escalations and for the
+shadow sample of confident queries (search_pipeline.local_evaluation_sample_rate).
+Replaying the samples measures how often the local evaluator agrees with the
+LLM on the external search decision and how many LLM calls it would save at
+a given confidence threshold, and can re-fit the confidence calibration.
+
+Usage:
+    python -m src.search.evaluation_replay samples.log --min-confidence 0.8 --fit
+"""
+
+import argparse
+import json
+import logging
+import math
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .local_evaluator import LocalRelevanceEvaluator
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_MARKER = "EVALUATION_SAMPLE: "
+
+
+@dataclass
+class ReplayReport:
+    """Agreement of the local evaluator with logged LLM verdicts"""
+
+    samples: int
+    llm_calls_saved: int
+    escalated: int
+    saved_rate: float
+    confident_agreement: Optional[float]
+    overall_agreement: Optional[float]
+    confident_relevance_mae: Optional[float]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def load_samples(lines: Iterable[str]) -> List[Dict[str, Any]]:
+    """
+    Parse evaluation samples from JSONL or application log lines.
+
+    Lines that are neither a sample nor a JSON object are skipped.
+    """
+    samples = []
+    for line in lines:
+        line = line.strip()
+        if SAMPLE_MARKER in line:
+            line = line.split(SAMPLE_MARKER, 1)[1]
+        elif not line.startswith("{"):
+            continue
+        try:
+            sample = json.loads(line)
+        except json.JSONDecodeError:
+            logger.debug(f"Skipping malformed sample line: {line[:80]}")
+            continue
+        if isinstance(sample, dict) and "query" in sample and "llm" in sample:
+            samples.append(sample)
+    return samples
+
+
+def replay(samples: List[Dict[str, Any]], evaluator: LocalRelevanceEvaluator) -> ReplayReport:
+    """
+    Replay samples through an evaluator.
+
+    Args:
+        samples: Logged evaluation samples
+        evaluator: Evaluator (and thresholds) to measure
+
+    Returns:
+        ReplayReport; agreement is on the external search decision
+    """
+    confident_matches = []
+    all_matches = []
+    relevance_errors = []
+    for sample in samples:
+        local = evaluator.evaluate(sample["query"], sample.get("results") or [])
+        llm = sample["llm"]
+        agrees = local.needs_external_search == bool(llm["needs_external_search"])
+        all_matches.append(agrees)
+        if not local.escalate:
+            confident_matches.append(agrees)
+            relevance_errors.append(abs(local.relevance_score - float(llm["relevance_score"])))
+
+    saved = len(confident_matches)
+    return ReplayReport(
+        samples=len(samples),
+        llm_calls_saved=saved,
+        escalated=len(samples) - saved,
+        saved_rate=saved / len(samples) if samples else 0.0,
+        confident_agreement=_mean(confident_matches),
+        overall_agreement=_mean(all_matches),
+        confident_relevance_mae=_mean(relevance_errors),
+    )
+
+
+def fit_calibration(
+    samples: List[Dict[str, Any]],
+    evaluator: LocalRelevanceEvaluator,
+    iterations: int = 50,
+) -> Tuple[float, float]:
+    """
+    Fit the confidence calibration to logged LLM verdicts.
+
+    Logistic regression of "LLM found the results sufficient" on the local
+    relevance score; boundary and slope map to local_evaluation_boundary and
+    local_evaluation_slope.
+
+    Returns:
+        Tuple of (boundary, slope); the evaluator's current values if the
+        samples do not contain both outcomes
+    """
+    relevance = []
+    labels = []
+    for sample in samples:
+        local = evaluator.evaluate(sample["query"], sample.get("results") or [])
+        relevance.append(local.relevance_score)
+        labels.append(0.0 if sample["llm"]["needs_external_search"] else 1.0)
+
+    x = np.asarray(relevance, dtype=np.float64)
+    y = np.asarray(labels, dtype=np.float64)
+    if x.size == 0 or y.min() == y.max():
+        return evaluator.boundary, evaluator.slope
+
+    # Newton-Raphson with a small ridge term to stay finite on separable data
+    features = np.column_stack([np.ones_like(x), x])
+    weights = np.array([-evaluator.slope * evaluator.boundary, evaluator.slope])
+    ridge = 1e-3 * np.eye(2)
+    for _ in range(iterations):
+        p = 1.0 / (1.0 + np.exp(-(features @ weights)))
+        gradient = features.T @ (p - y) + ridge @ weights
+        hessian = features.T @ (features * (p * (1 - p))[:, None]) + ridge
+        step = np.linalg.solve(hessian, gradient)
+        weights -= step
+        if float(np.abs(step).max()) < 1e-8:
+            break
+
+    intercept, slope = float(weights[0]), float(weights[1])
+    if slope <= 0 or not math.isfinite(slope):
+        return evaluator.boundary, evaluator.slope
+    return min(max(-intercept / slope, 0.0), 1.0), slope
+
+
+def _mean(values: List[Any]) -> Optional[float]:
+    return float(sum(values)) / len(values) if values else None
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Replay logged evaluation samples through the local relevance evaluator"
+    )
+    parser.add_argument("samples", help="Log or JSONL file with EVALUATION_SAMPLE records")
+    parser.add_argument("--min-confidence", type=float, default=0.8)
+    parser.add_argument("--boundary", type=float, default=0.6)
+    parser.add_argument("--slope", type=float, default=12.0)
+    parser.add_argument("--fit", action="store_true", help="Re-fit boundary and slope and replay with them")
+    args = parser.parse_args(argv)
+
+    with open(args.samples) as f:
+        samples = load_samples(f)
+
+    evaluator = LocalRelevanceEvaluator(
+        boundary=args.boundary, slope=args.slope, min_confidence=args.min_confidence
+    )
+    print(json.dumps({"configured": replay(samples, evaluator).to_dict()}, indent=2))
+
+    if args.fit:
+        boundary, slope = fit_calibration(samples, evaluator)
+        fitted = LocalRelevanceEvaluator(
+            boundary=boundary, slope=slope, min_confidence=args.min_confidence
+        )
+        print(json.dumps({
+            "fitted": {"boundary": round(boundary, 4), "slope": round(slope, 4)},
+            "replay": replay(samples, fitted).to_dict(),
+        }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Local Relevance Evaluator
+In-process evaluation of search results without an LLM round trip
+
+Scores results from the vector score distribution and the lexical coverage
+of query terms in the top results, and maps the distance from the external
+search boundary to a calibrated confidence. Score features use the raw
+match score (certainty) when results carry one, never a rank-fused
+relevance score. Only results in the uncertain band around the boundary
+need LLM evaluation; the boundary and slope can be
+re-fitted from logged samples with src.search.evaluation_replay.
+"""
+
+import logging
+import math
+import re
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .query_normalizer import QueryNormalizer
+
+logger = logging.getLogger(__name__)
+
+
+_TOKEN_RE = re.compile(r"\b\w+\b")
+
+# Query words that carry no topical signal
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "do", "doe", "for",
+    "from", "how", "i", "in", "is", "it", "of", "on", "or", "should", "that",
+    "the", "to", "use", "what", "when", "where", "which", "why", "with", "you",
+})
+
+# Relevance blend: top score, mean of the top-k scores, query term coverage
+RELEVANCE_WEIGHTS = (0.45, 0.25, 0.30)
+
+
+@dataclass(frozen=True)
+class RelevanceFeatures:
+    """Features the local evaluation is computed from"""
+
+    result_count: int
+    top_score: Optional[float]
+    mean_score: Optional[float]
+    score_gap: Optional[float]
+    score_spread: Optional[float]
+    term_coverage: float
+    top_term_coverage: float
+
+
+@dataclass(frozen=True)
+class LocalEvaluation:
+    """Local evaluation of a result set"""
+
+    relevance_score: float
+    completeness_score: float
+    confidence: float
+    needs_external_search: bool
+    escalate: bool
+    missing_information: List[str] = field(default_factory=list)
+    features: Optional[RelevanceFeatures] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form for logging"""
+        return asdict(self)
+
+
+def result_fields(result: Any) -> Tuple[str, str, Optional[float]]:
+    """
+    Extract (title, text, score) from a search result.
+
+    Accepts search and MCP SearchResult models as well as the dicts passed
+    to LLM prompts. The score is the raw match score kept in metadata when
+    present; a reciprocal-rank fused relevance score only reflects rank, so
+    fused results without a match score have no score (None).
+    """
+    def get(*names: str) -> Any:
+        for name in names:
+            value = result.get(name) if isinstance(result, dict) else getattr(result, name, None)
+            if value is not None:
+                return value
+        return None
+
+    title = get("title") or ""
+    text = get("content_snippet", "snippet", "content") or ""
+    metadata = get("metadata")
+    metadata = metadata if isinstance(metadata, dict) else {}
+    score = metadata.get("match_score")
+    if score is None and "rrf_score" not in metadata:
+        score = get("relevance_score", "score") or 0.0
+    return str(title), str(text), float(score) if score is not None else None
+
+
+class LocalRelevanceEvaluator:
+    """
+    Fast result evaluator used before (and instead of) LLM evaluation.
+
+    Confidence is the logistic probability of the relevance score being on
+    its side of the external search boundary; evaluations below
+    min_confidence are flagged for escalation to the LLM.
+    """
+
+    def __init__(
+        self,
+        boundary: float = 0.6,
+        slope: float = 12.0,
+        min_confidence: float = 0.8,
+        top_k: int = 5,
+        target_results: int = 10,
+        min_completeness: float = 0.5,
+        normalizer: Optional[QueryNormalizer] = None,
+    ):
+        """
+        Initialize the evaluator.
+
+        Args:
+            boundary: Relevance below which external search is needed
+            slope: Logistic slope of the confidence calibration
+            min_confidence: Confidence below which the LLM decides
+            top_k: Results considered for score and coverage features
+            target_results: Result count considered complete
+            min_completeness: Completeness below which external search is needed
+            normalizer: QueryNormalizer used for stemming
+        """
+        self.boundary = boundary
+        self.slope = slope
+        self.min_confidence = min_confidence
+        self.top_k = top_k
+        self.target_results = target_results
+        self.min_completeness = min_completeness
+        self.normalizer = normalizer or QueryNormalizer(memo_size=0)
+
+    def evaluate(self, query: str, results: Sequence[Any]) -> LocalEvaluation:
+        """
+        Evaluate a result set for a query.
+
+        Args:
+            query: Query text (raw or normalized)
+            results: Ranked search results
+
+        Returns:
+            LocalEvaluation; escalate is set in the uncertain band, and
+            whenever no match scores are available unless no query term
+            is covered
+        """
+        if not results:
+            return LocalEvaluation(
+                relevance_score=0.0,
+                completeness_score=0.0,
+                confidence=0.9,
+                needs_external_search=True,
+                escalate=False,
+                missing_information=["No results found"],
+            )
+
+        features, missing_terms = self.extract_features(query, results)
+        top_weight, mean_weight, coverage_weight = RELEVANCE_WEIGHTS
+        if features.top_score is None:
+            # Only lexical evidence: too weak to skip the LLM on its own
+            relevance = features.term_coverage
+        else:
+            relevance = _clip(
+                top_weight * features.top_score
+                + mean_weight * features.mean_score
+                + coverage_weight * features.term_coverage
+            )
+        completeness = _clip(
+            min(features.result_count / self.target_results, 1.0)
+            * (0.5 + 0.5 * features.term_coverage)
+        )
+        confidence = self.confidence(relevance)
+
+        return LocalEvaluation(
+            relevance_score=relevance,
+            completeness_score=completeness,
+            confidence=confidence,
+            needs_external_search=relevance < self.boundary or completeness < self.min_completeness,
+            escalate=confidence < self.min_confidence
+            or (features.top_score is None and features.term_coverage > 0.0),
+            missing_information=missing_terms,
+            features=features,
+        )
+
+    def confidence(self, relevance: float) -> float:
+        """Calibrated confidence of the decision for a relevance score"""
+        probability = 1.0 / (1.0 + math.exp(-self.slope * (relevance - self.boundary)))
+        return max(probability, 1.0 - probability)
+
+    def extract_features(
+        self, query: str, results: Sequence[Any]
+    ) -> Tuple[RelevanceFeatures, List[str]]:
+        """
+        Compute score distribution and lexical coverage features.
+
+        Returns:
+            Tuple of (features, query terms missing from the top results)
+        """
+        top = [result_fields(result) for result in results[: self.top_k]]
+        scores = [_clip(score) for _, _, score in top if score is not None]
+        if scores:
+            mean_score = sum(scores) / len(scores)
+            spread = math.sqrt(sum((s - mean_score) ** 2 for s in scores) / len(scores))
+        else:
+            mean_score = spread = None
+
+        terms = self._terms(query, self.normalizer.stem)
+        if terms:
+            # Result text is stemmed without the shared memo, which is sized for queries
+            result_terms = [
+                self._terms(f"{title} {text}", QueryNormalizer.stem_uncached)
+                for title, text, _ in top
+            ]
+            top_terms = result_terms[0]
+            covered = set().union(*result_terms)
+            missing = [term for term in terms if term not in covered]
+            coverage = 1.0 - len(missing) / len(terms)
+            top_coverage = len(terms & top_terms) / len(terms)
+        else:
+            missing, coverage, top_coverage = [], 1.0, 1.0
+
+        features = RelevanceFeatures(
+            result_count=len(results),
+            top_score=scores[0] if scores else None,
+            mean_score=mean_score,
+            score_gap=(scores[0] - scores[1] if len(scores) > 1 else scores[0]) if scores else None,
+            score_spread=spread,
+            term_coverage=coverage,
+            top_term_coverage=top_coverage,
+        )
+        return features, sorted(missing)
+
+    @staticmethod
+    def _terms(text: str, stem: Callable[[str], str]) -> set:
+        """Stemmed content terms of a text"""
+        return {
+            stem(token)
+            for token in _TOKEN_RE.findall(text.lower())
+            if len(token) > 1 and token not in STOPWORDS
+        } - STOPWORDS
+
+
+def _clip(value: float) -> float:
+    return min(max(value, 0.0), 1.0)
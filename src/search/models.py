@@ -42,6 +42,12 @@ class SearchQuery(BaseModel):
     workspace_slugs: Optional[List[str]] = Field(None, description="Workspace filters")
     external_providers: Optional[List[str]] = Field(None, description="Specific external providers to use")
     use_external_search: Optional[bool] = Field(None, description="Force external search usage")
+    latency_budget_ms: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Return once this many ms have passed and enough results are ranked, "
+        "without waiting for slower workspaces",
+    )
 
 
 class SearchResult(BaseModel):
@@ -98,6 +104,37 @@ class SearchResults(BaseModel):
     )
 
 
+class SearchProgress(BaseModel):
+    """
+    Snapshot of a streaming multi-workspace search.
+
+    Emitted each time a workspace finishes and once more when the search
+    ends (all workspaces done or the latency budget met).
+    """
+
+    results: List[SearchResult] = Field(
+        default_factory=list, description="Current top results, best first"
+    )
+    completed_workspaces: List[str] = Field(
+        default_factory=list, description="Workspaces that returned results"
+    )
+    failed_workspaces: List[str] = Field(
+        default_factory=list, description="Workspaces whose search failed or timed out"
+    )
+    pending_workspaces: List[str] = Field(
+        default_factory=list, description="Workspaces still running (cancelled if final)"
+    )
+    candidate_count: int = Field(0, description="Distinct results received so far")
+    elapsed_ms: int = Field(0, description="Time since the search started")
+    top_k_changed: bool = Field(
+        True, description="Whether the last workspace changed the top-k membership"
+    )
+    final: bool = Field(False, description="Whether this is the last snapshot")
+    budget_met: bool = Field(
+        False, description="Whether the search ended early on its latency budget"
+    )
+
+
 class WorkspaceInfo(BaseModel):
     """
     Workspace information for multi-workspace search strategy.
@@ -140,6 +177,9 @@ class EvaluationResult(BaseModel):
         ..., ge=0.0, le=1.0, description="Evaluation confidence level"
     )
     reasoning: Optional[str] = Field(None, description="LLM reasoning for evaluation")
+    needs_external_search: Optional[bool] = Field(
+        None, description="External search decision made with the evaluation (None if not decided)"
+    )
 
 
 class SearchAnalytics(BaseModel):
@@ -181,4 +221,7 @@ class CachedSearchResult(BaseModel):
         default_factory=datetime.utcnow, description="Cache creation time"
     )
     expires_at: datetime = Field(..., description="Cache expiration time")
+    stale_at: Optional[datetime] = Field(
+        None, description="Soft expiry; later hits are served stale and refreshed"
+    )
     access_count: int = Field(0, description="Number of times accessed from cache")
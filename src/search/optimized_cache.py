@@ -23,38 +23,90 @@ logger = logging.getLogger(__name__)
 
 class LRUCache:
     """
-    Thread-safe LRU cache implementation for L1 caching.
+    TTL-aware LRU cache implementation for L1 caching.
+
+    Entries expire on read, and the cache can be bounded by serialized size
+    in bytes as well as entry count.
     """
     
-    def __init__(self, maxsize: int = 100):
+    def __init__(self, maxsize: int = 100, max_bytes: Optional[int] = None):
         self.maxsize = maxsize
+        self.max_bytes = max_bytes
         self.cache = OrderedDict()
+        self.current_bytes = 0
         self.hits = 0
         self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
         self._lock = asyncio.Lock()
     
     async def get(self, key: str) -> Optional[Any]:
-        """Get value from cache."""
+        """Get value from cache, treating expired entries as misses."""
         async with self._lock:
-            if key in self.cache:
-                # Move to end (most recently used)
-                self.cache.move_to_end(key)
-                self.hits += 1
-                return self.cache[key]['value']
-            self.misses += 1
-            return None
+            entry = self.cache.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry['expires'] <= time.time():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            # Move to end (most recently used)
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return entry['value']
     
-    async def set(self, key: str, value: Any, ttl: int = 3600) -> None:
-        """Set value in cache with TTL."""
+    async def set(
+        self, key: str, value: Any, ttl: int = 3600, size: Optional[int] = None
+    ) -> None:
+        """
+        Set value in cache with TTL.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds
+            size: Size in bytes (estimated from the JSON encoding if omitted
+                and the cache is byte-bounded)
+        """
+        if size is None:
+            size = self._estimate_size(value) if self.max_bytes else 0
         async with self._lock:
-            # Remove oldest if at capacity
-            if len(self.cache) >= self.maxsize:
-                self.cache.popitem(last=False)
+            if key in self.cache:
+                self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                # Larger than the whole cache; never worth holding
+                return
+
+            # Remove oldest until the new entry fits
+            while self.cache and (
+                len(self.cache) >= self.maxsize
+                or (self.max_bytes is not None and self.current_bytes + size > self.max_bytes)
+            ):
+                self._remove(next(iter(self.cache)))
+                self.evictions += 1
             
             self.cache[key] = {
                 'value': value,
-                'expires': time.time() + ttl
+                'expires': time.time() + ttl,
+                'size': size
             }
+            self.current_bytes += size
+    
+    async def delete(self, key: str) -> bool:
+        """Remove a key; returns True if it was present."""
+        async with self._lock:
+            if key in self.cache:
+                self._remove(key)
+                return True
+            return False
+    
+    async def clear(self) -> None:
+        """Remove all entries."""
+        async with self._lock:
+            self.cache.clear()
+            self.current_bytes = 0
     
     async def clear_expired(self) -> None:
         """Remove expired entries."""
@@ -62,10 +114,22 @@ class LRUCache:
             current_time = time.time()
             expired_keys = [
                 k for k, v in self.cache.items() 
-                if v['expires'] < current_time
+                if v['expires'] <= current_time
             ]
             for key in expired_keys:
-                del self.cache[key]
+                self._remove(key)
+            self.expirations += len(expired_keys)
+    
+    def _remove(self, key: str) -> None:
+        entry = self.cache.pop(key)
+        self.current_bytes -= entry['size']
+    
+    @staticmethod
+    def _estimate_size(value: Any) -> int:
+        try:
+            return len(json.dumps(value, default=str))
+        except (TypeError, ValueError):
+            return len(repr(value))
     
     @property
     def hit_rate(self) -> float:
@@ -73,6 +137,20 @@ class LRUCache:
         total = self.hits + self.misses
         return self.hits / total if total > 0 else 0.0
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Get L1 occupancy and hit statistics."""
+        return {
+            'entries': len(self.cache),
+            'max_entries': self.maxsize,
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+        }
+
 
 class OptimizedCacheManager:
     """
@@ -300,20 +378,12 @@ class OptimizedCacheManager:
         return value
     
     async def _batch_get_l2(self, keys: list) -> Dict[str, Any]:
-        """Batch get from L2 cache."""
-        # This would use Redis MGET or pipeline
-        results = {}
-        for key in keys:
-            value = await self.l2_cache.get(key)
-            if value is not None:
-                results[key] = value
-        return results
+        """Batch get from L2 cache in one round trip (Redis MGET)."""
+        return await self.l2_cache.mget(keys)
     
     async def _batch_set_l2(self, items: Dict[str, Any], ttl: int) -> None:
-        """Batch set in L2 cache."""
-        # This would use Redis MSET or pipeline
-        for key, value in items.items():
-            await self.l2_cache.set(key, value, ttl)
+        """Batch set in L2 cache in one pipelined round trip."""
+        await self.l2_cache.mset_with_ttl(items, ttl)
     
     async def _maintenance_loop(self) -> None:
         """Background maintenance tasks."""
@@ -8,23 +8,34 @@ compilation exactly as specified.
 """
 
 import asyncio
+import json
 import logging
+import random
 import time
 import uuid
 from datetime import datetime
-from typing import Optional, Dict, Any, Tuple, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, Tuple, List, Callable, Awaitable, AsyncIterator
 
 from fastapi import BackgroundTasks
 
-from .models import SearchQuery, SearchResults, EvaluationResult
+from .models import SearchQuery, SearchResults, EvaluationResult, SearchProgress
 from .strategies import WorkspaceSearchStrategy
 from .ranking import ResultRanker
+from .query_normalizer import QueryNormalizer
+from .local_evaluator import LocalEvaluation, LocalRelevanceEvaluator
 from .cache import SearchCacheManager
+from .cache_warming import SearchCacheWarmer
+from .workspace_catalog import WorkspaceCatalog
+from .single_flight import SingleFlight
 from .mcp_integration import MCPSearchEnhancer, create_mcp_enhancer
 from .exceptions import SearchOrchestrationError, SearchTimeoutError
+from src.core.config.models import SearchPipelineConfig
 from src.database.connection import DatabaseManager, CacheManager
 from src.clients.weaviate_client import WeaviateVectorClient
 
+if TYPE_CHECKING:
+    from src.api.v1.schemas import SearchResponse
+
 logger = logging.getLogger(__name__)
 
 
@@ -71,13 +82,6 @@ class SearchOrchestrator:
         self.llm_client = llm_client
         self.knowledge_enricher = knowledge_enricher
 
-        # Initialize sub-components
-        self.workspace_strategy = WorkspaceSearchStrategy(
-            db_manager, weaviate_client
-        )
-        self.result_ranker = ResultRanker()
-        self.search_cache = SearchCacheManager(cache_manager)
-        
         # Load configuration for enrichment settings
         try:
             from src.core.config import get_system_configuration
@@ -86,6 +90,63 @@ class SearchOrchestrator:
             logger.warning(f"Failed to load system configuration: {e}")
             self.config = None
 
+        # Initialize sub-components
+        weaviate_config = getattr(self.config, "weaviate", None)
+        self.workspace_catalog = WorkspaceCatalog(
+            db_manager,
+            weaviate_client,
+            getattr(weaviate_config, "workspace_catalog", None),
+            cache_manager,
+        )
+        self.workspace_strategy = WorkspaceSearchStrategy(
+            db_manager,
+            weaviate_client,
+            getattr(weaviate_config, "hybrid_search", None),
+            self.workspace_catalog,
+        )
+        self.result_ranker = ResultRanker()
+        self.query_normalizer = QueryNormalizer()
+        pipeline_config = getattr(self.config, "search_pipeline", None)
+        self.pipeline_config = (
+            pipeline_config if isinstance(pipeline_config, SearchPipelineConfig)
+            else SearchPipelineConfig()
+        )
+        # Per-process outcomes of speculative external searches; "cancelled"
+        # and "unused" are external calls made for nothing
+        self.speculative_external_outcomes: Dict[str, int] = {"used": 0, "cancelled": 0, "unused": 0}
+        self.local_evaluator = LocalRelevanceEvaluator(
+            boundary=self.pipeline_config.local_evaluation_boundary,
+            slope=self.pipeline_config.local_evaluation_slope,
+            min_confidence=self.pipeline_config.local_evaluation_min_confidence,
+            normalizer=self.query_normalizer,
+        )
+
+        self.search_cache = SearchCacheManager(
+            cache_manager, getattr(self.config, "search_cache", None)
+        )
+
+        # Single-flight coalescing of identical concurrent cache misses
+        cache_config = self.search_cache.config
+        self.single_flight: Optional[SingleFlight] = None
+        if cache_config.single_flight_enabled:
+            self.single_flight = SingleFlight(
+                cache_manager=cache_manager if cache_config.distributed_lock_enabled else None,
+                lock_ttl_seconds=cache_config.lock_ttl_seconds,
+                lock_wait_timeout_seconds=cache_config.lock_wait_timeout_seconds,
+                lock_poll_interval_ms=cache_config.lock_poll_interval_ms,
+            )
+
+        # Stale-while-revalidate: stale hits are refreshed through the pipeline
+        self.search_cache.set_refresh_handler(self._refresh_stale_search)
+
+        # Semantic cache tier reuses the vector client's (cached) query embeddings
+        if callable(getattr(type(weaviate_client), "embed_query", None)):
+            self.search_cache.set_query_embedder(weaviate_client.embed_query)
+
+        # Cache warming from search history; re-warm after full flushes
+        self.cache_warmer = SearchCacheWarmer(db_manager, self, cache_config)
+        self.search_cache.set_flush_handler(self._rewarm_after_flush)
+
         # Initialize MCP enhancer for external search capabilities
         self.mcp_enhancer: Optional[MCPSearchEnhancer] = None
         if llm_client:
@@ -151,7 +212,10 @@ class SearchOrchestrator:
         self._cache_cb_next_attempt = 0.0
 
     async def execute_search(
-        self, query: SearchQuery, background_tasks: Optional[BackgroundTasks] = None
+        self,
+        query: SearchQuery,
+        background_tasks: Optional[BackgroundTasks] = None,
+        progress_callback: Optional[Callable[[SearchProgress], Awaitable[Any]]] = None,
     ) -> Tuple[SearchResults, SearchQuery]:
         """
         Execute complete search workflow as specified in PRD-009.
@@ -168,6 +232,8 @@ class SearchOrchestrator:
         Args:
             query: Search query with parameters
             background_tasks: FastAPI background tasks for enrichment
+            progress_callback: Awaited with ranked SearchProgress snapshots while
+                workspaces complete (cache hits and coalesced requests get none)
 
         Returns:
             Tuple[SearchResults, SearchQuery]:
@@ -219,57 +285,397 @@ class SearchOrchestrator:
                 logger.warning(f"Cache check failed, continuing without cache: {e}")
                 # Continue without caching
 
-            # Step 3: Multi-Workspace Search with timeout (skip if external-only requested)
-            search_results = None
-            if normalized_query.use_external_search is True and self.mcp_enhancer:
-                # Skip workspace search if external search is explicitly requested
-                logger.info(f"[{trace_id}] Skipping workspace search due to explicit external search request")
-                logger.info(f"PIPELINE_METRICS: step=workspace_search duration_ms=0 "
-                           f"decision=skip_internal trace_id={trace_id}")
-                search_results = SearchResults(
-                    results=[],
-                    total_count=0,
-                    query_time_ms=0,
-                    strategy_used=normalized_query.strategy,
-                    cache_hit=False,
-                    workspaces_searched=[],
-                    enrichment_triggered=False,
+            # Steps 3-7 run once per cache key; identical concurrent misses
+            # wait for the same pipeline execution
+            final_results = await self._execute_coalesced(
+                normalized_query, background_tasks, start_time, trace_id, progress_callback
+            )
+            return final_results, normalized_query
+
+        except SearchTimeoutError:
+            # Re-raise timeout errors
+            raise
+        except Exception as e:
+            execution_time = int((time.time() - start_time) * 1000)
+            logger.error(f"Search orchestration failed after {execution_time}ms: {e}")
+            raise SearchOrchestrationError(
+                f"Search workflow failed: {str(e)}",
+                error_context={
+                    "query": query.query,
+                    "execution_time_ms": execution_time,
+                    "error": str(e),
+                },
+            )
+
+    async def _execute_coalesced(
+        self,
+        normalized_query: SearchQuery,
+        background_tasks: Optional[BackgroundTasks],
+        start_time: float,
+        trace_id: str,
+        progress_callback: Optional[Callable[[SearchProgress], Awaitable[Any]]] = None,
+    ) -> SearchResults:
+        """
+        Run the search pipeline through single-flight coalescing.
+
+        Args:
+            normalized_query: Normalized search query
+            background_tasks: FastAPI background tasks for enrichment
+            start_time: Request start time
+            trace_id: Request trace identifier
+            progress_callback: Streaming progress receiver (leader request only)
+
+        Returns:
+            SearchResults (a private copy when shared with other requests)
+        """
+        def run_pipeline():
+            return self._execute_search_pipeline(
+                normalized_query, background_tasks, start_time, trace_id, progress_callback
+            )
+
+        if self.single_flight is None:
+            return await run_pipeline()
+
+        wait_for_result = None
+        if self.single_flight.cache_manager is not None:
+            wait_for_result = lambda: self.search_cache.get_cached_results(normalized_query)
+
+        cache_key = self.search_cache._generate_cache_key(normalized_query)
+        if normalized_query.latency_budget_ms is not None:
+            # Budgeted searches may return partial results; only share them alike
+            cache_key = f"{cache_key}:budget={normalized_query.latency_budget_ms}"
+        results, shared = await self.single_flight.do(cache_key, run_pipeline, wait_for_result)
+        if shared:
+            results = results.model_copy(deep=True)
+            results.query_time_ms = int((time.time() - start_time) * 1000)
+            logger.info(f"PIPELINE_METRICS: step=single_flight decision=coalesced "
+                       f"duration_ms={results.query_time_ms} trace_id={trace_id}")
+        return results
+
+    async def _refresh_stale_search(self, normalized_query: SearchQuery) -> None:
+        """
+        Recompute and re-cache results for a soft-expired cache entry.
+
+        Args:
+            normalized_query: Normalized query whose cached results are stale
+        """
+        start_time = time.time()
+        trace_id = f"refresh_{int(start_time * 1000)}_{normalized_query.query[:10].replace(' ', '_')}"
+        logger.info(f"PIPELINE_METRICS: step=swr_refresh_start trace_id={trace_id}")
+        await self._execute_search_pipeline(normalized_query, None, start_time, trace_id)
+
+    async def _rewarm_after_flush(self) -> Dict[str, Any]:
+        """Re-warm popular queries after a full cache invalidation"""
+        return await self.cache_warmer.warm(force=True, reason="cache_flush")
+
+    async def _execute_search_pipeline(
+        self,
+        normalized_query: SearchQuery,
+        background_tasks: Optional[BackgroundTasks],
+        start_time: float,
+        trace_id: str,
+        progress_callback: Optional[Callable[[SearchProgress], Awaitable[Any]]] = None,
+    ) -> SearchResults:
+        """
+        Execute workflow steps 3-7 for a cache miss.
+
+        Args:
+            normalized_query: Normalized search query
+            background_tasks: FastAPI background tasks for enrichment
+            start_time: Request start time
+            trace_id: Request trace identifier
+            progress_callback: Streaming progress receiver for the workspace search
+
+        Returns:
+            Final SearchResults (also written to the result cache unless the
+            latency budget cut the workspace search short)
+        """
+        # Step 3: Multi-Workspace Search with timeout (skip if external-only requested)
+        search_results = None
+        if normalized_query.use_external_search is True and self.mcp_enhancer:
+            # Skip workspace search if external search is explicitly requested
+            logger.info(f"[{trace_id}] Skipping workspace search due to explicit external search request")
+            logger.info(f"PIPELINE_METRICS: step=workspace_search duration_ms=0 "
+                       f"decision=skip_internal trace_id={trace_id}")
+            search_results = SearchResults(
+                results=[],
+                total_count=0,
+                query_time_ms=0,
+                strategy_used=normalized_query.strategy,
+                cache_hit=False,
+                workspaces_searched=[],
+                enrichment_triggered=False,
+            )
+        else:
+            ws_start = time.time()
+            logger.info(f"[{trace_id}] Starting multi-workspace search for query: '{normalized_query.query}'")
+            try:
+                search_results = await asyncio.wait_for(
+                    self._execute_multi_workspace_search(normalized_query, progress_callback),
+                    timeout=self.search_timeout,
+                )
+                ws_time = int((time.time() - ws_start) * 1000)
+                logger.info(f"[{trace_id}] Workspace search completed: {len(search_results.results)} results from {len(search_results.workspaces_searched)} workspaces")
+                logger.info(f"PIPELINE_METRICS: step=workspace_search duration_ms={ws_time} "
+                           f"result_count={len(search_results.results)} workspaces={len(search_results.workspaces_searched)} trace_id={trace_id}")
+            except asyncio.TimeoutError:
+                raise SearchTimeoutError(
+                    f"Search timed out after {self.search_timeout}s",
+                    timeout_seconds=self.search_timeout,
+                    operation="multi_workspace_search",
                 )
+
+        # Steps 4-4.6: AI evaluation, refinement and external search, with
+        # independent LLM stages overlapped
+        (
+            search_results,
+            evaluation_result,
+            external_results_added,
+            external_search_executed,
+            stage_metrics,
+        ) = await self._run_llm_stages(normalized_query, search_results, trace_id)
+
+        # Step 5: Enrichment Decision
+        enrichment_triggered = False
+        ingestion_status = None
+        # Get external results for potential sync ingestion
+        external_results_list = []
+        if external_results_added and hasattr(search_results, 'results'):
+            # Get the external results that were added (including Context7)
+            external_results_list = [r for r in search_results.results 
+                                   if hasattr(r, 'metadata') and 
+                                   r.metadata.get('source') in ('external', 'context7_search')]
+        
+        # Trigger enrichment if we have evaluation requesting it OR if we have external results
+        if (evaluation_result and evaluation_result.needs_enrichment) or external_results_list:
+            enrichment_triggered, ingestion_status = await self._trigger_enrichment(
+                normalized_query, evaluation_result, background_tasks, external_results_list
+            )
+
+        # Step 6: Response Compilation
+        execution_time = int((time.time() - start_time) * 1000)
+        final_results = SearchResults(
+            results=search_results.results,
+            total_count=len(search_results.results),
+            query_time_ms=execution_time,
+            strategy_used=normalized_query.strategy,
+            cache_hit=False,
+            workspaces_searched=search_results.workspaces_searched,
+            enrichment_triggered=enrichment_triggered,
+            external_search_used=external_search_executed,
+            metadata=(
+                {**(search_results.metadata or {}), **stage_metrics}
+                if stage_metrics else search_results.metadata
+            ),
+            ingestion_status=ingestion_status,  # Add ingestion status to response
+        )
+
+        # Step 7: Cache Results with graceful degradation and circuit breaker
+        try:
+            if (final_results.metadata or {}).get("partial_results"):
+                logger.info(f"[{trace_id}] Not caching partial results cut short by latency budget")
+            elif await self._cache_circuit_allows():
+                await self.search_cache.cache_results(
+                    normalized_query, final_results
+                )
+                self._cache_circuit_on_success()
             else:
-                ws_start = time.time()
-                logger.info(f"[{trace_id}] Starting multi-workspace search for query: '{normalized_query.query}'")
-                try:
-                    search_results = await asyncio.wait_for(
-                        self._execute_multi_workspace_search(normalized_query),
-                        timeout=self.search_timeout,
+                logger.info("Bypassing cache set due to circuit breaker open state")
+        except Exception as e:
+            self._cache_circuit_on_failure("cache_results", e)
+            logger.warning(f"Failed to cache results: {e}")
+            # Continue without caching - this is non-critical
+
+        logger.info(
+            f"[{trace_id}] Search completed: {len(final_results.results)} results in {execution_time}ms"
+        )
+        logger.info(f"PIPELINE_METRICS: step=search_complete duration_ms={execution_time} "
+                   f"total_results={len(final_results.results)} cache_hit=False "
+                   f"external_used={external_search_executed} enrichment_triggered={enrichment_triggered} "
+                   f"trace_id={trace_id}")
+        return final_results
+
+    async def _execute_multi_workspace_search(
+        self,
+        query: SearchQuery,
+        progress_callback: Optional[Callable[[SearchProgress], Awaitable[Any]]] = None,
+    ) -> SearchResults:
+        """
+        Execute multi-workspace search strategy and result aggregation.
+
+        Process:
+        1. Identify relevant workspaces
+        2. Execute parallel workspace searches (streamed as workspaces complete
+           when a latency budget or progress callback is given)
+        3. Aggregate and rank results
+
+        Args:
+            query: Normalized search query
+            progress_callback: Awaited with ranked snapshots as workspaces complete
+
+        Returns:
+            SearchResults with aggregated results (metadata marks partial
+            results when the latency budget cancelled slower workspaces)
+        """
+        logger.info("Executing multi-workspace search strategy")
+
+        # Step 1: Identify relevant workspaces
+        relevant_workspaces = (
+            await self.workspace_strategy.identify_relevant_workspaces(
+                query.query, query.technology_hint
+            )
+        )
+
+        if not relevant_workspaces:
+            logger.warning("No relevant workspaces found")
+            return SearchResults(
+                results=[],
+                total_count=0,
+                query_time_ms=0,
+                strategy_used=query.strategy,
+                cache_hit=False,
+                workspaces_searched=[],
+                enrichment_triggered=False,
+            )
+
+        start_idx = query.offset
+        end_idx = start_idx + query.limit
+
+        # Step 2: Execute parallel workspace searches
+        metadata = None
+        if query.latency_budget_ms is not None or progress_callback is not None:
+            progress = None
+            async for progress in self.workspace_strategy.stream_parallel_search(
+                query.query,
+                relevant_workspaces,
+                query.strategy,
+                latency_budget_ms=query.latency_budget_ms,
+                min_results=end_idx,
+            ):
+                if progress_callback is not None and not progress.final:
+                    ranked = await self.result_ranker.rank_results(
+                        progress.results, query.strategy, query.query,
+                        query.technology_hint, top_k=end_idx,
                     )
-                    ws_time = int((time.time() - ws_start) * 1000)
-                    logger.info(f"[{trace_id}] Workspace search completed: {len(search_results.results)} results from {len(search_results.workspaces_searched)} workspaces")
-                    logger.info(f"PIPELINE_METRICS: step=workspace_search duration_ms={ws_time} "
-                               f"result_count={len(search_results.results)} workspaces={len(search_results.workspaces_searched)} trace_id={trace_id}")
-                except asyncio.TimeoutError:
-                    raise SearchTimeoutError(
-                        f"Search timed out after {self.search_timeout}s",
-                        timeout_seconds=self.search_timeout,
-                        operation="multi_workspace_search",
+                    await progress_callback(
+                        progress.model_copy(update={"results": ranked[start_idx:end_idx]})
+                    )
+            search_results = progress.results
+            if progress.budget_met:
+                metadata = {
+                    "partial_results": True,
+                    "pending_workspaces": progress.pending_workspaces,
+                    "elapsed_ms": progress.elapsed_ms,
+                }
+        else:
+            search_results = await self.workspace_strategy.execute_parallel_search(
+                query.query, relevant_workspaces, query.strategy
+            )
+
+        # Step 3: Rank and filter results (only the requested page is fully sorted)
+        ranked_results = await self.result_ranker.rank_results(
+            search_results, query.strategy, query.query, query.technology_hint,
+            top_k=end_idx,
+        )
+
+        # Apply limit and offset
+        paginated_results = ranked_results[start_idx:end_idx]
+
+        # Extract workspace slugs
+        workspace_slugs = [ws.slug for ws in relevant_workspaces]
+
+        return SearchResults(
+            results=paginated_results,
+            total_count=len(search_results),
+            query_time_ms=0,  # Will be set by caller
+            strategy_used=query.strategy,
+            cache_hit=False,
+            workspaces_searched=workspace_slugs,
+            enrichment_triggered=False,  # Will be set by caller
+            metadata=metadata,
+        )
+
+    async def _run_llm_stages(
+        self,
+        normalized_query: SearchQuery,
+        search_results: SearchResults,
+        trace_id: str,
+    ) -> Tuple[SearchResults, Optional[EvaluationResult], bool, bool, Dict[str, Any]]:
+        """
+        Execute workflow steps 4-4.6: AI evaluation, query refinement and
+        external search enhancement.
+
+        Independent stages are overlapped instead of run strictly in sequence:
+        - With an automatic external search decision, evaluation and the
+          decision are one structured LLM call (when the TextAI service
+          supports it), replacing the separate decide_external_search call.
+        - External search starts alongside evaluation when it was explicitly
+          requested, or speculatively when the workspace search returned few
+          results. Speculative work is cancelled if the decision is negative,
+          or recorded as "unused" when it already finished.
+
+        Args:
+            normalized_query: Normalized search query
+            search_results: Workspace search results
+            trace_id: Request trace identifier
+
+        Returns:
+            Tuple of (search results, evaluation result, external results
+            added, external search executed, stage metrics for the response
+            metadata; empty when no stage ran)
+        """
+        stage_timings: Dict[str, int] = {}
+        stages_start = time.time()
+        auto_decision = normalized_query.use_external_search is None
+        merged_decision = False
+
+        # Start external search early when it is (likely to be) needed
+        external_task: Optional[asyncio.Task] = None
+        speculation = "none"
+        if self.mcp_enhancer and normalized_query.use_external_search is not False:
+            start_external = normalized_query.use_external_search is True
+            if auto_decision and (
+                self.pipeline_config.speculative_external_search_enabled
+                and len(search_results.results) < self.pipeline_config.speculative_external_result_threshold
+            ):
+                start_external = True
+                speculation = "started"
+                logger.info(
+                    f"[{trace_id}] Starting speculative external search alongside evaluation "
+                    f"({len(search_results.results)} internal results)"
+                )
+            if start_external:
+                external_task = asyncio.create_task(
+                    self._timed_stage(
+                        stage_timings,
+                        "external_search",
+                        self._enhance_with_external_search(normalized_query, search_results),
                     )
+                )
 
+        external_results_added = False
+        external_search_executed = False
+        try:
             # Step 4: AI Evaluation (optional)
             evaluation_result = None
             if self.llm_client:
                 try:
-                    evaluation_result = await self._evaluate_search_results(
-                        normalized_query, search_results
+                    evaluation_result = await self._timed_stage(
+                        stage_timings,
+                        "evaluation",
+                        self._evaluate_search_results(
+                            normalized_query, search_results, decide_external=auto_decision
+                        ),
                     )
                 except Exception as e:
                     logger.warning(f"AI evaluation failed: {e}")
                     # Continue without evaluation
 
             # Step 4.5: Query Refinement (if needed)
-            refined_query_attempted = False
             if evaluation_result and 0.4 <= evaluation_result.overall_quality < 0.8:
                 # Results are partially relevant - try query refinement
                 logger.info(f"[{trace_id}] Results partially relevant (score: {evaluation_result.overall_quality}), attempting query refinement")
+                refinement_start = time.time()
                 try:
                     refined_results = await self._refine_and_retry_search(
                         normalized_query, search_results, evaluation_result, trace_id
@@ -277,24 +683,22 @@ class SearchOrchestrator:
                     if refined_results and len(refined_results.results) > len(search_results.results):
                         logger.info(f"[{trace_id}] Query refinement improved results from {len(search_results.results)} to {len(refined_results.results)}")
                         search_results = refined_results
-                        refined_query_attempted = True
                         # Re-evaluate with refined results
                         if self.llm_client:
                             try:
                                 evaluation_result = await self._evaluate_search_results(
-                                    normalized_query, search_results
+                                    normalized_query, search_results, decide_external=auto_decision
                                 )
                             except Exception as e:
                                 logger.warning(f"Re-evaluation after refinement failed: {e}")
                 except Exception as e:
                     logger.error(f"[{trace_id}] Query refinement failed: {e}")
-            
+                stage_timings["refinement"] = int((time.time() - refinement_start) * 1000)
+
             # Step 4.6: External Search Enhancement (if needed)
-            external_results_added = False
-            external_search_executed = False
             # Check if external search should be used
             should_use_external = False
-            
+
             # Log search state for metrics
             logger.info(
                 f"Search state - Query: '{normalized_query.query[:50]}...' | "
@@ -302,7 +706,7 @@ class SearchOrchestrator:
                 f"Quality score: {evaluation_result.overall_quality if evaluation_result else 'N/A'} | "
                 f"External search requested: {normalized_query.use_external_search}"
             )
-            
+
             if normalized_query.use_external_search is True:
                 # Explicitly requested
                 should_use_external = True
@@ -315,70 +719,38 @@ class SearchOrchestrator:
                 logger.info(f"[{trace_id}] External search explicitly disabled by user")
                 logger.info(f"PIPELINE_METRICS: step=external_search_decision duration_ms=0 "
                            f"decision=explicit_false trace_id={trace_id}")
+            elif evaluation_result is not None and evaluation_result.needs_external_search is not None:
+                # Decided together with the evaluation
+                should_use_external = evaluation_result.needs_external_search
+                merged_decision = True
+                logger.info(f"PIPELINE_METRICS: step=external_search_decision duration_ms=0 "
+                           f"decision={'use_external' if should_use_external else 'skip_external'} "
+                           f"source=merged_evaluation trace_id={trace_id}")
             else:
                 # Auto-decide using TextAI with EXTERNAL_SEARCH_DECISION prompt
-                decision_start = time.time()
-                if self.mcp_enhancer and self.mcp_enhancer.text_ai and evaluation_result:
-                    try:
-                        logger.info(f"[{trace_id}] Calling TextAI for external search decision")
-                        
-                        # Convert to MCP models
-                        from src.mcp.core.models import NormalizedQuery
-                        normalized = NormalizedQuery(
-                            original_query=normalized_query.query,
-                            normalized_text=normalized_query.query.lower().strip(),
-                            technology_hint=normalized_query.technology_hint,
-                            query_hash="",
-                            extracted_entities=[]
-                        )
-                        # Store trace_id separately since it's not a model field
-                        # We'll pass it as a parameter where needed
-                        
-                        # Convert evaluation result to MCP format
-                        from src.mcp.core.models import EvaluationResult as MCPEvalResult
-                        mcp_eval = MCPEvalResult(
-                            relevance_score=evaluation_result.overall_quality,
-                            completeness_score=evaluation_result.completeness_score,
-                            needs_refinement=evaluation_result.overall_quality < 0.8,
-                            needs_external_search=False,  # This is what we're deciding
-                            missing_information=evaluation_result.enrichment_topics,
-                            confidence=evaluation_result.confidence_level
-                        )
-                        
-                        # Call TextAI to decide
-                        external_decision = await self.mcp_enhancer.text_ai.decide_external_search(
-                            normalized, mcp_eval
-                        )
-                        should_use_external = external_decision.should_search
-                        
-                        decision_time = int((time.time() - decision_start) * 1000)
-                        logger.info(
-                            f"[{trace_id}] TextAI external search decision in {decision_time}ms: "
-                            f"{should_use_external} (reason: {external_decision.reasoning})"
-                        )
-                        logger.info(f"PIPELINE_METRICS: step=external_search_decision duration_ms={decision_time} "
-                                   f"decision={'use_external' if should_use_external else 'skip_external'} "
-                                   f"confidence={external_decision.confidence} trace_id={trace_id}")
-                    except Exception as e:
-                        logger.error(f"[{trace_id}] TextAI external search decision failed: {e}")
-                        # Fallback to simple logic
-                        should_use_external = (not search_results.results or 
-                                             evaluation_result.overall_quality < 0.6)
-                        logger.info(f"[{trace_id}] Fallback external search decision: {should_use_external}")
-                else:
-                    # No TextAI available, use simple logic
-                    should_use_external = (not search_results.results or 
-                                         (evaluation_result and evaluation_result.overall_quality < 0.6))
-                    logger.info(f"[{trace_id}] Simple external search decision: {should_use_external}")
-            
+                should_use_external = await self._timed_stage(
+                    stage_timings,
+                    "external_search_decision",
+                    self._decide_external_search(
+                        normalized_query, search_results, evaluation_result, trace_id
+                    ),
+                )
+
             logger.info(f"MCP enhancer available: {self.mcp_enhancer is not None}, should use external: {should_use_external}")
             if self.mcp_enhancer and should_use_external:
                 logger.info("Calling external search enhancement...")
                 try:
                     external_search_executed = True
-                    external_results = await self._enhance_with_external_search(
-                        normalized_query, search_results
-                    )
+                    if external_task is not None:
+                        if speculation == "started":
+                            speculation = "used"
+                        external_results = await external_task
+                    else:
+                        external_results = await self._timed_stage(
+                            stage_timings,
+                            "external_search",
+                            self._enhance_with_external_search(normalized_query, search_results),
+                        )
                     logger.info(f"External search returned {len(external_results) if external_results else 0} results")
                     if external_results:
                         search_results.results.extend(external_results)
@@ -390,144 +762,240 @@ class SearchOrchestrator:
                     logger.error(f"External search enhancement failed: {e}", exc_info=True)
             else:
                 logger.warning(f"External search not called: mcp_enhancer={self.mcp_enhancer is not None}, should_use_external={should_use_external}")
+        finally:
+            if external_task is not None and not external_task.done():
+                external_task.cancel()
+                await asyncio.gather(external_task, return_exceptions=True)
+                if speculation == "started":
+                    speculation = "cancelled"
+                    stage_timings["external_search_cancelled"] = stage_timings.pop("external_search", 0)
+                    logger.info(f"[{trace_id}] Speculative external search cancelled")
+            elif speculation == "started":
+                # Finished before a negative decision: the external call was wasted
+                await asyncio.gather(external_task, return_exceptions=True)
+                speculation = "unused"
+                stage_timings["external_search_unused"] = stage_timings.pop("external_search", 0)
+                logger.info(f"[{trace_id}] Speculative external search completed unused")
+            if speculation != "none":
+                self.speculative_external_outcomes[speculation] += 1
+
+        if not stage_timings:
+            return search_results, evaluation_result, external_results_added, external_search_executed, {}
+
+        # Overlap savings: stages that ran concurrently vs. their sequential sum
+        wall_ms = int((time.time() - stages_start) * 1000)
+        sequential_ms = sum(
+            duration for stage, duration in stage_timings.items()
+            if stage not in ("external_search_cancelled", "external_search_unused")
+        )
+        saved_ms = max(0, sequential_ms - wall_ms)
+        stages = ",".join(f"{stage}:{duration}" for stage, duration in stage_timings.items())
+        logger.info(f"PIPELINE_METRICS: step=llm_stage_plan duration_ms={wall_ms} "
+                   f"sequential_ms={sequential_ms} saved_ms={saved_ms} "
+                   f"speculative_external={speculation} merged_decision={merged_decision} "
+                   f"stages={stages} trace_id={trace_id}")
+        stage_metrics = {
+            "stage_timings_ms": stage_timings,
+            "llm_stages_ms": wall_ms,
+            "llm_stages_saved_ms": saved_ms,
+            "speculative_external_search": speculation,
+            "merged_external_decision": merged_decision,
+        }
+        return search_results, evaluation_result, external_results_added, external_search_executed, stage_metrics
 
-            # Step 5: Enrichment Decision
-            enrichment_triggered = False
-            ingestion_status = None
-            # Get external results for potential sync ingestion
-            external_results_list = []
-            if external_results_added and hasattr(search_results, 'results'):
-                # Get the external results that were added (including Context7)
-                external_results_list = [r for r in search_results.results 
-                                       if hasattr(r, 'metadata') and 
-                                       r.metadata.get('source') in ('external', 'context7_search')]
-            
-            # Trigger enrichment if we have evaluation requesting it OR if we have external results
-            if (evaluation_result and evaluation_result.needs_enrichment) or external_results_list:
-                enrichment_triggered, ingestion_status = await self._trigger_enrichment(
-                    normalized_query, evaluation_result, background_tasks, external_results_list
-                )
+    @staticmethod
+    async def _timed_stage(timings: Dict[str, int], stage: str, stage_coro: Awaitable[Any]) -> Any:
+        """Await a pipeline stage, recording its duration in timings"""
+        start = time.time()
+        try:
+            return await stage_coro
+        finally:
+            timings[stage] = int((time.time() - start) * 1000)
 
-            # Step 6: Response Compilation
-            execution_time = int((time.time() - start_time) * 1000)
-            final_results = SearchResults(
-                results=search_results.results,
-                total_count=len(search_results.results),
-                query_time_ms=execution_time,
-                strategy_used=normalized_query.strategy,
-                cache_hit=False,
-                workspaces_searched=search_results.workspaces_searched,
-                enrichment_triggered=enrichment_triggered,
-                external_search_used=external_search_executed,
-                ingestion_status=ingestion_status,  # Add ingestion status to response
-            )
+    async def _decide_external_search(
+        self,
+        normalized_query: SearchQuery,
+        search_results: SearchResults,
+        evaluation_result: Optional[EvaluationResult],
+        trace_id: str,
+    ) -> bool:
+        """
+        Decide on external search with a separate TextAI call
+        (EXTERNAL_SEARCH_DECISION prompt), or simple rules without TextAI.
 
-            # Step 7: Cache Results with graceful degradation and circuit breaker
+        Returns:
+            Whether to run external search
+        """
+        decision_start = time.time()
+        if self.mcp_enhancer and self.mcp_enhancer.text_ai and evaluation_result:
             try:
-                if await self._cache_circuit_allows():
-                    await self.search_cache.cache_results(
-                        normalized_query, final_results
-                    )
-                    self._cache_circuit_on_success()
-                else:
-                    logger.info("Bypassing cache set due to circuit breaker open state")
+                logger.info(f"[{trace_id}] Calling TextAI for external search decision")
+                
+                # Convert to MCP models
+                from src.mcp.core.models import NormalizedQuery
+                normalized = NormalizedQuery(
+                    original_query=normalized_query.query,
+                    normalized_text=normalized_query.query.lower().strip(),
+                    technology_hint=normalized_query.technology_hint,
+                    query_hash="",
+                    extracted_entities=[]
+                )
+                # Store trace_id separately since it's not a model field
+                # We'll pass it as a parameter where needed
+                
+                # Convert evaluation result to MCP format
+                from src.mcp.core.models import EvaluationResult as MCPEvalResult
+                mcp_eval = MCPEvalResult(
+                    relevance_score=evaluation_result.overall_quality,
+                    completeness_score=evaluation_result.completeness_score,
+                    needs_refinement=evaluation_result.overall_quality < 0.8,
+                    needs_external_search=False,  # This is what we're deciding
+                    missing_information=evaluation_result.enrichment_topics,
+                    confidence=evaluation_result.confidence_level
+                )
+                
+                # Call TextAI to decide
+                external_decision = await self.mcp_enhancer.text_ai.decide_external_search(
+                    normalized, mcp_eval
+                )
+                should_use_external = external_decision.should_search
+                
+                decision_time = int((time.time() - decision_start) * 1000)
+                logger.info(
+                    f"[{trace_id}] TextAI external search decision in {decision_time}ms: "
+                    f"{should_use_external} (reason: {external_decision.reasoning})"
+                )
+                logger.info(f"PIPELINE_METRICS: step=external_search_decision duration_ms={decision_time} "
+                           f"decision={'use_external' if should_use_external else 'skip_external'} "
+                           f"confidence={external_decision.confidence} trace_id={trace_id}")
             except Exception as e:
-                self._cache_circuit_on_failure("cache_results", e)
-                logger.warning(f"Failed to cache results: {e}")
-                # Continue without caching - this is non-critical
-
-            logger.info(
-                f"[{trace_id}] Search completed: {len(final_results.results)} results in {execution_time}ms"
-            )
-            logger.info(f"PIPELINE_METRICS: step=search_complete duration_ms={execution_time} "
-                       f"total_results={len(final_results.results)} cache_hit=False "
-                       f"external_used={external_search_executed} enrichment_triggered={enrichment_triggered} "
-                       f"trace_id={trace_id}")
-            return final_results, normalized_query
-
-        except SearchTimeoutError:
-            # Re-raise timeout errors
-            raise
-        except Exception as e:
-            execution_time = int((time.time() - start_time) * 1000)
-            logger.error(f"Search orchestration failed after {execution_time}ms: {e}")
-            raise SearchOrchestrationError(
-                f"Search workflow failed: {str(e)}",
-                error_context={
-                    "query": query.query,
-                    "execution_time_ms": execution_time,
-                    "error": str(e),
-                },
-            )
+                logger.error(f"[{trace_id}] TextAI external search decision failed: {e}")
+                # Fallback to simple logic
+                should_use_external = (not search_results.results or 
+                                     evaluation_result.overall_quality < 0.6)
+                logger.info(f"[{trace_id}] Fallback external search decision: {should_use_external}")
+        else:
+            # No TextAI available, use simple logic
+            should_use_external = (not search_results.results or 
+                                 (evaluation_result and evaluation_result.overall_quality < 0.6))
+            logger.info(f"[{trace_id}] Simple external search decision: {should_use_external}")
+        return should_use_external
 
-    async def _execute_multi_workspace_search(
-        self, query: SearchQuery
-    ) -> SearchResults:
+    async def _evaluate_search_results(
+        self, query: SearchQuery, results: SearchResults, decide_external: bool = False
+    ) -> Optional[EvaluationResult]:
         """
-        Execute multi-workspace search strategy and result aggregation.
-
-        Process:
-        1. Identify relevant workspaces
-        2. Execute parallel workspace searches
-        3. Aggregate and rank results
+        Evaluate search results quality, locally when confident and with the
+        LLM otherwise.
 
         Args:
-            query: Normalized search query
+            query: Search query
+            results: Search results to evaluate
+            decide_external: Also decide on external search (sets
+                EvaluationResult.needs_external_search)
 
         Returns:
-            SearchResults with aggregated results
+            EvaluationResult with quality assessment
         """
-        logger.info("Executing multi-workspace search strategy")
-
-        # Step 1: Identify relevant workspaces
-        relevant_workspaces = (
-            await self.workspace_strategy.identify_relevant_workspaces(
-                query.query, query.technology_hint
-            )
-        )
+        if not self.mcp_enhancer or not self.mcp_enhancer.text_ai:
+            logger.warning("MCP enhancer or text AI not available, using fallback evaluation")
+            return None
 
-        if not relevant_workspaces:
-            logger.warning("No relevant workspaces found")
-            return SearchResults(
-                results=[],
-                total_count=0,
-                query_time_ms=0,
-                strategy_used=query.strategy,
-                cache_hit=False,
-                workspaces_searched=[],
-                enrichment_triggered=False,
-            )
+        if not self.pipeline_config.local_evaluation_enabled:
+            return await self._evaluate_with_llm(query, results, decide_external)
 
-        # Step 2: Execute parallel workspace searches
-        search_results = await self.workspace_strategy.execute_parallel_search(
-            query.query, relevant_workspaces
+        trace_id = getattr(query, 'trace_id', f"search_{int(time.time() * 1000)}")
+        start_time = time.time()
+        local = self.local_evaluator.evaluate(query.query, results.results)
+        local_result = self._local_evaluation_result(query, local, decide_external)
+        shadow = (
+            not local.escalate
+            and random.random() < self.pipeline_config.local_evaluation_sample_rate
         )
-
-        # Step 3: Rank and filter results
-        ranked_results = await self.result_ranker.rank_results(
-            search_results, query.strategy, query.query, query.technology_hint
+        decision = "escalate" if local.escalate else ("shadow" if shadow else "skip_llm")
+        logger.info(f"PIPELINE_METRICS: step=local_evaluation duration_ms={int((time.time() - start_time) * 1000)} "
+                   f"confidence_score={local.confidence:.3f} relevance={local.relevance_score:.3f} "
+                   f"decision={decision} trace_id={trace_id}")
+        if decision == "skip_llm":
+            return local_result
+
+        evaluation_result = await self._evaluate_with_llm(
+            query, results, decide_external, fallback=local_result
         )
-
-        # Apply limit and offset
-        start_idx = query.offset
-        end_idx = start_idx + query.limit
-        paginated_results = ranked_results[start_idx:end_idx]
-
-        # Extract workspace slugs
-        workspace_slugs = [ws.slug for ws in relevant_workspaces]
-
-        return SearchResults(
-            results=paginated_results,
-            total_count=len(ranked_results),
-            query_time_ms=0,  # Will be set by caller
-            strategy_used=query.strategy,
-            cache_hit=False,
-            workspaces_searched=workspace_slugs,
-            enrichment_triggered=False,  # Will be set by caller
+        if evaluation_result is not local_result:
+            self._log_evaluation_sample(query, results, local, evaluation_result, shadow)
+        return evaluation_result
+
+    def _local_evaluation_result(
+        self, query: SearchQuery, local: LocalEvaluation, decide_external: bool
+    ) -> EvaluationResult:
+        """Convert a local evaluation to the orchestrator format"""
+        features = local.features
+        return EvaluationResult(
+            overall_quality=local.relevance_score,
+            relevance_assessment=local.relevance_score,
+            completeness_score=local.completeness_score,
+            needs_enrichment=local.needs_external_search or len(local.missing_information) > 0,
+            enrichment_topics=local.missing_information or (
+                [query.technology_hint] if query.technology_hint else []
+            ),
+            confidence_level=local.confidence,
+            reasoning=(
+                f"Local evaluation - relevance: {local.relevance_score:.2f}, "
+                f"term coverage: {features.term_coverage if features else 0.0:.2f}"
+            ),
+            needs_external_search=local.needs_external_search if decide_external else None,
         )
 
-    async def _evaluate_search_results(
-        self, query: SearchQuery, results: SearchResults
+    def _log_evaluation_sample(
+        self,
+        query: SearchQuery,
+        results: SearchResults,
+        local: LocalEvaluation,
+        evaluation_result: EvaluationResult,
+        shadow: bool,
+    ) -> None:
+        """Log local vs LLM evaluation for offline replay (src.search.evaluation_replay)"""
+        needs_external = evaluation_result.needs_external_search
+        sample = {
+            "trace_id": getattr(query, 'trace_id', None),
+            "query": query.query,
+            "results": [
+                {
+                    "title": result.title,
+                    "content": result.content_snippet[:500],
+                    "score": result.relevance_score,
+                    "metadata": {
+                        key: result.metadata[key]
+                        for key in ("match_score", "rrf_score") if key in result.metadata
+                    },
+                }
+                for result in results.results[:10]
+            ],
+            "result_count": len(results.results),
+            "local": {
+                "relevance_score": local.relevance_score,
+                "confidence": local.confidence,
+                "needs_external_search": local.needs_external_search,
+            },
+            "llm": {
+                "relevance_score": evaluation_result.overall_quality,
+                "confidence": evaluation_result.confidence_level,
+                "needs_external_search": (
+                    needs_external if needs_external is not None
+                    else evaluation_result.overall_quality < self.local_evaluator.boundary
+                ),
+            },
+            "shadow": shadow,
+        }
+        logger.info(f"EVALUATION_SAMPLE: {json.dumps(sample, default=str)}")
+
+    async def _evaluate_with_llm(
+        self,
+        query: SearchQuery,
+        results: SearchResults,
+        decide_external: bool = False,
+        fallback: Optional[EvaluationResult] = None,
     ) -> Optional[EvaluationResult]:
         """
         Call LLM client to evaluate search results quality.
@@ -535,15 +1003,22 @@ class SearchOrchestrator:
         Args:
             query: Search query
             results: Search results to evaluate
+            decide_external: Also decide on external search in the same LLM
+                call (sets EvaluationResult.needs_external_search)
+            fallback: Result returned if the LLM evaluation fails
 
         Returns:
             EvaluationResult with quality assessment
         """
-        if not self.mcp_enhancer or not self.mcp_enhancer.text_ai:
-            logger.warning("MCP enhancer or text AI not available, using fallback evaluation")
-            return None
-
+        text_ai = self.mcp_enhancer.text_ai
         try:
+            if (
+                decide_external
+                and self.pipeline_config.merged_evaluation_enabled
+                and callable(getattr(type(text_ai), "evaluate_and_decide", None))
+            ):
+                return await self._evaluate_and_decide(query, results)
+
             start_time = time.time()
             trace_id = getattr(query, 'trace_id', f"search_{int(time.time() * 1000)}")
             logger.info(f"[{trace_id}] Evaluating search results with TextAI for query: {query.query}")
@@ -600,6 +1075,8 @@ class SearchOrchestrator:
 
         except Exception as e:
             logger.error(f"TextAI evaluation failed: {e}", exc_info=True)
+            if fallback is not None:
+                return fallback
             # Fallback to simple evaluation
             return EvaluationResult(
                 overall_quality=0.5,
@@ -611,6 +1088,66 @@ class SearchOrchestrator:
                 reasoning=f"Fallback evaluation due to error: {str(e)}",
             )
 
+    async def _evaluate_and_decide(
+        self, query: SearchQuery, results: SearchResults
+    ) -> EvaluationResult:
+        """
+        Evaluate search results and decide on external search with a single
+        structured TextAI call.
+
+        Args:
+            query: Search query
+            results: Search results to evaluate
+
+        Returns:
+            EvaluationResult with needs_external_search set
+        """
+        start_time = time.time()
+        trace_id = getattr(query, 'trace_id', f"search_{int(time.time() * 1000)}")
+        logger.info(f"[{trace_id}] Evaluating search results and external search need with TextAI")
+
+        from src.mcp.core.models import NormalizedQuery
+        normalized = NormalizedQuery(
+            original_query=query.query,
+            normalized_text=query.query.lower().strip(),
+            technology_hint=query.technology_hint,
+            query_hash="",  # Not needed for evaluation
+            tokens=[]
+        )
+        top_results = [
+            {
+                "title": result.title,
+                "content": result.content_snippet,
+                "url": result.source_url,
+                "score": result.relevance_score,
+            }
+            for result in results.results[:10]
+        ]
+
+        decision = await self.mcp_enhancer.text_ai.evaluate_and_decide(normalized, top_results)
+
+        evaluation_result = EvaluationResult(
+            overall_quality=decision.relevance_score,
+            relevance_assessment=decision.relevance_score,
+            completeness_score=decision.completeness_score,
+            needs_enrichment=decision.needs_external_search or len(decision.missing_information) > 0,
+            enrichment_topics=decision.missing_information or (
+                [query.technology_hint] if query.technology_hint else []
+            ),
+            confidence_level=decision.confidence,
+            reasoning=decision.reasoning or (
+                f"LLM evaluation - relevance: {decision.relevance_score:.2f}, "
+                f"needs_external: {decision.needs_external_search}"
+            ),
+            needs_external_search=decision.needs_external_search,
+        )
+
+        eval_time = int((time.time() - start_time) * 1000)
+        logger.info(f"PIPELINE_METRICS: step=text_ai_evaluation duration_ms={eval_time} "
+                   f"confidence_score={evaluation_result.overall_quality} "
+                   f"decision=evaluate_and_decide trace_id={trace_id}")
+        return evaluation_result
+
     async def _trigger_enrichment(
         self,
         query: SearchQuery,
@@ -1519,7 +2056,7 @@ class SearchOrchestrator:
         Normalize search query for consistent processing and caching.
         Implements PRD-009 requirements:
         - Input validation and sanitization
-        - Text cleaning (reuse ContentPreprocessor)
+        - Text cleaning (same cleanup as ContentPreprocessor)
         - Tokenization and stemming
         - Consistent normalization for cache and all strategies
 
@@ -1530,70 +2067,17 @@ class SearchOrchestrator:
             Normalized SearchQuery
 
         Raises:
-            HTTPException: If input is invalid or normalization fails
+            HTTPException: If input is invalid
         """
-        import re
-        from fastapi import HTTPException
-        from src.document_processing.preprocessing import ContentPreprocessor
-
-        logger = logging.getLogger(__name__)
-
-        # Input validation
-        raw_query = query.query
-        if not isinstance(raw_query, str) or not raw_query.strip():
-            logger.warning("Empty or non-string search query rejected")
-            raise HTTPException(
-                status_code=422, detail="Query must be a non-empty string"
-            )
-        if len(raw_query) < 2 or len(raw_query) > 256:
-            logger.warning("Query length out of bounds")
-            raise HTTPException(
-                status_code=422,
-                detail="Query length must be between 2 and 256 characters",
-            )
-        if not re.match(r"^[\w\s\-\.,:;!?()'/@#&]+$", raw_query, re.UNICODE):
-            logger.warning("Query contains invalid characters")
-            raise HTTPException(
-                status_code=422, detail="Query contains invalid characters"
-            )
-
-        # Text cleaning (async)
-        preprocessor = ContentPreprocessor()
-        try:
-            cleaned = await preprocessor.clean_text(raw_query)
-        except Exception as e:
-            logger.error(f"Text cleaning failed: {e}")
-            raise HTTPException(status_code=500, detail="Failed to clean query text")
-
-        # Tokenization (split on word boundaries)
-        tokens = re.findall(r"\b\w+\b", cleaned.lower())
-
-        # Simple Porter stemmer (inline, no external deps)
-        def porter_stem(word):
-            # Only basic suffix stripping for production safety
-            for suffix in ["ing", "ed", "ly", "es", "s", "ment"]:
-                if word.endswith(suffix) and len(word) > len(suffix) + 2:
-                    return word[: -len(suffix)]
-            return word
-
-        stemmed_tokens = [porter_stem(token) for token in tokens]
-
-        # Reconstruct normalized query string
-        normalized_text = " ".join(stemmed_tokens)
+        # Validation, cleaning and stemming with precompiled patterns; repeated
+        # queries are served from the normalizer's memo
+        normalized = self.query_normalizer.normalize(query.query)
 
         # Lowercase technology_hint if present
         tech_hint = query.technology_hint.lower() if query.technology_hint else None
 
-        return SearchQuery(
-            query=normalized_text,
-            filters=query.filters,
-            strategy=query.strategy,
-            limit=query.limit,
-            offset=query.offset,
-            technology_hint=tech_hint,
-            workspace_slugs=query.workspace_slugs,
-            external_providers=query.external_providers,
-            use_external_search=query.use_external_search,
+        return query.model_copy(
+            update={"query": normalized.text, "technology_hint": tech_hint}
         )
 
     def _create_evaluation_prompt(
@@ -1685,6 +2169,8 @@ class SearchOrchestrator:
             cache_health = await self.search_cache.get_cache_stats()
             cache_status = cache_health.get("cache_status", "unknown")
             cache_details = cache_health
+            if self.single_flight is not None:
+                cache_details["single_flight"] = self.single_flight.get_stats()
             if cache_status != "healthy":
                 overall_status = "degraded"
         except Exception as e:
@@ -1799,7 +2285,8 @@ class SearchOrchestrator:
         session_id: Optional[str] = None,
         background_tasks: Optional[BackgroundTasks] = None,
         external_providers: Optional[List[str]] = None,
-        use_external_search: Optional[bool] = None
+        use_external_search: Optional[bool] = None,
+        latency_budget_ms: Optional[int] = None,
     ) -> "SearchResponse":
         """
         Main search method for API compatibility.
@@ -1811,6 +2298,7 @@ class SearchOrchestrator:
             offset: Pagination offset
             session_id: Optional session ID
             background_tasks: Optional background tasks
+            latency_budget_ms: Return early without waiting for slow workspaces
             
         Returns:
             SearchResponse compatible with API schema
@@ -1818,11 +2306,96 @@ class SearchOrchestrator:
         import uuid
         trace_id = f"orch-{uuid.uuid4().hex[:8]}"
         logger.info(f"[{trace_id}] Search called with: query={query!r}, technology_hint={technology_hint!r} (type: {type(technology_hint)}), limit={limit!r}, offset={offset!r}")
-        # Import here to avoid circular imports
-        from src.api.v1.schemas import SearchResponse as APISearchResponse
+
+        search_query = self._build_search_query(
+            query, technology_hint, limit, offset,
+            external_providers, use_external_search, latency_budget_ms,
+        )
         
-        # Create internal SearchQuery
-        search_query = SearchQuery(
+        # Execute search
+        results, _ = await self.execute_search(search_query, background_tasks)
+        return self._to_api_response(query, technology_hint, limit, results, trace_id)
+
+    async def stream_search(
+        self,
+        query: str,
+        technology_hint: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0,
+        session_id: Optional[str] = None,
+        background_tasks: Optional[BackgroundTasks] = None,
+        external_providers: Optional[List[str]] = None,
+        use_external_search: Optional[bool] = None,
+        latency_budget_ms: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Search with progressive results for SSE/WebSocket clients.
+
+        Yields "progress" frames with the ranked page each time a workspace
+        completes, then one "result" frame with the complete SearchResponse
+        (after evaluation, external search and enrichment). Cache hits yield
+        only the result frame.
+
+        Args:
+            Same as search()
+
+        Yields:
+            {"type": "progress" | "result", "data": {...}} frames
+        """
+        trace_id = f"orch-{uuid.uuid4().hex[:8]}"
+        search_query = self._build_search_query(
+            query, technology_hint, limit, offset,
+            external_providers, use_external_search, latency_budget_ms,
+        )
+        frames: asyncio.Queue = asyncio.Queue()
+
+        async def on_progress(progress: SearchProgress) -> None:
+            await frames.put({
+                "type": "progress",
+                "data": {
+                    "results": [
+                        api_result.model_dump()
+                        for api_result in self._to_api_results(progress.results, limit)
+                    ],
+                    "completed_workspaces": progress.completed_workspaces,
+                    "pending_workspaces": progress.pending_workspaces,
+                    "failed_workspaces": progress.failed_workspaces,
+                    "candidate_count": progress.candidate_count,
+                    "elapsed_ms": progress.elapsed_ms,
+                    "top_k_changed": progress.top_k_changed,
+                },
+            })
+
+        search_task = asyncio.create_task(
+            self.execute_search(search_query, background_tasks, progress_callback=on_progress)
+        )
+        search_task.add_done_callback(lambda _: frames.put_nowait(None))
+        try:
+            while True:
+                frame = await frames.get()
+                if frame is None:
+                    break
+                yield frame
+
+            results, _ = search_task.result()
+            response = self._to_api_response(query, technology_hint, limit, results, trace_id)
+            yield {"type": "result", "data": response.model_dump(mode="json")}
+        finally:
+            if not search_task.done():
+                search_task.cancel()
+
+    def _build_search_query(
+        self,
+        query: str,
+        technology_hint: Optional[str],
+        limit: int,
+        offset: int,
+        external_providers: Optional[List[str]],
+        use_external_search: Optional[bool],
+        latency_budget_ms: Optional[int],
+    ) -> SearchQuery:
+        """Create the internal SearchQuery for an API request"""
+        return SearchQuery(
             query=query,
             filters={
                 "technology": technology_hint
@@ -1831,25 +2404,16 @@ class SearchOrchestrator:
             offset=offset,
             technology_hint=technology_hint,
             external_providers=external_providers,
-            use_external_search=use_external_search
+            use_external_search=use_external_search,
+            latency_budget_ms=latency_budget_ms,
         )
-        
-        # Execute search
-        results, _ = await self.execute_search(search_query, background_tasks)
-        
-        # Convert to API response format
-        # Ensure technology_hint is always a string or None to prevent type errors
-        if technology_hint is not None and not isinstance(technology_hint, str):
-            logger.warning(f"Invalid technology_hint type: {type(technology_hint)}, value: {technology_hint!r}, converting to string")
-            tech_hint = str(technology_hint) if technology_hint else None
-        else:
-            tech_hint = technology_hint
-        
-        # Convert SearchResult objects to API SearchResult models
+
+    def _to_api_results(self, results: List[Any], limit: int) -> List[Any]:
+        """Convert SearchResult objects to API SearchResult models"""
         from src.api.v1.schemas import SearchResult as APISearchResult
-        logger.info(f"[{trace_id}] Converting {len(results.results[:limit])} search results to API format")
+
         api_results = []
-        for i, result in enumerate(results.results[:limit]):
+        for i, result in enumerate(results[:limit]):
             logger.debug(f"Converting result {i}: type={type(result)}, content_id={result.content_id}")
             api_result = APISearchResult(
                 content_id=result.content_id,
@@ -1862,6 +2426,31 @@ class SearchOrchestrator:
                 workspace=result.workspace_slug or "external_search",
             )
             api_results.append(api_result)
+        return api_results
+
+    def _to_api_response(
+        self,
+        query: str,
+        technology_hint: Optional[str],
+        limit: int,
+        results: SearchResults,
+        trace_id: str,
+    ) -> "SearchResponse":
+        """Convert SearchResults to the API SearchResponse"""
+        # Import here to avoid circular imports
+        from src.api.v1.schemas import SearchResponse as APISearchResponse
+
+        # Convert to API response format
+        # Ensure technology_hint is always a string or None to prevent type errors
+        if technology_hint is not None and not isinstance(technology_hint, str):
+            logger.warning(f"Invalid technology_hint type: {type(technology_hint)}, value: {technology_hint!r}, converting to string")
+            tech_hint = str(technology_hint) if technology_hint else None
+        else:
+            tech_hint = technology_hint
+        
+        # Convert SearchResult objects to API SearchResult models
+        logger.info(f"[{trace_id}] Converting {len(results.results[:limit])} search results to API format")
+        api_results = self._to_api_results(results.results, limit)
         
         logger.info(f"[{trace_id}] Converted to API results: {len(api_results)} items, types: {[type(r).__name__ for r in api_results[:2]]}")
         
@@ -1875,7 +2464,8 @@ class SearchOrchestrator:
                 cache_hit=results.cache_hit,
                 enrichment_triggered=results.enrichment_triggered,
                 external_search_used=results.external_search_used,
-                ingestion_status=results.ingestion_status
+                ingestion_status=results.ingestion_status,
+                partial_results=bool((results.metadata or {}).get("partial_results")),
             )
         except Exception as e:
             logger.error(f"Failed to create SearchResponse: {e}")
@@ -213,7 +213,7 @@ class EnhancedSearchOrchestrator(SearchOrchestrator):
             """
             
             result = await self.db_manager.fetch_one(
-                query, {"technology": intent.technology}
+                query, {"technology": intent.technology}, pool="search"
             )
             
             return result and result.get("count", 0) > 0
@@ -0,0 +1,66 @@
+"""
+Pub/Sub Invalidation Listener
+Long-running Redis channel subscription shared by the in-process caches
+
+Each worker keeps process-local state (search L1 entries, the workspace
+snapshot) that other workers invalidate by publishing on a channel. The
+listener decodes every message and hands it to a callback, resubscribing
+with exponential backoff while Redis is unavailable.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+MAX_BACKOFF = 30.0  # seconds
+
+
+async def listen_channel(
+    cache_manager: Any,
+    channel: str,
+    on_message: Callable[[str], Awaitable[None]],
+    name: str = "Pub/sub",
+    max_backoff: float = MAX_BACKOFF,
+) -> None:
+    """
+    Deliver every message published on a channel until cancelled.
+
+    Args:
+        cache_manager: CacheManager providing subscribe()
+        channel: Channel to subscribe to
+        on_message: Coroutine function called with each decoded payload
+        name: Listener name used in log messages
+        max_backoff: Longest wait between resubscription attempts
+    """
+    backoff = 1.0
+    while True:
+        pubsub = None
+        try:
+            pubsub = await cache_manager.subscribe(channel)
+            if pubsub is None:
+                # Redis unavailable: local TTLs bound staleness until we reconnect
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, max_backoff)
+                continue
+
+            backoff = 1.0
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                data = message.get("data")
+                await on_message(data.decode("utf-8") if isinstance(data, bytes) else str(data))
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"{name} invalidation listener error: {e}")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, max_backoff)
+        finally:
+            if pubsub is not None:
+                try:
+                    await pubsub.close()
+                except Exception:
+                    pass
@@ -0,0 +1,254 @@
+"""
+Query Normalizer
+Validation, cleaning and stemming of search queries on the request path
+
+Patterns are compiled once at import, stems come from a suffix rule table
+with a per-token memo, and whole queries are memoized in a bounded LRU, so a
+repeated query is normalized with a single dictionary lookup. The query
+fingerprint is shared with search cache key generation.
+"""
+
+import hashlib
+import logging
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from fastapi import HTTPException
+
+logger = logging.getLogger(__name__)
+
+
+MIN_QUERY_LENGTH = 2
+MAX_QUERY_LENGTH = 256
+
+_VALID_QUERY_RE = re.compile(r"^[\w\s\-\.,:;!?()'/@#&]+$", re.UNICODE)
+_WHITESPACE_RE = re.compile(r"\s+")
+# Same artifact cleanup as ContentPreprocessor.clean_text
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]")
+_REPEATED_DASHES_RE = re.compile(r"[-_]{3,}")
+_PAGE_NUMBER_RE = re.compile(r"\n?\s*Page \d+\s*\n?", re.IGNORECASE)
+_TOKEN_RE = re.compile(r"\b\w+\b")
+_VOWEL_RE = re.compile(r"[aeiouy]")
+
+# Ordered suffix rules: (suffix, replacement, minimum stem length). The first
+# matching suffix applies; a replacement of None protects the word.
+SUFFIX_RULES: Tuple[Tuple[str, Optional[str], int], ...] = (
+    ("sses", "ss", 2),
+    ("ies", "y", 2),
+    ("ches", "ch", 2),
+    ("shes", "sh", 2),
+    ("xes", "x", 2),
+    ("zes", "z", 2),
+    ("ss", None, 0),
+    ("us", None, 0),
+    ("is", None, 0),
+    ("ment", "", 4),
+    ("ing", "", 3),
+    ("ed", "", 3),
+    ("ly", "", 3),
+    ("s", "", 3),
+)
+
+# Words kept as-is (technology names and irregular forms stemming would mangle)
+STEM_EXCEPTIONS: Dict[str, str] = {
+    "kubernetes": "kubernetes",
+    "postgres": "postgres",
+    "redis": "redis",
+    "pandas": "pandas",
+    "rails": "rails",
+    "jenkins": "jenkins",
+    "express": "express",
+    "aws": "aws",
+    "css": "css",
+    "js": "js",
+    "children": "child",
+    "indices": "index",
+}
+
+_UNDOUBLE_EXEMPT = frozenset("lsz")
+
+
+def query_fingerprint(text: str) -> str:
+    """
+    Stable fingerprint of query text for cache keys.
+
+    Case and whitespace differences map to the same fingerprint.
+    """
+    canonical = " ".join(text.lower().split())
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True)
+class NormalizedText:
+    """Normalized query text and its cache fingerprint"""
+
+    text: str
+    fingerprint: str
+
+
+class QueryNormalizer:
+    """
+    Reusable search query normalizer (PRD-009 input handling).
+
+    Validates raw queries, applies the ContentPreprocessor cleanup, tokenizes
+    and stems. Stemming repeats the suffix rules until the token stops
+    changing, so normalizing already-normalized text is a no-op and the
+    fingerprint of a normalized query is stable.
+    """
+
+    def __init__(self, memo_size: int = 4096, stem_memo_size: int = 8192):
+        """
+        Initialize the normalizer.
+
+        Args:
+            memo_size: Maximum raw queries kept in the LRU memo (0 disables it)
+            stem_memo_size: Maximum tokens kept in the stem LRU memo (0 disables it)
+        """
+        self.memo_size = memo_size
+        self.stem_memo_size = stem_memo_size
+        self._memo: "OrderedDict[str, NormalizedText]" = OrderedDict()
+        self._stems: "OrderedDict[str, str]" = OrderedDict()
+        self.memo_hits = 0
+        self.memo_misses = 0
+
+    def normalize(self, raw_query: str) -> NormalizedText:
+        """
+        Normalize raw query text.
+
+        Args:
+            raw_query: Query text as submitted
+
+        Returns:
+            NormalizedText with the stemmed text and fingerprint
+
+        Raises:
+            HTTPException: 422 if the query is empty, too short/long or
+                contains invalid characters
+        """
+        normalized = self._memo.get(raw_query) if isinstance(raw_query, str) else None
+        if normalized is not None:
+            self._memo.move_to_end(raw_query)
+            self.memo_hits += 1
+            return normalized
+
+        self.memo_misses += 1
+        self.validate(raw_query)
+
+        cleaned = _WHITESPACE_RE.sub(" ", raw_query).strip()
+        cleaned = _CONTROL_CHARS_RE.sub("", cleaned)
+        cleaned = _REPEATED_DASHES_RE.sub("", cleaned)
+        cleaned = _PAGE_NUMBER_RE.sub("", cleaned)
+
+        text = " ".join(self.stem(token) for token in _TOKEN_RE.findall(cleaned.lower()))
+        normalized = NormalizedText(text=text, fingerprint=query_fingerprint(text))
+
+        if self.memo_size > 0:
+            self._memo[raw_query] = normalized
+            if len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        return normalized
+
+    @staticmethod
+    def validate(raw_query: str) -> None:
+        """Reject empty, out-of-bounds or invalid-character queries"""
+        if not isinstance(raw_query, str) or not raw_query.strip():
+            logger.warning("Empty or non-string search query rejected")
+            raise HTTPException(
+                status_code=422, detail="Query must be a non-empty string"
+            )
+        if len(raw_query) < MIN_QUERY_LENGTH or len(raw_query) > MAX_QUERY_LENGTH:
+            logger.warning("Query length out of bounds")
+            raise HTTPException(
+                status_code=422,
+                detail=f"Query length must be between {MIN_QUERY_LENGTH} and {MAX_QUERY_LENGTH} characters",
+            )
+        if not _VALID_QUERY_RE.match(raw_query):
+            logger.warning("Query contains invalid characters")
+            raise HTTPException(
+                status_code=422, detail="Query contains invalid characters"
+            )
+
+    def stem(self, token: str) -> str:
+        """
+        Stem a lowercase token (memoized in a bounded LRU).
+
+        Args:
+            token: Lowercase word token
+
+        Returns:
+            Stem that is its own stem
+        """
+        stem = STEM_EXCEPTIONS.get(token)
+        if stem is not None:
+            return stem
+        stem = self._stems.get(token)
+        if stem is not None:
+            self._stems.move_to_end(token)
+            return stem
+
+        stem = self.stem_uncached(token)
+        if self.stem_memo_size > 0:
+            self._stems[token] = stem
+            if len(self._stems) > self.stem_memo_size:
+                self._stems.popitem(last=False)
+        return stem
+
+    @classmethod
+    def stem_uncached(cls, token: str) -> str:
+        """
+        Stem a lowercase token without touching any memo.
+
+        Args:
+            token: Lowercase word token
+
+        Returns:
+            Stem that is its own stem
+        """
+        stem = STEM_EXCEPTIONS.get(token)
+        if stem is not None:
+            return stem
+        stem = token
+        while True:
+            next_stem = cls._strip_suffix(stem)
+            if next_stem == stem:
+                return stem
+            stem = next_stem
+
+    @staticmethod
+    def _strip_suffix(word: str) -> str:
+        """Apply the first matching suffix rule once"""
+        if word in STEM_EXCEPTIONS or not word.isalpha():
+            return word
+        for suffix, replacement, min_stem in SUFFIX_RULES:
+            if not word.endswith(suffix):
+                continue
+            if replacement is None:
+                return word
+            stem = word[: -len(suffix)]
+            if len(stem) < min_stem or not _VOWEL_RE.search(stem):
+                return word
+            if (
+                replacement == ""
+                and suffix in ("ing", "ed")
+                and len(stem) > 3
+                and stem[-1] == stem[-2]
+                and stem[-1] not in _UNDOUBLE_EXEMPT
+                and not _VOWEL_RE.match(stem[-1])
+            ):
+                # running -> run, mapped -> map
+                stem = stem[:-1]
+            return stem + replacement
+        return word
+
+    def get_stats(self) -> Dict[str, int]:
+        """Memo statistics"""
+        return {
+            "memo_entries": len(self._memo),
+            "memo_size": self.memo_size,
+            "memo_hits": self.memo_hits,
+            "memo_misses": self.memo_misses,
+            "stem_entries": len(self._stems),
+            "stem_memo_size": self.stem_memo_size,
+        }
@@ -12,6 +12,8 @@ from datetime import datetime
 from typing import List, Dict, Any, Optional
 from collections import defaultdict
 
+import numpy as np
+
 from .models import SearchResult, SearchStrategy
 from .exceptions import ResultRankingError
 
@@ -26,6 +28,25 @@ class ResultRanker:
     relevance scoring, recency weighting, quality boosting, and deduplication.
     """
 
+    # Column order of the feature matrix and weight vector
+    FEATURE_ORDER = (
+        "vector_similarity",
+        "metadata_relevance",
+        "recency",
+        "quality_score",
+        "technology_match",
+    )
+
+    _STRATEGY_ADJUSTMENTS = {
+        SearchStrategy.VECTOR: 1.0,  # No adjustment for pure vector search
+        SearchStrategy.METADATA: 0.95,  # Slight penalty for metadata-only search
+        SearchStrategy.HYBRID: 1.05,  # Slight boost for hybrid search
+        SearchStrategy.FACETED: 1.02,  # Small boost for faceted search
+    }
+
+    # Recency decay constant for a 6-month half-life
+    _RECENCY_DECAY = math.log(2) / 180
+
     def __init__(self):
         """Initialize result ranker with scoring weights."""
         # Scoring weights for different factors (must sum to 1.0)
@@ -45,6 +66,7 @@ class ResultRanker:
         strategy_used: SearchStrategy,
         query: str,
         technology_hint: Optional[str] = None,
+        top_k: Optional[int] = None,
     ) -> List[SearchResult]:
         """
         Rank search results using multi-factor scoring.
@@ -56,11 +78,16 @@ class ResultRanker:
         - Quality score integration
         - Technology matching boost
 
+        The whole candidate set is scored in one pass: each factor is built as
+        a NumPy column, combined with the scoring weights as a matrix-vector
+        product, and the top results are selected with argpartition.
+
         Args:
             results: List of search results to rank
             strategy_used: Search strategy that was executed
             query: Original search query for relevance calculation
             technology_hint: Technology filter hint for boosting
+            top_k: Only return the k best results (all results if None)
 
         Returns:
             List of SearchResult objects sorted by final score
@@ -77,30 +104,26 @@ class ResultRanker:
                 logger.info("No results to rank")
                 return []
 
-            # Step 1: Calculate multi-factor scores for each result
-            scored_results = []
-            for result in results:
-                try:
-                    final_score = await self._calculate_final_score(
-                        result, query, technology_hint, strategy_used
-                    )
+            try:
+                # Step 1: Calculate multi-factor scores for all results at once
+                features = self._build_feature_matrix(results, query, technology_hint)
+                scores = self.score_features(features, strategy_used)
+            except Exception as e:
+                logger.warning(f"Batch scoring failed, scoring results individually: {e}")
+                return await self._rank_results_individually(
+                    results, strategy_used, query, technology_hint, top_k
+                )
 
-                    # Update result with final score
-                    result.relevance_score = final_score
-                    scored_results.append(result)
-
-                except Exception as e:
-                    logger.warning(f"Failed to score result {result.content_id}: {e}")
-                    # Keep result with original score as fallback
-                    scored_results.append(result)
-
-            # Step 2: Sort by final relevance score (descending)
-            ranked_results = sorted(
-                scored_results, key=lambda r: r.relevance_score, reverse=True
-            )
+            # Step 2: Select and sort the top results by final score (descending)
+            order = self._top_k_order(scores, top_k)
 
             # Step 3: Apply position-based adjustments
-            final_results = self._apply_position_adjustments(ranked_results)
+            final_scores = scores[order] * self._position_decay(len(order))
+            final_results = []
+            for index, score in zip(order.tolist(), final_scores.tolist()):
+                result = results[index]
+                result.relevance_score = score
+                final_results.append(result)
 
             logger.info(
                 f"Ranking completed: top score = {final_results[0].relevance_score:.3f}"
@@ -117,6 +140,209 @@ class ResultRanker:
                 error_context={"error": str(e)},
             )
 
+    async def _rank_results_individually(
+        self,
+        results: List[SearchResult],
+        strategy_used: SearchStrategy,
+        query: str,
+        technology_hint: Optional[str],
+        top_k: Optional[int] = None,
+    ) -> List[SearchResult]:
+        """Score results one at a time (fallback when batch scoring fails)"""
+        scored_results = []
+        for result in results:
+            try:
+                final_score = await self._calculate_final_score(
+                    result, query, technology_hint, strategy_used
+                )
+
+                # Update result with final score
+                result.relevance_score = final_score
+                scored_results.append(result)
+
+            except Exception as e:
+                logger.warning(f"Failed to score result {result.content_id}: {e}")
+                # Keep result with original score as fallback
+                scored_results.append(result)
+
+        ranked_results = sorted(
+            scored_results, key=lambda r: r.relevance_score, reverse=True
+        )
+        if top_k is not None:
+            ranked_results = ranked_results[:top_k]
+
+        return self._apply_position_adjustments(ranked_results)
+
+    def _build_feature_matrix(
+        self,
+        results: List[SearchResult],
+        query: str,
+        technology_hint: Optional[str],
+    ) -> np.ndarray:
+        """
+        Build the (n_results, n_factors) feature matrix.
+
+        Columns follow FEATURE_ORDER and reproduce the per-result scoring
+        helpers exactly.
+
+        Args:
+            results: Search results to score
+            query: Search query
+            technology_hint: Technology filter hint
+
+        Returns:
+            Float matrix of factor scores in [0, 1]
+        """
+        n = len(results)
+        query_lower = query.lower()
+        # np.char operations loop per element; lowering each string once in
+        # Python and testing membership is cheaper
+        titles_lower = [r.title.lower() for r in results]
+        snippets_lower = [r.content_snippet.lower() for r in results]
+        query_words = set(query_lower.split())
+
+        vector = np.fromiter((r.relevance_score for r in results), dtype=float, count=n)
+        quality = np.fromiter(
+            (r.quality_score or 0.5 for r in results), dtype=float, count=n
+        )
+
+        # Lexical overlap: title (0.5) + snippet (0.3) + any query word in URL (0.2)
+        in_title = np.fromiter((query_lower in t for t in titles_lower), dtype=bool, count=n)
+        in_snippet = np.fromiter((query_lower in s for s in snippets_lower), dtype=bool, count=n)
+        in_url = np.fromiter(
+            (
+                any(word in url for word in query_words)
+                for url in (r.source_url.lower() for r in results)
+            ),
+            dtype=bool,
+            count=n,
+        )
+        metadata_relevance = np.minimum(
+            1.0, 0.5 * in_title + 0.3 * in_snippet + 0.2 * in_url
+        )
+
+        # Recency: exponential decay of content age (0.5 when unknown)
+        age_days = self._age_days(results)
+        recency = np.where(
+            np.isnan(age_days),
+            0.5,
+            np.minimum(1.0, np.exp(-np.nan_to_num(age_days) * self._RECENCY_DECAY)),
+        )
+
+        technology = self._technology_column(
+            results, technology_hint, titles_lower, snippets_lower
+        )
+
+        columns = {
+            "vector_similarity": vector,
+            "metadata_relevance": metadata_relevance,
+            "recency": recency,
+            "quality_score": quality,
+            "technology_match": technology,
+        }
+        return np.column_stack([columns[name] for name in self.FEATURE_ORDER])
+
+    def score_features(
+        self, features: np.ndarray, strategy: SearchStrategy
+    ) -> np.ndarray:
+        """
+        Combine a feature matrix into final scores.
+
+        Args:
+            features: Matrix with columns in FEATURE_ORDER
+            strategy: Search strategy used
+
+        Returns:
+            Final scores clipped to [0, 1]
+        """
+        scores = features @ self.weight_vector
+        scores *= self._STRATEGY_ADJUSTMENTS.get(strategy, 1.0)
+        return np.clip(scores, 0.0, 1.0)
+
+    @property
+    def weight_vector(self) -> np.ndarray:
+        """Scoring weights as a vector aligned with FEATURE_ORDER"""
+        return np.array([self.scoring_weights[name] for name in self.FEATURE_ORDER])
+
+    @staticmethod
+    def _top_k_order(scores: np.ndarray, top_k: Optional[int]) -> np.ndarray:
+        """
+        Indices of the top_k scores in descending order.
+
+        Ties keep input order, matching a stable sort.
+        """
+        n = len(scores)
+        if top_k is not None and 0 < top_k < n:
+            candidates = np.sort(np.argpartition(-scores, top_k - 1)[:top_k])
+            return candidates[np.argsort(-scores[candidates], kind="stable")]
+        if top_k is not None and top_k <= 0:
+            return np.empty(0, dtype=int)
+        return np.argsort(-scores, kind="stable")
+
+    @staticmethod
+    def _position_decay(count: int) -> np.ndarray:
+        """Small per-position decay applied after sorting"""
+        return 1.0 - np.arange(count) * 0.001
+
+    def _age_days(self, results: List[SearchResult]) -> np.ndarray:
+        """
+        Content age in whole days per result (NaN when unknown or invalid).
+
+        Chunks of the same document share timestamps, so each distinct
+        timestamp is parsed once per batch.
+        """
+        now = datetime.utcnow()
+        parsed: Dict[Any, float] = {}
+        ages = np.full(len(results), np.nan)
+
+        for i, result in enumerate(results):
+            if not result.metadata:
+                continue
+            date_value = result.metadata.get("updated_at") or result.metadata.get("created_at")
+            if not date_value:
+                continue
+            try:
+                if date_value not in parsed:
+                    if isinstance(date_value, str):
+                        content_date = datetime.fromisoformat(date_value.replace("Z", "+00:00"))
+                    else:
+                        content_date = date_value
+                    parsed[date_value] = float((now - content_date.replace(tzinfo=None)).days)
+                ages[i] = parsed[date_value]
+            except (ValueError, TypeError, AttributeError):
+                continue
+
+        return ages
+
+    def _technology_column(
+        self,
+        results: List[SearchResult],
+        technology_hint: Optional[str],
+        titles_lower: List[str],
+        snippets_lower: List[str],
+    ) -> np.ndarray:
+        """Technology match scores (see _calculate_technology_score)"""
+        n = len(results)
+        if not technology_hint:
+            return np.full(n, 0.5)
+
+        hint = technology_hint.lower()
+        direct = np.fromiter(
+            ((r.technology or "").lower() == hint for r in results), dtype=bool, count=n
+        )
+        in_title = np.fromiter((hint in t for t in titles_lower), dtype=bool, count=n)
+        in_snippet = np.fromiter((hint in s for s in snippets_lower), dtype=bool, count=n)
+
+        # Stringifying metadata is expensive; only do it for unmatched rows
+        in_metadata = np.zeros(n, dtype=bool)
+        for i in np.flatnonzero(~(direct | in_title | in_snippet)).tolist():
+            metadata = results[i].metadata
+            in_metadata[i] = bool(metadata) and hint in str(metadata).lower()
+
+        return np.select(
+            [direct, in_title, in_snippet, in_metadata], [1.0, 0.8, 0.6, 0.4], default=0.1
+        )
+
     async def _calculate_final_score(
         self,
         result: SearchResult,
@@ -292,14 +518,7 @@ class ResultRanker:
         Returns:
             Adjusted score
         """
-        adjustments = {
-            SearchStrategy.VECTOR: 1.0,  # No adjustment for pure vector search
-            SearchStrategy.METADATA: 0.95,  # Slight penalty for metadata-only search
-            SearchStrategy.HYBRID: 1.05,  # Slight boost for hybrid search
-            SearchStrategy.FACETED: 1.02,  # Small boost for faceted search
-        }
-
-        adjustment_factor = adjustments.get(strategy, 1.0)
+        adjustment_factor = self._STRATEGY_ADJUSTMENTS.get(strategy, 1.0)
         return score * adjustment_factor
 
     def _apply_position_adjustments(
@@ -0,0 +1,161 @@
+"""
+Semantic Query Index
+In-process nearest-neighbour index over the embeddings of cached queries
+
+Near-duplicate phrasings ("react useEffect cleanup" / "cleanup in react
+useeffect") hash to different exact cache keys. The index keeps the query
+embedding of recently cached results in a flat, L2-normalized NumPy matrix
+so a miss can be answered by the most similar cached query with the same
+scope (strategy, page, technology hint, workspaces and filters). At the
+configured entry limit a flat scan is a single matrix-vector product, so no
+approximate index is needed.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticQueryIndex:
+    """
+    Bounded cosine-similarity index from query embeddings to cache keys.
+
+    Rows are reused in least-recently-added order once max_entries is
+    reached. Each row carries a scope id; lookups only consider rows whose
+    scope matches the query exactly. A scope id is dropped with its last row.
+    """
+
+    def __init__(self, max_entries: int = 2048, threshold: float = 0.92):
+        """
+        Initialize the index.
+
+        Args:
+            max_entries: Maximum cached queries indexed
+            threshold: Minimum cosine similarity for a match
+        """
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self._vectors: Optional[np.ndarray] = None
+        self._scope_ids = np.full(max_entries, -1, dtype=np.int64)
+        self._row_keys: List[Optional[str]] = [None] * max_entries
+        self._rows: "OrderedDict[str, int]" = OrderedDict()
+        self._free_rows = list(range(max_entries - 1, -1, -1))
+        self._scopes: Dict[str, int] = {}
+        self._scope_names: Dict[int, str] = {}
+        self._scope_rows: Dict[int, int] = {}
+        self._next_scope_id = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, cache_key: str, vector: Sequence[float], scope: str) -> None:
+        """
+        Index a cached query.
+
+        Args:
+            cache_key: Exact cache key of the stored results
+            vector: Query embedding
+            scope: Non-text cache key components the match must share
+        """
+        normalized = self._normalize(vector)
+        if normalized is None:
+            return
+        if self._vectors is None or self._vectors.shape[1] != normalized.shape[0]:
+            # First entry, or the embedding model changed dimension
+            self.clear()
+            self._vectors = np.zeros((self.max_entries, normalized.shape[0]), dtype=np.float32)
+
+        row = self._rows.pop(cache_key, None)
+        if row is None:
+            if self._free_rows:
+                row = self._free_rows.pop()
+            else:
+                evicted_key, row = self._rows.popitem(last=False)
+                logger.debug(f"Semantic index evicted {evicted_key}")
+        self._release_scope(row)
+
+        scope_id = self._scopes.get(scope)
+        if scope_id is None:
+            scope_id = self._next_scope_id
+            self._next_scope_id += 1
+            self._scopes[scope] = scope_id
+            self._scope_names[scope_id] = scope
+        self._scope_rows[scope_id] = self._scope_rows.get(scope_id, 0) + 1
+
+        self._vectors[row] = normalized
+        self._scope_ids[row] = scope_id
+        self._row_keys[row] = cache_key
+        self._rows[cache_key] = row
+
+    def search(self, vector: Sequence[float], scope: str) -> Optional[Tuple[str, float]]:
+        """
+        Find the most similar indexed query within a scope.
+
+        Args:
+            vector: Query embedding
+            scope: Scope the match must share
+
+        Returns:
+            (cache_key, similarity) of the best match above the threshold, or None
+        """
+        scope_id = self._scopes.get(scope)
+        if scope_id is None or self._vectors is None:
+            return None
+        normalized = self._normalize(vector)
+        if normalized is None or normalized.shape[0] != self._vectors.shape[1]:
+            return None
+
+        candidates = np.flatnonzero(self._scope_ids == scope_id)
+        if candidates.size == 0:
+            return None
+        similarities = self._vectors[candidates] @ normalized
+        best = int(np.argmax(similarities))
+        similarity = float(similarities[best])
+        if similarity < self.threshold:
+            return None
+        return self._row_keys[candidates[best]], similarity
+
+    def remove(self, cache_key: str) -> None:
+        """Drop a cache key from the index"""
+        row = self._rows.pop(cache_key, None)
+        if row is None:
+            return
+        self._release_scope(row)
+        self._row_keys[row] = None
+        self._free_rows.append(row)
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        self._scope_ids.fill(-1)
+        self._row_keys = [None] * self.max_entries
+        self._rows.clear()
+        self._free_rows = list(range(self.max_entries - 1, -1, -1))
+        self._scopes.clear()
+        self._scope_names.clear()
+        self._scope_rows.clear()
+
+    def _release_scope(self, row: int) -> None:
+        """Detach a row from its scope, dropping the scope with its last row"""
+        scope_id = int(self._scope_ids[row])
+        if scope_id < 0:
+            return
+        self._scope_ids[row] = -1
+        remaining = self._scope_rows[scope_id] - 1
+        if remaining:
+            self._scope_rows[scope_id] = remaining
+        else:
+            del self._scope_rows[scope_id]
+            del self._scopes[self._scope_names.pop(scope_id)]
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> Optional[np.ndarray]:
+        """L2-normalize an embedding (None for empty or zero vectors)"""
+        array = np.asarray(vector, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(array)) if array.size else 0.0
+        if norm == 0.0:
+            return None
+        return array / norm
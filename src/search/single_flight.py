@@ -0,0 +1,132 @@
+"""
+Single-Flight Request Coalescing
+Ensures identical concurrent searches execute the search pipeline once
+
+Callers sharing a key within a process await the same task. With a cache
+manager configured, workers also take a short-lived Redis lock per key:
+workers that lose the race poll the result cache instead of running the
+pipeline themselves, and fall back to executing it if the lock holder
+disappears or the wait times out.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent executions of the same keyed coroutine.
+
+    The shared work runs in its own task, so a cancelled caller (e.g. a
+    disconnected client) does not cancel the work for the other waiters.
+    """
+
+    LOCK_KEY_PREFIX = "search:lock:"
+
+    def __init__(
+        self,
+        cache_manager: Optional[Any] = None,
+        lock_ttl_seconds: int = 35,
+        lock_wait_timeout_seconds: float = 30.0,
+        lock_poll_interval_ms: int = 100,
+    ):
+        """
+        Initialize single-flight coordinator.
+
+        Args:
+            cache_manager: CacheManager for cross-worker locking (in-process only if None)
+            lock_ttl_seconds: Redis lock TTL (should exceed the pipeline timeout)
+            lock_wait_timeout_seconds: Maximum time to wait on another worker's result
+            lock_poll_interval_ms: Interval between result/lock checks while waiting
+        """
+        self.cache_manager = cache_manager
+        self.lock_ttl_seconds = lock_ttl_seconds
+        self.lock_wait_timeout_seconds = lock_wait_timeout_seconds
+        self.lock_poll_interval = lock_poll_interval_ms / 1000.0
+
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._stats = {
+            "executions": 0,
+            "coalesced_local": 0,
+            "coalesced_remote": 0,
+            "lock_wait_timeouts": 0,
+        }
+
+    async def do(
+        self,
+        key: str,
+        func: Callable[[], Awaitable[Any]],
+        wait_for_result: Optional[Callable[[], Awaitable[Optional[Any]]]] = None,
+    ) -> Tuple[Any, bool]:
+        """
+        Run func once per key across concurrent callers.
+
+        Args:
+            key: Coalescing key
+            func: Coroutine function producing the result
+            wait_for_result: Coroutine function returning another worker's
+                published result, or None if not yet available
+
+        Returns:
+            Tuple of (result, shared) where shared is True if the result was
+            produced for another caller and must be treated as read-only
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            self._stats["coalesced_local"] += 1
+            return await asyncio.shield(task), True
+
+        task = asyncio.ensure_future(self._run(key, func, wait_for_result))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task), False
+
+    async def _run(
+        self,
+        key: str,
+        func: Callable[[], Awaitable[Any]],
+        wait_for_result: Optional[Callable[[], Awaitable[Optional[Any]]]],
+    ) -> Any:
+        if self.cache_manager is None or wait_for_result is None:
+            self._stats["executions"] += 1
+            return await func()
+
+        lock_key = f"{self.LOCK_KEY_PREFIX}{key}"
+        deadline = time.monotonic() + self.lock_wait_timeout_seconds
+        while True:
+            token = await self.cache_manager.acquire_lock(lock_key, self.lock_ttl_seconds)
+            if token is not None:
+                try:
+                    self._stats["executions"] += 1
+                    return await func()
+                finally:
+                    await self.cache_manager.release_lock(lock_key, token)
+
+            # Another worker holds the lock; use its result once published
+            try:
+                result = await wait_for_result()
+            except Exception as e:
+                logger.warning(f"Single-flight result check failed for {key}: {e}")
+                result = None
+            if result is not None:
+                self._stats["coalesced_remote"] += 1
+                return result
+
+            if time.monotonic() >= deadline:
+                logger.warning(
+                    f"Single-flight wait timed out after {self.lock_wait_timeout_seconds}s "
+                    f"for {key}; executing locally"
+                )
+                self._stats["lock_wait_timeouts"] += 1
+                self._stats["executions"] += 1
+                return await func()
+
+            await asyncio.sleep(self.lock_poll_interval)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing counters"""
+        return {**self._stats, "inflight": len(self._inflight)}
@@ -7,18 +7,103 @@ workspace selection and parallel search execution.
 """
 
 import asyncio
+import heapq
 import logging
+import time
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Set
+from typing import List, Optional, Dict, Any, Set, AsyncIterator, Tuple
 
-from .models import WorkspaceInfo, SearchResult
+from .models import WorkspaceInfo, SearchResult, SearchStrategy, SearchProgress
 from .exceptions import WorkspaceSelectionError, VectorSearchError, SearchTimeoutError
+from .workspace_catalog import DEFAULT_TECHNOLOGY_PATTERNS, TechnologyMatcher, WorkspaceCatalog
+from src.core.config.models import HybridSearchConfig
 from src.database.connection import DatabaseManager
 from src.clients.weaviate_client import WeaviateVectorClient
 
 logger = logging.getLogger(__name__)
 
 
+class IncrementalTopK:
+    """
+    Running deduplicated top-k over workspace result lists as they arrive.
+
+    Scores match execute_parallel_search: reciprocal-rank fusion in hybrid
+    mode (first occurrence kept otherwise) plus the workspace relevance
+    boost. Scores only accumulate, so each arrival re-selects the top k with
+    a heap in O(n log k) instead of re-sorting every candidate.
+    """
+
+    def __init__(
+        self,
+        k: int,
+        workspaces: List[WorkspaceInfo],
+        rrf_k: Optional[int] = None,
+    ):
+        """
+        Initialize the aggregator.
+
+        Args:
+            k: Number of results to keep
+            workspaces: Searched workspaces (for the relevance boost)
+            rrf_k: Reciprocal-rank fusion constant (plain deduplication if None)
+        """
+        self.k = k
+        self.rrf_k = rrf_k
+        self._workspace_boost = {ws.slug: ws.relevance_score * 0.2 for ws in workspaces}
+        self._base_scores: Dict[str, float] = {}
+        self._results: Dict[str, SearchResult] = {}
+        self._top_ids: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def add(self, results: List[SearchResult]) -> bool:
+        """
+        Merge one workspace's results (ordered best first).
+
+        Returns:
+            True if the membership of the top k changed
+        """
+        for rank, result in enumerate(results, start=1):
+            content_hash = result.content_id
+            if self.rrf_k is not None:
+                self._base_scores[content_hash] = (
+                    self._base_scores.get(content_hash, 0.0) + 1.0 / (self.rrf_k + rank)
+                )
+            elif content_hash not in self._base_scores:
+                self._base_scores[content_hash] = result.relevance_score
+            self._results.setdefault(content_hash, result)
+
+        previous = set(self._top_ids)
+        self._top_ids = heapq.nlargest(self.k, self._base_scores, key=self._rank_key)
+        return set(self._top_ids) != previous
+
+    def top(self) -> List[SearchResult]:
+        """Copies of the current top results with final relevance scores"""
+        top_results = []
+        for content_hash in self._top_ids:
+            result = self._results[content_hash]
+            update: Dict[str, Any] = {"relevance_score": self._score(content_hash)}
+            if self.rrf_k is not None:
+                update["metadata"] = {**result.metadata, "rrf_score": self._base_scores[content_hash]}
+            top_results.append(result.model_copy(update=update))
+        return top_results
+
+    def _rank_key(self, content_hash: str):
+        """Final score; fused ties (capped at 1.0) fall back to the RRF order"""
+        if self.rrf_k is not None:
+            return self._score(content_hash), self._base_scores[content_hash]
+        return self._score(content_hash)
+
+    def _score(self, content_hash: str) -> float:
+        """Fused/deduplicated score plus workspace boost"""
+        score = self._base_scores[content_hash]
+        if self.rrf_k is not None:
+            score = min(1.0, score * (self.rrf_k + 1))
+        boost = self._workspace_boost.get(self._results[content_hash].workspace_slug, 0.1 * 0.2)
+        return min(1.0, score + boost)
+
+
 class WorkspaceSearchStrategy:
     """
     Intelligent workspace selection and parallel search execution.
@@ -28,7 +113,11 @@ class WorkspaceSearchStrategy:
     """
 
     def __init__(
-        self, db_manager: DatabaseManager, weaviate_client: WeaviateVectorClient
+        self,
+        db_manager: DatabaseManager,
+        weaviate_client: WeaviateVectorClient,
+        hybrid_config: Optional[HybridSearchConfig] = None,
+        workspace_catalog: Optional[WorkspaceCatalog] = None,
     ):
         """
         Initialize workspace search strategy.
@@ -36,45 +125,24 @@ class WorkspaceSearchStrategy:
         Args:
             db_manager: Database manager for workspace metadata queries
             weaviate_client: Weaviate client for vector search operations
+            hybrid_config: Hybrid BM25 + vector retrieval settings (defaults if None)
+            workspace_catalog: Shared workspace catalog (a private one if None)
         """
         self.db_manager = db_manager
         self.weaviate_client = weaviate_client
+        self.hybrid_config = (
+            hybrid_config if isinstance(hybrid_config, HybridSearchConfig) else HybridSearchConfig()
+        )
 
-        # Technology keyword patterns for workspace matching
+        # Technology keyword patterns for workspace matching, compiled once
         self.technology_patterns = {
-            "python": [
-                "python",
-                "django",
-                "flask",
-                "fastapi",
-                "pandas",
-                "numpy",
-                "pytorch",
-                "tensorflow",
-            ],
-            "javascript": [
-                "javascript",
-                "js",
-                "node",
-                "react",
-                "vue",
-                "angular",
-                "express",
-                "next",
-            ],
-            "typescript": ["typescript", "ts", "angular", "react", "vue", "nest"],
-            "java": ["java", "spring", "maven", "gradle", "junit", "hibernate"],
-            "csharp": ["c#", "csharp", "dotnet", ".net", "asp.net", "entity"],
-            "go": ["go", "golang", "gin", "gorilla", "echo"],
-            "rust": ["rust", "cargo", "tokio", "serde"],
-            "php": ["php", "laravel", "symfony", "composer"],
-            "ruby": ["ruby", "rails", "gem", "bundler"],
-            "docker": ["docker", "container", "dockerfile", "compose"],
-            "kubernetes": ["kubernetes", "k8s", "kubectl", "helm"],
-            "aws": ["aws", "amazon", "ec2", "s3", "lambda", "cloudformation"],
-            "azure": ["azure", "microsoft", "resource group", "app service"],
-            "gcp": ["gcp", "google cloud", "compute engine", "cloud functions"],
+            technology: list(keywords)
+            for technology, keywords in DEFAULT_TECHNOLOGY_PATTERNS.items()
         }
+        self.technology_matcher = TechnologyMatcher(self.technology_patterns)
+
+        # Cached tenants with technology/document metadata
+        self.workspace_catalog = workspace_catalog or WorkspaceCatalog(db_manager, weaviate_client)
 
         logger.info("WorkspaceSearchStrategy initialized")
 
@@ -106,66 +174,49 @@ class WorkspaceSearchStrategy:
         try:
             logger.info(f"Identifying relevant workspaces for query: {query[:100]}...")
 
-            # Step 1: Get all available workspaces from database
-            available_workspaces = await self._get_available_workspaces()
-            logger.info(f"Found {len(available_workspaces)} available workspaces")
+            # Step 1: Extract technology keywords from query (single regex pass)
+            detected_technologies = self._extract_technology_keywords(query)
+            logger.info(f"Detected technologies in query: {detected_technologies}")
+            hint = technology_hint.lower() if technology_hint else None
+            if hint:
+                logger.info(f"Applying technology hint: {technology_hint}")
+
+            # Step 2: Look up matching workspaces in the catalog's technology index
+            available_workspaces = await self._get_candidate_workspaces(
+                detected_technologies | ({hint} if hint else set()), limit=5
+            )
+            logger.info(f"Found {len(available_workspaces)} candidate workspaces")
 
             if not available_workspaces:
                 logger.warning("No workspaces available in database")
                 return []
 
-            # Step 2: Calculate relevance scores for each workspace
-            workspace_scores = {}
-
-            # Step 3: Apply technology hint priority
-            if technology_hint:
-                logger.info(f"Applying technology hint: {technology_hint}")
-                for workspace in available_workspaces:
-                    if workspace["technology"].lower() == technology_hint.lower():
-                        workspace_scores[workspace["slug"]] = (
-                            workspace_scores.get(workspace["slug"], 0.0) + 0.5
-                        )
-
-            # Step 4: Extract technology keywords from query
-            detected_technologies = self._extract_technology_keywords(query)
-            logger.info(f"Detected technologies in query: {detected_technologies}")
-
-            # Step 5: Score workspaces based on detected technologies
+            # Step 3: Score candidates by technology hint and query technologies
+            scores = []
             for workspace in available_workspaces:
-                workspace_tech = workspace["technology"].lower()
-                base_score = workspace_scores.get(workspace["slug"], 0.0)
-
-                # Direct technology match
+                workspace_tech = (workspace["technology"] or "").lower()
+                score = 0.0
+                if hint and workspace_tech == hint:
+                    score += 0.5
                 if workspace_tech in detected_technologies:
-                    workspace_scores[workspace["slug"]] = base_score + 0.8
-
-                # Related technology match
-                for tech, keywords in self.technology_patterns.items():
-                    if workspace_tech == tech:
-                        for keyword in keywords:
-                            if keyword.lower() in query.lower():
-                                workspace_scores[workspace["slug"]] = base_score + 0.3
-                                break
-
+                    score += 0.3
                 # Default score for all workspaces
-                if workspace["slug"] not in workspace_scores:
-                    workspace_scores[workspace["slug"]] = 0.1
-
-            # Step 6: Create WorkspaceInfo objects with scores
-            workspace_infos = []
-            for workspace in available_workspaces:
-                workspace_info = WorkspaceInfo(
-                    slug=workspace["slug"],
-                    technology=workspace["technology"],
-                    relevance_score=workspace_scores.get(workspace["slug"], 0.1),
-                    last_updated=workspace.get("last_updated", datetime.utcnow()),
-                    document_count=workspace.get("document_count", 0),
+                scores.append(score or 0.1)
+
+            # Step 4: Keep the top 5 (ties in catalog order) as WorkspaceInfo objects
+            top_indices = heapq.nlargest(5, range(len(available_workspaces)), key=scores.__getitem__)
+            top_workspaces = []
+            for index in top_indices:
+                workspace = available_workspaces[index]
+                top_workspaces.append(
+                    WorkspaceInfo(
+                        slug=workspace["slug"],
+                        technology=workspace["technology"],
+                        relevance_score=scores[index],
+                        last_updated=workspace.get("last_updated") or datetime.utcnow(),
+                        document_count=workspace.get("document_count") or 0,
+                    )
                 )
-                workspace_infos.append(workspace_info)
-
-            # Step 7: Sort by relevance score and limit to max 5
-            workspace_infos.sort(key=lambda w: w.relevance_score, reverse=True)
-            top_workspaces = workspace_infos[:5]
 
             logger.info(f"Selected {len(top_workspaces)} workspaces for search")
             for ws in top_workspaces:
@@ -185,7 +236,10 @@ class WorkspaceSearchStrategy:
             )
 
     async def execute_parallel_search(
-        self, query: str, workspaces: List[WorkspaceInfo]
+        self,
+        query: str,
+        workspaces: List[WorkspaceInfo],
+        strategy: Optional[SearchStrategy] = None,
     ) -> List[SearchResult]:
         """
         Execute search across multiple workspaces in parallel.
@@ -195,13 +249,15 @@ class WorkspaceSearchStrategy:
         2. Apply per-workspace timeout (2 seconds each)
         3. Collect results as they complete
         4. Handle individual workspace failures gracefully
-        5. Aggregate and deduplicate results by content hash
+        5. Aggregate and deduplicate results by content hash (reciprocal-rank
+           fusion of the per-workspace rankings in hybrid mode)
         6. Apply technology-based ranking boost
         7. Return top 20 results across all workspaces
 
         Args:
             query: Search query string
             workspaces: List of workspaces to search
+            strategy: Search strategy selecting the hybrid alpha (vector-only if None)
 
         Returns:
             List of SearchResult objects
@@ -218,23 +274,32 @@ class WorkspaceSearchStrategy:
                 logger.warning("No workspaces provided for search")
                 return []
 
-            # Step 1: Create search tasks with timeout (max 5 simultaneous)
-            semaphore = asyncio.Semaphore(5)
-            search_tasks = []
+            alpha = self._resolve_alpha(strategy)
 
-            for workspace in workspaces:
-                task = self._search_single_workspace(
-                    query, workspace, semaphore, timeout_seconds=2.0
+            if self._supports_batched_search():
+                # Step 1-2: Single batched search (query embedded once)
+                search_results = await self._search_workspaces_batched(
+                    query, workspaces, timeout_seconds=2.0, alpha=alpha
                 )
-                search_tasks.append(task)
+            else:
+                # Step 1: Create search tasks with timeout (max 5 simultaneous)
+                semaphore = asyncio.Semaphore(5)
+                search_tasks = []
+
+                for workspace in workspaces:
+                    task = self._search_single_workspace(
+                        query, workspace, semaphore, timeout_seconds=2.0, alpha=alpha
+                    )
+                    search_tasks.append(task)
 
-            # Step 2: Execute searches and collect results
-            logger.info(f"Launching concurrent workspace searches for {len(search_tasks)} workspaces...")
-            search_results = await asyncio.gather(*search_tasks, return_exceptions=True)
+                # Step 2: Execute searches and collect results
+                logger.info(f"Launching concurrent workspace searches for {len(search_tasks)} workspaces...")
+                search_results = await asyncio.gather(*search_tasks, return_exceptions=True)
             logger.info(f"Gathered {len(search_results)} search results")
 
             # Step 3: Process results and handle failures gracefully
             all_results = []
+            ranked_lists = []
             successful_searches = 0
             failed_searches = 0
 
@@ -252,6 +317,7 @@ class WorkspaceSearchStrategy:
                         f"Search completed for workspace {workspace_slug}: {len(result)} results"
                     )
                     all_results.extend(result)
+                    ranked_lists.append(result)
                     successful_searches += 1
                 else:
                     logger.warning(
@@ -272,7 +338,10 @@ class WorkspaceSearchStrategy:
             )
 
             # Step 5: Aggregate and deduplicate results by content hash
-            deduplicated_results = self._deduplicate_results(all_results)
+            if alpha is not None:
+                deduplicated_results = self._fuse_ranked_lists(ranked_lists)
+            else:
+                deduplicated_results = self._deduplicate_results(all_results)
             logger.info(
                 f"Deduplicated {len(all_results)} results to {len(deduplicated_results)}"
             )
@@ -299,12 +368,284 @@ class WorkspaceSearchStrategy:
                 error_context={"error": str(e), "workspace_count": len(workspaces)},
             )
 
+    async def stream_parallel_search(
+        self,
+        query: str,
+        workspaces: List[WorkspaceInfo],
+        strategy: Optional[SearchStrategy] = None,
+        top_k: int = 20,
+        latency_budget_ms: Optional[int] = None,
+        min_results: Optional[int] = None,
+        timeout_seconds: float = 2.0,
+    ) -> AsyncIterator[SearchProgress]:
+        """
+        Search workspaces in parallel, yielding progress as each one completes.
+
+        Results are merged into an incremental top-k as workspaces answer, so
+        one slow tenant does not hold back the others. With a latency budget
+        the search ends early once the budget has elapsed and at least
+        min_results candidates are ranked; workspaces still running are
+        cancelled. Without one it ends when every workspace has answered or
+        timed out.
+
+        Args:
+            query: Search query string
+            workspaces: List of workspaces to search
+            strategy: Search strategy selecting the hybrid alpha (vector-only if None)
+            top_k: Number of results kept in each snapshot
+            latency_budget_ms: Return early after this many ms (wait for all if None)
+            min_results: Candidates required before returning early (defaults to top_k)
+            timeout_seconds: Per-search timeout for each workspace
+
+        Yields:
+            SearchProgress snapshots; the last one has final=True
+
+        Raises:
+            VectorSearchError: If all workspace searches fail
+        """
+        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        deadline = (
+            loop.time() + latency_budget_ms / 1000.0 if latency_budget_ms is not None else None
+        )
+        min_results = top_k if min_results is None else min(min_results, top_k)
+
+        alpha = self._resolve_alpha(strategy)
+        aggregator = IncrementalTopK(
+            top_k, workspaces, self.hybrid_config.rrf_k if alpha is not None else None
+        )
+        completed: List[str] = []
+        failed: List[str] = []
+        pending = {workspace.slug: workspace for workspace in workspaces}
+
+        def snapshot(top_k_changed: bool, final: bool = False, budget_met: bool = False):
+            return SearchProgress(
+                results=aggregator.top(),
+                completed_workspaces=list(completed),
+                failed_workspaces=list(failed),
+                pending_workspaces=list(pending),
+                candidate_count=len(aggregator),
+                elapsed_ms=int((time.time() - start_time) * 1000),
+                top_k_changed=top_k_changed,
+                final=final,
+                budget_met=budget_met,
+            )
+
+        arrivals = self._iter_workspace_results(query, workspaces, alpha, timeout_seconds)
+        next_arrival: Optional[asyncio.Future] = None
+        top_k_changed = False
+        try:
+            while pending:
+                if next_arrival is None:
+                    next_arrival = asyncio.ensure_future(arrivals.__anext__())
+
+                # Until min_results candidates are ranked, always wait for the next
+                # workspace; after that, wait no longer than the latency budget
+                wait_timeout = None
+                if deadline is not None and len(aggregator) >= min_results:
+                    wait_timeout = max(0.0, deadline - loop.time())
+
+                done, _ = await asyncio.wait({next_arrival}, timeout=wait_timeout)
+                if not done:
+                    # Budget elapsed with enough results ranked
+                    break
+
+                try:
+                    workspace, outcome = next_arrival.result()
+                except StopAsyncIteration:
+                    break
+                finally:
+                    next_arrival = None
+
+                pending.pop(workspace.slug, None)
+                if isinstance(outcome, Exception):
+                    logger.error(f"Search failed for workspace {workspace.slug}: {outcome}")
+                    failed.append(workspace.slug)
+                    top_k_changed = False
+                else:
+                    logger.info(
+                        f"Search completed for workspace {workspace.slug}: {len(outcome)} results"
+                    )
+                    completed.append(workspace.slug)
+                    top_k_changed = aggregator.add(outcome)
+
+                if not pending:
+                    break
+                yield snapshot(top_k_changed)
+        finally:
+            if next_arrival is not None:
+                next_arrival.cancel()
+                try:
+                    await next_arrival
+                except (asyncio.CancelledError, StopAsyncIteration, Exception):
+                    pass
+            await arrivals.aclose()
+
+        if not completed:
+            raise VectorSearchError(
+                f"All workspace searches failed ({len(failed)} failures)",
+                query=query,
+                error_context={"failed_workspaces": len(failed)},
+            )
+
+        budget_met = bool(pending)
+        logger.info(
+            f"PIPELINE_METRICS: step=streaming_workspace_search "
+            f"duration_ms={int((time.time() - start_time) * 1000)} "
+            f"completed={len(completed)} failed={len(failed)} cancelled={len(pending)} "
+            f"candidates={len(aggregator)} budget_met={budget_met}"
+        )
+        yield snapshot(top_k_changed, final=True, budget_met=budget_met)
+
+    async def _iter_workspace_results(
+        self,
+        query: str,
+        workspaces: List[WorkspaceInfo],
+        alpha: Optional[float],
+        timeout_seconds: float,
+    ) -> AsyncIterator[Tuple[WorkspaceInfo, Any]]:
+        """
+        Yield (workspace, SearchResult list or exception) in completion order.
+
+        Uses the vector client's per-tenant iterator when available (query
+        embedded once), otherwise one task per workspace consumed with
+        asyncio.as_completed. Closing the iterator cancels unfinished searches.
+        """
+        by_slug = {workspace.slug: workspace for workspace in workspaces}
+
+        if callable(getattr(type(self.weaviate_client), "iter_search_workspaces", None)):
+            search_kwargs = {"limit": 10}
+            if alpha is not None:
+                search_kwargs["alpha"] = alpha
+            tenant_results = self.weaviate_client.iter_search_workspaces(
+                list(by_slug), query, **search_kwargs
+            )
+            remaining = dict(by_slug)
+            deadline = asyncio.get_running_loop().time() + timeout_seconds
+            try:
+                while remaining:
+                    try:
+                        slug, outcome = await asyncio.wait_for(
+                            tenant_results.__anext__(),
+                            timeout=max(0.0, deadline - asyncio.get_running_loop().time()),
+                        )
+                    except StopAsyncIteration:
+                        break
+                    except asyncio.TimeoutError:
+                        # Every tenant still running missed the timeout
+                        for workspace in remaining.values():
+                            yield workspace, SearchTimeoutError(
+                                f"Workspace search timed out: {workspace.slug}",
+                                timeout_seconds=timeout_seconds,
+                                operation=f"search_workspace_{workspace.slug}",
+                            )
+                        break
+                    workspace = remaining.pop(slug)
+                    if not isinstance(outcome, Exception):
+                        outcome = [self._convert_raw_result(raw, workspace) for raw in outcome]
+                    yield workspace, outcome
+            finally:
+                await tenant_results.aclose()
+            return
+
+        semaphore = asyncio.Semaphore(5)
+
+        async def search(workspace: WorkspaceInfo):
+            try:
+                return workspace, await self._search_single_workspace(
+                    query, workspace, semaphore, timeout_seconds=timeout_seconds, alpha=alpha
+                )
+            except Exception as e:
+                return workspace, e
+
+        tasks = [asyncio.create_task(search(workspace)) for workspace in workspaces]
+        try:
+            for next_completed in asyncio.as_completed(tasks):
+                yield await next_completed
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _supports_batched_search(self) -> bool:
+        """Check whether the vector client provides multi-workspace search"""
+        return callable(getattr(type(self.weaviate_client), "search_workspaces", None))
+
+    async def _search_workspaces_batched(
+        self,
+        query: str,
+        workspaces: List[WorkspaceInfo],
+        timeout_seconds: float = 2.0,
+        alpha: Optional[float] = None,
+    ) -> List[Any]:
+        """
+        Search all workspaces with one batched vector client call.
+
+        Args:
+            query: Search query
+            workspaces: Workspaces to search
+            timeout_seconds: Timeout for each workspace's tenant query
+            alpha: Hybrid vector weight (pure vector search if None)
+
+        Returns:
+            Per-workspace list of SearchResult lists or exceptions, aligned
+            with workspaces (same shape as gather(return_exceptions=True))
+        """
+        slugs = [workspace.slug for workspace in workspaces]
+        logger.info(f"Launching batched workspace search for {len(slugs)} workspaces...")
+
+        search_kwargs = {"limit": 10, "timeout": timeout_seconds, "return_exceptions": True}
+        if alpha is not None:
+            search_kwargs["alpha"] = alpha
+
+        try:
+            # The timeout applies per tenant so one slow workspace cannot fail the rest
+            raw_by_workspace = await self.weaviate_client.search_workspaces(
+                slugs, query, **search_kwargs
+            )
+        except Exception as e:
+            logger.error(f"Batched workspace search failed: {e}", exc_info=True)
+            error = VectorSearchError(
+                f"Batched workspace search failed: {str(e)}",
+                query=query,
+                error_context={"error": str(e)},
+            )
+            return [error for _ in workspaces]
+
+        search_results: List[Any] = []
+        for workspace in workspaces:
+            raw_results = raw_by_workspace.get(workspace.slug)
+            if isinstance(raw_results, asyncio.TimeoutError):
+                logger.warning(f"Workspace search timed out after {timeout_seconds}s: {workspace.slug}")
+                search_results.append(
+                    SearchTimeoutError(
+                        f"Workspace search timed out: {workspace.slug}",
+                        timeout_seconds=timeout_seconds,
+                        operation=f"search_workspace_{workspace.slug}",
+                    )
+                )
+                continue
+            if raw_results is None or isinstance(raw_results, Exception):
+                search_results.append(
+                    VectorSearchError(
+                        "Workspace search failed",
+                        workspace_slug=workspace.slug,
+                        query=query,
+                        error_context={"error": str(raw_results)} if raw_results else None,
+                    )
+                )
+                continue
+            search_results.append(
+                [self._convert_raw_result(raw, workspace) for raw in raw_results]
+            )
+        return search_results
+
     async def _search_single_workspace(
         self,
         query: str,
         workspace: WorkspaceInfo,
         semaphore: asyncio.Semaphore,
         timeout_seconds: float = 2.0,
+        alpha: Optional[float] = None,
     ) -> List[SearchResult]:
         """
         Search a single workspace with timeout and error handling.
@@ -314,6 +655,7 @@ class WorkspaceSearchStrategy:
             workspace: Workspace to search
             semaphore: Concurrency control semaphore
             timeout_seconds: Timeout for workspace search
+            alpha: Hybrid vector weight (pure vector search if None)
 
         Returns:
             List of SearchResult objects
@@ -327,8 +669,11 @@ class WorkspaceSearchStrategy:
                 logger.debug(f"Starting search in workspace: {workspace.slug}")
 
                 # Execute search with timeout
+                search_kwargs = {"limit": 10}
+                if alpha is not None:
+                    search_kwargs["alpha"] = alpha
                 search_coro = self.weaviate_client.search_workspace(
-                    workspace.slug, query, limit=10
+                    workspace.slug, query, **search_kwargs
                 )
 
                 raw_results = await asyncio.wait_for(
@@ -368,91 +713,39 @@ class WorkspaceSearchStrategy:
 
     async def _get_available_workspaces(self) -> List[Dict[str, Any]]:
         """
-        Get available workspaces from Weaviate directly.
+        Get available workspaces from the workspace catalog.
+
+        Served from memory once the catalog is loaded; see WorkspaceCatalog.
 
         Returns:
             List of workspace dictionaries with metadata
         """
         try:
-            # First try to get workspaces from Weaviate directly
-            if self.weaviate_client:
-                try:
-                    weaviate_workspaces = await self.weaviate_client.list_workspaces()
-                    if weaviate_workspaces:
-                        # Convert Weaviate workspace format to expected format
-                        workspaces = []
-                        for ws in weaviate_workspaces:
-                            # Extract technology from workspace name if possible
-                            technology = "general"
-                            slug = ws.get("slug", "")
-                            if "python" in slug.lower():
-                                technology = "python"
-                            elif "react" in slug.lower():
-                                technology = "react"
-                            elif "vue" in slug.lower():
-                                technology = "vue"
-                            elif "angular" in slug.lower():
-                                technology = "angular"
-                            elif "typescript" in slug.lower() or "ts" in slug.lower():
-                                technology = "typescript"
-                            elif "node" in slug.lower():
-                                technology = "nodejs"
-                            
-                            workspaces.append({
-                                "slug": slug,
-                                "technology": technology,
-                                "last_updated": datetime.utcnow(),
-                                "document_count": 0  # Will be 0 for empty workspaces
-                            })
-                        
-                        logger.info(f"Found {len(workspaces)} workspaces from Weaviate")
-                        return workspaces
-                except Exception as e:
-                    logger.warning(f"Failed to get workspaces from Weaviate: {e}")
-            
-            # Fallback to database query for workspaces with documents
-            query = """
-                SELECT DISTINCT 
-                    weaviate_workspace as slug,
-                    technology,
-                    MAX(updated_at) as last_updated,
-                    COUNT(*) as document_count
-                FROM content_metadata 
-                WHERE weaviate_workspace IS NOT NULL 
-                    AND processing_status = 'completed'
-                GROUP BY weaviate_workspace, technology
-                ORDER BY document_count DESC
-            """
-
-            rows = await self.db_manager.fetch_all(query)
-
-            workspaces = []
-            if rows:
-                for row in rows:
-                    # Handle both dict and Row object cases
-                    if isinstance(row, dict):
-                        workspace = {
-                            "slug": row.get("slug"),
-                            "technology": row.get("technology"),
-                            "last_updated": row.get("last_updated"),
-                            "document_count": row.get("document_count"),
-                        }
-                    else:
-                        # Row object case - access by column name
-                        workspace = {
-                            "slug": row["slug"],
-                            "technology": row["technology"],
-                            "last_updated": row["last_updated"],
-                            "document_count": row["document_count"],
-                        }
-                    workspaces.append(workspace)
-
-            return workspaces
-
+            return await self.workspace_catalog.get_workspaces()
         except Exception as e:
             logger.error(f"Failed to get available workspaces: {e}")
             return []
 
+    async def _get_candidate_workspaces(self, technologies: Set[str], limit: int) -> List[Dict[str, Any]]:
+        """
+        Get the workspaces worth scoring for a query from the workspace catalog.
+
+        Workspaces tagged with one of the technologies come from the catalog's
+        technology index; other workspaces only fill up to limit entries.
+
+        Args:
+            technologies: Hinted and detected technologies
+            limit: Number of workspaces that will be selected
+
+        Returns:
+            List of workspace dictionaries with metadata
+        """
+        try:
+            return await self.workspace_catalog.select_workspaces(technologies, limit)
+        except Exception as e:
+            logger.error(f"Failed to get candidate workspaces: {e}")
+            return []
+
     def _extract_technology_keywords(self, query: str) -> Set[str]:
         """
         Extract technology keywords from search query.
@@ -463,17 +756,59 @@ class WorkspaceSearchStrategy:
         Returns:
             Set of detected technology keywords
         """
-        detected = set()
-        query_lower = query.lower()
+        return self.technology_matcher.detect(query)
 
-        # Check for direct technology matches
-        for tech, keywords in self.technology_patterns.items():
-            for keyword in keywords:
-                if keyword in query_lower:
-                    detected.add(tech)
-                    break
+    def _resolve_alpha(self, strategy: Optional[SearchStrategy]) -> Optional[float]:
+        """
+        Get the hybrid vector weight for a search strategy.
+
+        Args:
+            strategy: Search strategy of the query
+
+        Returns:
+            Alpha in [0, 1], or None for the pure vector path (hybrid disabled,
+            no strategy given, or no alpha configured for the strategy)
+        """
+        if strategy is None or not self.hybrid_config.enabled:
+            return None
+        key = strategy.value if isinstance(strategy, SearchStrategy) else str(strategy)
+        return self.hybrid_config.strategy_alpha.get(key.lower())
 
-        return detected
+    def _fuse_ranked_lists(
+        self, ranked_lists: List[List[SearchResult]]
+    ) -> List[SearchResult]:
+        """
+        Merge per-workspace rankings with reciprocal-rank fusion.
+
+        Each result scores sum(1 / (k + rank)) over the lists it appears in,
+        so results are compared by rank rather than by raw scores that are not
+        comparable across tenants. Scores are rescaled so that a first-ranked
+        result in a single list has relevance 1.0.
+
+        Args:
+            ranked_lists: Result lists, each ordered best first
+
+        Returns:
+            Deduplicated results ordered by fused score
+        """
+        k = self.hybrid_config.rrf_k
+        fused_scores: Dict[str, float] = {}
+        fused_results: Dict[str, SearchResult] = {}
+
+        for ranked in ranked_lists:
+            for rank, result in enumerate(ranked, start=1):
+                content_hash = result.content_id
+                fused_scores[content_hash] = fused_scores.get(content_hash, 0.0) + 1.0 / (k + rank)
+                fused_results.setdefault(content_hash, result)
+
+        ordered = sorted(fused_scores, key=fused_scores.get, reverse=True)
+        fused = []
+        for content_hash in ordered:
+            result = fused_results[content_hash]
+            result.metadata["rrf_score"] = fused_scores[content_hash]
+            result.relevance_score = min(1.0, fused_scores[content_hash] * (k + 1))
+            fused.append(result)
+        return fused
 
     def _deduplicate_results(self, results: List[SearchResult]) -> List[SearchResult]:
         """
@@ -544,8 +879,12 @@ class WorkspaceSearchStrategy:
         content = raw_result.get("content", "")
         snippet = content[:200] + "..." if len(content) > 200 else content
 
-        # Extract metadata
-        metadata = raw_result.get("metadata", {})
+        # Extract metadata; keep the raw match quality separately since
+        # relevance_score is replaced by rank fusion and workspace boosts
+        metadata = dict(raw_result.get("metadata", {}))
+        match_score = _match_score(metadata)
+        if match_score is not None:
+            metadata["match_score"] = match_score
 
         return SearchResult(
             content_id=metadata.get("document_id", raw_result.get("id", "unknown")),
@@ -558,3 +897,19 @@ class WorkspaceSearchStrategy:
             workspace_slug=workspace.slug,
             chunk_index=metadata.get("chunk_index"),
         )
+
+
+def _match_score(metadata: Dict[str, Any]) -> Optional[float]:
+    """
+    Raw vector match quality of a result in [0, 1].
+
+    Weaviate certainty, or the equivalent derived from cosine distance.
+    Hybrid and BM25 scores are relative to the query and are not used.
+    """
+    certainty = metadata.get("certainty")
+    if certainty is not None:
+        return float(certainty)
+    distance = metadata.get("distance")
+    if distance is not None:
+        return min(max(1.0 - float(distance) / 2.0, 0.0), 1.0)
+    return None
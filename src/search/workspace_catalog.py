@@ -0,0 +1,496 @@
+"""
+Workspace Catalog
+Cached workspace (tenant) list and technology index for workspace selection
+
+Tenants are listed from Weaviate and joined with per-workspace technology and
+document counts from content_metadata. The snapshot is served from memory on
+the search path; it is refreshed in the background after a TTL and
+immediately when a tenant is created or deleted (announced to other workers
+over Redis pub/sub).
+
+TechnologyMatcher compiles the technology keyword table into one trie-shaped
+regex so detecting technologies in a query is a single pass over the query.
+"""
+
+import asyncio
+import logging
+import re
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from src.core.config.models import WorkspaceCatalogConfig
+
+from .pubsub import listen_channel
+
+logger = logging.getLogger(__name__)
+
+
+# Technology keyword patterns for workspace matching
+DEFAULT_TECHNOLOGY_PATTERNS: Dict[str, List[str]] = {
+    "python": [
+        "python",
+        "django",
+        "flask",
+        "fastapi",
+        "pandas",
+        "numpy",
+        "pytorch",
+        "tensorflow",
+    ],
+    "javascript": [
+        "javascript",
+        "js",
+        "node",
+        "react",
+        "vue",
+        "angular",
+        "express",
+        "next",
+    ],
+    "typescript": ["typescript", "ts", "angular", "react", "vue", "nest"],
+    "java": ["java", "spring", "maven", "gradle", "junit", "hibernate"],
+    "csharp": ["c#", "csharp", "dotnet", ".net", "asp.net", "entity"],
+    "go": ["go", "golang", "gin", "gorilla", "echo"],
+    "rust": ["rust", "cargo", "tokio", "serde"],
+    "php": ["php", "laravel", "symfony", "composer"],
+    "ruby": ["ruby", "rails", "gem", "bundler"],
+    "docker": ["docker", "container", "dockerfile", "compose"],
+    "kubernetes": ["kubernetes", "k8s", "kubectl", "helm"],
+    "aws": ["aws", "amazon", "ec2", "s3", "lambda", "cloudformation"],
+    "azure": ["azure", "microsoft", "resource group", "app service"],
+    "gcp": ["gcp", "google cloud", "compute engine", "cloud functions"],
+}
+
+
+# Slug tokens that tag a workspace with no indexed documents; first match wins
+SLUG_TECHNOLOGY_KEYWORDS: List[Tuple[str, frozenset]] = [
+    ("python", frozenset({"python"})),
+    ("react", frozenset({"react", "reactjs"})),
+    ("vue", frozenset({"vue", "vuejs"})),
+    ("angular", frozenset({"angular", "angularjs"})),
+    ("typescript", frozenset({"typescript", "ts"})),
+    ("nodejs", frozenset({"node", "nodejs"})),
+]
+
+_SLUG_TOKEN_SPLIT = re.compile(r"[^a-z0-9]+")
+
+
+class TechnologyMatcher:
+    """
+    Detects technologies mentioned in text.
+
+    Equivalent to testing every keyword as a substring of the lowercased
+    text, but all keywords are compiled into a single regex trie scanned
+    once per query.
+    """
+
+    def __init__(self, patterns: Mapping[str, Iterable[str]]):
+        """
+        Compile technology keyword patterns.
+
+        Args:
+            patterns: Technology name -> keywords that indicate it
+        """
+        technologies_by_keyword: Dict[str, Set[str]] = {}
+        for technology, keywords in patterns.items():
+            for keyword in keywords:
+                if keyword:
+                    technologies_by_keyword.setdefault(keyword.lower(), set()).add(technology)
+
+        # The lookahead reports the longest keyword starting at each position;
+        # any shorter keyword matching there is one of its prefixes.
+        self._technologies_by_match: Dict[str, frozenset] = {
+            keyword: frozenset().union(
+                *(
+                    technologies
+                    for other, technologies in technologies_by_keyword.items()
+                    if keyword.startswith(other)
+                )
+            )
+            for keyword in technologies_by_keyword
+        }
+
+        trie: Dict[str, Any] = {}
+        for keyword in technologies_by_keyword:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        self.pattern: Optional[re.Pattern] = (
+            re.compile(f"(?=({self._trie_pattern(trie)}))") if trie else None
+        )
+
+    def detect(self, text: str) -> Set[str]:
+        """
+        Technologies whose keywords occur anywhere in text.
+
+        Args:
+            text: Query or other text to scan
+
+        Returns:
+            Set of detected technology names
+        """
+        detected: Set[str] = set()
+        if self.pattern is None or not text:
+            return detected
+        for match in self.pattern.finditer(text.lower()):
+            detected |= self._technologies_by_match[match.group(1)]
+        return detected
+
+    @classmethod
+    def _trie_pattern(cls, node: Dict[str, Any]) -> str:
+        """Regex for a trie node; optional suffixes are greedy so longer keywords win"""
+        branches = [
+            re.escape(char) + cls._trie_pattern(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+
+
+class WorkspaceCatalog:
+    """
+    In-memory catalog of searchable workspaces.
+
+    get_workspaces() never waits on the network once the catalog is loaded:
+    an expired snapshot is still served while a single background refresh
+    runs.
+    """
+
+    WORKSPACE_METADATA_SQL = """
+        SELECT
+            weaviate_workspace AS slug,
+            technology,
+            MAX(updated_at) AS last_updated,
+            COUNT(*) AS document_count
+        FROM content_metadata
+        WHERE weaviate_workspace IS NOT NULL
+            AND processing_status = 'completed'
+        GROUP BY weaviate_workspace, technology
+        ORDER BY document_count DESC
+    """
+
+    def __init__(
+        self,
+        db_manager: Any,
+        weaviate_client: Any,
+        config: Optional[WorkspaceCatalogConfig] = None,
+        cache_manager: Optional[Any] = None,
+    ):
+        """
+        Initialize workspace catalog.
+
+        Args:
+            db_manager: DatabaseManager for per-workspace document metadata
+            weaviate_client: Weaviate client listing tenants
+            config: Catalog configuration (defaults if None)
+            cache_manager: Optional Redis CacheManager for cross-worker invalidation
+        """
+        self.db_manager = db_manager
+        self.weaviate_client = weaviate_client
+        self.config = config if isinstance(config, WorkspaceCatalogConfig) else WorkspaceCatalogConfig()
+        self.cache_manager = cache_manager
+
+        self._workspaces: Optional[List[Dict[str, Any]]] = None
+        self._by_technology: Dict[str, List[int]] = {}
+        self._loaded_at: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._reload_requested = False
+        self._listener_task: Optional[asyncio.Task] = None
+        self._instance_id = uuid.uuid4().hex
+
+        self._stats = {
+            "hits": 0,
+            "refreshes": 0,
+            "refresh_failures": 0,
+            "invalidations_received": 0,
+        }
+
+        # Tenants created or deleted through this client refresh immediately
+        if callable(getattr(type(weaviate_client), "add_tenant_listener", None)):
+            weaviate_client.add_tenant_listener(self.handle_tenant_event)
+
+    async def get_workspaces(self) -> List[Dict[str, Any]]:
+        """
+        Get available workspaces.
+
+        Returns:
+            List of workspace dictionaries (slug, technology, last_updated,
+            document_count)
+        """
+        workspaces, _ = await self._current()
+        return list(workspaces)
+
+    async def select_workspaces(self, technologies: Iterable[str], limit: int) -> List[Dict[str, Any]]:
+        """
+        Candidate workspaces for a query, looked up in the technology index.
+
+        Returns every workspace tagged with one of the technologies, then
+        the first other workspaces until at least limit are returned. Both
+        groups keep catalog order; untagged workspaces are never scanned
+        beyond what the fill needs.
+
+        Args:
+            technologies: Technology names (case-insensitive)
+            limit: Minimum number of workspaces to return, if available
+
+        Returns:
+            Workspace dictionaries, tagged workspaces first
+        """
+        workspaces, by_technology = await self._current()
+
+        positions: Set[int] = set()
+        for technology in technologies:
+            positions.update(by_technology.get(technology.lower(), ()))
+        selected = [workspaces[position] for position in sorted(positions)]
+
+        for position, workspace in enumerate(workspaces):
+            if len(selected) >= limit:
+                break
+            if position not in positions:
+                selected.append(workspace)
+        return selected
+
+    async def refresh(self) -> List[Dict[str, Any]]:
+        """
+        Reload the catalog now (joining a refresh already in flight).
+
+        Returns:
+            The refreshed workspace list (previous snapshot if loading failed)
+        """
+        self._schedule_refresh()
+        await asyncio.shield(self._refresh_task)
+        return list(self._workspaces or [])
+
+    async def invalidate(self, reason: str = "manual", publish: bool = True) -> None:
+        """
+        Mark the catalog stale and refresh it in the background.
+
+        Args:
+            reason: Logged cause of the invalidation
+            publish: Also announce the invalidation to other workers
+        """
+        logger.info(f"Workspace catalog invalidated: {reason}")
+        self._loaded_at = None
+        # A refresh already in flight may have read the old tenant list
+        self._reload_requested = True
+        self._schedule_refresh()
+
+        if publish and self.cache_manager is not None:
+            try:
+                await self.cache_manager.publish(
+                    self.config.invalidation_channel, f"{self._instance_id}:{reason}"
+                )
+            except Exception as e:
+                logger.warning(f"Failed to publish workspace catalog invalidation: {e}")
+
+    async def handle_tenant_event(self, event: str, workspace_slug: str) -> None:
+        """
+        Tenant listener registered with the Weaviate client.
+
+        Args:
+            event: "created" or "deleted"
+            workspace_slug: Affected workspace
+        """
+        await self.invalidate(reason=f"tenant_{event}:{workspace_slug}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Catalog size, age and refresh counters"""
+        return {
+            **self._stats,
+            "workspace_count": len(self._workspaces or []),
+            "technology_counts": {
+                technology: len(positions) for technology, positions in self._by_technology.items()
+            },
+            "age_seconds": (
+                round(time.monotonic() - self._loaded_at, 1) if self._loaded_at is not None else None
+            ),
+        }
+
+    async def close(self) -> None:
+        """Stop the background refresh and invalidation listener"""
+        for task in (self._refresh_task, self._listener_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._refresh_task = None
+        self._listener_task = None
+
+    async def _current(self) -> Tuple[List[Dict[str, Any]], Dict[str, List[int]]]:
+        """The workspace snapshot and its technology index (not copied)"""
+        if not self.config.enabled:
+            workspaces = await self._load()
+            return workspaces, self._index_by_technology(workspaces)
+
+        if self.cache_manager is not None:
+            self._ensure_invalidation_listener()
+
+        if self._workspaces is None:
+            await self.refresh()
+            return self._workspaces or [], self._by_technology
+
+        if self._is_stale():
+            self._schedule_refresh()
+        self._stats["hits"] += 1
+        return self._workspaces, self._by_technology
+
+    @staticmethod
+    def _index_by_technology(workspaces: List[Dict[str, Any]]) -> Dict[str, List[int]]:
+        """Technology -> positions of the workspaces tagged with it, in catalog order"""
+        by_technology: Dict[str, List[int]] = {}
+        for position, workspace in enumerate(workspaces):
+            technology = (workspace["technology"] or "").lower()
+            by_technology.setdefault(technology, []).append(position)
+        return by_technology
+
+    def _is_stale(self) -> bool:
+        """Whether the snapshot is past its TTL or was invalidated"""
+        return (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at >= self.config.refresh_ttl_seconds
+        )
+
+    def _schedule_refresh(self) -> None:
+        """Start a background refresh unless one is already running"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh())
+
+    async def _refresh(self) -> None:
+        """Load snapshots until no invalidation arrived meanwhile"""
+        while True:
+            self._reload_requested = False
+            if not await self._load_snapshot() or not self._reload_requested:
+                return
+
+    async def _load_snapshot(self) -> bool:
+        """Load a new snapshot; on failure keep serving the previous one"""
+        start_time = time.time()
+        try:
+            workspaces = await self._load()
+        except Exception as e:
+            self._stats["refresh_failures"] += 1
+            logger.warning(f"Workspace catalog refresh failed, keeping previous snapshot: {e}")
+            return False
+
+        by_technology = self._index_by_technology(workspaces)
+
+        self._workspaces = workspaces
+        self._by_technology = by_technology
+        self._loaded_at = time.monotonic()
+        self._stats["refreshes"] += 1
+
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.info(
+            f"PIPELINE_METRICS: step=workspace_catalog_refresh "
+            f"workspaces={len(workspaces)} technologies={len(by_technology)} "
+            f"duration_ms={duration_ms}"
+        )
+        return True
+
+    async def _load(self) -> List[Dict[str, Any]]:
+        """
+        List tenants and join them with document metadata.
+
+        Raises:
+            Exception: If neither Weaviate nor the database could be read
+        """
+        tenants: List[Dict[str, Any]] = []
+        if self.weaviate_client:
+            try:
+                tenants = await self.weaviate_client.list_workspaces() or []
+            except Exception as e:
+                logger.warning(f"Failed to get workspaces from Weaviate: {e}")
+
+        try:
+            metadata = await self._load_document_metadata()
+        except Exception as e:
+            if not tenants:
+                raise
+            logger.warning(f"Failed to load workspace metadata: {e}")
+            metadata = {}
+
+        if not tenants:
+            # No tenant listing: fall back to workspaces with indexed documents
+            return list(metadata.values())
+
+        workspaces = []
+        for tenant in tenants:
+            slug = tenant.get("slug", "")
+            known = metadata.get(slug, {})
+            workspaces.append({
+                "slug": slug,
+                "technology": known.get("technology") or self._infer_technology(slug),
+                "last_updated": known.get("last_updated") or datetime.utcnow(),
+                "document_count": known.get("document_count") or 0,
+            })
+        return workspaces
+
+    async def _load_document_metadata(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-workspace technology and document counts from content_metadata.
+
+        A workspace holding several technologies is tagged with the one it
+        has the most documents for.
+        """
+        rows = await self.db_manager.fetch_all(self.WORKSPACE_METADATA_SQL, pool="search")
+
+        metadata: Dict[str, Dict[str, Any]] = {}
+        for row in rows or []:
+            slug = row["slug"]
+            document_count = row["document_count"] or 0
+            last_updated = row["last_updated"]
+            workspace = metadata.get(slug)
+            if workspace is None:
+                # Rows arrive ordered by document count, so the first wins
+                metadata[slug] = {
+                    "slug": slug,
+                    "technology": row["technology"],
+                    "last_updated": last_updated,
+                    "document_count": document_count,
+                }
+                continue
+            workspace["document_count"] += document_count
+            if last_updated and (
+                workspace["last_updated"] is None or last_updated > workspace["last_updated"]
+            ):
+                workspace["last_updated"] = last_updated
+        return metadata
+
+    @staticmethod
+    def _infer_technology(slug: str) -> str:
+        """Guess a technology from the slug of a workspace with no indexed documents"""
+        tokens = set(_SLUG_TOKEN_SPLIT.split(slug.lower()))
+        for technology, keywords in SLUG_TECHNOLOGY_KEYWORDS:
+            if not tokens.isdisjoint(keywords):
+                return technology
+        return "general"
+
+    def _ensure_invalidation_listener(self) -> None:
+        """Start the pub/sub listener on first use inside a running loop"""
+        if self._listener_task is None or self._listener_task.done():
+            self._listener_task = asyncio.create_task(self._invalidation_loop())
+
+    async def _invalidation_loop(self) -> None:
+        """Refresh when another worker announces a tenant change"""
+        await listen_channel(
+            self.cache_manager,
+            self.config.invalidation_channel,
+            self._on_invalidation,
+            name="Workspace catalog",
+        )
+
+    async def _on_invalidation(self, payload: str) -> None:
+        """Apply a tenant change announced by another worker"""
+        if payload.startswith(f"{self._instance_id}:"):
+            return
+        self._stats["invalidations_received"] += 1
+        await self.invalidate(reason=payload.partition(":")[2], publish=False)
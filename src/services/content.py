@@ -213,41 +213,26 @@ class ContentService:
             )
 
         try:
-            # Get total document count
-            total_query = "SELECT COUNT(*) as count FROM content_metadata"
-            total_result = await self.db_manager.fetch_one(total_query, {})
-            total_documents = total_result["count"] if total_result else 0
-
-            # Get counts by technology
-            tech_query = """
-            SELECT technology, COUNT(*) as count
-            FROM content_metadata
-            WHERE technology IS NOT NULL
-            GROUP BY technology
-            """
-            tech_results = await self.db_manager.fetch_all(tech_query, {})
-            by_technology = {row["technology"]: row["count"] for row in tech_results}
-
-            # Get counts by content type
-            type_query = """
-            SELECT content_type, COUNT(*) as count
-            FROM content_metadata
-            WHERE content_type IS NOT NULL
-            GROUP BY content_type
-            """
-            type_results = await self.db_manager.fetch_all(type_query, {})
-            by_content_type = {
-                row["content_type"]: row["count"] for row in type_results
-            }
-
-            # Get counts by workspace
-            workspace_query = """
-            SELECT workspace, COUNT(*) as count
-            FROM content_metadata
-            GROUP BY workspace
+            # Read the per technology/workspace rollup maintained by
+            # triggers on content_metadata (one row per group)
+            counts_query = """
+            SELECT technology, workspace, document_count
+            FROM content_counts
+            WHERE document_count > 0
             """
-            workspace_results = await self.db_manager.fetch_all(workspace_query, {})
-            by_workspace = {row["workspace"]: row["count"] for row in workspace_results}
+            count_results = await self.db_manager.fetch_all(counts_query, {}, pool="analytics")
+
+            total_documents = 0
+            by_technology = {}
+            by_workspace = {}
+            for row in count_results:
+                count = row["document_count"]
+                total_documents += count
+                by_technology[row["technology"]] = by_technology.get(row["technology"], 0) + count
+                by_workspace[row["workspace"]] = by_workspace.get(row["workspace"], 0) + count
+
+            # content_metadata has no content type column
+            by_content_type = {}
 
             return ContentStatsResponse(
                 total_documents=total_documents,
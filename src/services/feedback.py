@@ -5,11 +5,12 @@ Handles user feedback collection including search quality feedback,
 usage signals, and analytics data.
 """
 
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 import uuid
 
 from src.database.manager import DatabaseManager
+from src.database.write_buffer import build_insert, get_write_buffer, row_params
 from src.api.schemas import (
     FeedbackRequest,
     FeedbackResponse,
@@ -17,23 +18,40 @@ from src.api.schemas import (
     FeedbackStatsResponse,
 )
 
+FEEDBACK_EVENT_TABLE = "feedback_events"
+FEEDBACK_EVENT_COLUMNS = (
+    "event_id", "content_id", "feedback_type", "rating", "comment",
+    "user_session_id", "search_query", "result_position", "created_at",
+)
+USAGE_SIGNAL_TABLE = "usage_signals"
+USAGE_SIGNAL_COLUMNS = (
+    "signal_id", "content_id", "signal_type", "signal_value", "search_query",
+    "result_position", "user_session_id", "created_at",
+)
+
 
 class FeedbackService:
     """Service for handling feedback and usage signal collection."""
 
-    def __init__(self, db_manager: Optional[DatabaseManager] = None):
+    def __init__(self, db_manager: Optional[DatabaseManager] = None, buffered: bool = True):
         """
         Initialize the feedback service.
 
         Args:
             db_manager: Optional DatabaseManager instance for database operations
+            buffered: Write feedback and usage signals through the shared
+                write-behind buffers instead of one INSERT per event
         """
         self.db_manager = db_manager
+        self.buffered = buffered
 
     async def submit_feedback(self, request: FeedbackRequest) -> FeedbackResponse:
         """
         Submit user feedback for a search result or content item.
 
+        The row is queued on the feedback_events write buffer and written
+        by its background flusher unless the service is unbuffered.
+
         Args:
             request: Feedback request with rating and comments
 
@@ -50,33 +68,26 @@ class FeedbackService:
         try:
             # Generate unique feedback ID
             feedback_id = str(uuid.uuid4())
+            metadata = request.metadata or {}
 
-            # Insert feedback into database
-            query = """
-            INSERT INTO feedback_events (
-                feedback_id, content_id, user_id, session_id,
-                feedback_type, rating, comment, metadata,
-                created_at
-            ) VALUES (
-                :feedback_id, :content_id, :user_id, :session_id,
-                :feedback_type, :rating, :comment, :metadata,
-                :created_at
-            )
-            """
-
-            params = {
-                "feedback_id": feedback_id,
+            row = {
+                "event_id": feedback_id,
                 "content_id": request.content_id,
-                "user_id": request.user_id or "anonymous",
-                "session_id": request.session_id or str(uuid.uuid4()),
                 "feedback_type": request.feedback_type,
                 "rating": request.rating,
                 "comment": request.comment,
-                "metadata": request.metadata or {},
+                "user_session_id": request.session_id,
+                "search_query": metadata.get("search_query") or metadata.get("query_context"),
+                "result_position": metadata.get("result_position"),
                 "created_at": datetime.utcnow(),
             }
 
-            await self.db_manager.execute(query, params)
+            if not await self._write(FEEDBACK_EVENT_TABLE, FEEDBACK_EVENT_COLUMNS, row):
+                return FeedbackResponse(
+                    feedback_id="",
+                    status="failed",
+                    message="Feedback buffer full, try again later",
+                )
 
             return FeedbackResponse(
                 feedback_id=feedback_id,
@@ -97,6 +108,9 @@ class FeedbackService:
         """
         Record a usage signal (view, click, etc.).
 
+        The row is queued on the usage_signals write buffer and written by
+        its background flusher unless the service is unbuffered.
+
         Args:
             request: Usage signal request with event details
 
@@ -113,32 +127,25 @@ class FeedbackService:
         try:
             # Generate unique signal ID
             signal_id = str(uuid.uuid4())
+            metadata = request.metadata or {}
 
-            # Insert usage signal into database
-            query = """
-            INSERT INTO usage_signals (
-                signal_id, content_id, user_id, session_id,
-                signal_type, signal_strength, metadata,
-                created_at
-            ) VALUES (
-                :signal_id, :content_id, :user_id, :session_id,
-                :signal_type, :signal_strength, :metadata,
-                :created_at
-            )
-            """
-
-            params = {
+            row = {
                 "signal_id": signal_id,
                 "content_id": request.content_id,
-                "user_id": request.user_id or "anonymous",
-                "session_id": request.session_id or str(uuid.uuid4()),
                 "signal_type": request.signal_type,
-                "signal_strength": request.signal_strength or 1.0,
-                "metadata": request.metadata or {},
+                "signal_value": request.signal_strength or 1.0,
+                "search_query": metadata.get("search_query"),
+                "result_position": metadata.get("result_position"),
+                "user_session_id": request.session_id,
                 "created_at": datetime.utcnow(),
             }
 
-            await self.db_manager.execute(query, params)
+            if not await self._write(USAGE_SIGNAL_TABLE, USAGE_SIGNAL_COLUMNS, row):
+                return FeedbackResponse(
+                    feedback_id="",
+                    status="failed",
+                    message="Usage signal buffer full, try again later",
+                )
 
             return FeedbackResponse(
                 feedback_id=signal_id,
@@ -153,6 +160,13 @@ class FeedbackService:
                 message=f"Failed to record usage signal: {str(e)}",
             )
 
+    async def _write(self, table: str, columns: Tuple[str, ...], row: Dict[str, Any]) -> bool:
+        """Queue a row on the table's write buffer, or insert it directly"""
+        if self.buffered:
+            return await get_write_buffer(self.db_manager, table, columns).add(row)
+        await self.db_manager.execute(build_insert(table, columns), row_params(columns, row))
+        return True
+
     async def get_feedback_stats(self, days: int = 30) -> FeedbackStatsResponse:
         """
         Get feedback statistics for the specified time period.
@@ -177,69 +191,46 @@ class FeedbackService:
             end_date = datetime.utcnow()
             start_date = end_date - timedelta(days=days)
 
-            # Get total feedback count
-            total_query = """
-            SELECT COUNT(*) as count
-            FROM feedback_events
-            WHERE created_at >= :start_date AND created_at <= :end_date
+            # Aggregate the daily rollup maintained by triggers on
+            # feedback_events (one row per type and rating)
+            rollup_query = """
+            SELECT feedback_type, rating, SUM(event_count) as count
+            FROM feedback_stats_daily
+            WHERE bucket >= :param_0 AND bucket <= :param_1
+            GROUP BY feedback_type, rating
             """
-            total_result = await self.db_manager.fetch_one(
-                total_query, {"start_date": start_date, "end_date": end_date}
+            rollup_results = await self.db_manager.fetch_all(
+                rollup_query, (start_date.date(), end_date.date()), pool="analytics"
             )
-            total_feedback = total_result["count"] if total_result else 0
 
-            # Get average rating
-            avg_query = """
-            SELECT AVG(rating) as avg_rating
-            FROM feedback_events
-            WHERE created_at >= :start_date AND created_at <= :end_date
-                AND rating IS NOT NULL
-            """
-            avg_result = await self.db_manager.fetch_one(
-                avg_query, {"start_date": start_date, "end_date": end_date}
-            )
-            average_rating = (
-                float(avg_result["avg_rating"])
-                if avg_result and avg_result["avg_rating"]
-                else 0.0
-            )
-
-            # Get feedback by type
-            type_query = """
-            SELECT feedback_type, COUNT(*) as count
-            FROM feedback_events
-            WHERE created_at >= :start_date AND created_at <= :end_date
-            GROUP BY feedback_type
-            """
-            type_results = await self.db_manager.fetch_all(
-                type_query, {"start_date": start_date, "end_date": end_date}
-            )
-            by_type = {row["feedback_type"]: row["count"] for row in type_results}
-
-            # Get feedback by rating
-            rating_query = """
-            SELECT rating, COUNT(*) as count
-            FROM feedback_events
-            WHERE created_at >= :start_date AND created_at <= :end_date
-                AND rating IS NOT NULL
-            GROUP BY rating
-            ORDER BY rating
-            """
-            rating_results = await self.db_manager.fetch_all(
-                rating_query, {"start_date": start_date, "end_date": end_date}
-            )
-            by_rating = {str(row["rating"]): row["count"] for row in rating_results}
+            total_feedback = 0
+            rated_count = 0
+            rating_sum = 0
+            by_type = {}
+            by_rating = {}
+            for row in rollup_results:
+                count = int(row["count"] or 0)
+                if count <= 0:
+                    continue
+                total_feedback += count
+                by_type[row["feedback_type"]] = by_type.get(row["feedback_type"], 0) + count
+                if row["rating"]:
+                    rated_count += count
+                    rating_sum += row["rating"] * count
+                    by_rating[str(row["rating"])] = by_rating.get(str(row["rating"]), 0) + count
+            average_rating = rating_sum / rated_count if rated_count else 0.0
+            by_rating = dict(sorted(by_rating.items()))
 
             # Get recent feedback
             recent_query = """
-            SELECT feedback_id, content_id, feedback_type, rating, comment, created_at
+            SELECT event_id as feedback_id, content_id, feedback_type, rating, comment, created_at
             FROM feedback_events
-            WHERE created_at >= :start_date AND created_at <= :end_date
+            WHERE created_at >= :param_0 AND created_at <= :param_1
             ORDER BY created_at DESC
             LIMIT 10
             """
             recent_results = await self.db_manager.fetch_all(
-                recent_query, {"start_date": start_date, "end_date": end_date}
+                recent_query, (start_date, end_date), pool="analytics"
             )
 
             recent_feedback = []
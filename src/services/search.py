@@ -148,7 +148,7 @@ class SearchService:
                 WHERE content_id = :content_id
                 """
                 result = await self.orchestrator.db_manager.fetch_one(
-                    query, {"content_id": content_id}
+                    query, {"content_id": content_id}, pool="search"
                 )
 
                 if result:
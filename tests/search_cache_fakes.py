@@ -0,0 +1,74 @@
+"""
+Search Cache Test Fakes
+Shared stand-ins for the search cache tests: an empty SearchResults payload,
+a Redis PubSub fed from a queue, and a CacheManager mock backed by a dict.
+"""
+
+import asyncio
+from typing import Any, Optional
+from unittest.mock import AsyncMock, Mock
+
+from src.database.connection import CacheManager, CachePipeline
+from src.search.models import SearchResults, SearchStrategy
+
+
+def make_results(workspace: str = "python-docs") -> SearchResults:
+    """Empty search results from one workspace"""
+    return SearchResults(
+        results=[],
+        total_count=0,
+        query_time_ms=12,
+        strategy_used=SearchStrategy.HYBRID,
+        cache_hit=False,
+        workspaces_searched=[workspace],
+        enrichment_triggered=False,
+    )
+
+
+class FakePubSub:
+    """Redis PubSub stand-in fed from an asyncio queue"""
+
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.closed = False
+
+    async def listen(self):
+        yield {"type": "subscribe", "data": 1}
+        while True:
+            yield await self.queue.get()
+
+    async def close(self):
+        self.closed = True
+
+
+def make_cache_manager(pubsub: Optional[Any] = None, lock_token: Optional[str] = "token") -> Mock:
+    """
+    CacheManager mock storing pipelined sets in a dict.
+
+    Values land in cache_manager.store and their TTLs in cache_manager.ttls.
+    subscribe() returns pubsub (None means Redis is unavailable) and
+    acquire_lock() returns lock_token.
+    """
+    cache_manager = Mock(spec=CacheManager)
+    cache_manager.store = {}
+    cache_manager.ttls = {}
+    cache_manager.get = AsyncMock(side_effect=lambda key: cache_manager.store.get(key))
+    cache_manager.delete = AsyncMock(side_effect=lambda key: cache_manager.store.pop(key, None))
+    cache_manager.increment = AsyncMock(return_value=1)
+    cache_manager.publish = AsyncMock(return_value=1)
+    cache_manager.subscribe = AsyncMock(return_value=pubsub)
+    cache_manager.acquire_lock = AsyncMock(return_value=lock_token)
+    cache_manager.release_lock = AsyncMock(return_value=True)
+
+    def pipeline():
+        def set_value(key, value, ttl):
+            cache_manager.store[key] = value
+            cache_manager.ttls[key] = ttl
+
+        pipe = Mock(spec=CachePipeline)
+        pipe.set = Mock(side_effect=set_value)
+        pipe.execute = AsyncMock(return_value=[])
+        return pipe
+
+    cache_manager.pipeline = Mock(side_effect=pipeline)
+    return cache_manager
@@ -0,0 +1,206 @@
+"""
+Analytics Rollup Tests
+Validates the trigger-maintained rollup tables (hourly search stats,
+per-technology document counts, daily feedback counts) created by the
+PostgreSQL initializer, and that the WebSocket analytics, /stats endpoint,
+content stats and feedback stats read them with a constant number of queries.
+"""
+
+import re
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.database.init_db_postgres import PostgreSQLInitializer
+from src.services.content import ContentService
+from src.services.feedback import FeedbackService
+from src.api.v1 import health_endpoints, websocket_endpoints
+
+
+class FakeDatabaseManager:
+    """DatabaseManager stand-in answering fetch_all by table name"""
+
+    def __init__(self, tables):
+        self.tables = tables
+        self.queries = []
+        self.pools = []
+
+    async def fetch_all(self, query, params=None, pool=None):
+        self.queries.append((query, params))
+        self.pools.append(pool)
+        table = re.search(r"FROM (\w+)", query).group(1)
+        return self.tables.get(table, [])
+
+    async def fetch_one(self, query, params=None, pool=None):
+        rows = await self.fetch_all(query, params, pool)
+        return rows[0] if rows else None
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return iter(self.rows)
+
+    def first(self):
+        return self.rows[0] if self.rows else None
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+class FakeSession:
+    """Async session stand-in answering ORM selects by table name"""
+
+    def __init__(self, tables, log):
+        self.tables, self.log = tables, log
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, params=None):
+        table = statement.get_final_froms()[0].name
+        self.log.append(table)
+        return FakeResult(self.tables.get(table, []))
+
+
+class TestRollupSchema:
+    """Test rollup DDL issued by the PostgreSQL initializer."""
+
+    def test_tables_functions_and_triggers_created(self):
+        """Test rollup tables, trigger functions and single-event triggers are created."""
+        conn = Mock()
+        initializer = PostgreSQLInitializer("postgresql+asyncpg://u:p@localhost/db")
+
+        initializer._create_rollups(conn)
+        initializer._rebuild_rollups(conn)
+
+        statements = [str(call.args[0]) for call in conn.execute.call_args_list]
+        sql = "\n".join(statements)
+        for table in ("search_stats_hourly", "content_counts", "feedback_stats_daily"):
+            assert f"CREATE TABLE IF NOT EXISTS {table}" in sql
+            assert f"INSERT INTO {table}" in sql
+        assert "TRUNCATE search_stats_hourly, content_counts, feedback_stats_daily" in sql
+        assert "ADD COLUMN IF NOT EXISTS quality_score_total" in sql
+
+        triggers = [s for s in statements if "CREATE OR REPLACE TRIGGER" in s]
+        assert len(triggers) == 7
+        for trigger in triggers:
+            event = re.search(r"AFTER (\w+) ON (\w+)", trigger)
+            assert event.group(2) in ("search_cache", "content_metadata", "feedback_events")
+            assert "FOR EACH STATEMENT" in trigger
+            assert ("new_rows" in trigger) == (event.group(1) in ("INSERT", "UPDATE"))
+            assert ("old_rows" in trigger) == (event.group(1) in ("DELETE", "UPDATE"))
+
+        # Each transition table is only referenced on the branch for its event
+        for function in [s for s in statements if "CREATE OR REPLACE FUNCTION" in s and "_update()" not in s]:
+            insert_branch, delete_branch = function.split("ELSE", 1)
+            assert "old_rows" not in insert_branch and "new_rows" not in delete_branch
+
+
+class TestRollupReaders:
+    """Test stats endpoints reading rollups."""
+
+    @pytest.mark.asyncio
+    async def test_content_stats_single_query(self):
+        """Test content stats are folded from the technology/workspace rollup."""
+        db = FakeDatabaseManager({"content_counts": [
+            {"technology": "react", "workspace": "frontend", "document_count": 40},
+            {"technology": "react", "workspace": "default", "document_count": 2},
+            {"technology": "python", "workspace": "default", "document_count": 10},
+        ]})
+
+        stats = await ContentService(db_manager=db).get_content_stats()
+
+        assert len(db.queries) == 1
+        assert db.pools == ["analytics"]
+        assert stats.total_documents == 52
+        assert stats.by_technology == {"react": 42, "python": 10}
+        assert stats.by_workspace == {"frontend": 40, "default": 12}
+
+    @pytest.mark.asyncio
+    async def test_feedback_stats_from_daily_rollup(self):
+        """Test totals, average rating and breakdowns come from one rollup query."""
+        db = FakeDatabaseManager({
+            "feedback_stats_daily": [
+                {"feedback_type": "helpful", "rating": 5, "count": 6},
+                {"feedback_type": "helpful", "rating": 4, "count": 2},
+                {"feedback_type": "outdated", "rating": 0, "count": 3},
+                {"feedback_type": "incorrect", "rating": 1, "count": 0},
+            ],
+            "feedback_events": [{
+                "feedback_id": "e1", "content_id": "doc-1", "feedback_type": "helpful",
+                "rating": 5, "comment": None, "created_at": datetime(2026, 1, 1),
+            }],
+        })
+
+        stats = await FeedbackService(db).get_feedback_stats(days=7)
+
+        assert len(db.queries) == 2
+        assert stats.total_feedback == 11
+        assert stats.average_rating == pytest.approx((6 * 5 + 2 * 4) / 8)
+        assert stats.by_type == {"helpful": 8, "outdated": 3}
+        assert stats.by_rating == {"4": 2, "5": 6}
+        assert stats.recent_feedback[0]["feedback_id"] == "e1"
+        start, end = db.queries[0][1]
+        assert end - start == timedelta(days=7)
+
+    @pytest.mark.asyncio
+    async def test_detailed_analytics_constant_queries(self):
+        """Test WebSocket analytics read hourly buckets instead of 24 hourly scans."""
+        current_hour = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+        hourly = [
+            SimpleNamespace(bucket=current_hour, search_count=4, searches_with_results=3,
+                            total_execution_time_ms=200),
+            SimpleNamespace(bucket=current_hour - timedelta(hours=5), search_count=6,
+                            searches_with_results=6, total_execution_time_ms=600),
+        ]
+        log = []
+        tables = {
+            "search_stats_hourly": hourly,
+            "search_cache": [("react hooks", 7)],
+            "content_counts": [("react", 42)],
+        }
+        db_manager = SimpleNamespace(session_factory=lambda: FakeSession(tables, log))
+
+        with patch.object(websocket_endpoints, "get_database_manager", return_value=db_manager):
+            data = await websocket_endpoints.get_detailed_analytics_data("24h")
+
+        assert log == ["search_stats_hourly", "search_cache", "content_counts"]
+        metrics = data["searchMetrics"]
+        assert (metrics["totalSearches"], metrics["successRate"]) == (10, 0.9)
+        assert len(metrics["queriesByHour"]) == 24
+        assert metrics["queriesByHour"][-1] == {"count": 4, "responseTime": 50}
+        assert metrics["queriesByHour"][-6] == {"count": 6, "responseTime": 100}
+        assert data["contentMetrics"]["documentsByTechnology"] == [{"technology": "react", "count": 42}]
+
+    @pytest.mark.asyncio
+    async def test_stats_endpoint_reads_rollups(self):
+        """Test /stats sums the rollups and only looks up the latest update in content_metadata."""
+        last_update = datetime(2026, 3, 1)
+        db = FakeDatabaseManager({
+            "search_stats_hourly": [{"total_searches": 10, "total_execution_time_ms": 800}],
+            "content_counts": [{
+                "total_documents": 4, "total_chunks": 30, "quality_score_total": 3.0, "workspaces": 2,
+            }],
+            "content_metadata": [{"last_enrichment": last_update}],
+        })
+
+        stats = await health_endpoints.get_stats(Mock(), db_manager=db, cache_manager=None)
+
+        assert [re.search(r"FROM (\w+)", query).group(1) for query, _ in db.queries] == [
+            "search_stats_hourly", "content_counts", "content_metadata",
+        ]
+        assert "COUNT(" not in db.queries[0][0] and "MAX(updated_at)" in db.queries[2][0]
+        assert set(db.pools) == {"analytics"}
+        assert (stats.search_stats["total_searches"], stats.search_stats["avg_response_time_ms"]) == (10, 80)
+        assert stats.content_stats == {
+            "total_documents": 4, "total_chunks": 30, "avg_quality_score": 0.75,
+            "workspaces": 2, "last_enrichment": last_update,
+        }
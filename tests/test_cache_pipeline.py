@@ -0,0 +1,169 @@
+"""
+Cache Pipeline Tests
+Validates CacheManager bulk operations (MGET, pipelined SETEX) and that the
+search caches issue one Redis round trip per batch instead of one per key.
+"""
+
+import gzip
+import json
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from src.database.connection import CacheManager, CachePipeline
+from src.search.cache import SearchCacheManager
+from src.search.models import SearchQuery, SearchStrategy
+from src.search.optimized_cache import OptimizedCacheManager
+from tests.search_cache_fakes import make_results
+
+
+class FakeRedisPipeline:
+    """Records queued commands and counts execute() round trips"""
+
+    def __init__(self, owner):
+        self.owner = owner
+        self.commands = []
+
+    def setex(self, key, ttl, data):
+        self.commands.append(("setex", key, ttl, data))
+
+    def incr(self, key):
+        self.commands.append(("incr", key))
+
+    def expire(self, key, seconds):
+        self.commands.append(("expire", key, seconds))
+
+    def delete(self, key):
+        self.commands.append(("delete", key))
+
+    async def execute(self):
+        self.owner.round_trips += 1
+        self.owner.executed.extend(self.commands)
+        for command in self.commands:
+            if command[0] == "setex":
+                self.owner.store[command[1]] = command[3]
+        return [True] * len(self.commands)
+
+
+class FakeRedis:
+    """Minimal redis.asyncio stand-in with bytes storage"""
+
+    def __init__(self):
+        self.store = {}
+        self.executed = []
+        self.round_trips = 0
+
+    def pipeline(self, transaction=True):
+        return FakeRedisPipeline(self)
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.store.get(key) for key in keys]
+
+    async def get(self, key):
+        self.round_trips += 1
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, data):
+        self.round_trips += 1
+        self.store[key] = data
+
+
+@pytest.fixture
+def cache_manager():
+    manager = CacheManager({"host": "localhost", "port": 6379})
+    manager.redis_client = FakeRedis()
+    manager._connected = True
+    return manager
+
+
+class TestCacheManagerBulkOperations:
+    """Test mget, mset_with_ttl and pipeline on CacheManager."""
+
+    @pytest.mark.asyncio
+    async def test_mset_with_ttl_single_round_trip_with_prefix_encoding(self, cache_manager):
+        """Test bulk set is one round trip and compresses by key prefix."""
+        await cache_manager.mset_with_ttl(
+            {"search:results:a": {"n": 1}, "search:results:b": {"n": 2}, "plain:c": {"n": 3}},
+            ttl=120,
+        )
+
+        redis_client = cache_manager.redis_client
+        assert redis_client.round_trips == 1
+        assert all(cmd[0] == "setex" and cmd[2] == 120 for cmd in redis_client.executed)
+        assert json.loads(gzip.decompress(redis_client.store["search:results:a"])) == {"n": 1}
+        assert json.loads(redis_client.store["plain:c"]) == {"n": 3}
+
+    @pytest.mark.asyncio
+    async def test_mget_decodes_and_skips_missing(self, cache_manager):
+        """Test bulk get decodes both encodings and omits misses."""
+        await cache_manager.mset_with_ttl({"search:results:a": [1, 2], "plain:b": "x"}, ttl=60)
+        cache_manager.redis_client.round_trips = 0
+
+        values = await cache_manager.mget(["search:results:a", "plain:b", "missing"])
+
+        assert values == {"search:results:a": [1, 2], "plain:b": "x"}
+        assert cache_manager.redis_client.round_trips == 1
+        assert await cache_manager.get("search:results:a") == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_pipeline_degrades_gracefully(self, cache_manager):
+        """Test connection failures during execute do not raise."""
+        failing_pipe = Mock()
+        failing_pipe.execute = AsyncMock(side_effect=ConnectionError("redis down"))
+        cache_manager.redis_client.pipeline = Mock(return_value=failing_pipe)
+
+        pipe = cache_manager.pipeline()
+        assert isinstance(pipe, CachePipeline)
+        pipe.set("k", 1, 10).increment("counter").expire("counter", 10)
+
+        assert await pipe.execute() == []
+        assert cache_manager._connected is False
+        assert len(pipe) == 0
+
+    @pytest.mark.asyncio
+    async def test_empty_operations_skip_redis(self, cache_manager):
+        """Test empty batches make no round trips."""
+        assert await cache_manager.mget([]) == {}
+        await cache_manager.mset_with_ttl({}, ttl=10)
+        assert await cache_manager.pipeline().execute() == []
+        assert cache_manager.redis_client.round_trips == 0
+
+
+class TestSearchCachePipelining:
+    """Test search caches use batched round trips."""
+
+    @pytest.mark.asyncio
+    async def test_cache_results_stores_results_and_analytics_together(self, cache_manager):
+        """Test result set and analytics are written in one round trip."""
+        search_cache = SearchCacheManager(cache_manager)
+        query = SearchQuery(query="fastapi routing", strategy=SearchStrategy.HYBRID)
+
+        await search_cache.cache_results(query, make_results(), ttl_seconds=300)
+
+        redis_client = cache_manager.redis_client
+        cache_key = search_cache._generate_cache_key(query)
+        assert redis_client.round_trips == 1
+        assert {cmd[1] for cmd in redis_client.executed} == {
+            cache_key, f"search:analytics:{cache_key}"
+        }
+        cached = json.loads(gzip.decompress(redis_client.store[cache_key]))
+        assert cached["query_hash"] == cache_key
+        analytics = json.loads(redis_client.store[f"search:analytics:{cache_key}"])
+        assert analytics["query"] == "fastapi routing"
+
+    @pytest.mark.asyncio
+    async def test_optimized_cache_batch_uses_bulk_l2(self, cache_manager):
+        """Test OptimizedCacheManager batch get/set make one L2 round trip each."""
+        optimized = OptimizedCacheManager(cache_manager)
+        items = {f"search:results:{i}": {"value": i} for i in range(10)}
+
+        assert await optimized.set_batch(items, ttl=60)
+        assert cache_manager.redis_client.round_trips == 1
+
+        optimized.l1_cache.cache.clear()
+        cache_manager.redis_client.round_trips = 0
+        results = await optimized.get_batch(list(items))
+
+        assert results == items
+        assert cache_manager.redis_client.round_trips == 1
+        await optimized.close()
@@ -0,0 +1,177 @@
+"""
+Search Cache Warming Tests
+Validates that popular queries from search history are replayed into the
+search cache at bounded concurrency, gated by the off-peak window, and that
+warming is wired into background jobs and cache flushes.
+"""
+
+import asyncio
+from datetime import datetime
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.api.utils.cache_manager import CacheManager as LogCacheManager
+from src.background_jobs.jobs import CacheWarmingJob
+from src.background_jobs.models import JobConfig, JobExecution, JobSchedule, JobType, Context7JobConfig
+from src.core.config.models import SearchCacheConfig
+from src.search.cache import SearchCacheManager
+from src.search.cache_warming import SearchCacheWarmer
+from src.search.models import SearchQuery
+from src.search.orchestrator import SearchOrchestrator
+from tests.search_cache_fakes import make_cache_manager, make_results
+
+
+def _history_rows():
+    return [
+        {"original_query": "FastAPI routing", "technology_hint": "python",
+         "workspace_slugs": '["python-docs"]', "access_count": 40},
+        {"original_query": "fastapi routing ", "technology_hint": "python",
+         "workspace_slugs": ["python-docs"], "access_count": 12},
+        {"original_query": "react hooks", "technology_hint": None,
+         "workspace_slugs": None, "access_count": 9},
+        {"original_query": "", "technology_hint": None, "workspace_slugs": None, "access_count": 5},
+    ]
+
+
+class TestSearchCacheWarming:
+    """Test SearchCacheManager.warm_cache and SearchCacheWarmer."""
+
+    @pytest.mark.asyncio
+    async def test_warm_cache_bounds_concurrency_and_skips_fresh(self):
+        """Test replays are capped at max_concurrency and cached queries are skipped."""
+        cache_manager = make_cache_manager()
+        search_cache = SearchCacheManager(cache_manager, SearchCacheConfig(local_cache_enabled=False))
+        cached = SearchQuery(query="already cached")
+        await search_cache.cache_results(cached, make_results())
+
+        in_flight = 0
+        peak = 0
+
+        async def search(query):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if query.query == "broken":
+                raise RuntimeError("search failed")
+            await search_cache.cache_results(query, make_results())
+
+        queries = [cached, SearchQuery(query="broken")] + [
+            SearchQuery(query=f"query {i}") for i in range(8)
+        ]
+        warmed = await search_cache.warm_cache(queries, search_func=search, max_concurrency=3)
+
+        assert warmed == 8
+        assert peak == 3
+        assert await search_cache._is_fresh(SearchQuery(query="query 7"))
+
+    @pytest.mark.asyncio
+    async def test_load_hot_queries_dedupes_history(self):
+        """Test history rows become distinct SearchQuery objects in popularity order."""
+        db_manager = Mock()
+        db_manager.fetch_all = AsyncMock(return_value=_history_rows())
+        warmer = SearchCacheWarmer(db_manager, Mock(), SearchCacheConfig(warming_query_limit=50))
+
+        queries = await warmer.load_hot_queries()
+
+        assert [q.query for q in queries] == ["FastAPI routing", "react hooks"]
+        assert queries[0].workspace_slugs == ["python-docs"]
+        params = db_manager.fetch_all.call_args.args[1]
+        assert (params["limit"], params["min_access_count"]) == (50, 2)
+        assert "FROM search_cache" in db_manager.fetch_all.call_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_off_peak_gate(self):
+        """Test scheduled runs outside the window are skipped unless forced."""
+        config = SearchCacheConfig(warming_off_peak_start_hour=22, warming_off_peak_end_hour=4)
+        orchestrator = Mock()
+        orchestrator.search_cache.warm_cache = AsyncMock(return_value=0)
+        db_manager = Mock()
+        db_manager.fetch_all = AsyncMock(return_value=[])
+        warmer = SearchCacheWarmer(db_manager, orchestrator, config)
+
+        assert warmer.is_off_peak(datetime(2024, 1, 1, 23))
+        assert warmer.is_off_peak(datetime(2024, 1, 1, 3))
+        assert not warmer.is_off_peak(datetime(2024, 1, 1, 12))
+
+        warmer.is_off_peak = Mock(return_value=False)
+        assert (await warmer.warm())["skipped_because"] == "peak_hours"
+        orchestrator.search_cache.warm_cache.assert_not_awaited()
+
+        result = await warmer.warm(force=True, reason="startup")
+        assert (result["status"], result["reason"]) == ("completed", "startup")
+        orchestrator.search_cache.warm_cache.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_replays_through_execute_search_and_rewarms_after_flush(self):
+        """Test warming goes through execute_search and a full flush triggers a re-warm."""
+        db_manager = Mock()
+        db_manager.fetch_all = AsyncMock(return_value=_history_rows())
+        orchestrator = SearchOrchestrator(
+            db_manager=db_manager, cache_manager=make_cache_manager(), weaviate_client=Mock()
+        )
+        orchestrator._execute_search_pipeline = AsyncMock(return_value=make_results())
+
+        result = await orchestrator.cache_warmer.warm(force=True)
+
+        assert (result["candidates"], result["warmed"]) == (2, 2)
+        assert orchestrator._execute_search_pipeline.await_count == 2
+
+        # A full flush schedules a forced re-warm in the background
+        orchestrator.cache_warmer.warm = AsyncMock(return_value={"status": "completed"})
+        await orchestrator.search_cache.invalidate_cache()
+        await asyncio.sleep(0)
+        orchestrator.cache_warmer.warm.assert_awaited_once_with(force=True, reason="cache_flush")
+        await orchestrator.search_cache.close()
+
+
+class TestCacheWarmingJob:
+    """Test the background job wrapper."""
+
+    @pytest.mark.asyncio
+    async def test_job_passes_parameters_and_reports_status(self):
+        """Test the job forwards parameters and respects the off-peak flag."""
+        orchestrator = Mock()
+        orchestrator.cache_warmer.warm = AsyncMock(return_value={"status": "completed", "warmed": 3})
+        job = CacheWarmingJob(Mock(), Mock(), Mock(), Context7JobConfig(), orchestrator)
+        job_config = JobConfig(
+            job_id="search-cache-warming",
+            job_type=JobType.CACHE_WARMING,
+            job_name="Search Cache Warming",
+            schedule=JobSchedule(schedule_type="interval", interval_hours=1),
+            parameters={"limit": 10, "respect_off_peak": False},
+        )
+        execution = JobExecution(execution_id="e1", job_id=job_config.job_id, correlation_id="c1")
+
+        result = await job.execute(job_config, execution)
+
+        assert (result["status"], result["warmed"]) == ("completed", 3)
+        kwargs = orchestrator.cache_warmer.warm.call_args.kwargs
+        assert (kwargs["limit"], kwargs["force"]) == (10, True)
+
+        orchestrator.cache_warmer.warm = AsyncMock(return_value={"status": "failed", "error": "db down"})
+        assert (await job.execute(job_config, execution))["status"] == "failed"
+
+
+class TestLogCacheWarming:
+    """Test the AI log cache warm-up."""
+
+    @pytest.mark.asyncio
+    async def test_warm_cache_loads_missing_entries(self):
+        """Test only uncached queries are loaded and stored."""
+        cache = LogCacheManager()
+        redis_client = Mock()
+        existing = cache.generate_cache_key({"service": "api"})
+        redis_client.exists = AsyncMock(side_effect=lambda key: int(key == existing))
+        redis_client.setex = AsyncMock()
+        cache._redis_client = redis_client
+        loader = AsyncMock(side_effect=lambda params: {"logs": [params["service"]]})
+
+        warmed = await cache.warm_cache(
+            [{"service": "api"}, {"service": "worker"}, {"service": "db"}], loader=loader
+        )
+
+        assert warmed == 2
+        assert loader.await_count == 2
+        assert redis_client.setex.await_count == 2
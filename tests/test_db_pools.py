@@ -0,0 +1,198 @@
+"""
+Database Pool Routing Tests
+Validates the named connection pools of the API DatabaseManager: per-pool
+engine sizing and timeouts, routing of hinted read-only queries to the read
+replica, isolation of a saturated pool from the others, and per-pool
+connection wait metrics.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import MagicMock, patch
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from src.database import connection
+from src.database.connection import DatabaseManager, pool_settings
+
+PRIMARY_URL = "postgresql+asyncpg://u:p@primary/db"
+REPLICA_URL = "postgresql+asyncpg://u:p@replica/db"
+
+
+class FakeResult:
+    def __init__(self, target):
+        self.target = target
+
+    def fetchone(self):
+        return MagicMock(_mapping={"target": self.target})
+
+    def fetchall(self):
+        return [MagicMock(_mapping={"target": self.target})]
+
+
+class FakePool:
+    """Connection pool stand-in with a fixed number of connections"""
+
+    def __init__(self, size=10, error=None):
+        self.slots = asyncio.Semaphore(size)
+        self.error = error
+
+
+class FakeSession:
+    """Async session stand-in checking a connection out of a FakePool"""
+
+    def __init__(self, target, pool, log):
+        self.target, self.pool, self.log = target, pool, log
+        self.holding = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        if self.holding:
+            self.pool.slots.release()
+        return False
+
+    async def connection(self):
+        if self.pool.error:
+            raise self.pool.error
+        await self.pool.slots.acquire()
+        self.holding = True
+
+    async def execute(self, statement, params=None):
+        self.log.append((self.target, str(statement)))
+        if params and "delay" in params:
+            await asyncio.sleep(params["delay"])
+        return FakeResult(self.target)
+
+    async def commit(self):
+        pass
+
+
+def _factory(target, log, pool=None):
+    pool = pool or FakePool()
+    return lambda: FakeSession(target, pool, log)
+
+
+def _manager(replica=True, pools=None):
+    """Connected manager whose pools are fake session factories"""
+    pools = pools or {}
+    manager = DatabaseManager(PRIMARY_URL)
+    manager.replica_url = REPLICA_URL if replica else None
+    manager._connected = True
+    manager.log = []
+    manager.session_factory = _factory("default", manager.log, pools.get("default"))
+    for name in ("search", "analytics", "jobs"):
+        manager._session_factories[(name, False)] = _factory(f"{name}-primary", manager.log, pools.get(name))
+        if replica:
+            manager._session_factories[(name, True)] = _factory(f"{name}-replica", manager.log, pools.get(name))
+    return manager
+
+
+class TestPoolEngines:
+    """Test engine creation per named pool."""
+
+    def test_pool_settings_env_override(self, monkeypatch):
+        """Test DATABASE_POOL_<NAME>_* overrides only the named setting."""
+        monkeypatch.setenv("DATABASE_POOL_SEARCH_SIZE", "25")
+        monkeypatch.setenv("DATABASE_POOL_SEARCH_TIMEOUT", "2")
+
+        settings = pool_settings("search")
+
+        assert settings["size"] == 25 and settings["timeout"] == 2
+        assert settings["max_overflow"] == connection.POOL_DEFAULTS["search"]["max_overflow"]
+        assert pool_settings("default")["size"] == 10
+
+    @pytest.mark.asyncio
+    async def test_connect_creates_sized_engines(self, monkeypatch):
+        """Test one engine per pool plus replica engines, all disposed on disconnect."""
+        monkeypatch.setenv("DATABASE_READ_REPLICA_URL", REPLICA_URL)
+        monkeypatch.setenv("DATABASE_POOL_JOBS_COMMAND_TIMEOUT", "900")
+        engines = []
+
+        def create_engine(url, **kwargs):
+            engine = MagicMock()
+            engine.begin.return_value.__aenter__.return_value.execute = MagicMock(
+                side_effect=lambda *_: asyncio.sleep(0)
+            )
+            engine.dispose = MagicMock(side_effect=lambda: asyncio.sleep(0))
+            engines.append((url, kwargs, engine))
+            return engine
+
+        manager = DatabaseManager(PRIMARY_URL)
+        with patch.object(connection, "create_async_engine", side_effect=create_engine):
+            await manager.connect()
+
+        created = {
+            (kwargs["connect_args"]["server_settings"]["application_name"], url): kwargs
+            for url, kwargs, _ in engines
+        }
+        assert len(engines) == 7
+        assert ("docaiche", REPLICA_URL) not in created
+        default = created[("docaiche", PRIMARY_URL)]
+        assert (default["pool_size"], default["max_overflow"]) == (10, 20)
+        search = created[("docaiche-search", REPLICA_URL)]
+        assert (search["pool_size"], search["pool_timeout"]) == (10, 5)
+        assert created[("docaiche-jobs", PRIMARY_URL)]["connect_args"]["command_timeout"] == 900
+
+        await manager.disconnect()
+        assert all(engine.dispose.called for _, _, engine in engines)
+        assert manager._session_factories == {}
+
+
+class TestPoolRouting:
+    """Test fetch hints selecting pools and the read replica."""
+
+    @pytest.mark.asyncio
+    async def test_hinted_reads_use_replica(self):
+        """Test hinted SELECTs go to the replica and everything else to a primary."""
+        manager = _manager()
+
+        assert (await manager.fetch_one("SELECT 1", pool="search"))["target"] == "search-replica"
+        assert (await manager.fetch_all("WITH t AS (SELECT 1) SELECT * FROM t", pool="analytics"))[0]["target"] == "analytics-replica"
+        assert (await manager.fetch_one("INSERT INTO t VALUES (1) RETURNING id", pool="jobs"))["target"] == "jobs-primary"
+        assert (await manager.fetch_one("SELECT 1"))["target"] == "default"
+        await manager.execute("DELETE FROM t")
+        assert manager.log[-1][0] == "default"
+
+    @pytest.mark.asyncio
+    async def test_no_replica_and_unknown_pool(self):
+        """Test hinted reads stay on the pool's primary without a replica; unknown hints fail."""
+        manager = _manager(replica=False)
+
+        assert (await manager.fetch_one("SELECT 1", pool="search"))["target"] == "search-primary"
+        with pytest.raises(ValueError, match="Unknown database pool"):
+            await manager.fetch_one("SELECT 1", pool="reporting")
+
+
+class TestPoolWaitMetrics:
+    """Test per-pool wait time metrics and isolation."""
+
+    @pytest.mark.asyncio
+    async def test_saturated_pool_does_not_block_search(self):
+        """Test a busy analytics pool queues its own callers while search is served at once."""
+        manager = _manager(pools={"analytics": FakePool(size=1), "search": FakePool(size=1)})
+
+        slow = asyncio.create_task(
+            manager.fetch_all("SELECT * FROM search_cache WHERE :delay > 0", {"delay": 0.1}, pool="analytics")
+        )
+        await asyncio.sleep(0.01)
+        queued = asyncio.create_task(manager.fetch_all("SELECT 2", pool="analytics"))
+        await manager.fetch_one("SELECT 1", pool="search")
+        await asyncio.gather(slow, queued)
+
+        stats = manager.get_pool_stats()
+        assert stats["search"]["checkouts"] == 1 and stats["search"]["wait_ms_max"] < 50
+        assert stats["analytics"]["checkouts"] == 2 and stats["analytics"]["wait_ms_max"] >= 80
+        assert stats["analytics"]["pool_size"] == connection.POOL_DEFAULTS["analytics"]["size"]
+        assert stats["jobs"]["checkouts"] == 0 and stats["jobs"]["wait_ms_avg"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_pool_timeout_counted(self):
+        """Test a pool checkout timeout is counted against its pool and re-raised."""
+        manager = _manager(pools={"jobs": FakePool(error=PoolTimeoutError("QueuePool limit reached"))})
+
+        with pytest.raises(PoolTimeoutError):
+            await manager.fetch_all("SELECT 1", pool="jobs")
+
+        stats = manager.get_pool_stats()
+        assert (stats["jobs"]["timeouts"], stats["jobs"]["checkouts"]) == (1, 0)
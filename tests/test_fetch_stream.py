@@ -0,0 +1,182 @@
+"""
+Streaming Fetch Tests
+Validates DatabaseManager.fetch_stream and fetch_columns: rows are read from
+a server-side cursor chunk by chunk (at most one chunk ahead of the
+consumer), column arrays are built without per-row dicts, and the document
+refresh job and ingestion metrics consume them.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.database.connection import DatabaseManager
+from src.database import manager as legacy_manager
+from src.background_jobs.jobs import DocumentRefreshJob
+from src.background_jobs.models import Context7JobConfig
+from src.ingestion.pipeline import IngestionPipeline
+
+
+class FakeStreamResult:
+    """AsyncResult stand-in producing rows lazily, recording how many were fetched"""
+
+    def __init__(self, keys, rows, state):
+        self._keys = keys
+        self._rows = rows
+        self._state = state
+        self._as_mappings = False
+
+    def keys(self):
+        return self._keys
+
+    def mappings(self):
+        self._as_mappings = True
+        return self
+
+    async def partitions(self, size):
+        for start in range(0, len(self._rows), size):
+            chunk = self._rows[start:start + size]
+            self._state["fetched"] += len(chunk)
+            if self._as_mappings:
+                yield [dict(zip(self._keys, row)) for row in chunk]
+            else:
+                yield chunk
+
+
+class FakeSession:
+    """Async session stand-in supporting stream()"""
+
+    def __init__(self, keys, rows, state):
+        self.keys, self.rows, self.state = keys, rows, state
+
+    async def __aenter__(self):
+        return self
+
+    async def connection(self):
+        return None
+
+    async def __aexit__(self, *exc):
+        self.state["closed"] = True
+        return False
+
+    async def stream(self, statement, params=None, execution_options=None):
+        self.state["statement"] = str(statement)
+        self.state["params"] = params
+        self.state["execution_options"] = execution_options
+        return FakeStreamResult(self.keys, self.rows, self.state)
+
+
+def _manager(manager_class, keys, rows):
+    manager = manager_class("postgresql+asyncpg://u:p@localhost/db")
+    manager._connected = True
+    manager.state = {"fetched": 0, "closed": False}
+    manager.session_factory = lambda: FakeSession(keys, rows, manager.state)
+    return manager
+
+
+class TestFetchStream:
+    """Test server-side cursor streaming."""
+
+    @pytest.mark.asyncio
+    async def test_rows_streamed_in_chunks(self):
+        """Test rows arrive before the scan completes, one chunk at a time."""
+        rows = [(f"doc-{i}", i) for i in range(2500)]
+        manager = _manager(DatabaseManager, ["content_id", "word_count"], rows)
+
+        stream = manager.fetch_stream("SELECT content_id, word_count FROM content_metadata WHERE technology = ?",
+                                      ("react",), chunk_size=100)
+        first = await stream.__anext__()
+
+        assert first == {"content_id": "doc-0", "word_count": 0}
+        assert manager.state["fetched"] == 100
+        assert manager.state["execution_options"] == {"yield_per": 100}
+        assert manager.state["params"] == {"param_0": "react"}
+
+        seen = 1
+        async for row in stream:
+            seen += 1
+            assert manager.state["fetched"] - seen < 100
+        assert seen == 2500
+        assert manager.state["closed"]
+
+    @pytest.mark.asyncio
+    async def test_early_exit_releases_session(self):
+        """Test closing the generator early stops fetching and closes the session."""
+        manager = _manager(DatabaseManager, ["content_id"], [(f"doc-{i}",) for i in range(1000)])
+
+        stream = manager.fetch_stream("SELECT content_id FROM content_metadata", chunk_size=50)
+        async for row in stream:
+            if row["content_id"] == "doc-10":
+                break
+        await stream.aclose()
+
+        assert manager.state["fetched"] == 50
+        assert manager.state["closed"]
+
+    @pytest.mark.asyncio
+    async def test_legacy_manager_streams_named_params(self):
+        """Test the jobs DatabaseManager streams with dict or tuple parameters."""
+        manager = _manager(legacy_manager.DatabaseManager, ["content_id"], [("a",), ("b",)])
+
+        rows = [row async for row in manager.fetch_stream("SELECT content_id FROM t WHERE w = :w", {"w": "x"})]
+        assert rows == [{"content_id": "a"}, {"content_id": "b"}]
+        assert manager.state["params"] == {"w": "x"}
+
+        [row async for row in manager.fetch_stream("SELECT content_id FROM t WHERE w = :param_0", ("x",))]
+        assert manager.state["params"] == {"param_0": "x"}
+
+
+class TestFetchColumns:
+    """Test column array fetches."""
+
+    @pytest.mark.asyncio
+    async def test_columns_built_across_chunks(self):
+        """Test every chunk is appended to its column and empty results keep keys."""
+        rows = [("react", i) for i in range(250)]
+        manager = _manager(DatabaseManager, ["technology", "count"], rows)
+
+        columns = await manager.fetch_columns("SELECT technology, count FROM t", chunk_size=100)
+
+        assert list(columns) == ["technology", "count"]
+        assert columns["count"] == list(range(250))
+        assert manager.state["fetched"] == 250
+
+        manager = _manager(DatabaseManager, ["technology", "count"], [])
+        assert await manager.fetch_columns("SELECT technology, count FROM t") == {"technology": [], "count": []}
+
+
+class TestStreamingConsumers:
+    """Test jobs and analytics using the streaming fetch API."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_candidates_filtered_while_streaming(self):
+        """Test only candidates passing the quality filter are kept."""
+        rows = [
+            (f"doc-{i}", {"quality_score": i / 10}, None, None) for i in range(10)
+        ]
+        manager = _manager(legacy_manager.DatabaseManager,
+                           ["content_id", "enrichment_metadata", "created_at", "updated_at"], rows)
+        job = DocumentRefreshJob(Mock(), Mock(), manager, Mock(), Context7JobConfig())
+
+        candidates = await job._get_refresh_candidates("react-docs", 7, 30, 0.7, "corr")
+
+        assert [c["content_id"] for c in candidates] == ["doc-7", "doc-8", "doc-9"]
+        assert manager.state["params"]["workspace"] == "react-docs"
+
+    @pytest.mark.asyncio
+    async def test_processing_metrics_from_columns(self):
+        """Test ingestion metrics zip column arrays into distributions."""
+        db = Mock()
+        db.fetch_one = AsyncMock(side_effect=[(90,), (10,)])
+        db.fetch_columns = AsyncMock(side_effect=[
+            {"format": ["pdf", "md"], "count": [60, 30]},
+            {"technology": ["react"], "count": [90]},
+            {"quality_range": ["high", "low"], "count": [80, 10]},
+        ])
+        pipeline = IngestionPipeline(Mock(), Mock(), db)
+
+        metrics = await pipeline.get_processing_metrics()
+
+        assert metrics.documents_by_format == {"pdf": 60, "md": 30}
+        assert metrics.documents_by_technology == {"react": 90}
+        assert metrics.quality_score_distribution == {"high": 80, "low": 10}
+        assert metrics.success_rate == pytest.approx(90.0)
@@ -0,0 +1,160 @@
+"""
+Hybrid Retrieval Tests
+Validates BM25/hybrid tenant queries selected by per-strategy alpha and
+reciprocal-rank fusion of workspace result lists.
+"""
+
+from datetime import datetime
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.clients.weaviate_client import WeaviateVectorClient
+from src.core.config.models import HybridSearchConfig, WeaviateConfig
+from src.search.models import SearchStrategy, WorkspaceInfo
+from src.search.strategies import WorkspaceSearchStrategy
+
+
+def _make_config(**overrides) -> WeaviateConfig:
+    params = {"endpoint": "http://localhost:8080", "api_key": "test-api-key-123"}
+    params.update(overrides)
+    return WeaviateConfig(**params)
+
+
+def _make_object(index: int, score: float = 0.5) -> Mock:
+    obj = Mock()
+    obj.properties = {"content": f"chunk {index}", "document_id": f"doc{index}", "chunk_id": f"c{index}"}
+    obj.metadata = Mock(distance=None, certainty=None, score=score)
+    obj.uuid = f"uuid-{index}"
+    return obj
+
+
+def _attach_tenants(client: WeaviateVectorClient) -> Mock:
+    tenant_collection = Mock()
+    for method in ("near_vector", "near_text", "hybrid", "bm25"):
+        setattr(
+            tenant_collection.query, method,
+            AsyncMock(return_value=Mock(objects=[_make_object(0, score=0.8)])),
+        )
+    collection = Mock()
+    collection.with_tenant.return_value = tenant_collection
+    client.client = Mock()
+    client.client.collections.get.return_value = collection
+    return tenant_collection
+
+
+def _workspace(slug: str, relevance: float = 0.0) -> WorkspaceInfo:
+    return WorkspaceInfo(
+        slug=slug, technology="python", relevance_score=relevance, last_updated=datetime.utcnow()
+    )
+
+
+def _raw(doc_id: str) -> dict:
+    return {"content": f"content {doc_id}", "metadata": {"document_id": doc_id}, "id": doc_id}
+
+
+class FakeBatchedClient:
+    """Vector client stand-in providing multi-workspace search"""
+
+    def __init__(self, results_by_workspace):
+        self.results_by_workspace = results_by_workspace
+        self.calls = []
+
+    async def search_workspaces(self, workspace_slugs, query, **kwargs):
+        self.calls.append(kwargs)
+        return self.results_by_workspace
+
+
+class TestHybridTenantQueries:
+    """Test WeaviateVectorClient query selection by alpha."""
+
+    @pytest.mark.asyncio
+    async def test_hybrid_query_reuses_embedded_vector(self):
+        """Test 0 < alpha < 1 issues one hybrid query per tenant with the shared vector."""
+        embedder = AsyncMock(return_value=[0.1, 0.2])
+        client = WeaviateVectorClient(_make_config(), query_embedder=embedder)
+        tenant_collection = _attach_tenants(client)
+
+        results = await client.search_workspaces(["ws-a", "ws-b"], "AsyncSession.execute", limit=5, alpha=0.4)
+
+        embedder.assert_awaited_once()
+        assert tenant_collection.query.hybrid.await_count == 2
+        tenant_collection.query.near_vector.assert_not_awaited()
+        kwargs = tenant_collection.query.hybrid.call_args.kwargs
+        assert (kwargs["query"], kwargs["vector"], kwargs["alpha"]) == ("AsyncSession.execute", [0.1, 0.2], 0.4)
+        assert results["ws-a"][0]["metadata"]["score"] == 0.8
+
+    @pytest.mark.asyncio
+    async def test_zero_alpha_is_pure_bm25_without_embedding(self):
+        """Test alpha 0 issues BM25 queries and skips query embedding."""
+        embedder = AsyncMock(return_value=[0.1])
+        client = WeaviateVectorClient(_make_config(), query_embedder=embedder)
+        tenant_collection = _attach_tenants(client)
+
+        await client.search_workspaces(["ws-a"], "--no-cache", alpha=0.0)
+        await client.search_workspace("ws-b", "ECONNREFUSED", alpha=0.0)
+
+        embedder.assert_not_awaited()
+        assert tenant_collection.query.bm25.await_count == 2
+        tenant_collection.query.hybrid.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_default_and_full_alpha_keep_vector_search(self):
+        """Test alpha None or 1 keeps the pure vector path."""
+        client = WeaviateVectorClient(_make_config(), query_embedder=AsyncMock(return_value=[0.1]))
+        tenant_collection = _attach_tenants(client)
+
+        await client.search_workspaces(["ws-a"], "query")
+        await client.search_workspaces(["ws-a"], "query", alpha=1.0)
+        await client.search_workspace("ws-a", "query")
+
+        assert tenant_collection.query.near_vector.await_count == 2
+        tenant_collection.query.near_text.assert_awaited_once()
+        tenant_collection.query.hybrid.assert_not_awaited()
+
+
+class TestReciprocalRankFusion:
+    """Test WorkspaceSearchStrategy alpha resolution and RRF."""
+
+    def test_alpha_resolved_per_strategy(self):
+        """Test configured alphas apply per strategy and hybrid can be disabled."""
+        strategy = WorkspaceSearchStrategy(Mock(), Mock())
+        assert strategy._resolve_alpha(SearchStrategy.HYBRID) == 0.5
+        assert strategy._resolve_alpha(SearchStrategy.METADATA) == 0.0
+        assert strategy._resolve_alpha(None) is None
+
+        disabled = WorkspaceSearchStrategy(Mock(), Mock(), HybridSearchConfig(enabled=False))
+        assert disabled._resolve_alpha(SearchStrategy.HYBRID) is None
+
+    @pytest.mark.asyncio
+    async def test_fused_ranking_across_workspaces(self):
+        """Test results are interleaved by rank and shared hits are boosted."""
+        client = FakeBatchedClient({
+            "python-docs": [_raw("a"), _raw("shared"), _raw("b")],
+            "fastapi-docs": [_raw("shared"), _raw("c")],
+        })
+        strategy = WorkspaceSearchStrategy(Mock(), client, HybridSearchConfig(rrf_k=10))
+
+        results = await strategy.execute_parallel_search(
+            "AsyncSession.execute",
+            [_workspace("python-docs"), _workspace("fastapi-docs")],
+            SearchStrategy.HYBRID,
+        )
+
+        assert client.calls[0]["alpha"] == 0.5
+        assert [r.content_id for r in results] == ["shared", "a", "c", "b"]
+        assert results[0].metadata["rrf_score"] == pytest.approx(1 / 12 + 1 / 11)
+        assert results[1].relevance_score == pytest.approx(1.0)
+        assert results[2].relevance_score == pytest.approx(11 / 12)
+
+    @pytest.mark.asyncio
+    async def test_vector_only_path_unchanged(self):
+        """Test calls without a strategy keep plain deduplication and no alpha."""
+        client = Mock(spec=["search_workspace"])
+        client.search_workspace = AsyncMock(return_value=[_raw("a"), _raw("a")])
+        strategy = WorkspaceSearchStrategy(Mock(), client)
+
+        results = await strategy.execute_parallel_search("query", [_workspace("python-docs")])
+
+        assert "alpha" not in client.search_workspace.call_args.kwargs
+        assert [r.content_id for r in results] == ["a"]
+        assert "rrf_score" not in results[0].metadata
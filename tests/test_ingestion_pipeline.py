@@ -44,6 +44,7 @@ async def mock_db_manager():
     db = Mock()
     db.fetch_one = AsyncMock()
     db.fetch_all = AsyncMock()
+    db.fetch_columns = AsyncMock()
     db.execute = AsyncMock()
     return db
 
@@ -344,10 +345,10 @@ class TestIngestionPipeline:
             (5,)     # failed documents
         ]
         
-        ingestion_pipeline.db_manager.fetch_all.side_effect = [
-            [("pdf", 30), ("txt", 40), ("md", 30)],  # format distribution
-            [("python", 50), ("javascript", 30), ("java", 20)],  # technology distribution
-            [("high", 60), ("medium", 30), ("low", 10)]  # quality distribution
+        ingestion_pipeline.db_manager.fetch_columns.side_effect = [
+            {"format": ["pdf", "txt", "md"], "count": [30, 40, 30]},  # format distribution
+            {"technology": ["python", "javascript", "java"], "count": [50, 30, 20]},  # technology distribution
+            {"quality_range": ["high", "medium", "low"], "count": [60, 30, 10]}  # quality distribution
         ]
         
         metrics = await ingestion_pipeline.get_processing_metrics()
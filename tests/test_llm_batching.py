@@ -0,0 +1,169 @@
+"""
+LLM Micro-Batching Tests
+Validates the micro-batching dispatcher: concurrent prompts sharing
+instructions coalesce into one structured call, batches respect item and
+token caps and per-provider concurrency, missing items are retried, and
+SmartIngestionPipeline chunk metadata extraction goes through it.
+"""
+
+import asyncio
+import re
+import pytest
+from unittest.mock import Mock
+
+from src.core.config.models import AIConfig, ProviderConfig
+from src.search.llm_query_analyzer import QueryIntent
+from src.ingestion.smart_pipeline import SmartIngestionPipeline
+from src.llm.batching import BatchResponse, MicroBatchDispatcher
+
+ITEM_RE = re.compile(r"### ITEM (\d+)\n(.*?)(?=\n\n### ITEM |\n\nReturn ONLY JSON)", re.DOTALL)
+
+
+class FakeLLMClient:
+    """LLM client stand-in answering batched prompts item by item"""
+
+    def __init__(self, delay: float = 0.0, drop_ids=(), fail: bool = False, config=None):
+        self.config = config or {}
+        self.primary_provider_name = "ollama"
+        self.delay = delay
+        self.drop_ids = set(drop_ids)
+        self.fail = fail
+        self.prompts = []
+        self.active = 0
+        self.max_active = 0
+
+    async def generate_structured(self, prompt, response_model):
+        assert response_model is BatchResponse
+        self.prompts.append(prompt)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError("provider down")
+            return BatchResponse(results=[
+                {"id": item_id, "result": {"echo": content}}
+                for item_id, content in ITEM_RE.findall(prompt)
+                if item_id not in self.drop_ids
+            ])
+        finally:
+            self.active -= 1
+
+    async def generate(self, prompt):
+        return "---CHUNK---".join(f"Section {i} " + "x" * 60 for i in range(40))
+
+
+async def _submit_all(dispatcher, contents, task="Summarize"):
+    return await asyncio.gather(
+        *(dispatcher.submit(task, content) for content in contents), return_exceptions=True
+    )
+
+
+class TestMicroBatchDispatcher:
+    """Test MicroBatchDispatcher batching behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_prompts_share_one_call(self):
+        """Test concurrent items are packed into one prompt and fanned back out."""
+        client = FakeLLMClient()
+        dispatcher = MicroBatchDispatcher(client, window_ms=5)
+
+        results = await _submit_all(dispatcher, [f"item-{i}" for i in range(10)])
+
+        assert len(client.prompts) == 1
+        assert client.prompts[0].startswith("Summarize")
+        assert results == [{"echo": f"item-{i}"} for i in range(10)]
+        stats = dispatcher.get_stats()
+        assert (stats["batches"], stats["llm_calls_saved"], stats["max_batch_size"]) == (1, 9, 10)
+
+    @pytest.mark.asyncio
+    async def test_item_token_and_task_boundaries(self):
+        """Test item and token caps split batches and tasks are never mixed."""
+        client = FakeLLMClient()
+        dispatcher = MicroBatchDispatcher(client, window_ms=5, max_batch_items=4)
+        await _submit_all(dispatcher, [f"item-{i}" for i in range(10)])
+        assert [len(ITEM_RE.findall(p)) for p in client.prompts] == [4, 4, 2]
+
+        client = FakeLLMClient()
+        dispatcher = MicroBatchDispatcher(client, window_ms=5, max_batch_tokens=600)
+        await _submit_all(dispatcher, ["y" * 800] * 6)
+        assert [len(ITEM_RE.findall(p)) for p in client.prompts] == [2, 2, 2]
+
+        client = FakeLLMClient()
+        dispatcher = MicroBatchDispatcher(client, window_ms=5)
+        await asyncio.gather(_submit_all(dispatcher, ["a", "b"], "Task A"), _submit_all(dispatcher, ["c"], "Task B"))
+        assert sorted(len(ITEM_RE.findall(p)) for p in client.prompts) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_provider_concurrency_limit(self):
+        """Test batched calls per provider never exceed the configured limit."""
+        client = FakeLLMClient(delay=0.02)
+        dispatcher = MicroBatchDispatcher(
+            client, window_ms=1, max_batch_items=1, provider_concurrency={"ollama": 3}
+        )
+
+        await _submit_all(dispatcher, [str(i) for i in range(12)])
+
+        assert len(client.prompts) == 12
+        assert client.max_active == 3
+
+    @pytest.mark.asyncio
+    async def test_missing_items_retried_and_failures_propagate(self):
+        """Test dropped items are retried alone and call errors reach every caller."""
+        client = FakeLLMClient(drop_ids={"1"})
+        dispatcher = MicroBatchDispatcher(client, window_ms=5)
+        results = await _submit_all(dispatcher, ["a", "b", "c"])
+        assert results == [{"echo": "a"}, None, {"echo": "c"}]
+        assert len(client.prompts) == 2
+        assert dispatcher.get_stats()["retried_items"] == 1
+
+        dispatcher = MicroBatchDispatcher(FakeLLMClient(fail=True), window_ms=5)
+        results = await _submit_all(dispatcher, ["a", "b"])
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert dispatcher.get_stats()["failed_batches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_and_configured_from_client(self):
+        """Test disabling sends items alone and from_client reads the ai config."""
+        client = FakeLLMClient()
+        await _submit_all(MicroBatchDispatcher(client, enabled=False), ["a", "b", "c"])
+        assert len(client.prompts) == 3
+
+        ai_config = AIConfig(
+            batching={"window_ms": 40, "max_batch_items": 8},
+            providers={"ollama": ProviderConfig(max_concurrent_requests=7)},
+        ).model_dump()
+        dispatcher = MicroBatchDispatcher.from_client(FakeLLMClient(config=ai_config))
+        assert (dispatcher.window, dispatcher.max_batch_items) == (0.04, 8)
+        assert dispatcher.provider_concurrency == {"ollama": 7}
+        assert MicroBatchDispatcher.from_client(Mock()).enabled
+
+
+class TestSmartPipelineBatching:
+    """Test SmartIngestionPipeline chunk metadata batching."""
+
+    @pytest.mark.asyncio
+    async def test_chunk_metadata_extracted_in_few_calls(self):
+        """Test a 40-chunk document needs a handful of metadata calls, in order."""
+        client = FakeLLMClient()
+        pipeline = SmartIngestionPipeline(client, Mock(), Mock())
+        intent = QueryIntent(technology="react", topics=["hooks"], doc_type="guide", user_level="beginner")
+
+        chunks = await pipeline._smart_chunk("document text", intent)
+
+        assert len(chunks) == 40
+        assert len(client.prompts) == 3
+        for chunk in chunks:
+            assert chunk.metadata["echo"].startswith("Technology: react\nChunk preview: Section")
+            assert chunk.metadata["echo"].endswith(chunk.text[:500])
+
+    @pytest.mark.asyncio
+    async def test_metadata_failure_is_per_chunk(self):
+        """Test a failed batch leaves empty metadata without failing chunking."""
+        client = FakeLLMClient(fail=True)
+        pipeline = SmartIngestionPipeline(client, Mock(), Mock())
+        intent = QueryIntent(technology="react", doc_type="guide")
+
+        assert await pipeline._extract_chunk_metadata("chunk " * 20, intent) == {}
+        client.fail, client.drop_ids = False, {"1"}
+        assert await pipeline._extract_chunk_metadata("chunk " * 20, intent) == {"extraction_failed": True}
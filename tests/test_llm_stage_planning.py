@@ -0,0 +1,245 @@
+"""
+LLM Stage Planning Tests
+Validates the search pipeline's LLM stage planner: evaluation and the
+external search decision share one structured call, external search starts
+speculatively alongside evaluation when internal results are few and is
+cancelled (or counted as unused) when not needed, and per-stage timings reach
+the response metadata.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.core.config.models import SearchPipelineConfig
+from src.search.models import SearchQuery, SearchResult, SearchResults, SearchStrategy
+from src.search.orchestrator import SearchOrchestrator
+from src.mcp.core.models import NormalizedQuery
+from src.mcp.text_ai.llm_adapter import TextAILLMAdapter
+from src.mcp.text_ai.models import ResultEvaluationDecision
+
+
+def _result(index: int, score: float = 0.9) -> SearchResult:
+    return SearchResult(
+        content_id=f"doc-{index}",
+        title=f"Doc {index}",
+        content_snippet=f"content {index}",
+        source_url=f"https://docs.example.com/{index}",
+        relevance_score=score,
+        metadata={},
+    )
+
+
+def _results(count: int) -> SearchResults:
+    return SearchResults(
+        results=[_result(i) for i in range(count)],
+        total_count=count,
+        query_time_ms=5,
+        strategy_used=SearchStrategy.HYBRID,
+        workspaces_searched=["docs"],
+    )
+
+
+class FakeTextAI:
+    """TextAI stand-in with a delayed merged evaluation call"""
+
+    def __init__(self, needs_external: bool, delay: float = 0.05, relevance: float = 0.9):
+        self.needs_external = needs_external
+        self.delay = delay
+        self.relevance = relevance
+        self.evaluate_and_decide_calls = 0
+        self.decide_external_search = AsyncMock()
+        self.evaluate_results = AsyncMock()
+
+    async def evaluate_and_decide(self, query, results):
+        self.evaluate_and_decide_calls += 1
+        await asyncio.sleep(self.delay)
+        return ResultEvaluationDecision(
+            relevance_score=self.relevance,
+            completeness_score=0.9,
+            missing_information=[],
+            confidence=0.8,
+            needs_external_search=self.needs_external,
+        )
+
+
+def _make_orchestrator(text_ai, external_delay: float = 0.05, **pipeline) -> SearchOrchestrator:
+    orchestrator = SearchOrchestrator(db_manager=Mock(), cache_manager=Mock(), weaviate_client=Mock())
+    orchestrator.llm_client = Mock()
+    orchestrator.mcp_enhancer = Mock(text_ai=text_ai)
+    pipeline.setdefault("local_evaluation_enabled", False)
+    orchestrator.pipeline_config = SearchPipelineConfig(**pipeline)
+    orchestrator.external_started = 0
+    orchestrator.external_cancelled = 0
+
+    async def external_search(query, current_results):
+        orchestrator.external_started += 1
+        try:
+            await asyncio.sleep(external_delay)
+        except asyncio.CancelledError:
+            orchestrator.external_cancelled += 1
+            raise
+        return [_result(100, 0.7)]
+
+    orchestrator._enhance_with_external_search = external_search
+    return orchestrator
+
+
+class TestLLMStagePlanning:
+    """Test SearchOrchestrator._run_llm_stages."""
+
+    @pytest.mark.asyncio
+    async def test_merged_call_replaces_separate_decision(self):
+        """Test one evaluate_and_decide call decides external search."""
+        text_ai = FakeTextAI(needs_external=False)
+        orchestrator = _make_orchestrator(text_ai)
+
+        _, evaluation, added, executed, metrics = await orchestrator._run_llm_stages(
+            SearchQuery(query="react hooks"), _results(5), "trace"
+        )
+
+        assert text_ai.evaluate_and_decide_calls == 1
+        text_ai.decide_external_search.assert_not_awaited()
+        text_ai.evaluate_results.assert_not_awaited()
+        assert evaluation.needs_external_search is False
+        assert (added, executed) == (False, False)
+        assert orchestrator.external_started == 0
+        assert metrics["merged_external_decision"]
+        assert metrics["speculative_external_search"] == "none"
+        assert set(metrics["stage_timings_ms"]) == {"evaluation"}
+
+    @pytest.mark.asyncio
+    async def test_speculative_search_cancelled_when_not_needed(self):
+        """Test few internal results start external search that is then cancelled."""
+        orchestrator = _make_orchestrator(FakeTextAI(needs_external=False), external_delay=5.0)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results, _, added, executed, metrics = await orchestrator._run_llm_stages(
+            SearchQuery(query="react hooks"), _results(1), "trace"
+        )
+
+        assert loop.time() - started < 1.0
+        assert (orchestrator.external_started, orchestrator.external_cancelled) == (1, 1)
+        assert (added, executed) == (False, False)
+        assert len(results.results) == 1
+        assert metrics["speculative_external_search"] == "cancelled"
+        assert "external_search_cancelled" in metrics["stage_timings_ms"]
+        assert "external_search" not in metrics["stage_timings_ms"]
+
+    @pytest.mark.asyncio
+    async def test_finished_speculative_search_recorded_as_unused(self):
+        """Test a speculative search that finishes before a negative decision is counted as wasted."""
+        orchestrator = _make_orchestrator(
+            FakeTextAI(needs_external=False, delay=0.05), external_delay=0.0
+        )
+
+        results, _, added, executed, metrics = await orchestrator._run_llm_stages(
+            SearchQuery(query="react hooks"), _results(1), "trace"
+        )
+
+        assert (orchestrator.external_started, orchestrator.external_cancelled) == (1, 0)
+        assert (added, executed) == (False, False)
+        assert len(results.results) == 1
+        assert metrics["speculative_external_search"] == "unused"
+        assert "external_search_unused" in metrics["stage_timings_ms"]
+        assert "external_search" not in metrics["stage_timings_ms"]
+        assert orchestrator.speculative_external_outcomes == {"used": 0, "cancelled": 0, "unused": 1}
+
+    @pytest.mark.asyncio
+    async def test_speculative_search_used_and_overlaps_evaluation(self):
+        """Test a positive decision reuses the speculative search run alongside evaluation."""
+        orchestrator = _make_orchestrator(
+            FakeTextAI(needs_external=True, delay=0.1, relevance=0.2), external_delay=0.1
+        )
+
+        results, _, added, executed, metrics = await orchestrator._run_llm_stages(
+            SearchQuery(query="react hooks"), _results(1), "trace"
+        )
+
+        assert orchestrator.external_started == 1
+        assert (added, executed) == (True, True)
+        assert [r.content_id for r in results.results] == ["doc-0", "doc-100"]
+        assert metrics["speculative_external_search"] == "used"
+        assert orchestrator.speculative_external_outcomes["used"] == 1
+        timings = metrics["stage_timings_ms"]
+        assert timings["evaluation"] >= 90 and timings["external_search"] >= 90
+        assert metrics["llm_stages_ms"] < 180
+        assert metrics["llm_stages_saved_ms"] >= 20
+
+    @pytest.mark.asyncio
+    async def test_no_speculation_above_threshold_or_when_disabled(self):
+        """Test enough internal results or disabled speculation defer external search."""
+        for count, pipeline in ((5, {}), (1, {"speculative_external_search_enabled": False})):
+            orchestrator = _make_orchestrator(
+                FakeTextAI(needs_external=True, delay=0.0, relevance=0.2), external_delay=0.0, **pipeline
+            )
+
+            _, _, added, _, metrics = await orchestrator._run_llm_stages(
+                SearchQuery(query="react hooks"), _results(count), "trace"
+            )
+
+            assert added
+            assert metrics["speculative_external_search"] == "none"
+            assert orchestrator.external_started == 1
+
+    @pytest.mark.asyncio
+    async def test_explicit_request_runs_concurrently_without_merged_call(self):
+        """Test use_external_search=True overlaps external search with plain evaluation."""
+        text_ai = FakeTextAI(needs_external=False)
+        orchestrator = _make_orchestrator(text_ai)
+        orchestrator._evaluate_search_results = AsyncMock(return_value=None)
+
+        _, _, added, executed, metrics = await orchestrator._run_llm_stages(
+            SearchQuery(query="react hooks", use_external_search=True), _results(5), "trace"
+        )
+
+        orchestrator._evaluate_search_results.assert_awaited_once()
+        assert orchestrator._evaluate_search_results.await_args.kwargs == {"decide_external": False}
+        assert (added, executed) == (True, True)
+        assert metrics["speculative_external_search"] == "none"
+        assert not metrics["merged_external_decision"]
+
+    @pytest.mark.asyncio
+    async def test_merged_evaluation_disabled_falls_back_to_separate_calls(self):
+        """Test disabling the merged call restores the separate external search decision."""
+        text_ai = FakeTextAI(needs_external=True)
+        orchestrator = _make_orchestrator(text_ai, merged_evaluation_enabled=False)
+        orchestrator._decide_external_search = AsyncMock(return_value=False)
+
+        _, _, _, executed, metrics = await orchestrator._run_llm_stages(
+            SearchQuery(query="react hooks"), _results(5), "trace"
+        )
+
+        assert text_ai.evaluate_and_decide_calls == 0
+        orchestrator._decide_external_search.assert_awaited_once()
+        assert not executed
+        assert "external_search_decision" in metrics["stage_timings_ms"]
+
+
+class TestEvaluateAndDecideAdapter:
+    """Test TextAILLMAdapter.evaluate_and_decide."""
+
+    @pytest.mark.asyncio
+    async def test_structured_call_and_fallback(self):
+        """Test the single structured call and the heuristic fallback."""
+        llm_client = Mock()
+        decision = ResultEvaluationDecision(
+            relevance_score=0.9, completeness_score=0.8, missing_information=[],
+            confidence=0.9, needs_external_search=False,
+        )
+        llm_client.generate_structured = AsyncMock(return_value=decision)
+        adapter = TextAILLMAdapter(llm_client)
+        query = NormalizedQuery(
+            original_query="react hooks", normalized_text="react hooks", query_hash=""
+        )
+        results = [{"title": "Doc", "content": "text", "url": "u", "score": 0.3}]
+
+        assert await adapter.evaluate_and_decide(query, results) == decision
+        assert llm_client.generate_structured.await_args.kwargs["response_model"] is ResultEvaluationDecision
+
+        llm_client.generate_structured = AsyncMock(side_effect=RuntimeError("provider down"))
+        fallback = await adapter.evaluate_and_decide(query, results)
+        assert fallback.needs_external_search
+        assert fallback.relevance_score < 0.6
+        assert fallback.missing_information == ["hook", "react"]
@@ -0,0 +1,334 @@
+"""
+LLM Streaming Tests
+Validates token streaming through the LLM layer: incremental JSON parsing of
+streamed envelopes, the SSE event parser, Ollama NDJSON / OpenAI-compatible
+SSE / Anthropic event streams against a local HTTP server, and
+LLMProviderClient.generate_stream failover before the first token.
+"""
+
+import asyncio
+import json
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from unittest.mock import Mock, patch
+
+from src.llm.base_provider import BaseLLMProvider, LLMProviderError, iter_sse_events
+from src.llm.client import LLMProviderClient
+from src.llm.json_parser import IncrementalJSONParser, stream_json_field
+from src.llm.ollama_provider import OllamaProvider
+from src.llm.openai_provider import OpenAIProvider
+from src.llm.providers.anthropic_provider import AnthropicProvider
+from src.mcp.core.models import NormalizedQuery
+from src.mcp.text_ai.llm_adapter import TextAILLMAdapter
+
+
+async def _chunks(text: str, size: int = 3):
+    for i in range(0, len(text), size):
+        yield text[i : i + size]
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+class TestIncrementalJSONParser:
+    """Test partial parsing of streamed JSON."""
+
+    def test_partials_grow_monotonically(self):
+        """Test every prefix parses and string values only ever extend."""
+        document = {
+            "text": 'Use "asyncio.gather"\n\\o/ café',
+            "items": [1, {"a": "b"}, [True, None]],
+            "score": 0.75,
+        }
+        text = "```json\n" + json.dumps(document) + "\n```"
+        parser = IncrementalJSONParser()
+
+        previous = ""
+        for char in text:
+            parser.feed(char)
+            partial = parser.partial()
+            if partial is None:
+                continue
+            value = partial.get("text", "")
+            assert value.startswith(previous)
+            previous = value
+
+        assert parser.complete
+        assert parser.partial() == document
+
+    def test_incomplete_tokens_are_withheld(self):
+        """Test keys, numbers and literals appear only once complete."""
+        parser = IncrementalJSONParser()
+        for chunk, expected in [
+            ('{"na', {}),
+            ('me": "do', {"name": "do"}),
+            ('c", "count": 1', {"name": "doc"}),
+            ('2, "ok": tr', {"name": "doc", "count": 12}),
+            ('ue, "tags": ["a', {"name": "doc", "count": 12, "ok": True, "tags": ["a"]}),
+        ]:
+            parser.feed(chunk)
+            assert parser.partial() == expected
+        assert not parser.complete
+
+    def test_open_string_is_extended_without_reparsing(self):
+        """Test a growing string is decoded incrementally, holding back split escapes."""
+        final = "x" * 2000 + ' caf\u00e9 \U0001F600 "done"'
+        document = {"items": [{"text": final}], "n": 1}
+        text = json.dumps(document)
+        parser = IncrementalJSONParser()
+        parsed_chars = []
+        real_loads = json.loads
+
+        def counting_loads(candidate, *args, **kwargs):
+            parsed_chars.append(len(candidate))
+            return real_loads(candidate, *args, **kwargs)
+
+        with patch("src.llm.json_parser.json.loads", side_effect=counting_loads):
+            for char in text:
+                parser.feed(char)
+                value = parser.partial().get("items")
+                if value and "text" in value[0]:
+                    assert final.startswith(value[0]["text"])
+
+        assert parser.partial() == document
+        assert sum(parsed_chars) < 10 * len(text)
+
+    @pytest.mark.asyncio
+    async def test_stream_json_field_unwraps_or_passes_through(self):
+        """Test envelope fields stream as text and non-JSON passes through."""
+        enveloped = json.dumps({"text": "Hello, streaming world"})
+        assert "".join(await _collect(stream_json_field(_chunks(enveloped), "text"))) == "Hello, streaming world"
+        assert len(await _collect(stream_json_field(_chunks(enveloped), "text"))) > 3
+
+        raw = "Plain markdown answer"
+        assert await _collect(stream_json_field(_chunks(raw), "text")) == ["Pla", "in ", "mar", "kdo", "wn ", "ans", "wer"]
+
+
+class TestSSEParser:
+    """Test server-sent event parsing."""
+
+    @pytest.mark.asyncio
+    async def test_events_data_lines_and_comments(self):
+        """Test event names, multi-line data, comments and a trailing event."""
+        async def lines():
+            for line in [": keepalive", "event: ping", "data: {}", "", "data: a", "data: b", "", "data: last"]:
+                yield line
+
+        assert await _collect(iter_sse_events(lines())) == [("ping", "{}"), (None, "a\nb"), (None, "last")]
+
+
+async def _serve(handler, path: str) -> TestServer:
+    app = web.Application()
+    app.router.add_post(path, handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+async def _streaming_response(request, body_parts, content_type, release: asyncio.Event):
+    response = web.StreamResponse(headers={"Content-Type": content_type})
+    await response.prepare(request)
+    for index, part in enumerate(body_parts):
+        await response.write(part.encode())
+        if index == 0:
+            # Hold the rest of the completion until the test has seen a token
+            await release.wait()
+    await response.write_eof()
+    return response
+
+
+class ConcreteOpenAIProvider(OpenAIProvider):
+    """OpenAIProvider does not implement the abstract catalog methods"""
+
+    get_static_capabilities = classmethod(lambda cls: Mock())
+    get_config_schema = classmethod(lambda cls: {})
+
+    async def generate_text(self, request):
+        raise NotImplementedError
+
+
+class TestProviderStreams:
+    """Test provider wire formats against a local server."""
+
+    @pytest.mark.asyncio
+    async def test_ollama_ndjson_yields_before_completion(self):
+        """Test the first Ollama token is yielded while generation continues."""
+        release = asyncio.Event()
+        requests = []
+
+        async def handler(request):
+            requests.append(await request.json())
+            lines = [
+                json.dumps({"response": "Hel", "done": False}) + "\n",
+                json.dumps({"response": "lo", "done": False}) + "\n",
+                json.dumps({"response": "", "done": True}) + "\n",
+            ]
+            return await _streaming_response(request, lines, "application/x-ndjson", release)
+
+        server = await _serve(handler, "/api/generate")
+        provider = OllamaProvider({"endpoint": str(server.make_url("")), "model": "llama2"})
+        try:
+            stream = provider.generate_stream("hi", temperature=0.1)
+            assert await stream.__anext__() == "Hel"
+            release.set()
+            assert await _collect(stream) == ["lo"]
+            assert requests[0]["stream"] is True
+            assert requests[0]["options"]["temperature"] == 0.1
+            assert provider._circuit_breaker.failures == 0
+        finally:
+            await provider.close()
+            await server.close()
+
+    @pytest.mark.asyncio
+    async def test_ollama_stream_error_chunk(self):
+        """Test an error chunk mid-stream raises LLMProviderError."""
+        release = asyncio.Event()
+        release.set()
+
+        async def handler(request):
+            lines = [json.dumps({"response": "x"}) + "\n", json.dumps({"error": "model crashed"}) + "\n"]
+            return await _streaming_response(request, lines, "application/x-ndjson", release)
+
+        server = await _serve(handler, "/api/generate")
+        provider = OllamaProvider({"endpoint": str(server.make_url("")), "model": "llama2"})
+        try:
+            with pytest.raises(LLMProviderError, match="model crashed"):
+                await _collect(provider.generate_stream("hi"))
+            assert provider._circuit_breaker.failures == 1
+        finally:
+            await provider.close()
+            await server.close()
+
+    @pytest.mark.asyncio
+    async def test_openai_compatible_sse(self):
+        """Test Chat Completions SSE deltas are yielded."""
+        release = asyncio.Event()
+        release.set()
+
+        def chunk(content):
+            return "data: " + json.dumps({
+                "id": "c1", "object": "chat.completion.chunk", "created": 0, "model": "m",
+                "choices": [{"index": 0, "delta": {"content": content}, "finish_reason": None}],
+            }) + "\n\n"
+
+        async def handler(request):
+            assert (await request.json())["stream"] is True
+            parts = [chunk("Str"), chunk("eamed"), "data: [DONE]\n\n"]
+            return await _streaming_response(request, parts, "text/event-stream", release)
+
+        server = await _serve(handler, "/v1/chat/completions")
+        provider = ConcreteOpenAIProvider({"api_key": "sk-test-key-123", "api_base": str(server.make_url("/v1")), "model": "m"})
+        try:
+            assert await _collect(provider.generate_stream("hi")) == ["Str", "eamed"]
+        finally:
+            await server.close()
+
+    @pytest.mark.asyncio
+    async def test_anthropic_event_stream(self):
+        """Test Messages API text deltas are yielded and other events skipped."""
+        release = asyncio.Event()
+        release.set()
+
+        def event(name, payload):
+            return f"event: {name}\ndata: {json.dumps(dict(payload, type=name))}\n\n"
+
+        async def handler(request):
+            assert (await request.json())["stream"] is True
+            parts = [
+                event("message_start", {"message": {}}),
+                event("content_block_delta", {"delta": {"type": "text_delta", "text": "Cla"}}),
+                event("ping", {}),
+                event("content_block_delta", {"delta": {"type": "text_delta", "text": "ude"}}),
+                event("message_stop", {}),
+            ]
+            return await _streaming_response(request, parts, "text/event-stream", release)
+
+        server = await _serve(handler, "/v1/messages")
+        provider = AnthropicProvider({"api_key": "test-anthropic-key", "base_url": str(server.make_url(""))})
+        try:
+            assert await _collect(provider.generate_stream("hi")) == ["Cla", "ude"]
+        finally:
+            await server.close()
+
+
+class FakeProvider(BaseLLMProvider):
+    """Provider stand-in streaming fixed chunks or failing"""
+
+    def __init__(self, chunks, fail_after=None):
+        super().__init__({})
+        self.chunks = chunks
+        self.fail_after = fail_after
+
+    @classmethod
+    def get_static_capabilities(cls):
+        return Mock()
+
+    @classmethod
+    def get_config_schema(cls):
+        return {}
+
+    def _create_circuit_breaker(self):
+        return None
+
+    async def _make_request(self, prompt: str, **kwargs) -> str:
+        return "".join(self.chunks)
+
+    async def _stream_request(self, prompt: str, **kwargs):
+        for index, chunk in enumerate(self.chunks):
+            if index == self.fail_after:
+                raise LLMProviderError("stream broke")
+            yield chunk
+        if self.fail_after == len(self.chunks):
+            raise LLMProviderError("stream broke")
+
+    async def generate_text(self, request):
+        raise NotImplementedError
+
+
+def _make_client(primary, fallback) -> LLMProviderClient:
+    client = LLMProviderClient({})
+    client.providers = {"primary": primary, "fallback": fallback}
+    client.primary_provider_name, client.fallback_provider_name = "primary", "fallback"
+    client._last_health_check = float("inf")
+    return client
+
+
+class TestClientStreaming:
+    """Test LLMProviderClient.generate_stream."""
+
+    @pytest.mark.asyncio
+    async def test_fails_over_before_first_token_only(self):
+        """Test failover when the primary fails early, not after it has streamed."""
+        client = _make_client(FakeProvider(["a"], fail_after=0), FakeProvider(["b", "c"]))
+        assert await _collect(client.generate_stream("q", json_field=None)) == ["b", "c"]
+
+        client = _make_client(FakeProvider(["a", "b"], fail_after=1), FakeProvider(["z"]))
+        with pytest.raises(LLMProviderError, match="stream broke"):
+            await _collect(client.generate_stream("q", json_field=None))
+
+    @pytest.mark.asyncio
+    async def test_envelope_unwrapped_and_default_single_chunk(self):
+        """Test the JSON envelope is unwrapped and non-streaming providers yield once."""
+        enveloped = json.dumps({"text": "Answer body"})
+        client = _make_client(FakeProvider([enveloped[i : i + 4] for i in range(0, len(enveloped), 4)]), None)
+        assert "".join(await _collect(client.generate_stream("q"))) == "Answer body"
+
+        provider = FakeProvider(["whole ", "response"])
+        provider._stream_request = BaseLLMProvider._stream_request.__get__(provider)
+        assert await _collect(provider.generate_stream("q")) == ["whole response"]
+
+    @pytest.mark.asyncio
+    async def test_adapter_answer_stream_and_fallback(self):
+        """Test TextAI answer streaming and the formatted fallback."""
+        query = NormalizedQuery(original_query="q", normalized_text="q", query_hash="")
+        content = {"summary": "Summary text"}
+
+        client = _make_client(FakeProvider(["An", "swer"]), None)
+        adapter = TextAILLMAdapter(client)
+        assert await _collect(adapter.generate_answer_stream(query, content)) == ["An", "swer"]
+
+        client = _make_client(FakeProvider(["x"], fail_after=0), None)
+        adapter = TextAILLMAdapter(client)
+        assert await _collect(adapter.generate_answer_stream(query, content)) == ["Summary text"]
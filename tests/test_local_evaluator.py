@@ -0,0 +1,335 @@
+"""
+Local Relevance Evaluator Tests
+Validates the in-process evaluator (score distribution and lexical coverage
+features, calibrated confidence, escalation band), its use in the search
+orchestrator to skip LLM evaluation, and the offline replay harness.
+"""
+
+import json
+import logging
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.core.config.models import SearchPipelineConfig
+from src.search.evaluation_replay import fit_calibration, load_samples, main, replay
+from src.search.local_evaluator import LocalRelevanceEvaluator
+from src.search.query_normalizer import QueryNormalizer
+from src.search.models import SearchQuery, SearchResult, SearchResults, SearchStrategy
+from src.search.orchestrator import SearchOrchestrator
+from src.mcp.core.models import SearchResult as MCPSearchResult, VectorSearchResults
+from src.mcp.text_ai.llm_adapter import TextAILLMAdapter
+from src.mcp.text_ai.models import ResultEvaluationDecision
+
+
+def _result(title: str, score: float, snippet: str = "") -> SearchResult:
+    return SearchResult(
+        content_id=title,
+        title=title,
+        content_snippet=snippet or f"{title} documentation",
+        source_url=f"https://docs.example.com/{title.replace(' ', '-')}",
+        relevance_score=score,
+        metadata={},
+    )
+
+
+def _results(*results: SearchResult) -> SearchResults:
+    return SearchResults(
+        results=list(results),
+        total_count=len(results),
+        query_time_ms=5,
+        strategy_used=SearchStrategy.HYBRID,
+        workspaces_searched=["docs"],
+    )
+
+
+CONFIDENT = _results(*[_result(f"React hooks guide {i}", 0.92, "Using react hooks like useEffect") for i in range(10)])
+UNCERTAIN = _results(*[_result(f"Component patterns {i}", 0.7, "Using react components") for i in range(10)])
+
+
+def _sample(score: float, covered: bool, needs_external: bool) -> dict:
+    title = "react hooks" if covered else "vue routing"
+    return {
+        "query": "react hooks",
+        "results": [{"title": title, "content": "", "score": score}] * 10,
+        "llm": {"relevance_score": score, "needs_external_search": needs_external},
+    }
+
+
+class TestLocalRelevanceEvaluator:
+    """Test features, scoring and the escalation band."""
+
+    def test_confident_decisions_at_both_ends(self):
+        """Test strong covered results and absent results need no LLM."""
+        evaluator = LocalRelevanceEvaluator()
+
+        strong = evaluator.evaluate("react hooks", CONFIDENT.results)
+        assert not strong.escalate and not strong.needs_external_search
+        assert strong.confidence > 0.95
+        assert strong.features.term_coverage == 1.0
+
+        empty = evaluator.evaluate("react hooks", [])
+        assert (empty.escalate, empty.needs_external_search) == (False, True)
+        assert empty.missing_information == ["No results found"]
+
+        weak = evaluator.evaluate("kubernetes ingress", [_result("Unrelated", 0.2)])
+        assert not weak.escalate and weak.needs_external_search
+        assert weak.missing_information == ["ingress", "kubernetes"]
+
+    def test_uncertain_band_escalates(self):
+        """Test results near the boundary are left to the LLM."""
+        evaluation = LocalRelevanceEvaluator().evaluate("react hooks", UNCERTAIN.results)
+
+        assert evaluation.escalate
+        assert evaluation.confidence < 0.8
+        assert evaluation.missing_information == ["hook"]
+        assert evaluation.features.term_coverage == 0.5
+
+    def test_score_distribution_features(self):
+        """Test top score, gap, spread and per-result coverage features."""
+        features, _ = LocalRelevanceEvaluator().extract_features(
+            "running queries",
+            [
+                {"title": "Running SQL", "content": "queries", "score": 0.9},
+                {"title": "Other", "content": "", "score": 0.5},
+            ],
+        )
+
+        assert (features.result_count, features.top_score) == (2, 0.9)
+        assert features.score_gap == pytest.approx(0.4)
+        assert features.score_spread == pytest.approx(0.2)
+        assert (features.term_coverage, features.top_term_coverage) == (1.0, 1.0)
+
+    def test_result_text_does_not_fill_shared_stem_memo(self):
+        """Test only query terms reach the normalizer's stem memo."""
+        normalizer = QueryNormalizer()
+        evaluator = LocalRelevanceEvaluator(normalizer=normalizer)
+        results = [
+            {"title": f"Handling widgets v{i}", "content": f"configuring gadgets{i}", "score": 0.8}
+            for i in range(20)
+        ]
+
+        features, _ = evaluator.extract_features("handling widgets", results)
+
+        assert features.term_coverage == 1.0
+        assert normalizer.get_stats()["stem_entries"] == 2
+
+    def test_rank_fused_results_use_match_scores(self):
+        """Test RRF-fused results are judged by certainty, not the rescaled rank score."""
+        from datetime import datetime
+        from src.search.models import WorkspaceInfo
+        from src.search.strategies import WorkspaceSearchStrategy
+
+        strategy = WorkspaceSearchStrategy(db_manager=Mock(), weaviate_client=Mock())
+        workspaces = [
+            WorkspaceInfo(slug=slug, technology="kubernetes", relevance_score=1.0, last_updated=datetime.utcnow())
+            for slug in ("k8s-a", "k8s-b")
+        ]
+
+        def fused(query, certainties):
+            ranked_lists = [
+                [
+                    strategy._convert_raw_result({
+                        "content": "Configure Kubernetes ingress controllers and routing rules",
+                        "metadata": {"document_id": f"{workspace.slug}-{i}", "document_title": "Kubernetes ingress",
+                                     "certainty": certainty},
+                    }, workspace)
+                    for i, certainty in enumerate(certainties)
+                ]
+                for workspace in workspaces
+            ]
+            results = strategy._fuse_ranked_lists(ranked_lists)
+            assert results[0].relevance_score == 1.0
+            return LocalRelevanceEvaluator().evaluate(query, results)
+
+        mismatch = fused("kubernetes react hooks", [0.56, 0.54, 0.52, 0.5, 0.5])
+        assert mismatch.needs_external_search or mismatch.escalate
+        assert mismatch.features.top_score == pytest.approx(0.56)
+
+        strong = fused("kubernetes ingress", [0.93, 0.91, 0.9, 0.9, 0.88])
+        assert not strong.escalate and not strong.needs_external_search
+
+        # Fused results without a raw match score cannot skip the LLM
+        unscored = fused("kubernetes react hooks", [None] * 5)
+        assert unscored.features.top_score is None and unscored.escalate
+        assert LocalRelevanceEvaluator().evaluate("terraform modules", [
+            _result("Kubernetes ingress", 1.0).model_copy(update={"metadata": {"rrf_score": 0.03}})
+        ]).needs_external_search
+
+    def test_calibrated_confidence_is_symmetric(self):
+        """Test confidence depends on the distance from the boundary only."""
+        evaluator = LocalRelevanceEvaluator(boundary=0.6, slope=10.0)
+        assert evaluator.confidence(0.6) == pytest.approx(0.5)
+        assert evaluator.confidence(0.7) == pytest.approx(evaluator.confidence(0.5))
+        assert evaluator.confidence(0.9) > evaluator.confidence(0.7)
+
+    def test_adapter_simple_evaluation_uses_query_terms(self):
+        """Test the TextAI fallback evaluation is the generalized local evaluation."""
+        adapter = TextAILLMAdapter(Mock())
+        results = VectorSearchResults(execution_time_ms=5, results=[
+            MCPSearchResult(
+                content_id="1", title="Kubernetes ingress", snippet="configure ingress",
+                source_url="https://kubernetes.io", workspace="k8s", content_type="documentation",
+                relevance_score=0.9,
+            )
+        ])
+
+        covered = adapter._simple_evaluation(results, "kubernetes ingress")
+        uncovered = adapter._simple_evaluation(results, "terraform modules")
+
+        assert covered.overall_quality > uncovered.overall_quality
+        assert uncovered.missing_information == ["module", "terraform"]
+        assert adapter._simple_evaluation(VectorSearchResults(execution_time_ms=5), "x").needs_external_search
+
+
+class FakeTextAI:
+    """TextAI stand-in counting merged evaluation calls"""
+
+    def __init__(self, error=None):
+        self.calls = 0
+        self.error = error
+
+    async def evaluate_and_decide(self, query, results):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return ResultEvaluationDecision(
+            relevance_score=0.4, completeness_score=0.9, missing_information=[],
+            confidence=0.8, needs_external_search=True,
+        )
+
+
+def _make_orchestrator(**pipeline) -> SearchOrchestrator:
+    orchestrator = SearchOrchestrator(db_manager=Mock(), cache_manager=Mock(), weaviate_client=Mock())
+    orchestrator.llm_client = Mock()
+    orchestrator.mcp_enhancer = Mock(text_ai=FakeTextAI())
+    orchestrator.pipeline_config = SearchPipelineConfig(**pipeline)
+    return orchestrator
+
+
+class TestOrchestratorLocalEvaluation:
+    """Test LLM evaluation is skipped outside the uncertain band."""
+
+    @pytest.mark.asyncio
+    async def test_confident_results_skip_llm(self):
+        """Test a confident local evaluation answers evaluation and decision."""
+        orchestrator = _make_orchestrator()
+
+        evaluation = await orchestrator._evaluate_search_results(
+            SearchQuery(query="react hooks"), CONFIDENT, decide_external=True
+        )
+
+        assert orchestrator.mcp_enhancer.text_ai.calls == 0
+        assert evaluation.needs_external_search is False
+        assert evaluation.reasoning.startswith("Local evaluation")
+        plain = await orchestrator._evaluate_search_results(SearchQuery(query="react hooks"), CONFIDENT)
+        assert plain.needs_external_search is None
+
+    @pytest.mark.asyncio
+    async def test_uncertain_results_escalate_and_log_sample(self, caplog):
+        """Test the LLM decides in the uncertain band and the sample is logged."""
+        orchestrator = _make_orchestrator()
+
+        with caplog.at_level(logging.INFO, logger="src.search.orchestrator"):
+            evaluation = await orchestrator._evaluate_search_results(
+                SearchQuery(query="react hooks"), UNCERTAIN, decide_external=True
+            )
+
+        assert orchestrator.mcp_enhancer.text_ai.calls == 1
+        assert (evaluation.overall_quality, evaluation.needs_external_search) == (0.4, True)
+        samples = load_samples(record.getMessage() for record in caplog.records)
+        assert len(samples) == 1
+        assert samples[0]["llm"] == {"relevance_score": 0.4, "confidence": 0.8, "needs_external_search": True}
+        assert len(samples[0]["results"]) == 10 and not samples[0]["shadow"]
+
+    @pytest.mark.asyncio
+    async def test_shadow_sampling_and_disabled(self):
+        """Test shadow sampling and disabling local evaluation both call the LLM."""
+        for pipeline in ({"local_evaluation_sample_rate": 1.0}, {"local_evaluation_enabled": False}):
+            orchestrator = _make_orchestrator(**pipeline)
+            await orchestrator._evaluate_search_results(
+                SearchQuery(query="react hooks"), CONFIDENT, decide_external=True
+            )
+            assert orchestrator.mcp_enhancer.text_ai.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_llm_failure_falls_back_to_local_evaluation(self):
+        """Test a failing LLM evaluation returns the local result, not a flat 0.5."""
+        orchestrator = _make_orchestrator(merged_evaluation_enabled=False)
+        orchestrator.mcp_enhancer.text_ai = Mock(evaluate_results=AsyncMock(side_effect=RuntimeError("down")))
+
+        evaluation = await orchestrator._evaluate_search_results(SearchQuery(query="react hooks"), UNCERTAIN)
+
+        assert evaluation.reasoning.startswith("Local evaluation")
+        assert evaluation.overall_quality != 0.5
+
+    @pytest.mark.asyncio
+    async def test_merged_llm_failure_falls_back_to_local_evaluation(self):
+        """Test a failing merged evaluate-and-decide call also returns the local result."""
+        orchestrator = _make_orchestrator()
+        orchestrator.mcp_enhancer.text_ai = FakeTextAI(error=RuntimeError("down"))
+
+        evaluation = await orchestrator._evaluate_search_results(
+            SearchQuery(query="react hooks"), UNCERTAIN, decide_external=True
+        )
+
+        assert orchestrator.mcp_enhancer.text_ai.calls == 1
+        assert evaluation.reasoning.startswith("Local evaluation")
+        assert evaluation.needs_external_search is not None
+
+
+class TestEvaluationReplay:
+    """Test the offline replay harness."""
+
+    def test_load_samples_from_logs_and_jsonl(self):
+        """Test samples are parsed from log lines and JSONL; other lines skipped."""
+        sample = _sample(0.9, True, False)
+        lines = [
+            f"2026-01-01 INFO src.search.orchestrator EVALUATION_SAMPLE: {json.dumps(sample)}",
+            json.dumps(sample),
+            "INFO PIPELINE_METRICS: step=local_evaluation",
+            "{not json",
+            json.dumps({"unrelated": True}),
+        ]
+        assert load_samples(lines) == [sample, sample]
+
+    def test_replay_measures_agreement_and_savings(self):
+        """Test LLM calls saved and agreement on confident decisions."""
+        samples = [
+            _sample(0.95, True, False),   # confident, agrees
+            _sample(0.1, False, True),    # confident, agrees
+            _sample(0.95, True, True),    # confident, disagrees
+            _sample(0.45, True, False),   # uncertain (relevance 0.615)
+        ]
+        report = replay(samples, LocalRelevanceEvaluator())
+
+        assert (report.samples, report.llm_calls_saved, report.escalated) == (4, 3, 1)
+        assert report.saved_rate == pytest.approx(0.75)
+        assert report.confident_agreement == pytest.approx(2 / 3)
+        assert report.overall_agreement == pytest.approx(0.75)
+        assert replay([], LocalRelevanceEvaluator()).confident_agreement is None
+
+    def test_fit_calibration_recovers_boundary(self):
+        """Test the fitted boundary sits where LLM verdicts flip."""
+        evaluator = LocalRelevanceEvaluator()
+        samples = [
+            _sample(score / 100, False, score / 100 * 0.7 < 0.45)
+            for score in range(5, 100, 2)
+        ]
+
+        boundary, slope = fit_calibration(samples, evaluator)
+
+        assert boundary == pytest.approx(0.45, abs=0.03)
+        assert slope > 12.0
+        assert fit_calibration(samples[:3], evaluator) == (0.6, 12.0)
+
+    def test_main_reports_configured_and_fitted(self, tmp_path, capsys):
+        """Test the command line entry point prints both reports."""
+        path = tmp_path / "samples.log"
+        path.write_text("\n".join(
+            f"EVALUATION_SAMPLE: {json.dumps(_sample(s / 10, True, s < 5))}" for s in range(10)
+        ))
+
+        main([str(path), "--fit"])
+
+        output = capsys.readouterr().out
+        assert '"configured"' in output and '"fitted"' in output
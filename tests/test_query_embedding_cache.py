@@ -0,0 +1,120 @@
+"""
+Query Embedding Cache Tests
+Validates the L1/L2 normalized query -> vector cache used for near_vector search.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+from src.clients.embedding_cache import (
+    QueryEmbeddingCache,
+    normalize_query_text,
+    pack_vector,
+    unpack_vector,
+)
+from src.clients.weaviate_client import WeaviateVectorClient
+from src.core.config.models import WeaviateConfig
+
+
+class FakeBytesCache:
+    """In-memory stand-in for CacheManager raw byte operations."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get_bytes(self, key):
+        return self.store.get(key)
+
+    async def set_bytes(self, key, value, ttl):
+        self.store[key] = value
+
+
+class TestQueryEmbeddingCache:
+    """Test query embedding cache behaviour and metrics."""
+
+    def test_near_repeated_queries_share_key(self):
+        """Test case, whitespace and edge punctuation are normalized."""
+        assert normalize_query_text("  FastAPI   Routing? ") == "fastapi routing"
+        assert normalize_query_text("fastapi routing") == "fastapi routing"
+
+    def test_vectors_packed_as_float32(self):
+        """Test vectors round-trip through compact float32 bytes."""
+        vector = [0.25, -1.5, 3.0]
+        data = pack_vector(vector)
+        assert len(data) == 4 * len(vector)
+        assert unpack_vector(data) == vector
+
+    @pytest.mark.asyncio
+    async def test_repeated_queries_skip_embedder(self):
+        """Test L1 hits avoid calling the embedder."""
+        embedder = AsyncMock(return_value=[0.5, 0.25])
+        cache = QueryEmbeddingCache(embedder)
+
+        first = await cache("FastAPI routing")
+        second = await cache("fastapi   routing")
+
+        assert first == second == [0.5, 0.25]
+        embedder.assert_awaited_once()
+        stats = cache.get_stats()
+        assert stats["l1_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_shared_between_processes(self):
+        """Test a second cache instance is served from the Redis tier."""
+        shared = FakeBytesCache()
+        embedder = AsyncMock(return_value=[0.5, 0.25])
+
+        await QueryEmbeddingCache(embedder, cache_manager=shared)("react hooks")
+        other = QueryEmbeddingCache(embedder, cache_manager=shared)
+        vector = await other("react hooks")
+
+        assert vector == [0.5, 0.25]
+        embedder.assert_awaited_once()
+        assert other.get_stats()["l2_hits"] == 1
+        assert all(isinstance(v, bytes) for v in shared.store.values())
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_embed_once(self):
+        """Test concurrent lookups for one query share a single embedding call."""
+        async def slow_embed(query):
+            await asyncio.sleep(0.01)
+            return [1.0]
+
+        embedder = AsyncMock(side_effect=slow_embed)
+        cache = QueryEmbeddingCache(embedder)
+        results = await asyncio.gather(*[cache("vue router") for _ in range(10)])
+
+        assert all(r == [1.0] for r in results)
+        embedder.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """Test the in-process tier is bounded."""
+        cache = QueryEmbeddingCache(AsyncMock(return_value=[1.0]), maxsize=2)
+        for query in ("a", "b", "c"):
+            await cache(query)
+        assert cache.get_stats()["l1_size"] == 2
+
+
+class TestWeaviateClientEmbeddingCache:
+    """Test WeaviateVectorClient wraps the embedder with the cache."""
+
+    def test_embedder_wrapped_by_default(self):
+        config = WeaviateConfig(endpoint="http://localhost:8080", api_key="test-api-key-123")
+        client = WeaviateVectorClient(config, query_embedder=AsyncMock(return_value=[1.0]))
+        assert isinstance(client.query_embedder, QueryEmbeddingCache)
+        assert client.get_embedding_cache_stats()["enabled"] is True
+
+    def test_cache_can_be_disabled(self):
+        config = WeaviateConfig(
+            endpoint="http://localhost:8080",
+            api_key="test-api-key-123",
+            query_embedding_cache_size=0,
+        )
+        embedder = AsyncMock(return_value=[1.0])
+        client = WeaviateVectorClient(config, query_embedder=embedder)
+        assert client.query_embedder is embedder
+        assert client.get_embedding_cache_stats() == {"enabled": False}
@@ -0,0 +1,193 @@
+"""
+Query Normalizer Tests
+Validates QueryNormalizer validation, cleaning and table-driven stemming,
+the raw-query LRU memo, the shared cache fingerprint, and the orchestrator's
+use of it.
+
+Includes pytest-benchmark microbenchmarks of per-request normalization
+overhead against the previous per-call implementation.
+"""
+
+import asyncio
+import re
+import pytest
+from fastapi import HTTPException
+from unittest.mock import Mock
+
+from src.document_processing.preprocessing import ContentPreprocessor
+from src.search.cache import SearchCacheManager
+from src.search.models import SearchQuery, SearchStrategy
+from src.search.orchestrator import SearchOrchestrator
+from src.search.query_normalizer import QueryNormalizer, query_fingerprint
+
+
+QUERIES = [
+    "FastAPI dependency injection",
+    "  How do I configure   Kubernetes ingresses?  ",
+    "running async queries with SQLAlchemy sessions",
+    "React hooks: useEffect cleanup (mapped refs)",
+    "postgres indexes vs redis classes",
+    "deployments --- page settings",
+]
+
+
+async def _previous_normalize(raw_query: str) -> str:
+    """Per-call normalization as implemented before QueryNormalizer"""
+    if not re.match(r"^[\w\s\-\.,:;!?()'/@#&]+$", raw_query, re.UNICODE):
+        raise ValueError("invalid")
+    cleaned = await ContentPreprocessor().clean_text(raw_query)
+    tokens = re.findall(r"\b\w+\b", cleaned.lower())
+
+    def porter_stem(word):
+        for suffix in ["ing", "ed", "ly", "es", "s", "ment"]:
+            if word.endswith(suffix) and len(word) > len(suffix) + 2:
+                return word[: -len(suffix)]
+        return word
+
+    return " ".join(porter_stem(token) for token in tokens)
+
+
+class TestQueryNormalizer:
+    """Test normalization, stemming and memoization."""
+
+    @pytest.mark.parametrize("word,stem", [
+        ("classes", "class"),
+        ("queries", "query"),
+        ("indexes", "index"),
+        ("running", "run"),
+        ("mapped", "map"),
+        ("deployments", "deploy"),
+        ("settings", "set"),
+        ("tutorials", "tutorial"),
+        ("process", "process"),
+        ("kubernetes", "kubernetes"),
+        ("string", "string"),
+        ("docs", "doc"),
+        ("os", "os"),
+        ("v2", "v2"),
+    ])
+    def test_stemmer_table(self, word, stem):
+        """Test suffix rules, protected endings and exceptions."""
+        assert QueryNormalizer().stem(word) == stem
+
+    @pytest.mark.parametrize("raw", QUERIES)
+    def test_normalization_is_idempotent(self, raw):
+        """Test normalized text normalizes to itself and keeps its fingerprint."""
+        normalizer = QueryNormalizer()
+        first = normalizer.normalize(raw)
+        second = normalizer.normalize(first.text)
+
+        assert second == first
+        assert first.fingerprint == query_fingerprint(first.text.upper())
+
+    def test_cleaning_and_validation(self):
+        """Test whitespace/artifact cleanup and the 422 validation errors."""
+        normalizer = QueryNormalizer()
+        assert normalizer.normalize("  FastAPI   Tutorial  ").text == "fastapi tutorial"
+        assert normalizer.normalize("deploy --- guide").text == "deploy guide"
+
+        for raw in ["", "   ", "a", "x" * 257, "drop table; <script>"]:
+            with pytest.raises(HTTPException) as exc_info:
+                normalizer.normalize(raw)
+            assert exc_info.value.status_code == 422
+
+    def test_memo_is_bounded_lru(self):
+        """Test repeated queries hit the memo and old entries are evicted."""
+        normalizer = QueryNormalizer(memo_size=2)
+        normalizer.normalize("first query")
+        normalizer.normalize("second query")
+        normalizer.normalize("first query")
+        normalizer.normalize("third query")
+
+        assert list(normalizer._memo) == ["first query", "third query"]
+        stats = normalizer.get_stats()
+        assert (stats["memo_hits"], stats["memo_misses"]) == (1, 3)
+
+    def test_stem_memo_is_bounded_lru(self):
+        """Test the stem memo evicts least recently used tokens and skips exceptions."""
+        normalizer = QueryNormalizer(stem_memo_size=2)
+        assert [normalizer.stem(t) for t in ("running", "queries", "running", "mapped")] == [
+            "run", "query", "run", "map",
+        ]
+        assert list(normalizer._stems) == ["running", "mapped"]
+        assert normalizer.stem("children") == "child"
+        assert normalizer.get_stats()["stem_entries"] == 2
+
+        unmemoized = QueryNormalizer(stem_memo_size=0)
+        assert unmemoized.stem("running") == QueryNormalizer.stem_uncached("running") == "run"
+        assert unmemoized.get_stats()["stem_entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_repeated_requests_hit_the_memo(self):
+        """Test repeated orchestrator requests reuse the memoized normalization."""
+        orchestrator = SearchOrchestrator(db_manager=Mock(), cache_manager=Mock(), weaviate_client=Mock())
+        normalizer = orchestrator.query_normalizer
+        requests = [SearchQuery(query=QUERIES[i % len(QUERIES)]) for i in range(60)]
+
+        normalized = [await orchestrator._normalize_query(request) for request in requests]
+
+        stats = normalizer.get_stats()
+        assert (stats["memo_hits"], stats["memo_misses"]) == (60 - len(QUERIES), len(QUERIES))
+        assert normalizer.normalize(QUERIES[0]) is normalizer.normalize(QUERIES[0])
+        uncached = QueryNormalizer(memo_size=0)
+        for raw, result in zip(QUERIES, normalized):
+            assert result.query == uncached.normalize(raw).text
+
+
+class TestOrchestratorNormalization:
+    """Test the orchestrator and cache keys use the shared normalizer."""
+
+    @pytest.mark.asyncio
+    async def test_normalize_query_copies_request_fields(self):
+        """Test only the text and technology hint change."""
+        orchestrator = SearchOrchestrator(db_manager=Mock(), cache_manager=Mock(), weaviate_client=Mock())
+        original = SearchQuery(
+            query="Running Queries", technology_hint="PYTHON", limit=7,
+            strategy=SearchStrategy.VECTOR, latency_budget_ms=150,
+        )
+
+        normalized = await orchestrator._normalize_query(original)
+
+        assert (normalized.query, normalized.technology_hint) == ("run query", "python")
+        assert (normalized.limit, normalized.strategy, normalized.latency_budget_ms) == (
+            7, SearchStrategy.VECTOR, 150
+        )
+        assert original.query == "Running Queries"
+
+    def test_cache_key_uses_fingerprint(self):
+        """Test cache keys agree for case/whitespace variants of a query."""
+        search_cache = SearchCacheManager(Mock())
+        key = search_cache._generate_cache_key(SearchQuery(query="run query"))
+
+        assert key == search_cache._generate_cache_key(SearchQuery(query="  Run   QUERY "))
+        assert key != search_cache._generate_cache_key(SearchQuery(query="run queries"))
+
+
+class TestNormalizationBenchmark:
+    """Microbenchmark per-request normalization overhead (pytest-benchmark)."""
+
+    @pytest.mark.benchmark(group="query-normalization")
+    def test_previous_normalization_benchmark(self, benchmark):
+        """Benchmark the previous per-call normalization."""
+        loop = asyncio.new_event_loop()
+
+        async def normalize_all():
+            for raw in QUERIES:
+                await _previous_normalize(raw)
+
+        try:
+            benchmark(lambda: loop.run_until_complete(normalize_all()))
+        finally:
+            loop.close()
+
+    @pytest.mark.benchmark(group="query-normalization")
+    def test_memo_hit_benchmark(self, benchmark):
+        """Benchmark QueryNormalizer on repeated (memoized) queries."""
+        normalizer = QueryNormalizer()
+        benchmark(lambda: [normalizer.normalize(raw) for raw in QUERIES])
+
+    @pytest.mark.benchmark(group="query-normalization")
+    def test_uncached_normalization_benchmark(self, benchmark):
+        """Benchmark QueryNormalizer with the memo disabled."""
+        normalizer = QueryNormalizer(memo_size=0)
+        benchmark(lambda: [normalizer.normalize(raw) for raw in QUERIES])
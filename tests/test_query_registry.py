@@ -0,0 +1,259 @@
+"""
+Compiled Query Registry Tests
+Validates DatabaseManager's compiled query registry (placeholder rewrite,
+text() reuse, operation/table classification, LRU bound), the stale
+prepared statement retry and the asyncpg statement cache arguments.
+
+Includes pytest-benchmark microbenchmarks of per-call query preparation for
+hot queries against the previous per-call implementation.
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from src.database.connection import DatabaseManager
+from src.database.query_registry import QueryRegistry, extract_table_name, rewrite_placeholders
+
+
+USAGE_SIGNAL_INSERT = """
+            INSERT INTO usage_signals (
+                signal_id, content_id, user_id, session_id,
+                signal_type, signal_strength, metadata,
+                created_at
+            ) VALUES (
+                :signal_id, :content_id, :user_id, :session_id,
+                :signal_type, :signal_strength, :metadata,
+                :created_at
+            )
+            """
+CONTENT_LOOKUP = "SELECT * FROM content_metadata WHERE content_id = ? AND technology = ?"
+
+
+def _previous_prepare(query, params):
+    """Per-call preparation as implemented before the registry"""
+    operation = query.strip().split()[0].upper()
+    table = extract_table_name(query)
+    if isinstance(params, dict):
+        statement, bind = text(query), params
+    else:
+        bind = {}
+        for i, value in enumerate(params):
+            bind[f"param_{i}"] = value
+            query = query.replace("?", f":param_{i}", 1)
+        statement = text(query)
+    return statement, bind, operation, table, hash(query) % 10000
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeRow:
+    def __init__(self, mapping):
+        self._mapping = mapping
+
+
+class FakeSession:
+    """Async session stand-in recording executed statements"""
+
+    def __init__(self, log, failures):
+        self.log = log
+        self.failures = failures
+
+    async def __aenter__(self):
+        return self
+
+    async def connection(self):
+        return None
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, params=None):
+        self.log.append((statement, params))
+        if self.failures:
+            raise self.failures.pop(0)
+        return FakeResult([FakeRow({"content_id": "doc-1"})])
+
+    async def commit(self):
+        self.log.append(("commit", None))
+
+    async def rollback(self):
+        self.log.append(("rollback", None))
+
+
+def _manager(failures=None):
+    manager = DatabaseManager("postgresql+asyncpg://u:p@localhost/db")
+    manager._connected = True
+    manager.log = []
+    failures = failures if failures is not None else []
+    manager.session_factory = lambda: FakeSession(manager.log, failures)
+    return manager
+
+
+class InvalidCachedStatementError(Exception):
+    """Same name as the asyncpg adapter's invalidated statement error"""
+
+
+class TestQueryRegistry:
+    """Test query compilation and caching."""
+
+    def test_rewrite_skips_literals_and_extra_marks(self):
+        """Test only the first N placeholders outside quotes are rewritten."""
+        query = "SELECT * FROM t WHERE a = ? AND b = '?' AND data ? 'key' AND c = ?"
+        assert rewrite_placeholders(query, 2) == (
+            "SELECT * FROM t WHERE a = :param_0 AND b = '?' AND data :param_1 'key' AND c = ?"
+        )
+        assert rewrite_placeholders('SELECT "odd?col" FROM t WHERE x = ?', 1) == (
+            'SELECT "odd?col" FROM t WHERE x = :param_0'
+        )
+
+    def test_prepare_binds_every_parameter_style(self):
+        """Test tuple, list, scalar, dict and empty parameters."""
+        registry = QueryRegistry()
+
+        compiled, bind = registry.prepare(CONTENT_LOOKUP, ("doc-1", "react"))
+        assert compiled.sql.endswith("content_id = :param_0 AND technology = :param_1")
+        assert bind == {"param_0": "doc-1", "param_1": "react"}
+        assert (compiled.operation, compiled.table) == ("SELECT", "CONTENT_METADATA")
+
+        assert registry.prepare(CONTENT_LOOKUP, ["a", "b"])[0] is compiled
+        assert registry.prepare("SELECT 1 FROM t WHERE id = ?", 7)[1] == {"param_0": 7}
+        compiled, bind = registry.prepare(USAGE_SIGNAL_INSERT, {"signal_id": "s"})
+        assert (compiled.sql, bind) == (USAGE_SIGNAL_INSERT, {"signal_id": "s"})
+        assert (compiled.operation, compiled.table) == ("INSERT", "USAGE_SIGNALS")
+        assert registry.prepare("SELECT 1", ())[1] is None
+
+        stats = registry.get_stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 4, 4)
+
+    def test_lru_bound(self):
+        """Test the least recently used query is evicted at capacity."""
+        registry = QueryRegistry(max_size=2)
+        first = registry.compile("SELECT 1")
+        registry.compile("SELECT 2")
+        registry.compile("SELECT 1")
+        registry.compile("SELECT 3")
+
+        assert registry.compile("SELECT 1") is first
+        assert registry.get_stats()["evictions"] == 1
+        assert registry.get_stats()["size"] == 2
+
+
+class TestDatabaseManagerRegistry:
+    """Test DatabaseManager query execution through the registry."""
+
+    @pytest.mark.asyncio
+    async def test_statements_reused_across_calls(self):
+        """Test repeated queries execute the same compiled text() clause."""
+        manager = _manager()
+
+        assert await manager.fetch_one(CONTENT_LOOKUP, ("doc-1", "react")) == {"content_id": "doc-1"}
+        assert await manager.fetch_all(CONTENT_LOOKUP, ("doc-2", "vue")) == [{"content_id": "doc-1"}]
+        await manager.execute(USAGE_SIGNAL_INSERT, {"signal_id": "s1"})
+        await manager.execute(USAGE_SIGNAL_INSERT, {"signal_id": "s2"})
+
+        statements = [entry for entry in manager.log if entry[0] != "commit"]
+        assert statements[0][0] is statements[1][0]
+        assert statements[1][1] == {"param_0": "doc-2", "param_1": "vue"}
+        assert statements[2][0] is statements[3][0]
+        assert statements[3][1] == {"signal_id": "s2"}
+
+    @pytest.mark.asyncio
+    async def test_execute_many_compiles_once_for_any_batch_size(self):
+        """Test batches of different sizes share one statement and registry entry."""
+        manager = _manager()
+        query = "INSERT INTO usage_signals (signal_id, signal_value) VALUES (?, ?)"
+
+        await manager.execute_many(query, [("s1", 1.0), ("s2", 2.0)])
+        await manager.execute_many(query, [("s3", 3.0)])
+        await manager.execute_many(query, [])
+
+        statements = [entry for entry in manager.log if entry[0] != "commit"]
+        assert statements[0][0] is statements[1][0]
+        assert statements[0][1] == [
+            {"param_0": "s1", "param_1": 1.0},
+            {"param_0": "s2", "param_1": 2.0},
+        ]
+        assert manager.query_registry.get_stats()["size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_statement_retried_once(self):
+        """Test an invalidated cached statement is re-executed after rollback."""
+        stale = DBAPIError("SELECT", {}, InvalidCachedStatementError("cached plan changed"))
+        manager = _manager([stale])
+
+        assert await manager.fetch_one(CONTENT_LOOKUP, ("doc-1", "react")) == {"content_id": "doc-1"}
+        assert [entry[0] for entry in manager.log][1] == "rollback"
+
+        other = DBAPIError("SELECT", {}, RuntimeError("connection reset"))
+        manager = _manager([other])
+        with pytest.raises(DBAPIError):
+            await manager.fetch_one(CONTENT_LOOKUP, ("doc-1", "react"))
+        assert len(manager.log) == 1
+
+    def test_statement_cache_arguments(self, monkeypatch):
+        """Test the statement cache is enabled, sized, and disabled for PgBouncer."""
+        monkeypatch.delenv("DATABASE_PGBOUNCER", raising=False)
+        monkeypatch.delenv("DATABASE_STATEMENT_CACHE_SIZE", raising=False)
+        assert DatabaseManager._statement_cache_args() == {"prepared_statement_cache_size": 256}
+
+        monkeypatch.setenv("DATABASE_STATEMENT_CACHE_SIZE", "64")
+        assert DatabaseManager._statement_cache_args()["prepared_statement_cache_size"] == 64
+
+        monkeypatch.setenv("DATABASE_PGBOUNCER", "true")
+        args = DatabaseManager._statement_cache_args()
+        assert args["statement_cache_size"] == args["prepared_statement_cache_size"] == 0
+        assert args["prepared_statement_name_func"]() != args["prepared_statement_name_func"]()
+
+
+def _hot_calls(count):
+    return [
+        (USAGE_SIGNAL_INSERT, {"signal_id": f"s{i}", "content_id": "doc"}) if i % 2 else
+        (CONTENT_LOOKUP, (f"doc-{i}", "react"))
+        for i in range(count)
+    ]
+
+
+class TestHotQueryPreparation:
+    """Test hot queries are compiled once and bound like before."""
+
+    def test_hot_queries_compiled_once(self):
+        """Test each distinct query compiles once and later calls are cache hits."""
+        calls = _hot_calls(5000)
+        registry = QueryRegistry()
+
+        prepared = [registry.prepare(query, params) for query, params in calls]
+
+        stats = registry.get_stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (4998, 2, 2)
+        assert prepared[0][0] is prepared[2][0] and prepared[1][0] is prepared[3][0]
+        for (query, params), (compiled, bind) in zip(calls[:4], prepared[:4]):
+            statement, previous_bind, operation, table, _ = _previous_prepare(query, params)
+            assert (bind, compiled.operation, compiled.table) == (previous_bind, operation, table)
+            assert compiled.statement.text == statement.text
+
+
+class TestQueryPreparationBenchmark:
+    """Microbenchmark per-call query preparation for hot queries (pytest-benchmark)."""
+
+    @pytest.mark.benchmark(group="query-preparation")
+    def test_previous_preparation_benchmark(self, benchmark):
+        """Benchmark the previous per-call preparation."""
+        calls = _hot_calls(500)
+        benchmark(lambda: [_previous_prepare(query, params) for query, params in calls])
+
+    @pytest.mark.benchmark(group="query-preparation")
+    def test_registry_preparation_benchmark(self, benchmark):
+        """Benchmark preparation through the compiled registry."""
+        calls = _hot_calls(500)
+        registry = QueryRegistry()
+        benchmark(lambda: [registry.prepare(query, params) for query, params in calls])
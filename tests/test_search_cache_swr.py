@@ -0,0 +1,150 @@
+"""
+Stale-While-Revalidate Search Cache Tests
+Validates soft/hard TTLs, deduplicated background refresh, per-technology
+windows and stale-served metrics in SearchCacheManager.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.core.config.models import SearchCacheConfig, StaleWindowConfig
+from src.search.cache import SearchCacheManager
+from src.search.models import CachedSearchResult, SearchQuery
+from src.search.orchestrator import SearchOrchestrator
+from tests.search_cache_fakes import make_cache_manager, make_results
+
+
+def _store_entry(cache_manager, search_cache, query, stale_for: int, expires_in: int) -> str:
+    """Write an entry that went stale `stale_for` seconds ago"""
+    cache_key = search_cache._generate_cache_key(query)
+    now = datetime.utcnow()
+    cache_manager.store[cache_key] = CachedSearchResult(
+        query_hash=cache_key,
+        results=make_results(),
+        stale_at=now - timedelta(seconds=stale_for),
+        expires_at=now + timedelta(seconds=expires_in),
+    ).model_dump()
+    return cache_key
+
+
+def _config(**overrides) -> SearchCacheConfig:
+    params = {"local_cache_enabled": False, "stats_sample_rate": 0.0}
+    params.update(overrides)
+    return SearchCacheConfig(**params)
+
+
+class TestStaleWhileRevalidate:
+    """Test SWR behaviour of SearchCacheManager."""
+
+    @pytest.mark.asyncio
+    async def test_entries_carry_soft_and_hard_expiry(self):
+        """Test Redis TTL covers soft TTL plus the technology's stale window."""
+        cache_manager = make_cache_manager()
+        config = _config(
+            stale_window=StaleWindowConfig(soft_ttl_seconds=600, stale_window_seconds=300),
+            technology_stale_windows={
+                "react": StaleWindowConfig(soft_ttl_seconds=60, stale_window_seconds=30)
+            },
+        )
+        search_cache = SearchCacheManager(cache_manager, config)
+
+        python_query = SearchQuery(query="asyncio", technology_hint="python")
+        react_query = SearchQuery(query="hooks", technology_hint="React")
+        await search_cache.cache_results(python_query, make_results())
+        await search_cache.cache_results(react_query, make_results())
+
+        python_key = search_cache._generate_cache_key(python_query)
+        react_key = search_cache._generate_cache_key(react_query)
+        assert cache_manager.ttls[python_key] == 900
+        assert cache_manager.ttls[react_key] == 90
+        entry = CachedSearchResult(**cache_manager.store[react_key])
+        assert (entry.expires_at - entry.stale_at) == timedelta(seconds=30)
+
+    @pytest.mark.asyncio
+    async def test_stale_hit_served_immediately_with_one_refresh(self):
+        """Test concurrent stale hits return at once and trigger a single refresh."""
+        cache_manager = make_cache_manager()
+        search_cache = SearchCacheManager(cache_manager, _config())
+        release = asyncio.Event()
+        refresh = AsyncMock(side_effect=lambda query: release.wait())
+        search_cache.set_refresh_handler(refresh)
+        query = SearchQuery(query="fastapi routing")
+        _store_entry(cache_manager, search_cache, query, stale_for=10, expires_in=300)
+
+        results = await asyncio.gather(*[search_cache.get_cached_results(query) for _ in range(5)])
+
+        assert all(r is not None and r.cache_hit for r in results)
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.sleep(0.01)
+
+        refresh.assert_awaited_once()
+        cache_manager.acquire_lock.assert_awaited_once()
+        cache_manager.release_lock.assert_awaited_once()
+        stats = search_cache.get_local_stats()
+        assert stats["stale_served"] == 5
+        assert stats["refreshes_scheduled"] == 1
+        assert stats["refreshes_deduplicated"] == 4
+        assert stats["refreshes_completed"] == 1
+        assert stats["stale_served_ratio"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_refresh_skipped_when_other_worker_holds_lock(self):
+        """Test the cross-worker refresh lock prevents duplicate refreshes."""
+        cache_manager = make_cache_manager(lock_token=None)
+        search_cache = SearchCacheManager(cache_manager, _config())
+        refresh = AsyncMock()
+        search_cache.set_refresh_handler(refresh)
+        query = SearchQuery(query="django orm")
+        _store_entry(cache_manager, search_cache, query, stale_for=10, expires_in=300)
+
+        assert await search_cache.get_cached_results(query) is not None
+        await asyncio.sleep(0.01)
+
+        refresh.assert_not_awaited()
+        cache_manager.release_lock.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_hard_expired_entry_is_a_miss(self):
+        """Test entries past the hard expiry are not served."""
+        cache_manager = make_cache_manager()
+        search_cache = SearchCacheManager(cache_manager, _config())
+        search_cache.set_refresh_handler(AsyncMock())
+        query = SearchQuery(query="vue router")
+        _store_entry(cache_manager, search_cache, query, stale_for=600, expires_in=-1)
+
+        assert await search_cache.get_cached_results(query) is None
+        assert search_cache.get_local_stats()["stale_served"] == 0
+
+    @pytest.mark.asyncio
+    async def test_fresh_hits_do_not_refresh(self):
+        """Test entries within the soft TTL are served without refreshing."""
+        cache_manager = make_cache_manager()
+        search_cache = SearchCacheManager(cache_manager, _config())
+        refresh = AsyncMock()
+        search_cache.set_refresh_handler(refresh)
+        query = SearchQuery(query="flask blueprints")
+        await search_cache.cache_results(query, make_results())
+
+        assert await search_cache.get_cached_results(query) is not None
+        await asyncio.sleep(0)
+
+        refresh.assert_not_awaited()
+        stats = search_cache.get_local_stats()
+        assert (stats["fresh_hits"], stats["stale_served_ratio"]) == (1, 0.0)
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_refresh_reruns_pipeline(self):
+        """Test SearchOrchestrator registers a refresh that re-executes the pipeline."""
+        orchestrator = SearchOrchestrator(
+            db_manager=Mock(), cache_manager=make_cache_manager(), weaviate_client=Mock()
+        )
+        orchestrator._execute_search_pipeline = AsyncMock(return_value=make_results())
+        query = SearchQuery(query="fastapi routing")
+
+        await orchestrator.search_cache._refresh_handler(query)
+
+        orchestrator._execute_search_pipeline.assert_awaited_once()
+        assert orchestrator._execute_search_pipeline.call_args.args[0] is query
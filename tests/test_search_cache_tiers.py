@@ -0,0 +1,167 @@
+"""
+Two-Tier Search Cache Tests
+Validates the process-local L1 cache in front of Redis used by SearchOrchestrator:
+TTL-aware byte-bounded LRU, pub/sub invalidation and sampled hit counters.
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.core.config.models import SearchCacheConfig
+from src.search.cache import SearchCacheManager
+from src.search.models import SearchQuery
+from src.search.optimized_cache import LRUCache
+from tests.search_cache_fakes import FakePubSub, make_cache_manager, make_results
+
+
+class TestLRUCache:
+    """Test TTL and byte-size handling of the L1 LRU."""
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_misses(self):
+        """Test get() honours entry TTL."""
+        cache = LRUCache(maxsize=10)
+        await cache.set("k", "v", ttl=60)
+        assert await cache.get("k") == "v"
+
+        with patch("src.search.optimized_cache.time.time", return_value=cache.cache["k"]["expires"] + 1):
+            assert await cache.get("k") is None
+
+        assert "k" not in cache.cache
+        assert cache.expirations == 1
+
+    @pytest.mark.asyncio
+    async def test_byte_limit_evicts_least_recently_used(self):
+        """Test byte-bounded eviction and oversized entry rejection."""
+        cache = LRUCache(maxsize=100, max_bytes=100)
+        await cache.set("a", "x", size=40)
+        await cache.set("b", "x", size=40)
+        await cache.get("a")
+        await cache.set("c", "x", size=40)
+
+        assert set(cache.cache) == {"a", "c"}
+        assert cache.current_bytes == 80
+        assert cache.evictions == 1
+
+        await cache.set("huge", "x", size=500)
+        assert "huge" not in cache.cache
+
+        await cache.set("a", "x", size=10)
+        assert cache.current_bytes == 50
+
+
+class TestTwoTierSearchCache:
+    """Test SearchCacheManager L1/L2 behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_l1_hit_skips_redis_and_returns_copies(self):
+        """Test repeated lookups are served from L1 without sharing state."""
+        cache_manager = make_cache_manager()
+        search_cache = SearchCacheManager(cache_manager, SearchCacheConfig(stats_sample_rate=0.0))
+        query = SearchQuery(query="fastapi routing")
+
+        await search_cache.cache_results(query, make_results())
+        first = await search_cache.get_cached_results(query)
+        first.query_time_ms = 9999
+        first.workspaces_searched.append("mutated")
+        second = await search_cache.get_cached_results(query)
+
+        cache_manager.get.assert_not_awaited()
+        cache_manager.increment.assert_not_awaited()
+        assert second.cache_hit is True
+        assert second.query_time_ms == 12
+        assert second.workspaces_searched == ["python-docs"]
+        assert search_cache.get_local_stats()["l1_hits"] == 2
+        await search_cache.close()
+
+    @pytest.mark.asyncio
+    async def test_l2_hit_populates_l1_with_capped_ttl(self):
+        """Test Redis hits are promoted to L1 for at most local_cache_ttl_seconds."""
+        cache_manager = make_cache_manager()
+        writer = SearchCacheManager(cache_manager, SearchCacheConfig(local_cache_enabled=False))
+        query = SearchQuery(query="react hooks")
+        await writer.cache_results(query, make_results(), ttl_seconds=3600)
+
+        reader = SearchCacheManager(cache_manager, SearchCacheConfig(local_cache_ttl_seconds=30))
+        assert await reader.get_cached_results(query) is not None
+        assert await reader.get_cached_results(query) is not None
+
+        assert cache_manager.get.await_count == 1
+        entry = reader.local_cache.cache[reader._generate_cache_key(query)]
+        assert 0 < entry["expires"] - time.time() <= 30
+        stats = reader.get_local_stats()
+        assert (stats["l1_hits"], stats["l2_hits"]) == (1, 1)
+        await reader.close()
+
+    @pytest.mark.asyncio
+    async def test_hit_counters_are_sampled(self):
+        """Test sampled hits increment Redis by the inverse sample rate."""
+        cache_manager = make_cache_manager()
+        search_cache = SearchCacheManager(cache_manager, SearchCacheConfig(stats_sample_rate=0.25))
+        query = SearchQuery(query="django orm")
+        await search_cache.cache_results(query, make_results())
+
+        with patch("src.search.cache.random.random", side_effect=[0.9, 0.1]):
+            await search_cache.get_cached_results(query)
+            await search_cache.get_cached_results(query)
+
+        cache_manager.increment.assert_awaited_once()
+        assert cache_manager.increment.call_args.args[1] == 4
+        await search_cache.close()
+
+    @pytest.mark.asyncio
+    async def test_invalidation_is_broadcast_and_applied(self):
+        """Test invalidation publishes the key and listeners evict it from L1."""
+        pubsub = FakePubSub()
+        cache_manager = make_cache_manager(pubsub)
+        worker = SearchCacheManager(cache_manager)
+        query = SearchQuery(query="vue router")
+        cache_key = worker._generate_cache_key(query)
+
+        await worker.cache_results(query, make_results())
+        await worker.get_cached_results(query)  # starts the listener
+        await asyncio.sleep(0)
+        assert cache_key in worker.local_cache.cache
+
+        # Another worker invalidates the key
+        other = SearchCacheManager(cache_manager)
+        await other.invalidate_cache(cache_key[len(other.cache_key_prefix):])
+        cache_manager.publish.assert_awaited_with("search:cache:invalidate", cache_key)
+
+        await pubsub.queue.put({"type": "message", "data": cache_key.encode("utf-8")})
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert cache_key not in worker.local_cache.cache
+        assert worker.get_local_stats()["invalidations_received"] == 1
+
+        await worker.close()
+        assert pubsub.closed
+
+    @pytest.mark.asyncio
+    async def test_refresh_broadcast_evicts_only_l1(self):
+        """Test refreshed keys keep their semantic rows; invalidated keys drop them."""
+        pubsub = FakePubSub()
+        worker = SearchCacheManager(make_cache_manager(pubsub))
+        worker.set_query_embedder(AsyncMock(return_value=[1.0, 0.0]))
+        query = SearchQuery(query="vue router")
+        cache_key = worker._generate_cache_key(query)
+
+        await worker.cache_results(query, make_results())
+        await worker.get_cached_results(query)  # starts the listener
+        await asyncio.sleep(0)
+
+        await pubsub.queue.put({"type": "message", "data": f"refreshed:{cache_key}".encode("utf-8")})
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert cache_key not in worker.local_cache.cache
+        assert len(worker.semantic_index) == 1
+
+        await pubsub.queue.put({"type": "message", "data": cache_key.encode("utf-8")})
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert len(worker.semantic_index) == 0
+
+        await worker.close()
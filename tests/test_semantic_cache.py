@@ -0,0 +1,191 @@
+"""
+Semantic Search Cache Tests
+Validates the NumPy query-embedding index and the semantic tier of
+SearchCacheManager: near-duplicate queries with the same scope and
+technology_hint are served cached results, and semantic vs exact hit rates
+are reported.
+"""
+
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from src.core.config.models import SearchCacheConfig
+from src.search.cache import SearchCacheManager
+from src.search.models import SearchQuery
+from src.search.orchestrator import SearchOrchestrator
+from src.search.semantic_cache import SemanticQueryIndex
+from tests.search_cache_fakes import make_cache_manager, make_results
+
+
+VOCABULARY = ["react", "useeffect", "cleanup", "hooks", "python", "asyncio", "tutorial"]
+STOPWORDS = {"in", "the", "a"}
+
+
+async def _bag_of_words(text: str):
+    """Order-insensitive embedding stand-in"""
+    words = [w for w in text.lower().split() if w not in STOPWORDS]
+    return [float(words.count(term)) for term in VOCABULARY]
+
+
+def _make_search_cache(**config) -> SearchCacheManager:
+    config.setdefault("local_cache_enabled", False)
+    search_cache = SearchCacheManager(make_cache_manager(), SearchCacheConfig(**config))
+    search_cache.set_query_embedder(AsyncMock(side_effect=_bag_of_words))
+    return search_cache
+
+
+class TestSemanticQueryIndex:
+    """Test the flat cosine-similarity index."""
+
+    def test_best_match_within_scope_and_threshold(self):
+        """Test the most similar same-scope entry above the threshold is returned."""
+        index = SemanticQueryIndex(max_entries=8, threshold=0.9)
+        index.add("k1", [1.0, 0.0, 0.0], "scope-a")
+        index.add("k2", [0.8, 0.6, 0.0], "scope-a")
+        index.add("k3", [1.0, 0.0, 0.0], "scope-b")
+
+        key, similarity = index.search([2.0, 0.1, 0.0], "scope-a")
+        assert key == "k1"
+        assert similarity == pytest.approx(2.0 / np.sqrt(4.01), rel=1e-5)
+        assert index.search([0.0, 0.0, 1.0], "scope-a") is None
+        assert index.search([1.0, 0.0, 0.0], "scope-c") is None
+        assert index.search([0.0, 0.0, 0.0], "scope-a") is None
+
+    def test_bounded_with_oldest_evicted(self):
+        """Test rows are reused oldest-first and removed keys stop matching."""
+        index = SemanticQueryIndex(max_entries=2, threshold=0.99)
+        index.add("k1", [1.0, 0.0], "s")
+        index.add("k2", [0.0, 1.0], "s")
+        index.add("k1", [1.0, 0.0], "s")
+        index.add("k3", [0.7, 0.7], "s")
+
+        assert len(index) == 2
+        assert index.search([0.0, 1.0], "s") is None
+        assert index.search([1.0, 0.0], "s")[0] == "k1"
+
+        index.remove("k1")
+        assert index.search([1.0, 0.0], "s") is None
+        index.add("k4", [1.0, 0.0, 0.0], "s")
+        assert (len(index), index.search([1.0, 0.0, 0.0], "s")[0]) == (1, "k4")
+
+    def test_scope_dropped_with_its_last_row(self):
+        """Test scope ids are released once no row uses them."""
+        index = SemanticQueryIndex(max_entries=2, threshold=0.99)
+        index.add("k1", [1.0, 0.0], "s1")
+        index.add("k2", [0.0, 1.0], "s2")
+        index.add("k3", [1.0, 0.0], "s3")  # evicts k1
+        index.add("k2", [0.0, 1.0], "s3")
+        index.remove("k3")
+
+        assert set(index._scopes) == {"s3"}
+        assert index.search([0.0, 1.0], "s3")[0] == "k2"
+        assert index.search([1.0, 0.0], "s1") is None
+
+
+class TestSemanticCacheTier:
+    """Test semantic hits in SearchCacheManager."""
+
+    @pytest.mark.asyncio
+    async def test_reordered_query_served_from_semantic_tier(self):
+        """Test a rephrased query with the same hint hits; another hint misses."""
+        search_cache = _make_search_cache()
+        cached = SearchQuery(query="react useeffect cleanup", technology_hint="react")
+        await search_cache.cache_results(cached, make_results("react-docs"))
+
+        exact = await search_cache.get_cached_results(cached)
+        semantic = await search_cache.get_cached_results(
+            SearchQuery(query="cleanup in react useeffect", technology_hint="react")
+        )
+        other_hint = await search_cache.get_cached_results(
+            SearchQuery(query="cleanup in react useeffect", technology_hint="vue")
+        )
+        unrelated = await search_cache.get_cached_results(
+            SearchQuery(query="python asyncio tutorial", technology_hint="react")
+        )
+
+        assert exact.cache_hit and semantic.cache_hit
+        assert semantic.workspaces_searched == ["react-docs"]
+        assert other_hint is None and unrelated is None
+        stats = search_cache.get_local_stats()
+        assert (stats["l2_hits"], stats["semantic_hits"], stats["misses"]) == (1, 1, 2)
+        assert stats["exact_hit_rate"] == pytest.approx(0.25)
+        assert stats["semantic_hit_rate"] == pytest.approx(0.25)
+
+    @pytest.mark.asyncio
+    async def test_invalidated_or_evicted_entries_are_dropped(self):
+        """Test invalidation and missing Redis entries remove index rows."""
+        search_cache = _make_search_cache()
+        first = SearchQuery(query="react hooks tutorial")
+        second = SearchQuery(query="python asyncio tutorial")
+        await search_cache.cache_results(first, make_results("react-docs"))
+        await search_cache.cache_results(second, make_results("python-docs"))
+        assert len(search_cache.semantic_index) == 2
+
+        await search_cache.invalidate_cache(search_cache._generate_cache_key(first)[len("search:results:"):])
+        assert len(search_cache.semantic_index) == 1
+
+        search_cache.cache_manager.store.clear()
+        assert await search_cache.get_cached_results(SearchQuery(query="tutorial python asyncio")) is None
+        assert len(search_cache.semantic_index) == 0
+
+    @pytest.mark.asyncio
+    async def test_disabled_or_without_embedder_uses_exact_keys_only(self):
+        """Test the semantic tier is inactive without an embedder or when disabled."""
+        for search_cache in (
+            SearchCacheManager(make_cache_manager(), SearchCacheConfig(local_cache_enabled=False)),
+            _make_search_cache(semantic_cache_enabled=False),
+        ):
+            await search_cache.cache_results(SearchQuery(query="react useeffect cleanup"), make_results("react-docs"))
+            assert await search_cache.get_cached_results(
+                SearchQuery(query="cleanup react useeffect")
+            ) is None
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_wires_vector_client_embedder(self):
+        """Test the orchestrator registers the vector client's embed_query."""
+
+        class EmbeddingClient:
+            async def embed_query(self, query):
+                return await _bag_of_words(query)
+
+        orchestrator = SearchOrchestrator(
+            db_manager=Mock(), cache_manager=make_cache_manager(), weaviate_client=EmbeddingClient()
+        )
+        assert await orchestrator.search_cache._query_embedder("react hooks") == [1.0, 0, 0, 1.0, 0, 0, 0]
+
+        plain = SearchOrchestrator(db_manager=Mock(), cache_manager=make_cache_manager(), weaviate_client=Mock())
+        assert plain.search_cache._query_embedder is None
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_semantic_hit_through_configured_embedding_model(self):
+        """Test a rephrased search is served from the semantic tier via the API Weaviate client's embedder."""
+        from src.api.v1.dependencies import _configure_embeddings
+        from src.clients.weaviate_client import WeaviateVectorClient
+        from src.core.config.models import OllamaConfig, WeaviateConfig
+        from src.llm.models import EmbeddingResponse
+
+        embedded = []
+
+        async def generate_embeddings(provider, request):
+            embedded.extend(request.texts)
+            return EmbeddingResponse(
+                embeddings=[await _bag_of_words(text) for text in request.texts],
+                tokens_used=0, latency_ms=1, model_id=request.model_id, provider_id="ollama",
+            )
+
+        client = WeaviateVectorClient(WeaviateConfig(endpoint="http://localhost:8080", api_key="test-api-key-123"))
+        _configure_embeddings(client, Mock(ai=Mock(ollama=OllamaConfig(embedding_model="nomic-embed-text"))))
+        orchestrator = SearchOrchestrator(
+            db_manager=Mock(), cache_manager=make_cache_manager(), weaviate_client=client
+        )
+
+        with patch("src.llm.ollama_provider.OllamaProvider.generate_embeddings", generate_embeddings):
+            cached = await orchestrator._normalize_query(SearchQuery(query="React useEffect cleanup"))
+            await orchestrator.search_cache.cache_results(cached, make_results("react-docs"))
+            results, _ = await orchestrator.execute_search(SearchQuery(query="cleanup in react useeffect"))
+            await orchestrator.execute_search(SearchQuery(query="cleanup in react useeffect"))
+
+        assert results.cache_hit and results.workspaces_searched == ["react-docs"]
+        assert orchestrator.search_cache.get_local_stats()["semantic_hits"] == 2
+        assert embedded == ["react useeffect cleanup", "cleanup in react useeffect"]
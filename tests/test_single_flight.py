@@ -0,0 +1,158 @@
+"""
+Single-Flight Coalescing Tests
+Validates that identical concurrent searches run the search pipeline once,
+both within a process and across workers via a Redis lock.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from src.search.models import SearchQuery
+from src.search.orchestrator import SearchOrchestrator
+from src.search.single_flight import SingleFlight
+from tests.search_cache_fakes import make_results
+
+
+CONCURRENT_REQUESTS = 10
+
+
+class TestSingleFlight:
+    """Test in-process and cross-worker coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_execution(self):
+        """Test N concurrent calls produce one execution and N results."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        outcomes = await asyncio.gather(*[
+            flight.do("key", work) for _ in range(CONCURRENT_REQUESTS)
+        ])
+
+        assert calls == 1
+        assert [r for r, _ in outcomes] == ["result"] * CONCURRENT_REQUESTS
+        assert sum(shared for _, shared in outcomes) == CONCURRENT_REQUESTS - 1
+        assert flight.get_stats()["coalesced_local"] == CONCURRENT_REQUESTS - 1
+        assert flight.get_stats()["inflight"] == 0
+
+        # Once complete, the next call executes again
+        await flight.do("key", work)
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        """Test a disconnected first caller leaves the shared work running."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return 42
+
+        leader = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        release.set()
+
+        assert await follower == (42, True)
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_all_waiters(self):
+        """Test a failing execution raises for every coalesced caller."""
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("pipeline failed")
+
+        outcomes = await asyncio.gather(
+            flight.do("key", work), flight.do("key", work), return_exceptions=True
+        )
+        assert all(isinstance(o, RuntimeError) for o in outcomes)
+
+    @pytest.mark.asyncio
+    async def test_lock_holder_elsewhere_waits_for_published_result(self):
+        """Test a worker that loses the lock race uses the other worker's result."""
+        cache_manager = Mock()
+        cache_manager.acquire_lock = AsyncMock(return_value=None)
+        cache_manager.release_lock = AsyncMock()
+        flight = SingleFlight(cache_manager, lock_poll_interval_ms=10)
+        work = AsyncMock(return_value="local")
+        wait_for_result = AsyncMock(side_effect=[None, None, "remote"])
+
+        result, shared = await flight.do("key", work, wait_for_result)
+
+        assert (result, shared) == ("remote", False)
+        work.assert_not_awaited()
+        assert cache_manager.acquire_lock.call_args.args[0] == "search:lock:key"
+        assert flight.get_stats()["coalesced_remote"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lock_acquired_executes_and_releases(self):
+        """Test the lock owner executes and releases with its token."""
+        cache_manager = Mock()
+        cache_manager.acquire_lock = AsyncMock(side_effect=[None, "token-1"])
+        cache_manager.release_lock = AsyncMock(return_value=True)
+        flight = SingleFlight(cache_manager, lock_poll_interval_ms=10)
+
+        result, _ = await flight.do("key", AsyncMock(return_value="local"), AsyncMock(return_value=None))
+
+        assert result == "local"
+        cache_manager.release_lock.assert_awaited_once_with("search:lock:key", "token-1")
+
+    @pytest.mark.asyncio
+    async def test_lock_wait_timeout_falls_back_to_local_execution(self):
+        """Test a stuck lock holder does not block the request indefinitely."""
+        cache_manager = Mock()
+        cache_manager.acquire_lock = AsyncMock(return_value=None)
+        flight = SingleFlight(cache_manager, lock_wait_timeout_seconds=0.03, lock_poll_interval_ms=10)
+
+        result, _ = await flight.do("key", AsyncMock(return_value="local"), AsyncMock(return_value=None))
+
+        assert result == "local"
+        assert flight.get_stats()["lock_wait_timeouts"] == 1
+
+
+class TestOrchestratorCoalescing:
+    """Test SearchOrchestrator routes cache misses through single-flight."""
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_misses_run_pipeline_once(self):
+        """Test N identical concurrent searches execute one pipeline and get private copies."""
+        orchestrator = SearchOrchestrator(
+            db_manager=Mock(), cache_manager=Mock(), weaviate_client=Mock()
+        )
+        orchestrator.search_cache.get_cached_results = AsyncMock(return_value=None)
+
+        async def pipeline(*args):
+            await asyncio.sleep(0.02)
+            return make_results()
+
+        with patch.object(orchestrator, "_execute_search_pipeline", side_effect=pipeline) as run:
+            outcomes = await asyncio.gather(*[
+                orchestrator.execute_search(SearchQuery(query="FastAPI routing"))
+                for _ in range(CONCURRENT_REQUESTS)
+            ])
+
+        assert run.call_count == 1
+        results = [r for r, _ in outcomes]
+        assert len({id(r) for r in results}) == CONCURRENT_REQUESTS
+        assert orchestrator.single_flight.get_stats()["coalesced_local"] == CONCURRENT_REQUESTS - 1
+
+        # Different queries are not coalesced
+        with patch.object(orchestrator, "_execute_search_pipeline", side_effect=pipeline) as run:
+            await asyncio.gather(
+                orchestrator.execute_search(SearchQuery(query="fastapi routing")),
+                orchestrator.execute_search(SearchQuery(query="django orm")),
+            )
+        assert run.call_count == 2
@@ -0,0 +1,231 @@
+"""
+Streaming Search Tests
+Validates progressive multi-workspace search: the incremental top-k matches
+the batch merge, a latency budget returns early and cancels slow workspaces,
+partial results are not cached, and stream_search/SSE emit progress frames
+before the final response.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.core.config.models import HybridSearchConfig
+from src.search.models import SearchQuery, SearchStrategy, WorkspaceInfo
+from src.search.exceptions import SearchTimeoutError, VectorSearchError
+from src.search.orchestrator import SearchOrchestrator
+from src.search.strategies import WorkspaceSearchStrategy
+
+
+def _workspace(slug: str, relevance: float = 0.0) -> WorkspaceInfo:
+    return WorkspaceInfo(
+        slug=slug, technology="python", relevance_score=relevance, last_updated=datetime.utcnow()
+    )
+
+
+def _raw(doc_id: str, score: float = 0.5) -> dict:
+    return {
+        "content": f"content {doc_id}",
+        "metadata": {"document_id": doc_id, "score": score},
+        "id": doc_id,
+        "score": score,
+    }
+
+
+RESULTS = {
+    "fast": [_raw("a", 0.9), _raw("shared", 0.7), _raw("b", 0.4)],
+    "medium": [_raw("shared", 0.8), _raw("c", 0.6)],
+    "slow": [_raw("d", 0.95)],
+}
+
+
+class FakeTenantClient:
+    """Vector client stand-in with per-workspace delays"""
+
+    def __init__(self, delays, results=RESULTS):
+        self.delays = delays
+        self.results = results
+        self.cancelled = []
+
+    async def search_workspace(self, workspace_slug, query, limit=20, **kwargs):
+        try:
+            await asyncio.sleep(self.delays[workspace_slug])
+        except asyncio.CancelledError:
+            self.cancelled.append(workspace_slug)
+            raise
+        if isinstance(self.results[workspace_slug], Exception):
+            raise self.results[workspace_slug]
+        return self.results[workspace_slug]
+
+
+class FakeIterClient(FakeTenantClient):
+    """Vector client stand-in yielding tenants as they complete"""
+
+    async def iter_search_workspaces(self, workspace_slugs, query, limit=20, alpha=None):
+        async def run(slug):
+            try:
+                return slug, await self.search_workspace(slug, query)
+            except Exception as e:
+                return slug, e
+
+        tasks = [asyncio.create_task(run(slug)) for slug in workspace_slugs]
+        try:
+            for next_completed in asyncio.as_completed(tasks):
+                yield await next_completed
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+def _workspaces():
+    return [_workspace("fast", 0.5), _workspace("medium", 0.3), _workspace("slow", 0.1)]
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+class TestStreamParallelSearch:
+    """Test WorkspaceSearchStrategy.stream_parallel_search."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy", [None, SearchStrategy.HYBRID])
+    @pytest.mark.parametrize("client_class", [FakeTenantClient, FakeIterClient])
+    async def test_full_run_matches_batch_search(self, strategy, client_class):
+        """Test a stream without budget ends with the execute_parallel_search ranking."""
+        delays = {"fast": 0.0, "medium": 0.01, "slow": 0.02}
+        streaming = WorkspaceSearchStrategy(Mock(), client_class(delays), HybridSearchConfig(rrf_k=10))
+        batch = WorkspaceSearchStrategy(Mock(), FakeTenantClient(delays), HybridSearchConfig(rrf_k=10))
+
+        frames = await _collect(streaming.stream_parallel_search("query", _workspaces(), strategy))
+        expected = await batch.execute_parallel_search("query", _workspaces(), strategy)
+
+        assert [f.final for f in frames] == [False, False, True]
+        assert [f.completed_workspaces for f in frames][-1] == ["fast", "medium", "slow"]
+        assert frames[0].pending_workspaces == ["medium", "slow"]
+        final = frames[-1]
+        assert not final.budget_met
+        assert [r.content_id for r in final.results] == [r.content_id for r in expected]
+        assert [r.relevance_score for r in final.results] == pytest.approx(
+            [r.relevance_score for r in expected]
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("client_class", [FakeTenantClient, FakeIterClient])
+    async def test_budget_returns_early_and_cancels_slow_workspace(self, client_class):
+        """Test the budget ends the search once enough results are ranked."""
+        client = client_class({"fast": 0.0, "medium": 0.01, "slow": 5.0})
+        strategy = WorkspaceSearchStrategy(Mock(), client)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        frames = await _collect(strategy.stream_parallel_search(
+            "query", _workspaces(), latency_budget_ms=50, min_results=3
+        ))
+
+        assert loop.time() - started < 1.0
+        final = frames[-1]
+        assert (final.final, final.budget_met) == (True, True)
+        assert final.pending_workspaces == ["slow"]
+        assert final.candidate_count == 4
+        await asyncio.sleep(0)
+        assert client.cancelled == ["slow"]
+
+    @pytest.mark.asyncio
+    async def test_budget_waits_for_minimum_results(self):
+        """Test an elapsed budget does not return before min_results candidates."""
+        client = FakeTenantClient({"fast": 0.0, "medium": 0.01, "slow": 0.05})
+        strategy = WorkspaceSearchStrategy(Mock(), client)
+
+        frames = await _collect(strategy.stream_parallel_search(
+            "query", _workspaces(), latency_budget_ms=1, min_results=5
+        ))
+
+        assert frames[-1].candidate_count == 5
+        assert not frames[-1].budget_met
+        assert frames[-1].top_k_changed
+
+    @pytest.mark.asyncio
+    async def test_timeouts_and_failures_reported(self):
+        """Test timed-out and failing workspaces are reported, all-failed raises."""
+        results = dict(RESULTS, medium=RuntimeError("tenant down"))
+        client = FakeIterClient({"fast": 0.0, "medium": 0.0, "slow": 5.0}, results)
+        strategy = WorkspaceSearchStrategy(Mock(), client)
+
+        frames = await _collect(strategy.stream_parallel_search(
+            "query", _workspaces(), timeout_seconds=0.05
+        ))
+
+        assert frames[-1].completed_workspaces == ["fast"]
+        assert sorted(frames[-1].failed_workspaces) == ["medium", "slow"]
+        assert not frames[-1].budget_met
+
+        failing = WorkspaceSearchStrategy(Mock(), FakeTenantClient(
+            {"fast": 0.0}, {"fast": SearchTimeoutError("slow", timeout_seconds=0.1)}
+        ))
+        with pytest.raises(VectorSearchError):
+            await _collect(failing.stream_parallel_search("query", [_workspace("fast")]))
+
+
+def _make_orchestrator(delays) -> SearchOrchestrator:
+    cache_manager = Mock()
+    cache_manager.get = AsyncMock(return_value=None)
+    orchestrator = SearchOrchestrator(
+        db_manager=Mock(), cache_manager=cache_manager, weaviate_client=FakeTenantClient(delays)
+    )
+    orchestrator.workspace_strategy.identify_relevant_workspaces = AsyncMock(return_value=_workspaces())
+    orchestrator.search_cache.get_cached_results = AsyncMock(return_value=None)
+    orchestrator.search_cache.cache_results = AsyncMock()
+    orchestrator.single_flight = None
+    return orchestrator
+
+
+class TestOrchestratorStreaming:
+    """Test latency budgets and progress frames through the orchestrator."""
+
+    @pytest.mark.asyncio
+    async def test_budgeted_search_returns_partial_and_skips_cache(self):
+        """Test partial results are flagged and never written to the cache."""
+        orchestrator = _make_orchestrator({"fast": 0.0, "medium": 0.0, "slow": 5.0})
+        query = SearchQuery(query="query", limit=2, latency_budget_ms=30, use_external_search=False)
+
+        results = await orchestrator._execute_multi_workspace_search(query)
+        assert results.metadata["partial_results"]
+        assert results.metadata["pending_workspaces"] == ["slow"]
+        assert len(results.results) == 2
+
+        response = await orchestrator.search("query", limit=2, latency_budget_ms=30, use_external_search=False)
+        assert response.partial_results
+        orchestrator.search_cache.cache_results.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stream_search_emits_progress_then_result(self):
+        """Test stream_search yields ranked pages per workspace and the final response."""
+        orchestrator = _make_orchestrator({"fast": 0.0, "medium": 0.01, "slow": 0.02})
+
+        frames = await _collect(orchestrator.stream_search("query", limit=3, use_external_search=False))
+
+        assert [f["type"] for f in frames] == ["progress", "progress", "result"]
+        assert frames[0]["data"]["completed_workspaces"] == ["fast"]
+        assert len(frames[1]["data"]["results"]) == 3
+        result = frames[-1]["data"]
+        assert not result["partial_results"]
+        assert {r["content_id"] for r in result["results"]} <= {"a", "b", "c", "d", "shared"}
+        orchestrator.search_cache.cache_results.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_sse_endpoint_formats_events(self):
+        """Test the SSE generator frames progress and result events."""
+        from src.api.v1.schemas import SearchRequest
+        from src.api.v1.search_endpoints import _search_event_stream
+
+        orchestrator = _make_orchestrator({"fast": 0.0, "medium": 0.0, "slow": 0.0})
+        request = SearchRequest(query="query", limit=3, use_external_search=False, stream=True)
+
+        events = await _collect(_search_event_stream(orchestrator, request, None, "trace"))
+
+        assert events[-1].startswith("event: result\ndata: ")
+        assert all(e.startswith("event: progress\n") for e in events[:-1])
+        assert json.loads(events[-1].split("data: ", 1)[1])["query"] == "query"
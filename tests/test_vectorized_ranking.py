@@ -0,0 +1,144 @@
+"""
+Vectorized Result Ranking Tests
+Validates that batch NumPy scoring in ResultRanker matches the per-result
+scoring helpers and selects top-k correctly.
+
+Includes pytest-benchmark microbenchmarks of both scoring paths for 20, 200
+and 2000 candidates.
+"""
+
+import asyncio
+import functools
+import random
+from datetime import datetime, timedelta
+import numpy as np
+import pytest
+
+from src.search.models import SearchResult, SearchStrategy
+from src.search.ranking import ResultRanker
+
+
+CANDIDATE_COUNTS = (20, 200, 2000)
+TECHNOLOGIES = ["python", "javascript", "go", None]
+
+
+def _make_results(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    results = []
+    for i in range(count):
+        metadata = {"document_id": f"doc{i // 4}"}
+        roll = rng.random()
+        if roll < 0.4:
+            metadata["updated_at"] = (now - timedelta(days=(i // 4) * 3)).isoformat() + "Z"
+        elif roll < 0.7:
+            metadata["created_at"] = now - timedelta(days=rng.randint(0, 900))
+        elif roll < 0.8:
+            metadata["created_at"] = "not-a-date"
+        elif roll < 0.9:
+            metadata = {}
+        if rng.random() < 0.2:
+            metadata["framework"] = "FastAPI"
+        results.append(
+            SearchResult(
+                content_id=f"c{i}",
+                title=rng.choice(["FastAPI routing guide", "Async SQLAlchemy", "React hooks", "Intro"]),
+                content_snippet=rng.choice(["use fastapi routing here", "asyncsession execute", "hooks"]),
+                source_url=rng.choice(["https://fastapi.tiangolo.com/routing", "https://example.com/x"]),
+                relevance_score=round(rng.random(), 3),
+                metadata=metadata,
+                technology=rng.choice(TECHNOLOGIES),
+                quality_score=rng.choice([None, round(rng.random(), 3)]),
+            )
+        )
+    return results
+
+
+async def _scalar_scores(ranker, results, query, hint, strategy):
+    return [
+        await ranker._calculate_final_score(r, query, hint, strategy) for r in results
+    ]
+
+
+class TestVectorizedRanking:
+    """Test batch scoring equivalence and top-k selection."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("hint", [None, "python", "fastapi"])
+    @pytest.mark.parametrize("strategy", list(SearchStrategy))
+    async def test_batch_scores_match_per_result_scoring(self, hint, strategy):
+        """Test the feature matrix reproduces the scalar scoring helpers."""
+        ranker = ResultRanker()
+        results = _make_results(200)
+        query = "fastapi routing"
+
+        expected = await _scalar_scores(ranker, results, query, hint, strategy)
+        features = ranker._build_feature_matrix(results, query, hint)
+        actual = ranker.score_features(features, strategy)
+
+        assert features.shape == (200, len(ResultRanker.FEATURE_ORDER))
+        np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-12)
+
+    @pytest.mark.asyncio
+    async def test_rank_results_matches_full_sort_and_top_k(self):
+        """Test ordering and position decay match the previous full-sort behaviour."""
+        ranker = ResultRanker()
+        query, hint, strategy = "fastapi routing", "python", SearchStrategy.HYBRID
+
+        reference = _make_results(300)
+        expected_scores = sorted(
+            await _scalar_scores(ranker, reference, query, hint, strategy), reverse=True
+        )
+        decay = 1.0 - np.arange(300) * 0.001
+
+        ranked = await ranker.rank_results(_make_results(300), strategy, query, hint)
+        np.testing.assert_allclose(
+            [r.relevance_score for r in ranked], np.array(expected_scores) * decay, rtol=1e-9
+        )
+
+        top = await ranker.rank_results(_make_results(300), strategy, query, hint, top_k=10)
+        assert [r.content_id for r in top] == [r.content_id for r in ranked[:10]]
+        assert len(await ranker.rank_results(_make_results(5), strategy, query, hint, top_k=50)) == 5
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_per_result_scoring(self):
+        """Test a batch scoring failure degrades to the scalar path."""
+        ranker = ResultRanker()
+        ranker._build_feature_matrix = lambda *args: (_ for _ in ()).throw(ValueError("bad column"))
+        results = _make_results(20)
+
+        ranked = await ranker.rank_results(results, SearchStrategy.VECTOR, "fastapi", top_k=5)
+
+        assert len(ranked) == 5
+        assert ranked[0].relevance_score >= ranked[-1].relevance_score
+
+    def test_weights_form_a_vector(self):
+        """Test scoring_weights are exposed as a vector in feature order."""
+        ranker = ResultRanker()
+        assert ranker.weight_vector.tolist() == [0.4, 0.2, 0.15, 0.15, 0.1]
+
+
+class TestRankingBenchmark:
+    """Microbenchmark batch vs per-result scoring (pytest-benchmark)."""
+
+    @pytest.mark.parametrize("count", CANDIDATE_COUNTS)
+    @pytest.mark.parametrize("path", ["per_result", "vectorized"])
+    def test_ranking_benchmark(self, benchmark, count, path):
+        """Benchmark ranking 20/200/2000 candidates with either scoring path."""
+        ranker = ResultRanker()
+        query, hint = "fastapi routing", "python"
+        batch = _make_results(count)
+        if path == "vectorized":
+            rank = functools.partial(ranker.rank_results, batch, SearchStrategy.HYBRID, query, hint, top_k=20)
+        else:
+            rank = functools.partial(
+                ranker._rank_results_individually, batch, SearchStrategy.HYBRID, query, hint, 20
+            )
+
+        benchmark.group = f"ranking-{count}"
+        loop = asyncio.new_event_loop()
+        try:
+            ranked = benchmark(lambda: loop.run_until_complete(rank()))
+        finally:
+            loop.close()
+        assert len(ranked) == min(count, 20)
@@ -0,0 +1,501 @@
+"""
+Weaviate Async Client Tests
+Validates the non-blocking Weaviate client modes, the per-process connection pool
+and the embedding model wiring for queries and uploaded chunks.
+
+Includes a small concurrency benchmark comparing searches that block the event
+loop (the previous behaviour) with the native async and executor-offloaded modes.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+
+from src.clients.weaviate_client import (
+    WeaviateVectorClient,
+    WeaviateConnectionPool,
+    get_weaviate_connection_pool,
+    close_weaviate_connections,
+)
+from src.core.config.models import WeaviateConfig, OllamaConfig
+from src.database.connection import ProcessedDocument, DocumentChunk, DocumentMetadata
+
+
+SEARCH_LATENCY = 0.05
+CONCURRENT_SEARCHES = 5
+
+
+def _make_config(**overrides) -> WeaviateConfig:
+    params = {"endpoint": "http://localhost:8080", "api_key": "test-api-key-123"}
+    params.update(overrides)
+    return WeaviateConfig(**params)
+
+
+def _make_object(index: int) -> Mock:
+    obj = Mock()
+    obj.properties = {"content": f"chunk {index}", "document_id": "doc1", "chunk_id": f"c{index}"}
+    obj.metadata = Mock(distance=0.1, certainty=0.9)
+    obj.uuid = f"uuid-{index}"
+    return obj
+
+
+def _make_document(chunk_count: int) -> ProcessedDocument:
+    now = datetime.utcnow()
+    return ProcessedDocument(
+        id="doc1", title="Routing", full_content="", source_url="https://example.com",
+        technology="fastapi", quality_score=0.9, created_at=now,
+        metadata=DocumentMetadata(
+            word_count=10, heading_count=1, code_block_count=0, content_hash="h", created_at=now
+        ),
+        chunks=[
+            DocumentChunk(
+                id=f"c{i}", parent_document_id="doc1", content=f"chunk {i}",
+                chunk_index=i, total_chunks=chunk_count, created_at=now
+            )
+            for i in range(chunk_count)
+        ],
+    )
+
+
+def _attach_search(client: WeaviateVectorClient, near_text) -> None:
+    """Attach a fake collection whose near_text is the given callable"""
+    tenant_collection = Mock()
+    tenant_collection.query.near_text = near_text
+    collection = Mock()
+    collection.with_tenant.return_value = tenant_collection
+    client.client = Mock()
+    client.client.collections.get.return_value = collection
+
+
+async def _run_concurrent_searches(client: WeaviateVectorClient) -> float:
+    start = time.perf_counter()
+    results = await asyncio.gather(*[
+        client.search_workspace("workspace", f"query {i}", limit=1)
+        for i in range(CONCURRENT_SEARCHES)
+    ])
+    elapsed = time.perf_counter() - start
+    assert all(len(r) == 1 for r in results)
+    return elapsed
+
+
+class TestWeaviateClientModes:
+    """Test async and sync+executor client modes."""
+
+    def test_config_defaults_to_async_client(self):
+        """Test the native async client is the default mode."""
+        client = WeaviateVectorClient(_make_config())
+        assert client.use_async is True
+
+        sync_client = WeaviateVectorClient(_make_config(use_async_client=False))
+        assert sync_client.use_async is False
+
+    @pytest.mark.asyncio
+    async def test_async_mode_awaits_client_calls(self):
+        """Test async mode awaits coroutine-returning client methods."""
+        client = WeaviateVectorClient(_make_config())
+        near_text = AsyncMock(return_value=Mock(objects=[_make_object(0)]))
+        _attach_search(client, near_text)
+
+        results = await client.search_workspace("workspace", "fastapi", limit=1)
+
+        assert len(results) == 1
+        assert results[0]["content"] == "chunk 0"
+        near_text.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_sync_mode_offloads_to_executor(self):
+        """Test sync mode runs client calls outside the event loop thread."""
+        import threading
+
+        client = WeaviateVectorClient(_make_config(use_async_client=False))
+        calling_threads = []
+
+        def near_text(**kwargs):
+            calling_threads.append(threading.current_thread().name)
+            return Mock(objects=[_make_object(0)])
+
+        _attach_search(client, near_text)
+        await client.search_workspace("workspace", "fastapi", limit=1)
+
+        assert calling_threads
+        assert calling_threads[0].startswith("weaviate")
+        assert calling_threads[0] != threading.current_thread().name
+
+
+class TestWeaviateConcurrencyBenchmark:
+    """Benchmark concurrent searches before/after removing event loop blocking."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_search_latency(self):
+        """Test concurrent searches no longer serialize on the event loop."""
+        # Before: sync client call made directly on the event loop
+        blocking_client = WeaviateVectorClient(_make_config())
+
+        def blocking_near_text(**kwargs):
+            time.sleep(SEARCH_LATENCY)
+            return Mock(objects=[_make_object(0)])
+
+        _attach_search(blocking_client, blocking_near_text)
+        before = await _run_concurrent_searches(blocking_client)
+
+        # After: native async client
+        async_client = WeaviateVectorClient(_make_config())
+
+        async def async_near_text(**kwargs):
+            await asyncio.sleep(SEARCH_LATENCY)
+            return Mock(objects=[_make_object(0)])
+
+        _attach_search(async_client, async_near_text)
+        after_async = await _run_concurrent_searches(async_client)
+
+        # After: sync client offloaded to the bounded executor
+        executor_client = WeaviateVectorClient(_make_config(use_async_client=False))
+        _attach_search(executor_client, blocking_near_text)
+        after_executor = await _run_concurrent_searches(executor_client)
+
+        print(f"\n{CONCURRENT_SEARCHES} concurrent searches ({SEARCH_LATENCY * 1000:.0f}ms each):")
+        print(f"  blocking event loop: {before * 1000:.1f}ms")
+        print(f"  async client:        {after_async * 1000:.1f}ms")
+        print(f"  sync + executor:     {after_executor * 1000:.1f}ms")
+
+        assert before >= SEARCH_LATENCY * CONCURRENT_SEARCHES * 0.9
+        assert after_async < before / 2
+        assert after_executor < before / 2
+
+
+class TestWeaviateConnectionPool:
+    """Test per-process connection pooling."""
+
+    @pytest.mark.asyncio
+    async def test_clients_share_pooled_connection(self):
+        """Test clients with the same config reuse one connection."""
+        await close_weaviate_connections()
+
+        fake_client = Mock()
+        fake_client.connect = AsyncMock()
+        fake_client.close = AsyncMock()
+        fake_client.collections.exists = AsyncMock(return_value=True)
+        fake_client.collections.get.return_value.config.get = AsyncMock(
+            return_value=Mock(properties=[])
+        )
+
+        with patch("src.clients.weaviate_client.weaviate.use_async_with_custom",
+                   return_value=fake_client) as factory, \
+             patch.object(WeaviateVectorClient, "_migrate_collection_schema", AsyncMock()):
+            first = WeaviateVectorClient(_make_config())
+            second = WeaviateVectorClient(_make_config())
+            await first.connect()
+            await second.connect()
+
+            assert first.client is fake_client
+            assert second.client is fake_client
+            assert factory.call_count == 1
+            fake_client.connect.assert_awaited_once()
+
+            stats = get_weaviate_connection_pool().get_stats()
+            assert stats["connections"] == 1
+            assert stats["active_references"] == 2
+
+            await first.disconnect()
+            await second.disconnect()
+            fake_client.close.assert_not_awaited()
+            assert get_weaviate_connection_pool().get_stats()["active_references"] == 0
+
+        await close_weaviate_connections()
+        fake_client.close.assert_awaited_once()
+        assert get_weaviate_connection_pool().get_stats()["connections"] == 0
+
+    @pytest.mark.asyncio
+    async def test_shutdown_closes_pool_and_search_listeners(self):
+        """Test application shutdown closes pooled connections and search background tasks."""
+        from src.api.v1 import dependencies
+
+        await close_weaviate_connections()
+        pooled_client = Mock(close=AsyncMock())
+        await get_weaviate_connection_pool().acquire(
+            ("http://localhost:8080", "key", 50051, True), AsyncMock(return_value=pooled_client), loop_bound=True
+        )
+        order = []
+        weaviate_client = Mock(disconnect=AsyncMock())
+        db_manager = Mock(disconnect=AsyncMock(side_effect=lambda: order.append("database")))
+        orchestrator = Mock()
+        orchestrator.search_cache.close = AsyncMock(side_effect=lambda: order.append("search_cache"))
+        orchestrator.workspace_catalog.close = AsyncMock(side_effect=lambda: order.append("catalog"))
+
+        with patch.object(dependencies, "_weaviate_client", weaviate_client), \
+             patch.object(dependencies, "_db_manager", db_manager), \
+             patch.object(dependencies, "_search_orchestrator", orchestrator):
+            await dependencies.cleanup_dependencies()
+
+            assert order == ["search_cache", "catalog", "database"]
+            weaviate_client.disconnect.assert_awaited_once()
+            pooled_client.close.assert_awaited_once()
+            assert get_weaviate_connection_pool().get_stats()["connections"] == 0
+            orchestrator.search_cache.close.assert_awaited_once()
+            orchestrator.workspace_catalog.close.assert_awaited_once()
+            assert dependencies._weaviate_client is None and dependencies._search_orchestrator is None
+
+    @pytest.mark.asyncio
+    async def test_reset_survives_embedding_provider_close_error(self):
+        """Test a failing embedding provider close still resets the service instances."""
+        from src.api.v1 import dependencies
+
+        provider = Mock(close=AsyncMock(side_effect=RuntimeError("already closed")))
+        with patch.object(dependencies, "_weaviate_client", None), \
+             patch.object(dependencies, "_embedding_provider", provider), \
+             patch.object(dependencies, "_search_orchestrator", Mock()):
+            await dependencies.reset_service_instances()
+
+            provider.close.assert_awaited_once()
+            assert dependencies._embedding_provider is None and dependencies._search_orchestrator is None
+
+    @pytest.mark.asyncio
+    async def test_pool_replaces_connection_from_closed_loop(self):
+        """Test loop-bound entries created on a closed loop are replaced and closed."""
+        pool = WeaviateConnectionPool()
+        key = ("http://localhost:8080", "key", 50051, True)
+        stale_loop = asyncio.new_event_loop()
+        stale_loop.close()
+        stale_client = Mock(close=AsyncMock())
+        pool._entries[key] = {"client": stale_client, "loop": stale_loop, "refs": 1, "created_at": 0}
+
+        factory = AsyncMock(return_value="fresh")
+        client = await pool.acquire(key, factory, loop_bound=True)
+
+        assert client == "fresh"
+        factory.assert_awaited_once()
+        stale_client.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_replaced_connection_closes_after_last_release(self):
+        """Test a replaced entry still referenced on its live loop closes on its last release."""
+        pool = WeaviateConnectionPool()
+        key = ("http://localhost:8080", "key", 50051, True)
+        other_loop = asyncio.new_event_loop()
+        old_client = Mock(close=AsyncMock())
+        pool._entries[key] = {"client": old_client, "loop": other_loop, "refs": 1, "created_at": 0}
+
+        await pool.acquire(key, AsyncMock(return_value=Mock()), loop_bound=True)
+        old_client.close.assert_not_awaited()
+        assert pool.get_stats()["retired_connections"] == 1
+
+        await pool.release(key, old_client)
+        old_client.close.assert_awaited_once()
+        assert pool.get_stats() == {
+            "connections": 1, "active_references": 1, "retired_connections": 0, "executor_active": False,
+        }
+        other_loop.close()
+
+
+class TestEmbeddingProvider:
+    """Test the configured embedding model feeding queries and uploads."""
+
+    @pytest.mark.asyncio
+    async def test_ollama_embeddings_use_embed_endpoint(self):
+        """Test one /api/embed request returns a vector per input text."""
+        from src.llm.models import EmbeddingRequest
+        from src.llm.ollama_provider import OllamaProvider
+
+        response = Mock(status=200)
+        response.json = AsyncMock(return_value={"embeddings": [[0.1, 0.2], [0.3, 0.4]], "prompt_eval_count": 4})
+        post = Mock()
+        post.return_value.__aenter__ = AsyncMock(return_value=response)
+        post.return_value.__aexit__ = AsyncMock(return_value=False)
+        provider = OllamaProvider({"endpoint": "http://ollama:11434", "embedding_model": "nomic-embed-text"})
+        provider.session = Mock(closed=False, post=post)
+
+        result = await provider.generate_embeddings(EmbeddingRequest(texts=["a", "b"]))
+
+        assert result.embeddings == [[0.1, 0.2], [0.3, 0.4]]
+        assert result.model_id == "nomic-embed-text"
+        post.assert_called_once_with(
+            "http://ollama:11434/api/embed", json={"model": "nomic-embed-text", "input": ["a", "b"]}
+        )
+
+    @pytest.mark.asyncio
+    async def test_dependency_client_embeds_queries_and_chunks(self):
+        """Test the API client embeds queries and stores chunk vectors with the configured model."""
+        from src.api.v1 import dependencies
+        from src.llm.models import EmbeddingResponse
+
+        async def generate_embeddings(provider, request):
+            return EmbeddingResponse(
+                embeddings=[[float(len(text))] for text in request.texts],
+                tokens_used=0, latency_ms=1, model_id=request.model_id, provider_id="ollama",
+            )
+
+        config = Mock(weaviate=_make_config(), ai=Mock(ollama=OllamaConfig(embedding_model="nomic-embed-text")))
+        with patch.object(dependencies, "_weaviate_client", None), \
+             patch.object(dependencies, "_embedding_provider", None), \
+             patch.object(dependencies, "get_system_configuration", return_value=config), \
+             patch.object(dependencies, "get_cache_manager", AsyncMock(return_value=None)), \
+             patch.object(WeaviateVectorClient, "connect", AsyncMock()), \
+             patch.object(WeaviateVectorClient, "health_check", AsyncMock()), \
+             patch("src.llm.ollama_provider.OllamaProvider.generate_embeddings", generate_embeddings):
+            client = await dependencies.get_weaviate_client()
+
+            assert isinstance(client, WeaviateVectorClient)
+            assert await client.embed_query("routing") == [7.0]
+            assert client.get_embedding_cache_stats()["enabled"] is True
+
+            tenant_collection = Mock()
+            tenant_collection.data.insert_many = AsyncMock(return_value=Mock(errors={}))
+            client.client = Mock()
+            client.client.collections.get.return_value.with_tenant.return_value = tenant_collection
+            with patch.object(WeaviateVectorClient, "get_or_create_workspace", AsyncMock()):
+                result = await client.upload_document("ws", _make_document(2))
+
+        assert result.successful_uploads == 2
+        stored = tenant_collection.data.insert_many.call_args.args[0]
+        assert [obj.vector for obj in stored] == [[7.0], [7.0]]
+        assert stored[0].properties["chunk_id"] == "c0"
+
+    @pytest.mark.asyncio
+    async def test_document_embedding_failure_uploads_without_vectors(self):
+        """Test chunks are still stored when the embedding model is unavailable."""
+        client = WeaviateVectorClient(
+            _make_config(), document_embedder=AsyncMock(side_effect=RuntimeError("model not found"))
+        )
+        tenant_collection = Mock()
+        tenant_collection.data.insert_many = AsyncMock(return_value=Mock(errors={}))
+        client.client = Mock()
+        client.client.collections.get.return_value.with_tenant.return_value = tenant_collection
+
+        with patch.object(WeaviateVectorClient, "get_or_create_workspace", AsyncMock()):
+            result = await client.upload_document("ws", _make_document(1))
+
+        assert result.successful_uploads == 1
+        assert tenant_collection.data.insert_many.call_args.args[0][0]["chunk_id"] == "c0"
+
+
+class TestBatchedWorkspaceSearch:
+    """Test multi-workspace search with a single query embedding."""
+
+    def _attach_tenants(self, client: WeaviateVectorClient) -> Mock:
+        tenant_collection = Mock()
+        tenant_collection.query.near_vector = AsyncMock(
+            return_value=Mock(objects=[_make_object(0)])
+        )
+        tenant_collection.query.near_text = AsyncMock(
+            return_value=Mock(objects=[_make_object(1)])
+        )
+        collection = Mock()
+        collection.with_tenant.return_value = tenant_collection
+        client.client = Mock()
+        client.client.collections.get.return_value = collection
+        return tenant_collection
+
+    @pytest.mark.asyncio
+    async def test_query_embedded_once_for_all_workspaces(self):
+        """Test the query is vectorized once and sent to every tenant with near_vector."""
+        embedder = AsyncMock(return_value=[0.1, 0.2, 0.3])
+        client = WeaviateVectorClient(_make_config(), query_embedder=embedder)
+        tenant_collection = self._attach_tenants(client)
+
+        results = await client.search_workspaces(["ws-a", "ws-b", "ws-c"], "fastapi routing", limit=5)
+
+        embedder.assert_awaited_once_with("fastapi routing")
+        assert tenant_collection.query.near_vector.await_count == 3
+        tenant_collection.query.near_text.assert_not_awaited()
+        assert set(results) == {"ws-a", "ws-b", "ws-c"}
+        call_kwargs = tenant_collection.query.near_vector.call_args.kwargs
+        assert call_kwargs["near_vector"] == [0.1, 0.2, 0.3]
+        assert call_kwargs["limit"] == 5
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_near_text_without_embedder(self):
+        """Test near_text is used when no embedder is configured or it fails."""
+        client = WeaviateVectorClient(_make_config())
+        tenant_collection = self._attach_tenants(client)
+        results = await client.search_workspaces(["ws-a", "ws-b"], "fastapi")
+        assert tenant_collection.query.near_text.await_count == 2
+        assert results["ws-a"][0]["content"] == "chunk 1"
+
+        failing = WeaviateVectorClient(
+            _make_config(), query_embedder=AsyncMock(side_effect=RuntimeError("down"))
+        )
+        tenant_collection = self._attach_tenants(failing)
+        await failing.search_workspaces(["ws-a"], "fastapi")
+        tenant_collection.query.near_text.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_workspaces_are_omitted(self):
+        """Test per-tenant failures are isolated and missing tenants return empty results."""
+        client = WeaviateVectorClient(_make_config(), query_embedder=AsyncMock(return_value=[0.1]))
+        tenant_collection = self._attach_tenants(client)
+        tenant_collection.query.near_vector.side_effect = [
+            Mock(objects=[_make_object(0)]),
+            Exception("tenant not found"),
+            Exception("connection reset"),
+        ]
+
+        results = await client.search_workspaces(["ok", "missing", "broken"], "query")
+
+        assert len(results["ok"]) == 1
+        assert results["missing"] == []
+        assert "broken" not in results
+
+    @pytest.mark.asyncio
+    async def test_slow_tenant_times_out_alone(self):
+        """Test the timeout applies per tenant: only the slow workspace fails."""
+        from src.search.exceptions import SearchTimeoutError
+        from src.search.models import WorkspaceInfo
+        from src.search.strategies import WorkspaceSearchStrategy
+
+        async def slow_search(**kwargs):
+            await asyncio.sleep(1.0)
+            return Mock(objects=[_make_object(9)])
+
+        tenants = {}
+        for slug in ("fast-a", "fast-b", "slow"):
+            tenants[slug] = Mock()
+            tenants[slug].query.near_vector = AsyncMock(return_value=Mock(objects=[_make_object(0)]))
+        tenants["slow"].query.near_vector = AsyncMock(side_effect=slow_search)
+        client = WeaviateVectorClient(_make_config(), query_embedder=AsyncMock(return_value=[0.1]))
+        client.client = Mock()
+        client.client.collections.get.return_value.with_tenant.side_effect = tenants.get
+
+        raw = await client.search_workspaces(list(tenants), "query", timeout=0.1, return_exceptions=True)
+        assert isinstance(raw["slow"], asyncio.TimeoutError)
+        assert len(raw["fast-a"]) == len(raw["fast-b"]) == 1
+
+        strategy = WorkspaceSearchStrategy(db_manager=Mock(), weaviate_client=client)
+        workspaces = [
+            WorkspaceInfo(slug=slug, technology="python", relevance_score=1.0, last_updated=datetime.utcnow())
+            for slug in tenants
+        ]
+        start = time.perf_counter()
+        results = await strategy._search_workspaces_batched("query", workspaces, timeout_seconds=0.1)
+
+        assert time.perf_counter() - start < 0.5
+        assert [len(r) for r in results[:2]] == [1, 1]
+        assert isinstance(results[2], SearchTimeoutError)
+
+    @pytest.mark.asyncio
+    async def test_strategy_uses_batched_search(self):
+        """Test WorkspaceSearchStrategy issues one batched call for all workspaces."""
+        from src.search.models import WorkspaceInfo
+        from src.search.strategies import WorkspaceSearchStrategy
+
+        client = WeaviateVectorClient(_make_config(), query_embedder=AsyncMock(return_value=[0.1]))
+        client.search_workspaces = AsyncMock(return_value={
+            "python-docs": [{"content": "fastapi docs", "metadata": {"document_id": "d1"}, "id": "1"}],
+            "react-docs": [],
+        })
+        client.search_workspace = AsyncMock()
+        strategy = WorkspaceSearchStrategy(db_manager=Mock(), weaviate_client=client)
+        workspaces = [
+            WorkspaceInfo(slug="python-docs", technology="python", relevance_score=1.0,
+                          last_updated=datetime.utcnow()),
+            WorkspaceInfo(slug="react-docs", technology="react", relevance_score=0.5,
+                          last_updated=datetime.utcnow()),
+        ]
+
+        results = await strategy.execute_parallel_search("fastapi", workspaces)
+
+        client.search_workspaces.assert_awaited_once()
+        client.search_workspace.assert_not_called()
+        assert len(results) == 1
+        assert results[0].workspace_slug == "python-docs"
@@ -12,7 +12,7 @@ Comprehensive tests for Weaviate client TTL functionality including:
 
 Test Coverage:
 - get_expired_documents() functionality
-- cleanup_expired_documents() batch processing
+- cleanup_expired_documents() server-side expiry deletion
 - update_document_ttl() operations
 - get_document_ttl_info() queries
 - get_expiration_statistics() monitoring
@@ -50,14 +50,16 @@ class TestWeaviateTTLOperations:
     def mock_weaviate_client(self, weaviate_config):
         """Mock Weaviate client"""
         client = WeaviateVectorClient(weaviate_config)
-        client.client = AsyncMock()
+        client.client = Mock()
         return client
     
     @pytest.fixture
     def mock_collection(self):
-        """Mock Weaviate collection"""
-        collection = AsyncMock()
-        tenant_collection = AsyncMock()
+        """Mock Weaviate collection (collection access is sync, queries are async)"""
+        collection = Mock()
+        tenant_collection = Mock()
+        tenant_collection.query = AsyncMock()
+        tenant_collection.data = AsyncMock()
         collection.with_tenant.return_value = tenant_collection
         return collection, tenant_collection
     
@@ -195,69 +197,61 @@ class TestWeaviateTTLOperations:
     
     @pytest.mark.asyncio
     async def test_cleanup_expired_documents_success(self, mock_weaviate_client, mock_collection):
-        """Test successful cleanup of expired documents"""
+        """Test cleanup is one server-side expiry delete with counts from its result"""
         collection, tenant_collection = mock_collection
         mock_weaviate_client.client.collections.get.return_value = collection
+        tenant_collection.aggregate.over_all = AsyncMock(return_value=Mock(groups=[Mock(), Mock()]))
+        delete_result = {"matched": 6, "deleted": 6, "failed": 0, "requests": 1}
         
-        # Mock get_expired_documents to return test data
-        mock_expired_docs = [
-            {"id": "doc-1", "title": "Expired Doc 1", "chunks": 3},
-            {"id": "doc-2", "title": "Expired Doc 2", "chunks": 2},
-        ]
-        
-        with patch.object(mock_weaviate_client, 'get_expired_documents', return_value=mock_expired_docs):
-            with patch.object(mock_weaviate_client, 'delete_document') as mock_delete:
-                # Mock successful deletions
-                mock_delete.return_value = {"success": True, "deleted_chunks": 3}
-                
-                # Test cleanup
+        with patch.object(mock_weaviate_client, 'get_expired_documents') as mock_scan:
+            with patch.object(mock_weaviate_client, 'delete_many', AsyncMock(return_value=delete_result)) as mock_delete:
                 result = await mock_weaviate_client.cleanup_expired_documents("test-workspace")
                 
-                # Verify results
                 assert result["deleted_documents"] == 2
-                assert result["deleted_chunks"] == 6  # 3 + 3 (mock returns 3 for each)
+                assert result["deleted_chunks"] == 6
                 assert result["failed_deletions"] == 0
                 assert "Successfully cleaned up 2 expired documents" in result["message"]
                 assert "duration_seconds" in result
                 
-                # Verify delete_document was called for each expired document
-                assert mock_delete.call_count == 2
-                mock_delete.assert_any_call("test-workspace", "doc-1")
-                mock_delete.assert_any_call("test-workspace", "doc-2")
+                # No client-side scan; a single filtered delete by expiry
+                mock_scan.assert_not_called()
+                mock_delete.assert_awaited_once()
+                assert mock_delete.call_args.kwargs["expired_before"] is not None
+                assert "document_ids" not in mock_delete.call_args.kwargs
+                group_by = tenant_collection.aggregate.over_all.call_args.kwargs["group_by"]
+                assert group_by.prop == "document_id"
     
     @pytest.mark.asyncio
-    async def test_cleanup_expired_documents_no_expired(self, mock_weaviate_client):
+    async def test_cleanup_expired_documents_no_expired(self, mock_weaviate_client, mock_collection):
         """Test cleanup when no expired documents exist"""
-        with patch.object(mock_weaviate_client, 'get_expired_documents', return_value=[]):
-            result = await mock_weaviate_client.cleanup_expired_documents("test-workspace")
-            
-            assert result["deleted_documents"] == 0
-            assert result["deleted_chunks"] == 0
-            assert result["message"] == "No expired documents found"
+        collection, tenant_collection = mock_collection
+        mock_weaviate_client.client.collections.get.return_value = collection
+        tenant_collection.aggregate.over_all = AsyncMock(return_value=Mock(groups=[]))
+        tenant_collection.data.delete_many = AsyncMock(return_value=Mock(matches=0, successful=0, failed=0))
+        
+        result = await mock_weaviate_client.cleanup_expired_documents("test-workspace")
+        
+        assert result["deleted_documents"] == 0
+        assert result["deleted_chunks"] == 0
+        assert result["message"] == "No expired documents found"
+        tenant_collection.data.delete_many.assert_awaited_once()
     
     @pytest.mark.asyncio
-    async def test_cleanup_expired_documents_partial_failures(self, mock_weaviate_client):
-        """Test cleanup with some deletion failures"""
-        mock_expired_docs = [
-            {"id": "doc-1", "title": "Expired Doc 1", "chunks": 3},
-            {"id": "doc-2", "title": "Expired Doc 2", "chunks": 2},
-            {"id": "doc-3", "title": "Expired Doc 3", "chunks": 1},
-        ]
+    async def test_cleanup_expired_documents_partial_failures(self, mock_weaviate_client, mock_collection):
+        """Test cleanup with some chunk deletion failures"""
+        collection, tenant_collection = mock_collection
+        mock_weaviate_client.client.collections.get.return_value = collection
+        tenant_collection.aggregate.over_all = AsyncMock(side_effect=Exception("aggregate unavailable"))
+        tenant_collection.data.delete_many = AsyncMock(return_value=Mock(matches=6, successful=5, failed=1))
         
-        def mock_delete(workspace_slug, doc_id):
-            if doc_id == "doc-2":
-                return {"success": False}  # Simulate failure
-            return {"success": True, "deleted_chunks": 2}
+        result = await mock_weaviate_client.cleanup_expired_documents("test-workspace")
         
-        with patch.object(mock_weaviate_client, 'get_expired_documents', return_value=mock_expired_docs):
-            with patch.object(mock_weaviate_client, 'delete_document', side_effect=mock_delete):
-                result = await mock_weaviate_client.cleanup_expired_documents("test-workspace")
-                
-                assert result["deleted_documents"] == 2  # doc-1 and doc-3 succeeded
-                assert result["failed_deletions"] == 1  # doc-2 failed
-                assert "failed_document_ids" in result
-                assert "doc-2" in result["failed_document_ids"]
-                assert "(1 failed)" in result["message"]
+        assert result["deleted_chunks"] == 5
+        assert result["failed_deletions"] == 1
+        assert result["deleted_documents"] == 0  # count unavailable, cleanup still ran
+        assert "(1 chunks failed)" in result["message"]
+        # Failed chunks would match again, so the delete is not repeated
+        tenant_collection.data.delete_many.assert_awaited_once()
     
     @pytest.mark.asyncio
     async def test_update_document_ttl_success(self, mock_weaviate_client, mock_collection):
@@ -526,25 +520,15 @@ class TestWeaviateTTLOperations:
         assert stats["expiration_percentages"]["long_term"] == 25.0  # 1/4 = 25%
     
     @pytest.mark.asyncio
-    async def test_delete_document_success(self, mock_weaviate_client, mock_collection):
+    async def test_delete_document_success(self, mock_weaviate_client):
         """Test successful document deletion"""
-        collection, tenant_collection = mock_collection
-        mock_weaviate_client.client.collections.get.return_value = collection
-        
-        # Mock the query to find chunks
-        class MockObject:
-            def __init__(self, uuid_val):
-                self.uuid = uuid_val
-        
-        class MockResponse:
-            def __init__(self, objects):
-                self.objects = objects
-        
-        mock_objects = [MockObject(f"chunk-{i}") for i in range(4)]
-        tenant_collection.query.fetch_objects.return_value = MockResponse(mock_objects)
-        
-        # Mock successful deletions
-        tenant_collection.data.delete_by_id.return_value = None
+        tenant_collection = Mock()
+        tenant_collection.data.delete_many = AsyncMock(side_effect=[
+            Mock(matches=4, successful=4, failed=0),
+            Mock(matches=0, successful=0, failed=0),
+        ])
+        mock_weaviate_client.client = Mock()
+        mock_weaviate_client.client.collections.get.return_value.with_tenant.return_value = tenant_collection
         
         # Test document deletion
         result = await mock_weaviate_client.delete_document("test-workspace", "doc-123")
@@ -557,41 +541,59 @@ class TestWeaviateTTLOperations:
         assert result["deleted_chunks"] == 4
         assert "deleted_at" in result
         
-        # Verify delete was called for each chunk
-        assert tenant_collection.data.delete_by_id.call_count == 4
+        # Verify a single server-side filtered delete was issued (plus the
+        # terminating request that matches nothing)
+        tenant_collection.data.delete_by_id.assert_not_called()
+        where = tenant_collection.data.delete_many.call_args.kwargs["where"]
+        assert where.target == "document_id"
     
     @pytest.mark.asyncio
-    async def test_delete_document_partial_failures(self, mock_weaviate_client, mock_collection):
+    async def test_delete_document_partial_failures(self, mock_weaviate_client):
         """Test document deletion with some chunk deletion failures"""
-        collection, tenant_collection = mock_collection
-        mock_weaviate_client.client.collections.get.return_value = collection
-        
-        # Mock the query response
-        class MockObject:
-            def __init__(self, uuid_val):
-                self.uuid = uuid_val
-        
-        class MockResponse:
-            def __init__(self, objects):
-                self.objects = objects
-        
-        mock_objects = [MockObject(f"chunk-{i}") for i in range(3)]
-        tenant_collection.query.fetch_objects.return_value = MockResponse(mock_objects)
-        
-        # Mock deletion to fail for one chunk
-        def mock_delete(chunk_id):
-            if chunk_id == "chunk-1":
-                raise Exception("Deletion failed for chunk-1")
-        
-        tenant_collection.data.delete_by_id.side_effect = mock_delete
+        tenant_collection = Mock()
+        tenant_collection.data.delete_many = AsyncMock(
+            return_value=Mock(matches=3, successful=2, failed=1)
+        )
+        mock_weaviate_client.client = Mock()
+        mock_weaviate_client.client.collections.get.return_value.with_tenant.return_value = tenant_collection
         
         # Test document deletion
         result = await mock_weaviate_client.delete_document("test-workspace", "doc-123")
         
-        # Verify partial success
-        assert result["success"] is True  # Should be True if any deletions succeeded
+        # Failures are reported exactly and stop further requests
+        assert result["success"] is False
         assert result["total_chunks"] == 3
         assert result["deleted_chunks"] == 2  # Only 2 succeeded
+        assert tenant_collection.data.delete_many.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_delete_many_repeats_past_server_limit(self, mock_weaviate_client):
+        """Test delete_many keeps deleting until no objects match"""
+        tenant_collection = Mock()
+        tenant_collection.data.delete_many = AsyncMock(side_effect=[
+            Mock(matches=10000, successful=10000, failed=0),
+            Mock(matches=2500, successful=2500, failed=0),
+            Mock(matches=0, successful=0, failed=0),
+        ])
+        mock_weaviate_client.client = Mock()
+        mock_weaviate_client.client.collections.get.return_value.with_tenant.return_value = tenant_collection
+        
+        result = await mock_weaviate_client.delete_many(
+            "test-workspace", expired_before=datetime.utcnow()
+        )
+        
+        assert result["deleted"] == 12500
+        assert result["matched"] == 12500
+        assert result["requests"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_delete_many_requires_filter(self, mock_weaviate_client):
+        """Test delete_many refuses to delete a whole tenant"""
+        with pytest.raises(ValueError):
+            await mock_weaviate_client.delete_many("test-workspace")
+        
+        result = await mock_weaviate_client.delete_many("test-workspace", document_ids=[])
+        assert result["deleted"] == 0
 
 
 class TestWeaviateTTLErrorHandling:
@@ -610,7 +612,7 @@ class TestWeaviateTTLErrorHandling:
     def mock_weaviate_client(self, weaviate_config):
         """Mock Weaviate client"""
         client = WeaviateVectorClient(weaviate_config)
-        client.client = AsyncMock()
+        client.client = Mock()
         return client
     
     @pytest.mark.asyncio
@@ -700,56 +702,54 @@ class TestWeaviateTTLPerformance:
     def mock_weaviate_client(self, weaviate_config):
         """Mock Weaviate client"""
         client = WeaviateVectorClient(weaviate_config)
-        client.client = AsyncMock()
+        client.client = Mock()
         return client
     
+    @pytest.fixture
+    def mock_collection(self):
+        """Mock Weaviate collection (collection access is sync, queries are async)"""
+        collection = Mock()
+        tenant_collection = Mock()
+        tenant_collection.query = AsyncMock()
+        tenant_collection.data = AsyncMock()
+        collection.with_tenant.return_value = tenant_collection
+        return collection, tenant_collection
+    
     @pytest.mark.asyncio
     async def test_cleanup_large_batch_performance(self, mock_weaviate_client):
-        """Test cleanup performance with large batch of expired documents"""
+        """Test cleanup of many expired documents stays a single server-side delete"""
         import time
         
-        # Create large batch of expired documents
-        large_batch = []
-        for i in range(100):
-            large_batch.append({
-                "id": f"doc-{i}",
-                "title": f"Expired Document {i}",
-                "chunks": 3
-            })
+        delete_result = {"matched": 300, "deleted": 300, "failed": 0, "requests": 1}
         
-        # Mock fast deletion
-        with patch.object(mock_weaviate_client, 'get_expired_documents', return_value=large_batch):
-            with patch.object(mock_weaviate_client, 'delete_document') as mock_delete:
-                mock_delete.return_value = {"success": True, "deleted_chunks": 3}
+        with patch.object(mock_weaviate_client, '_count_expired_documents', AsyncMock(return_value=100)):
+            with patch.object(mock_weaviate_client, 'delete_many', AsyncMock(return_value=delete_result)) as mock_delete:
                 
                 start_time = time.time()
-                result = await mock_weaviate_client.cleanup_expired_documents("test-workspace", batch_size=20)
+                result = await mock_weaviate_client.cleanup_expired_documents("test-workspace")
                 processing_time = time.time() - start_time
                 
                 # Should complete reasonably quickly
                 assert processing_time < 10.0, f"Large batch cleanup took too long: {processing_time}s"
                 assert result["deleted_documents"] == 100
                 assert result["deleted_chunks"] == 300
+                assert mock_delete.await_count == 1  # independent of the number of documents
     
     @pytest.mark.asyncio
-    async def test_batch_size_optimization(self, mock_weaviate_client):
-        """Test that batch size affects processing behavior"""
-        # Create moderate batch
-        batch = [{"id": f"doc-{i}", "title": f"Doc {i}", "chunks": 1} for i in range(10)]
-        
-        with patch.object(mock_weaviate_client, 'get_expired_documents', return_value=batch):
-            with patch.object(mock_weaviate_client, 'delete_document') as mock_delete:
-                mock_delete.return_value = {"success": True, "deleted_chunks": 1}
-                
-                # Test with small batch size
-                result_small = await mock_weaviate_client.cleanup_expired_documents("test-workspace", batch_size=2)
+    async def test_repeated_cleanup_single_delete_each(self, mock_weaviate_client):
+        """Test that each cleanup issues exactly one server-side delete"""
+        delete_result = {"matched": 10, "deleted": 10, "failed": 0, "requests": 1}
+        
+        with patch.object(mock_weaviate_client, '_count_expired_documents', AsyncMock(return_value=10)):
+            with patch.object(mock_weaviate_client, 'delete_many', AsyncMock(return_value=delete_result)) as mock_delete:
                 
-                # Test with large batch size
-                result_large = await mock_weaviate_client.cleanup_expired_documents("test-workspace", batch_size=20)
+                result_first = await mock_weaviate_client.cleanup_expired_documents("test-workspace")
+                result_second = await mock_weaviate_client.cleanup_expired_documents("test-workspace")
                 
-                # Both should achieve same result
-                assert result_small["deleted_documents"] == result_large["deleted_documents"] == 10
-                assert result_small["deleted_chunks"] == result_large["deleted_chunks"] == 10
+                # Both should achieve same result with one delete each
+                assert result_first["deleted_documents"] == result_second["deleted_documents"] == 10
+                assert result_first["deleted_chunks"] == result_second["deleted_chunks"] == 10
+                assert mock_delete.await_count == 2
     
     @pytest.mark.asyncio
     async def test_concurrent_ttl_operations(self, mock_weaviate_client, mock_collection):
@@ -781,4 +781,80 @@ class TestWeaviateTTLPerformance:
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
+
+class TestWeaviateCursorIteration:
+    """Test bounded-memory cursor iteration over tenant objects"""
+    
+    @pytest.fixture
+    def mock_weaviate_client(self):
+        """Weaviate client with a paged fake tenant of 2,500 chunks"""
+        client = WeaviateVectorClient(
+            WeaviateConfig(endpoint="http://localhost:8080", api_key="test-api-key")
+        )
+        past = datetime.utcnow() - timedelta(days=1)
+        future = datetime.utcnow() + timedelta(days=30)
+        objects = [
+            Mock(uuid=f"uuid-{i:05d}", properties={
+                "document_id": f"doc-{i // 10}",
+                "document_title": f"Doc {i // 10}",
+                "expires_at": past if i < 1000 else future,
+                "source_provider": "context7" if i % 2 == 0 else "github",
+            })
+            for i in range(2500)
+        ]
+        
+        async def fetch_objects(limit, after=None, return_properties=None):
+            start = 0 if after is None else int(after.split("-")[1]) + 1
+            return Mock(objects=objects[start:start + limit])
+        
+        tenant_collection = Mock()
+        tenant_collection.query.fetch_objects = AsyncMock(side_effect=fetch_objects)
+        client.client = Mock()
+        client.client.collections.get.return_value.with_tenant.return_value = tenant_collection
+        client.tenant_collection = tenant_collection
+        return client
+    
+    @pytest.mark.asyncio
+    async def test_iterates_whole_tenant_in_pages(self, mock_weaviate_client):
+        """Test the cursor walks past 10k-style limits page by page"""
+        seen = [obj.uuid async for obj in mock_weaviate_client.iter_workspace_objects(
+            "test-workspace", properties=["document_id"], page_size=1000
+        )]
+        
+        assert len(seen) == 2500
+        assert len(set(seen)) == 2500
+        calls = mock_weaviate_client.tenant_collection.query.fetch_objects.call_args_list
+        assert len(calls) == 3
+        assert "after" not in calls[0].kwargs
+        assert calls[1].kwargs["after"] == "uuid-00999"
+        assert calls[0].kwargs["return_properties"] == ["document_id"]
+    
+    @pytest.mark.asyncio
+    async def test_streaming_aggregation(self, mock_weaviate_client):
+        """Test document helpers aggregate while streaming"""
+        expired = await mock_weaviate_client.get_expired_documents("test-workspace")
+        assert len(expired) == 100
+        assert all(doc["chunks"] == 10 for doc in expired)
+        
+        documents = await mock_weaviate_client.list_workspace_documents("test-workspace")
+        assert len(documents) == 250
+        
+        github_docs = await mock_weaviate_client.get_documents_by_provider("test-workspace", "github")
+        assert len(github_docs) == 250
+        assert all(doc["chunks"] == 5 for doc in github_docs)
+        
+        stats = await mock_weaviate_client.get_expiration_statistics("test-workspace")
+        assert stats["total_chunks"] == 2500
+        assert stats["expired_documents"] == 100
+    
+    @pytest.mark.asyncio
+    async def test_max_objects_bounds_scan(self, mock_weaviate_client):
+        """Test max_objects stops the scan early"""
+        count = 0
+        async for _ in mock_weaviate_client.iter_workspace_objects(
+            "test-workspace", page_size=100, max_objects=250
+        ):
+            count += 1
+        assert count == 250
+        assert mock_weaviate_client.tenant_collection.query.fetch_objects.await_count == 3
@@ -0,0 +1,212 @@
+"""
+Workspace Catalog Tests
+Validates the precompiled technology matcher, the cached tenant catalog
+(TTL and tenant-event refresh, metadata join) and catalog-backed workspace
+selection in WorkspaceSearchStrategy.
+"""
+
+import asyncio
+import random
+from datetime import datetime
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.core.config.models import WorkspaceCatalogConfig
+from src.search.strategies import WorkspaceSearchStrategy
+from src.search.workspace_catalog import (
+    DEFAULT_TECHNOLOGY_PATTERNS,
+    TechnologyMatcher,
+    WorkspaceCatalog,
+)
+
+
+def _naive_detect(patterns, query):
+    query_lower = query.lower()
+    return {
+        tech for tech, keywords in patterns.items()
+        if any(keyword in query_lower for keyword in keywords)
+    }
+
+
+def _metadata_rows():
+    return [
+        {"slug": "backend", "technology": "python", "last_updated": datetime(2024, 5, 1), "document_count": 40},
+        {"slug": "backend", "technology": "docker", "last_updated": datetime(2024, 6, 1), "document_count": 5},
+        {"slug": "web", "technology": "javascript", "last_updated": datetime(2024, 4, 1), "document_count": 12},
+    ]
+
+
+class FakeWeaviateClient:
+    """Weaviate client stand-in with tenant listeners"""
+
+    def __init__(self, slugs):
+        self.slugs = slugs
+        self.list_calls = 0
+        self.listeners = []
+
+    async def list_workspaces(self):
+        self.list_calls += 1
+        return [{"slug": slug} for slug in self.slugs]
+
+    def add_tenant_listener(self, listener):
+        self.listeners.append(listener)
+
+
+def _make_catalog(slugs=("backend", "web", "vue-guide"), **config):
+    db_manager = Mock()
+    db_manager.fetch_all = AsyncMock(return_value=_metadata_rows())
+    client = FakeWeaviateClient(list(slugs))
+    catalog = WorkspaceCatalog(db_manager, client, WorkspaceCatalogConfig(**config))
+    return catalog, client, db_manager
+
+
+class TestTechnologyMatcher:
+    """Test the compiled keyword automaton."""
+
+    def test_matches_substring_semantics(self):
+        """Test detection equals testing each keyword as a substring."""
+        matcher = TechnologyMatcher(DEFAULT_TECHNOLOGY_PATTERNS)
+        keywords = [k for words in DEFAULT_TECHNOLOGY_PATTERNS.values() for k in words]
+        rng = random.Random(3)
+        queries = [
+            "FastAPI python tutorial",
+            "React JavaScript components",
+            "javascript closures",
+            "golang google cloud functions",
+            "asp.net vs .NET core",
+            "deploy with kubectl and helm",
+            "",
+        ] + [
+            " ".join(rng.choice(keywords + ["the", "setup", "docs"]) for _ in range(4))
+            for _ in range(200)
+        ]
+
+        for query in queries:
+            assert matcher.detect(query) == _naive_detect(DEFAULT_TECHNOLOGY_PATTERNS, query), query
+
+    def test_prefix_keywords_are_not_shadowed(self):
+        """Test a longer keyword still reports technologies of its prefixes."""
+        matcher = TechnologyMatcher({"java": ["java"], "javascript": ["javascript"], "go": ["go"]})
+        assert matcher.detect("JavaScript on google") == {"java", "javascript", "go"}
+        assert TechnologyMatcher({}).detect("python") == set()
+
+
+class TestWorkspaceCatalog:
+    """Test caching, refresh and metadata join."""
+
+    @pytest.mark.asyncio
+    async def test_joins_tenants_with_document_metadata(self):
+        """Test tenants get the dominant technology and summed document counts."""
+        catalog, _, _ = _make_catalog()
+
+        workspaces = {w["slug"]: w for w in await catalog.get_workspaces()}
+
+        assert workspaces["backend"]["technology"] == "python"
+        assert workspaces["backend"]["document_count"] == 45
+        assert workspaces["backend"]["last_updated"] == datetime(2024, 6, 1)
+        assert (workspaces["vue-guide"]["technology"], workspaces["vue-guide"]["document_count"]) == ("vue", 0)
+        assert [w["slug"] for w in await catalog.select_workspaces({"Python"}, limit=1)] == ["backend"]
+
+    def test_infers_technology_from_slug_tokens(self):
+        """Test slug inference matches whole tokens, not substrings."""
+        assert WorkspaceCatalog._infer_technology("ts-handbook") == "typescript"
+        assert WorkspaceCatalog._infer_technology("charts") == "general"
+        assert WorkspaceCatalog._infer_technology("unit_tests") == "general"
+        assert WorkspaceCatalog._infer_technology("NodeJS-api") == "nodejs"
+
+    @pytest.mark.asyncio
+    async def test_select_uses_index_and_fills_in_catalog_order(self):
+        """Test tagged workspaces come from the index and others only fill to the limit."""
+        catalog, _, _ = _make_catalog(slugs=[f"ws-{i}" for i in range(50)] + ["web", "backend"])
+
+        selected = await catalog.select_workspaces({"javascript", "python", "rust"}, limit=4)
+
+        assert [w["slug"] for w in selected] == ["web", "backend", "ws-0", "ws-1"]
+        assert len(await catalog.select_workspaces({"python"}, limit=0)) == 1
+
+    @pytest.mark.asyncio
+    async def test_hot_path_served_from_memory_until_ttl(self):
+        """Test loaded catalogs make no calls; expiry triggers one background refresh."""
+        catalog, client, db_manager = _make_catalog(refresh_ttl_seconds=60)
+
+        await asyncio.gather(*[catalog.get_workspaces() for _ in range(5)])
+        await catalog.get_workspaces()
+        assert (client.list_calls, db_manager.fetch_all.await_count) == (1, 1)
+
+        catalog._loaded_at -= 61
+        client.slugs.append("rust-book")
+        stale = await catalog.get_workspaces()
+        await catalog.get_workspaces()
+        assert len(stale) == 3
+        await asyncio.sleep(0)
+
+        assert client.list_calls == 2
+        assert len(await catalog.get_workspaces()) == 4
+        await catalog.close()
+
+    @pytest.mark.asyncio
+    async def test_tenant_events_refresh_and_failures_keep_snapshot(self):
+        """Test tenant create events refresh immediately and failed loads keep the snapshot."""
+        catalog, client, db_manager = _make_catalog()
+        await catalog.get_workspaces()
+
+        client.slugs.append("django-docs")
+        await client.listeners[0]("created", "django-docs")
+        await asyncio.sleep(0)
+        assert "django-docs" in {w["slug"] for w in await catalog.get_workspaces()}
+
+        client.list_workspaces = AsyncMock(side_effect=RuntimeError("weaviate down"))
+        db_manager.fetch_all = AsyncMock(side_effect=RuntimeError("db down"))
+        assert len(await catalog.refresh()) == 4
+        assert catalog.get_stats()["refresh_failures"] == 1
+        await catalog.close()
+
+    @pytest.mark.asyncio
+    async def test_remote_invalidation_ignores_own_messages(self):
+        """Test pub/sub invalidations from other workers refresh the catalog."""
+        messages = []
+
+        class FakePubSub:
+            async def listen(self):
+                for message in messages:
+                    yield message
+                await asyncio.Event().wait()
+
+            async def close(self):
+                pass
+
+        cache_manager = Mock()
+        cache_manager.subscribe = AsyncMock(return_value=FakePubSub())
+        cache_manager.publish = AsyncMock(return_value=1)
+        catalog, client, _ = _make_catalog()
+        await catalog.get_workspaces()
+        messages.extend([
+            {"type": "message", "data": f"{catalog._instance_id}:tenant_created:a".encode()},
+            {"type": "message", "data": b"other-worker:tenant_deleted:web"},
+        ])
+
+        catalog.cache_manager = cache_manager
+        await catalog.get_workspaces()
+        await asyncio.sleep(0.01)
+
+        assert catalog.get_stats()["invalidations_received"] == 1
+        assert client.list_calls == 2
+        await catalog.close()
+
+
+class TestCatalogWorkspaceSelection:
+    """Test WorkspaceSearchStrategy selection over the catalog."""
+
+    @pytest.mark.asyncio
+    async def test_scores_by_hint_and_query_technologies(self):
+        """Test hint and query technologies are scored without per-keyword loops."""
+        catalog, _, _ = _make_catalog(slugs=[f"ws-{i}" for i in range(8)] + ["backend", "web"])
+        strategy = WorkspaceSearchStrategy(Mock(), Mock(), workspace_catalog=catalog)
+
+        selected = await strategy.identify_relevant_workspaces(
+            "async views in fastapi", technology_hint="javascript"
+        )
+
+        assert [w.slug for w in selected] == ["web", "backend", "ws-0", "ws-1", "ws-2"]
+        assert [w.relevance_score for w in selected] == [0.5, 0.3, 0.1, 0.1, 0.1]
+        assert selected[1].document_count == 45
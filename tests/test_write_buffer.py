@@ -0,0 +1,222 @@
+"""
+Write-Behind Buffer Tests
+Validates batched background inserts for usage signals and feedback events:
+row and interval triggered flushes, backpressure and drop counting,
+transient failure re-queueing, per-row fallback for rejected batches,
+draining on shutdown, and FeedbackService routing writes through the buffer.
+"""
+
+import asyncio
+import time
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from src.api.schemas import FeedbackRequest, UsageSignalRequest
+from src.database import write_buffer
+from src.database.write_buffer import (
+    WriteBehindBuffer, build_insert, close_write_buffers, get_write_buffer_stats, row_params
+)
+from src.services.feedback import USAGE_SIGNAL_COLUMNS, FeedbackService
+
+COLUMNS = ("signal_id", "content_id", "signal_value")
+
+
+class FakeDatabaseManager:
+    """DatabaseManager stand-in recording executed INSERTs, one params list per call"""
+
+    def __init__(self, delay: float = 0.0, failures=None, reject=None):
+        self.delay = delay
+        self.failures = list(failures or [])
+        self.reject = reject
+        self.calls = []
+
+    async def execute(self, query, params=None):
+        await self.execute_many(query, [params])
+
+    async def execute_many(self, query, params_list):
+        await asyncio.sleep(self.delay)
+        if self.failures:
+            raise self.failures.pop(0)
+        if self.reject and any(self.reject in params for params in params_list):
+            raise IntegrityError(query, params_list, Exception("check constraint"))
+        self.calls.append((query, list(params_list)))
+
+    def rows_written(self):
+        return sum(len(params_list) for _, params_list in self.calls)
+
+
+def _row(i):
+    return {"signal_id": f"s{i}", "content_id": "doc-1", "signal_value": float(i)}
+
+
+class TestBuildInsert:
+    """Test INSERT construction."""
+
+    def test_single_row_statement_and_params(self):
+        """Test one fixed statement with positional parameters per row."""
+        query = build_insert("usage_signals", COLUMNS)
+
+        assert query == (
+            "INSERT INTO usage_signals (signal_id, content_id, signal_value) VALUES "
+            "(:param_0, :param_1, :param_2)"
+        )
+        assert row_params(COLUMNS, _row(0)) == ("s0", "doc-1", 0.0)
+        assert row_params(COLUMNS, {"signal_id": "s1"}) == ("s1", None, None)
+
+
+class TestWriteBehindBuffer:
+    """Test WriteBehindBuffer flushing and failure handling."""
+
+    @pytest.mark.asyncio
+    async def test_flush_by_rows_and_interval(self):
+        """Test full batches flush immediately and stragglers on the interval."""
+        db = FakeDatabaseManager()
+        buffer = WriteBehindBuffer(db, "usage_signals", COLUMNS, flush_rows=10, flush_interval_ms=50)
+
+        for i in range(10):
+            assert await buffer.add(_row(i))
+        await asyncio.sleep(0.01)
+        for i in range(10, 15):
+            assert await buffer.add(_row(i))
+        assert [len(params_list) for _, params_list in db.calls] == [10]
+
+        await asyncio.sleep(0.08)
+        assert [len(params_list) for _, params_list in db.calls] == [10, 5]
+        assert len({query for query, _ in db.calls}) == 1
+        stats = buffer.get_stats()
+        assert (stats["accepted"], stats["flushed_rows"], stats["flushes"], stats["buffered"]) == (15, 15, 2, 0)
+        await buffer.close()
+
+    @pytest.mark.asyncio
+    async def test_backpressure_then_drop(self):
+        """Test writers wait for a flush when full and drop once it stays full."""
+        db = FakeDatabaseManager(delay=0.2)
+        buffer = WriteBehindBuffer(
+            db, "usage_signals", COLUMNS, max_rows=4, flush_rows=2, flush_interval_ms=1000, backpressure_ms=20
+        )
+
+        results = [await buffer.add(_row(i)) for i in range(8)]
+
+        assert results.count(False) == buffer.get_stats()["dropped_full"] > 0
+        await buffer.close()
+        assert db.rows_written() == results.count(True)
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_requeued(self):
+        """Test a batch failing for a transient error is written on the next flush."""
+        db = FakeDatabaseManager(failures=[ConnectionError("database unavailable")])
+        buffer = WriteBehindBuffer(db, "usage_signals", COLUMNS, flush_interval_ms=10)
+        for i in range(3):
+            await buffer.add(_row(i))
+
+        assert await buffer.flush() == 0
+        assert buffer.get_stats()["buffered"] == 3
+        assert await buffer.flush() == 3
+        assert [params[0] for params in db.calls[0][1]] == ["s0", "s1", "s2"]
+        assert buffer.get_stats()["failed_flushes"] == 1
+        await buffer.close()
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_falls_back_to_rows(self):
+        """Test a constraint violation only drops the offending row."""
+        db = FakeDatabaseManager(reject="s1")
+        buffer = WriteBehindBuffer(db, "usage_signals", COLUMNS, flush_interval_ms=1000)
+        for i in range(3):
+            await buffer.add(_row(i))
+
+        assert await buffer.flush() == 2
+        assert [params_list[0][0] for _, params_list in db.calls] == ["s0", "s2"]
+        assert buffer.get_stats()["dropped_invalid"] == 1
+        await buffer.close()
+
+    @pytest.mark.asyncio
+    async def test_close_drains_shared_buffers(self):
+        """Test shutdown writes buffered rows and later writes are refused."""
+        db = FakeDatabaseManager()
+        buffer = write_buffer.get_write_buffer(db, "usage_signals", COLUMNS)
+        assert write_buffer.get_write_buffer(db, "usage_signals", COLUMNS) is buffer
+        await buffer.add(_row(0))
+        assert get_write_buffer_stats()["usage_signals"]["buffered"] == 1
+
+        await close_write_buffers()
+
+        assert db.rows_written() == 1
+        assert await buffer.add(_row(1)) is False
+        assert get_write_buffer_stats() == {}
+
+
+class TestFeedbackServiceBuffering:
+    """Test FeedbackService writes through the write-behind buffers."""
+
+    @pytest.mark.asyncio
+    async def test_signals_and_feedback_batched(self):
+        """Test concurrent events are accepted at once and written in one INSERT per table."""
+        db = FakeDatabaseManager()
+        service = FeedbackService(db)
+
+        signals = await asyncio.gather(*(
+            service.record_usage_signal(UsageSignalRequest(
+                content_id="doc-1", signal_type="click", session_id="sess",
+                metadata={"search_query": "react hooks", "result_position": i},
+            ))
+            for i in range(20)
+        ))
+        feedback = await service.submit_feedback(FeedbackRequest(
+            content_id="doc-1", feedback_type="helpful", rating=5,
+            metadata={"query_context": "react hooks"},
+        ))
+
+        assert all(response.status == "accepted" for response in [*signals, feedback])
+        assert db.calls == []
+        await close_write_buffers()
+
+        tables = {query.split()[2]: params_list for query, params_list in db.calls}
+        assert len(db.calls) == 2
+        assert len(tables["usage_signals"]) == 20
+        row = dict(zip(USAGE_SIGNAL_COLUMNS, tables["usage_signals"][0]))
+        assert (row["signal_value"], row["search_query"], row["user_session_id"]) == (1.0, "react hooks", "sess")
+        assert tables["feedback_events"][0][:3] == (feedback.feedback_id, "doc-1", "helpful")
+
+    @pytest.mark.asyncio
+    async def test_unbuffered_writes_directly(self):
+        """Test buffered=False inserts each event synchronously."""
+        db = FakeDatabaseManager()
+        service = FeedbackService(db, buffered=False)
+
+        response = await service.record_usage_signal(UsageSignalRequest(content_id="doc-1", signal_type="copy"))
+
+        assert response.status == "accepted"
+        assert db.calls[0][1][0][:3] == (response.feedback_id, "doc-1", "copy")
+
+
+class TestWriteBehindBenchmark:
+    """Benchmark per-event inserts against the write-behind buffer."""
+
+    @pytest.mark.asyncio
+    async def test_request_path_latency(self):
+        """Benchmark request-path time for 500 events with a 1ms INSERT round trip."""
+        requests = [
+            UsageSignalRequest(content_id="doc-1", signal_type="click", session_id=f"s{i}")
+            for i in range(500)
+        ]
+
+        direct_db = FakeDatabaseManager(delay=0.001)
+        direct = FeedbackService(direct_db, buffered=False)
+        start = time.perf_counter()
+        for request in requests:
+            await direct.record_usage_signal(request)
+        direct_ms = (time.perf_counter() - start) * 1000
+
+        buffered_db = FakeDatabaseManager(delay=0.001)
+        buffered = FeedbackService(buffered_db)
+        start = time.perf_counter()
+        for request in requests:
+            await buffered.record_usage_signal(request)
+        buffered_ms = (time.perf_counter() - start) * 1000
+        await close_write_buffers()
+
+        print(f"\n500 usage signals: per-event INSERT {direct_ms:.1f}ms ({len(direct_db.calls)} statements), "
+              f"write-behind {buffered_ms:.1f}ms ({len(buffered_db.calls)} statements)")
+        assert buffered_db.rows_written() == 500
+        assert len(buffered_db.calls) <= 2
+        assert buffered_ms * 5 < direct_ms